@@ -0,0 +1,27 @@
+"""Run `pip install duckduckgo-search sqlalchemy openai` to install dependencies."""
+
+from agno.agent import Agent
+from agno.storage.sqlite import SqliteStorage
+from agno.storage.write_behind import WriteBehindStorage
+from agno.tools.duckduckgo import DuckDuckGoTools
+
+# Sessions are buffered in memory and flushed every 2 seconds (and on exit).
+# Only the runs appended since the last flush are written to SQLite.
+storage = WriteBehindStorage(
+    SqliteStorage(table_name="agent_sessions", db_file="tmp/data.db"),
+    durability="batched",
+    flush_interval=2.0,
+)
+
+agent = Agent(
+    storage=storage,
+    tools=[DuckDuckGoTools()],
+    add_history_to_messages=True,
+    add_datetime_to_instructions=True,
+)
+agent.print_response("How many people live in Canada?")
+agent.print_response("What is their national anthem?")
+agent.print_response("List my messages one by one")
+
+# Persist any pending sessions now instead of waiting for the next flush
+storage.flush()
@@ -0,0 +1,25 @@
+"""Run `pip install duckduckgo-search openai msgpack zstandard` to install dependencies."""
+
+from agno.agent import Agent
+from agno.models.openai import OpenAIChat
+from agno.storage.codec import SessionCodec, migrate_sessions
+from agno.storage.json import JsonStorage
+from agno.tools.duckduckgo import DuckDuckGoTools
+
+# Sessions are stored as msgpack, compressed with zstd, with repeated message content stored once
+storage = JsonStorage(
+    dir_path="tmp/agent_sessions_json",
+    codec=SessionCodec(format="msgpack", compression="zstd"),
+)
+
+# Re-encode the sessions that were previously stored as plain JSON
+migrate_sessions(storage)
+
+agent = Agent(
+    model=OpenAIChat(id="gpt-4o-mini"),
+    storage=storage,
+    tools=[DuckDuckGoTools()],
+    add_history_to_messages=True,
+)
+agent.print_response("How many people live in Canada?")
+agent.print_response("What is their national anthem called?")
@@ -0,0 +1,36 @@
+"""Run `pip install duckduckgo-search sqlalchemy psycopg openai` to install dependencies.
+
+Agent.arun() reads and writes the session with PostgresStorage.aread() / aupsert(), which use an async
+SQLAlchemy engine, so concurrent runs don't block the event loop on the database.
+"""
+
+import asyncio
+
+from agno.agent import Agent
+from agno.storage.postgres import PostgresStorage
+from agno.tools.duckduckgo import DuckDuckGoTools
+
+db_url = "postgresql+psycopg://ai:ai@localhost:5532/ai"
+
+storage = PostgresStorage(table_name="agent_sessions", db_url=db_url, auto_upgrade_schema=True)
+
+
+async def run_session(session_id: str, question: str) -> None:
+    agent = Agent(
+        session_id=session_id,
+        storage=storage,
+        tools=[DuckDuckGoTools()],
+        add_history_to_messages=True,
+    )
+    response = await agent.arun(question)
+    print(f"{session_id}: {response.content}")
+
+
+async def main():
+    await asyncio.gather(
+        run_session("canada", "How many people live in Canada?"),
+        run_session("france", "How many people live in France?"),
+    )
+
+
+asyncio.run(main())
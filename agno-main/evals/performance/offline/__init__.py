@@ -0,0 +1 @@
+"""Offline benchmarks of the agent runtime, using a scripted local model. See run.py."""
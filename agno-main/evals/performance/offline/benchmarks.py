@@ -0,0 +1,202 @@
+"""
+The benchmarks of the offline suite. Each benchmark is a setup function that prepares its objects and returns the
+function to measure, so the setup is not included in the measurements.
+"""
+
+import random
+from dataclasses import dataclass
+from itertools import count
+from pathlib import Path
+from typing import Callable, Dict, List, Literal
+
+from agno.agent import Agent
+from agno.document import Document
+from agno.knowledge.document import DocumentKnowledgeBase
+from agno.storage.base import Storage
+from agno.storage.json import JsonStorage
+from agno.storage.sqlite import SqliteStorage
+from agno.team.team import Team
+
+from evals.performance.offline.mocks import HashEmbedder, ScriptedModel, ScriptedResponse
+
+QUESTION = "What is the capital of France?"
+ANSWER = (
+    "The capital of France is Paris. It is located on the Seine river, in the north of the country, and it is the "
+    "largest city of France with more than two million inhabitants."
+)
+WORDS = (
+    "agent team model tool memory storage knowledge vector search session summary workflow stream token latency "
+    "python paris france river city weather sunny cloudy market stock price report table query document"
+).split()
+
+
+def get_weather(city: Literal["nyc", "sf"]) -> str:
+    """Use this to get weather information."""
+    return "It might be cloudy in nyc" if city == "nyc" else "It's always sunny in sf"
+
+
+def add(a: int, b: int) -> int:
+    """Add two numbers."""
+    return a + b
+
+
+@dataclass
+class Benchmark:
+    name: str
+    # Prepares the benchmark in a temporary directory and returns the function to measure
+    setup: Callable[[Path], Callable[[], object]]
+    # Overrides the number of iterations of the suite
+    num_iterations: int = 0
+
+
+def _agent(**kwargs) -> Agent:
+    kwargs.setdefault("model", ScriptedModel(script=[ScriptedResponse(content=ANSWER)]))
+    return Agent(system_message="Be concise, reply with one sentence.", telemetry=False, **kwargs)
+
+
+def agent_instantiation(tmp_dir: Path) -> Callable[[], object]:
+    model = ScriptedModel()
+    return lambda: Agent(model=model, system_message="Be concise, reply with one sentence.", telemetry=False)
+
+
+def agent_instantiation_with_tools(tmp_dir: Path) -> Callable[[], object]:
+    model = ScriptedModel()
+    return lambda: Agent(model=model, tools=[get_weather, add], telemetry=False)
+
+
+def agent_run_with_history(num_history_runs: int) -> Callable[[Path], Callable[[], object]]:
+    """The overhead of a run, with the given number of previous runs added to the messages."""
+
+    def setup(tmp_dir: Path) -> Callable[[], object]:
+        agent = _agent(add_history_to_messages=True, num_history_runs=num_history_runs)
+        for _ in range(num_history_runs):
+            agent.run(QUESTION)
+        return lambda: agent.run(QUESTION)
+
+    return setup
+
+
+def agent_run_stream(tmp_dir: Path) -> Callable[[], object]:
+    agent = _agent(model=ScriptedModel(script=[ScriptedResponse(content=ANSWER)], chunk_size=1))
+    return lambda: list(agent.run(QUESTION, stream=True))
+
+
+def tool_dispatch(num_tool_calls: int) -> Callable[[Path], Callable[[], object]]:
+    """A run where the model calls a tool num_tool_calls times, then answers."""
+
+    def setup(tmp_dir: Path) -> Callable[[], object]:
+        model = ScriptedModel(
+            script=[
+                ScriptedResponse(tool_calls=[("add", {"a": i, "b": 1}) for i in range(num_tool_calls)]),
+                ScriptedResponse(content="Done."),
+            ]
+        )
+        agent = _agent(model=model, tools=[add])
+        return lambda: agent.run("Add the numbers.")
+
+    return setup
+
+
+def _get_storage(backend: str, tmp_dir: Path) -> Storage:
+    if backend == "sqlite":
+        return SqliteStorage(table_name="agent_sessions", db_file=str(tmp_dir / "sessions.db"))
+    return JsonStorage(dir_path=tmp_dir / "sessions")
+
+
+def storage_round_trip(backend: str) -> Callable[[Path], Callable[[], object]]:
+    """Writing and reading back the session of an agent with 10 runs."""
+
+    def setup(tmp_dir: Path) -> Callable[[], object]:
+        storage = _get_storage(backend, tmp_dir)
+        agent = _agent(storage=storage, session_id="benchmark-session")
+        for _ in range(10):
+            agent.run(QUESTION)
+        session = agent.get_agent_session(session_id="benchmark-session")
+
+        def round_trip() -> object:
+            storage.upsert(session)
+            return storage.read(session_id="benchmark-session")
+
+        return round_trip
+
+    return setup
+
+
+def agent_run_with_storage(backend: str) -> Callable[[Path], Callable[[], object]]:
+    """
+    A run that reads its session from storage and writes it. Each run uses a new session, so the size of the
+    session doesn't grow with the number of iterations.
+    """
+
+    def setup(tmp_dir: Path) -> Callable[[], object]:
+        agent = _agent(storage=_get_storage(backend, tmp_dir))
+        session_ids = count()
+        return lambda: agent.run(QUESTION, session_id=f"benchmark-session-{next(session_ids)}")
+
+    return setup
+
+
+def knowledge_search(num_documents: int) -> Callable[[Path], Callable[[], object]]:
+    """Searching a local LanceDb table of num_documents documents."""
+
+    def setup(tmp_dir: Path) -> Callable[[], object]:
+        from agno.vectordb.lancedb import LanceDb
+
+        rng = random.Random(0)
+        documents = [
+            Document(name=f"document-{i}", content=" ".join(rng.choices(WORDS, k=40))) for i in range(num_documents)
+        ]
+        vector_db = LanceDb(
+            uri=str(tmp_dir / "lancedb"), table_name="documents", embedder=HashEmbedder(), use_tantivy=False
+        )
+        vector_db.create()
+        vector_db.insert(documents)
+        knowledge = DocumentKnowledgeBase(documents=documents, vector_db=vector_db)
+        return lambda: knowledge.search(query="weather in paris", num_documents=5)
+
+    return setup
+
+
+def team_fan_out(num_members: int) -> Callable[[Path], Callable[[], object]]:
+    """A collaborate team run, sending the task to num_members member agents."""
+
+    def setup(tmp_dir: Path) -> Callable[[], object]:
+        members: List[Agent] = [_agent(name=f"member-{i}") for i in range(num_members)]
+        team_model = ScriptedModel(
+            script=[
+                ScriptedResponse(tool_calls=[("run_member_agents", {"task_description": QUESTION})]),
+                ScriptedResponse(content=ANSWER),
+            ]
+        )
+        team = Team(mode="collaborate", members=members, model=team_model, telemetry=False)  # type: ignore
+        return lambda: team.run(QUESTION)
+
+    return setup
+
+
+BENCHMARKS: List[Benchmark] = [
+    Benchmark("agent_instantiation", agent_instantiation, num_iterations=1000),
+    Benchmark("agent_instantiation_with_tools", agent_instantiation_with_tools, num_iterations=1000),
+    Benchmark("agent_run_history_0", agent_run_with_history(0)),
+    Benchmark("agent_run_history_10", agent_run_with_history(10)),
+    Benchmark("agent_run_history_50", agent_run_with_history(50)),
+    Benchmark("agent_run_stream", agent_run_stream),
+    Benchmark("tool_dispatch_1", tool_dispatch(1)),
+    Benchmark("tool_dispatch_10", tool_dispatch(10)),
+    Benchmark("storage_round_trip_sqlite", storage_round_trip("sqlite")),
+    Benchmark("storage_round_trip_json", storage_round_trip("json")),
+    Benchmark("agent_run_with_storage_sqlite", agent_run_with_storage("sqlite")),
+    Benchmark("agent_run_with_storage_json", agent_run_with_storage("json")),
+    Benchmark("knowledge_search_1000", knowledge_search(1000)),
+    Benchmark("team_fan_out_2", team_fan_out(2)),
+    Benchmark("team_fan_out_8", team_fan_out(8)),
+]
+
+
+def get_benchmarks(names: List[str]) -> Dict[str, Benchmark]:
+    """Returns the benchmarks whose names contain one of the given names, or all benchmarks."""
+    return {
+        benchmark.name: benchmark
+        for benchmark in BENCHMARKS
+        if not names or any(name in benchmark.name for name in names)
+    }
@@ -0,0 +1,104 @@
+"""Deterministic stand-ins for model and embedding providers, so benchmarks measure the Agno runtime only."""
+
+import json
+import re
+from dataclasses import dataclass, field
+from hashlib import sha256
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from agno.embedder.base import Embedder
+from agno.models.base import Model
+from agno.models.response import ModelResponse
+
+
+@dataclass
+class ScriptedResponse:
+    """A response of the ScriptedModel: text, tool calls, or both."""
+
+    content: Optional[str] = None
+    # (tool name, arguments) of each tool call
+    tool_calls: List[Tuple[str, Dict[str, Any]]] = field(default_factory=list)
+
+
+@dataclass
+class ScriptedModel(Model):
+    """
+    A Model that returns the responses of its script in order, starting over after the last one, without any I/O.
+    Streamed responses are split into chunks of `chunk_size` words.
+
+    A script of a tool call followed by text makes each agent run call the tool once.
+    """
+
+    id: str = "scripted"
+    name: str = "ScriptedModel"
+    provider: str = "Offline"
+    script: List[ScriptedResponse] = field(
+        default_factory=lambda: [ScriptedResponse(content="The capital of France is Paris.")]
+    )
+    chunk_size: int = 1
+
+    _turn: int = 0
+
+    def _next_response(self) -> ScriptedResponse:
+        response = self.script[self._turn % len(self.script)]
+        self._turn += 1
+        return response
+
+    def _get_tool_calls(self, response: ScriptedResponse) -> Optional[List[Dict[str, Any]]]:
+        if not response.tool_calls:
+            return None
+        return [
+            {
+                "id": f"call_{self._turn}_{i}",
+                "type": "function",
+                "function": {"name": name, "arguments": json.dumps(arguments)},
+            }
+            for i, (name, arguments) in enumerate(response.tool_calls)
+        ]
+
+    def _get_chunks(self, response: ScriptedResponse) -> Iterator[ModelResponse]:
+        words = re.findall(r"\S+\s*", response.content or "")
+        for i in range(0, len(words), self.chunk_size):
+            yield ModelResponse(role="assistant", content="".join(words[i : i + self.chunk_size]))
+        tool_calls = self._get_tool_calls(response)
+        if tool_calls is not None:
+            yield ModelResponse(role="assistant", tool_calls=tool_calls)
+
+    def invoke(self, *args, **kwargs) -> Any:
+        response = self._next_response()
+        return ModelResponse(role="assistant", content=response.content, tool_calls=self._get_tool_calls(response))
+
+    async def ainvoke(self, *args, **kwargs) -> Any:
+        return self.invoke(*args, **kwargs)
+
+    def invoke_stream(self, *args, **kwargs) -> Iterator[Any]:
+        yield from self._get_chunks(self._next_response())
+
+    async def ainvoke_stream(self, *args, **kwargs):
+        for chunk in self._get_chunks(self._next_response()):
+            yield chunk
+
+    def parse_provider_response(self, response: Any) -> ModelResponse:
+        return response
+
+    def parse_provider_response_delta(self, response: Any) -> ModelResponse:
+        return response
+
+
+@dataclass
+class HashEmbedder(Embedder):
+    """Embeds text by hashing its words into a fixed number of buckets. Similar texts get similar embeddings."""
+
+    dimensions: Optional[int] = 64
+
+    def get_embedding(self, text: str) -> List[float]:
+        dimensions = self.dimensions or 64
+        embedding = [0.0] * dimensions
+        for word in re.findall(r"\w+", text.lower()):
+            digest = sha256(word.encode("utf-8")).digest()
+            embedding[int.from_bytes(digest[:4], "little") % dimensions] += 1.0 if digest[4] % 2 else -1.0
+        norm = sum(value * value for value in embedding) ** 0.5 or 1.0
+        return [value / norm for value in embedding]
+
+    def get_embedding_and_usage(self, text: str) -> Tuple[List[float], Optional[Dict]]:
+        return self.get_embedding(text), None
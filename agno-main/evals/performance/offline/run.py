@@ -0,0 +1,197 @@
+"""
+Run the offline benchmark suite and compare the results with a baseline.
+
+Run `pip install agno lancedb` to install dependencies, then from the root of the repository:
+
+    python -m evals.performance.offline.run                      # run and compare with baseline.json
+    python -m evals.performance.offline.run --output results.json
+    python -m evals.performance.offline.run --save-baseline      # update baseline.json
+    python -m evals.performance.offline.run agent_run team       # only benchmarks matching a name
+
+Exits with status 1 if a benchmark regressed compared to the baseline.
+"""
+
+import argparse
+import json
+import platform
+import sys
+import tempfile
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from agno.eval.perf import PerfEval
+
+from evals.performance.offline.benchmarks import Benchmark, get_benchmarks
+
+BASELINE_FILE = Path(__file__).parent / "baseline.json"
+RESULTS_VERSION = 1
+# Metrics stored for each benchmark
+METRICS = [
+    "median_run_time",
+    "p95_run_time",
+    "avg_run_time",
+    "min_run_time",
+    "std_dev_run_time",
+    "median_memory_usage",
+    "max_memory_usage",
+]
+
+
+@dataclass
+class Regression:
+    benchmark: str
+    metric: str
+    baseline: float
+    current: float
+
+    @property
+    def ratio(self) -> float:
+        return self.current / self.baseline if self.baseline else float("inf")
+
+
+def get_environment() -> Dict[str, Any]:
+    try:
+        from importlib.metadata import version
+
+        agno_version = version("agno")
+    except Exception:
+        agno_version = None
+    return {
+        "agno": agno_version,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+    }
+
+
+def run_benchmark(benchmark: Benchmark, num_iterations: int, warmup_runs: int, measure_memory: bool) -> Dict[str, Any]:
+    with tempfile.TemporaryDirectory(prefix="agno-benchmark-") as tmp_dir:
+        func = benchmark.setup(Path(tmp_dir))
+        num_iterations = benchmark.num_iterations or num_iterations
+        perf = PerfEval(
+            func=func,
+            name=benchmark.name,
+            num_iterations=num_iterations,
+            warmup_runs=warmup_runs,
+            measure_memory=measure_memory,
+        )
+        result = perf.run()
+    metrics: Dict[str, Any] = {metric: getattr(result, metric) for metric in METRICS}
+    metrics["num_iterations"] = num_iterations
+    return metrics
+
+
+def run_suite(names: List[str], num_iterations: int, warmup_runs: int, measure_memory: bool = True) -> Dict[str, Any]:
+    """Run the benchmarks and return the results in the format of the baseline file."""
+    results: Dict[str, Any] = {
+        "version": RESULTS_VERSION,
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "environment": get_environment(),
+        "benchmarks": {},
+    }
+    for name, benchmark in get_benchmarks(names).items():
+        print(f"Running {name}...", file=sys.stderr)
+        results["benchmarks"][name] = run_benchmark(benchmark, num_iterations, warmup_runs, measure_memory)
+    return results
+
+
+def compare(
+    results: Dict[str, Any],
+    baseline: Dict[str, Any],
+    time_tolerance: float,
+    memory_tolerance: float,
+    min_memory_delta: float = 0.05,
+) -> List[Regression]:
+    """
+    Returns the metrics that regressed compared to the baseline: the median run time by more than time_tolerance, or
+    the median memory usage by more than memory_tolerance and min_memory_delta MiB.
+    """
+    regressions: List[Regression] = []
+    for name, metrics in results["benchmarks"].items():
+        baseline_metrics = baseline.get("benchmarks", {}).get(name)
+        if baseline_metrics is None:
+            continue
+        baseline_time = baseline_metrics.get("median_run_time") or 0
+        current_time = metrics["median_run_time"]
+        if baseline_time > 0 and current_time > baseline_time * (1 + time_tolerance):
+            regressions.append(Regression(name, "median_run_time", baseline_time, current_time))
+        baseline_memory = baseline_metrics.get("median_memory_usage") or 0
+        current_memory = metrics["median_memory_usage"]
+        if (
+            current_memory > baseline_memory * (1 + memory_tolerance)
+            and current_memory - baseline_memory > min_memory_delta
+        ):
+            regressions.append(Regression(name, "median_memory_usage", baseline_memory, current_memory))
+    return regressions
+
+
+def print_comparison(results: Dict[str, Any], baseline: Optional[Dict[str, Any]]) -> None:
+    from rich.console import Console
+    from rich.table import Table
+
+    table = Table(title="Offline Benchmarks", show_header=True, header_style="bold magenta")
+    table.add_column("Benchmark", style="cyan", no_wrap=True)
+    table.add_column("Median (ms)", style="green", justify="right")
+    table.add_column("p95 (ms)", style="green", justify="right")
+    table.add_column("Baseline (ms)", justify="right")
+    table.add_column("Change", justify="right")
+    table.add_column("Memory (MiB)", style="yellow", justify="right")
+    for name, metrics in results["benchmarks"].items():
+        baseline_metrics = (baseline or {}).get("benchmarks", {}).get(name)
+        baseline_time = baseline_metrics.get("median_run_time") if baseline_metrics else None
+        change = f"{(metrics['median_run_time'] / baseline_time - 1) * 100:+.1f}%" if baseline_time else "-"
+        table.add_row(
+            name,
+            f"{metrics['median_run_time'] * 1000:.3f}",
+            f"{metrics['p95_run_time'] * 1000:.3f}",
+            f"{baseline_time * 1000:.3f}" if baseline_time else "-",
+            change,
+            f"{metrics['median_memory_usage']:.3f}",
+        )
+    Console(stderr=True).print(table)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Run the offline benchmarks of the agent runtime.")
+    parser.add_argument("names", nargs="*", help="Run only the benchmarks whose names contain one of these names")
+    parser.add_argument("--iterations", type=int, default=50, help="Measured iterations per benchmark")
+    parser.add_argument("--warmup", type=int, default=5, help="Warm-up runs per benchmark")
+    parser.add_argument("--no-memory", action="store_true", help="Don't measure memory usage")
+    parser.add_argument("--output", type=Path, help="Write the results to this JSON file")
+    parser.add_argument("--baseline", type=Path, default=BASELINE_FILE, help="Baseline JSON file to compare with")
+    parser.add_argument("--save-baseline", action="store_true", help="Save the results as the baseline")
+    parser.add_argument("--time-tolerance", type=float, default=0.25, help="Allowed increase of the median run time")
+    parser.add_argument("--memory-tolerance", type=float, default=0.25, help="Allowed increase of the memory usage")
+    args = parser.parse_args(argv)
+
+    results = run_suite(args.names, args.iterations, args.warmup, measure_memory=not args.no_memory)
+    if args.output is not None:
+        args.output.write_text(json.dumps(results, indent=2))
+
+    baseline = json.loads(args.baseline.read_text()) if args.baseline.exists() else None
+    print_comparison(results, baseline)
+
+    if args.save_baseline:
+        if baseline is not None:
+            # Keep the baseline of the benchmarks that were not run
+            results["benchmarks"] = {**baseline.get("benchmarks", {}), **results["benchmarks"]}
+        args.baseline.write_text(json.dumps(results, indent=2) + "\n")
+        print(f"Saved baseline to {args.baseline}", file=sys.stderr)
+        return 0
+
+    if baseline is None:
+        return 0
+    regressions = compare(results, baseline, args.time_tolerance, args.memory_tolerance)
+    for regression in regressions:
+        print(
+            f"Regression: {regression.benchmark} {regression.metric} {regression.baseline:.6f} -> "
+            f"{regression.current:.6f} ({regression.ratio:.2f}x)",
+            file=sys.stderr,
+        )
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
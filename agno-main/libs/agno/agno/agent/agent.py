@@ -15,6 +15,7 @@ from typing import (
     Optional,
     Sequence,
     Set,
+    Tuple,
     Type,
     Union,
     cast,
@@ -40,7 +41,24 @@ from agno.run.team import TeamRunResponse
 from agno.storage.base import Storage
 from agno.storage.session.agent import AgentSession
 from agno.tools.function import Function
+from agno.tools.memo import ToolCallMemo
 from agno.tools.toolkit import Toolkit
+from agno.tracing.span import Span
+from agno.tracing.tracer import (
+    AGENT_RUN,
+    HISTORY,
+    KNOWLEDGE_SEARCH,
+    MEMORY_UPDATE,
+    STORAGE_READ,
+    STORAGE_WRITE,
+    SYSTEM_MESSAGE,
+    atrace_iterator,
+    is_tracing_enabled,
+    start_span,
+    trace_iterator,
+    trace_span,
+    use_span,
+)
 from agno.utils.log import (
     log_debug,
     log_error,
@@ -50,7 +68,8 @@ from agno.utils.log import (
     set_log_level_to_debug,
     set_log_level_to_info,
 )
-from agno.utils.message import get_text_from_message
+from agno.utils.message import get_history_messages, get_text_from_message
+from agno.utils.phases import STORAGE, phase
 from agno.utils.prompts import get_json_output_prompt
 from agno.utils.response import create_panel, escape_markdown_tags, format_tool_calls
 from agno.utils.safe_formatter import SafeFormatter
@@ -110,6 +129,9 @@ class Agent:
     num_history_responses: Optional[int] = None
     # Number of historical runs to include in the messages
     num_history_runs: int = 3
+    # Maximum number of tokens of history to include in the messages.
+    # If set, the most recent runs that fit in this budget are included instead of the last num_history_runs.
+    max_history_tokens: Optional[int] = None
 
     # --- Agent Knowledge ---
     knowledge: Optional[AgentKnowledge] = None
@@ -136,6 +158,19 @@ class Agent:
     show_tool_calls: bool = True
     # Maximum number of tool calls allowed.
     tool_call_limit: Optional[int] = None
+    # If True, run the tool calls of a model response concurrently in a thread pool.
+    # Tools with Function.parallel_safe=False run one at a time after the others.
+    run_tools_in_parallel: bool = False
+    # Maximum number of tool calls run concurrently. Defaults to the number of tool calls.
+    max_tool_workers: Optional[int] = None
+    # Seconds after which a tool call run in parallel is reported as failed. Can be overridden by Function.timeout.
+    tool_call_timeout: Optional[float] = None
+    # If True, identical tool calls (same function and arguments) reuse the result of the first call,
+    # and identical tool calls running concurrently share a single execution.
+    # Tools with Function.deduplicate=False always run.
+    deduplicate_tool_calls: bool = False
+    # Reuse the results of identical tool calls within a "run" or across the runs of a "session".
+    tool_call_memo_scope: Literal["run", "session"] = "run"
     # Controls which (if any) tool is called by the model.
     # "none" means the model will not call a tool and instead generates a message.
     # "auto" means the model can pick between generating a message or calling a tool.
@@ -294,6 +329,7 @@ class Agent:
         add_history_to_messages: bool = False,
         num_history_responses: Optional[int] = None,
         num_history_runs: int = 3,
+        max_history_tokens: Optional[int] = None,
         knowledge: Optional[AgentKnowledge] = None,
         add_references: bool = False,
         retriever: Optional[Callable[..., Optional[List[Dict]]]] = None,
@@ -303,6 +339,11 @@ class Agent:
         tools: Optional[List[Union[Toolkit, Callable, Function, Dict]]] = None,
         show_tool_calls: bool = True,
         tool_call_limit: Optional[int] = None,
+        run_tools_in_parallel: bool = False,
+        max_tool_workers: Optional[int] = None,
+        tool_call_timeout: Optional[float] = None,
+        deduplicate_tool_calls: bool = False,
+        tool_call_memo_scope: Literal["run", "session"] = "run",
         tool_choice: Optional[Union[str, Dict[str, Any]]] = None,
         tool_hooks: Optional[List[Callable]] = None,
         reasoning: bool = False,
@@ -376,6 +417,7 @@ class Agent:
         self.add_history_to_messages = add_history_to_messages
         self.num_history_responses = num_history_responses
         self.num_history_runs = num_history_runs
+        self.max_history_tokens = max_history_tokens
 
         self.knowledge = knowledge
         self.add_references = add_references
@@ -388,6 +430,11 @@ class Agent:
         self.tools = tools
         self.show_tool_calls = show_tool_calls
         self.tool_call_limit = tool_call_limit
+        self.run_tools_in_parallel = run_tools_in_parallel
+        self.max_tool_workers = max_tool_workers
+        self.tool_call_timeout = tool_call_timeout
+        self.deduplicate_tool_calls = deduplicate_tool_calls
+        self.tool_call_memo_scope = tool_call_memo_scope
         self.tool_choice = tool_choice
         self.tool_hooks = tool_hooks
 
@@ -466,6 +513,12 @@ class Agent:
         self.agent_session: Optional[AgentSession] = None
 
         self._tool_instructions: Optional[List[str]] = None
+        # The static prefix of the default system message and the inputs it was built from
+        self._system_message_prefix: Optional[Tuple[Tuple[Any, ...], str, str]] = None
+
+        # Results of the tool calls of the current run or session, see deduplicate_tool_calls
+        self._tool_call_memo: Optional[ToolCallMemo] = None
+        self._tool_call_memo_session_id: Optional[str] = None
 
         self._formatter: Optional[SafeFormatter] = None
 
@@ -960,7 +1013,8 @@ class Agent:
             # Add AgentRun to memory
             self.memory.add_run(session_id=session_id, run=self.run_response)
 
-            self._make_memories_and_summaries(run_messages, session_id, user_id, messages)  # type: ignore
+            with trace_span(MEMORY_UPDATE, {"agno.session_id": session_id}):
+                self._make_memories_and_summaries(run_messages, session_id, user_id, messages)  # type: ignore
 
             if self.session_metrics is None:
                 self.session_metrics = self.calculate_metrics(run_messages.messages)  # Calculate metrics for the run
@@ -1100,21 +1154,22 @@ class Agent:
                     if self.stream and self.stream is True:
                         log_debug("Setting stream=False as response_model is set")
                         self.stream = False
-                    run_response: RunResponse = next(
-                        self._run(
-                            message=message,
-                            stream=False,
-                            user_id=user_id,
-                            session_id=session_id,
-                            audio=audio,
-                            images=images,
-                            videos=videos,
-                            files=files,
-                            messages=messages,
-                            stream_intermediate_steps=stream_intermediate_steps,
-                            **kwargs,
+                    with use_span(self._start_run_span(session_id, user_id), end_on_exit=True):
+                        run_response: RunResponse = next(
+                            self._run(
+                                message=message,
+                                stream=False,
+                                user_id=user_id,
+                                session_id=session_id,
+                                audio=audio,
+                                images=images,
+                                videos=videos,
+                                files=files,
+                                messages=messages,
+                                stream_intermediate_steps=stream_intermediate_steps,
+                                **kwargs,
+                            )
                         )
-                    )
 
                     # Do a final check confirming the content is in the response_model format
                     if isinstance(run_response.content, self.response_model):
@@ -1154,7 +1209,7 @@ class Agent:
                             stream_intermediate_steps=stream_intermediate_steps,
                             **kwargs,
                         )
-                        return resp
+                        return trace_iterator(resp, self._start_run_span(session_id, user_id, stream=True))
                     else:
                         resp = self._run(
                             message=message,
@@ -1169,7 +1224,8 @@ class Agent:
                             stream_intermediate_steps=stream_intermediate_steps,
                             **kwargs,
                         )
-                        return next(resp)
+                        with use_span(self._start_run_span(session_id, user_id), end_on_exit=True):
+                            return next(resp)
             except ModelProviderError as e:
                 log_warning(f"Attempt {attempt + 1}/{num_attempts} failed: {str(e)}")
                 if isinstance(e, StopAgentRun):
@@ -1256,7 +1312,7 @@ class Agent:
             await self.aresolve_run_context()
 
         # 3. Read existing session from storage
-        self.read_from_storage(session_id=session_id, user_id=user_id)
+        await self.aread_from_storage(session_id=session_id, user_id=user_id)
 
         # 4. Prepare run messages
         run_messages: RunMessages = self.get_run_messages(
@@ -1604,7 +1660,8 @@ class Agent:
             # Add AgentRun to memory
             self.memory.add_run(session_id=session_id, run=self.run_response)
 
-            await self._amake_memories_and_summaries(run_messages, session_id, user_id, messages)  # type: ignore
+            with trace_span(MEMORY_UPDATE, {"agno.session_id": session_id}):
+                await self._amake_memories_and_summaries(run_messages, session_id, user_id, messages)  # type: ignore
 
             if self.session_metrics is None:
                 self.session_metrics = self.calculate_metrics(run_messages.messages)  # Calculate metrics for the run
@@ -1620,7 +1677,7 @@ class Agent:
             )
 
         # 11. Save session to storage
-        self.write_to_storage(user_id=user_id, session_id=session_id)
+        await self.awrite_to_storage(user_id=user_id, session_id=session_id)
 
         # 12. Save output to file if save_response_to_file is set
         self.save_run_response_to_file(message=message, session_id=session_id)
@@ -1706,19 +1763,20 @@ class Agent:
                     if self.stream and self.stream is True:
                         log_debug("Setting stream=False as response_model is set")
                         self.stream = False
-                    run_response = await self._arun(
-                        message=message,
-                        stream=False,
-                        user_id=user_id,
-                        session_id=session_id,
-                        audio=audio,
-                        images=images,
-                        videos=videos,
-                        files=files,
-                        messages=messages,
-                        stream_intermediate_steps=stream_intermediate_steps,
-                        **kwargs,
-                    ).__anext__()
+                    with use_span(self._start_run_span(session_id, user_id), end_on_exit=True):
+                        run_response = await self._arun(
+                            message=message,
+                            stream=False,
+                            user_id=user_id,
+                            session_id=session_id,
+                            audio=audio,
+                            images=images,
+                            videos=videos,
+                            files=files,
+                            messages=messages,
+                            stream_intermediate_steps=stream_intermediate_steps,
+                            **kwargs,
+                        ).__anext__()
 
                     # Do a final check confirming the content is in the response_model format
                     if isinstance(run_response.content, self.response_model):
@@ -1758,7 +1816,7 @@ class Agent:
                             stream_intermediate_steps=stream_intermediate_steps,
                             **kwargs,
                         )
-                        return resp
+                        return atrace_iterator(resp, self._start_run_span(session_id, user_id, stream=True))
                     else:
                         resp = self._arun(
                             message=message,
@@ -1773,7 +1831,8 @@ class Agent:
                             stream_intermediate_steps=stream_intermediate_steps,
                             **kwargs,
                         )
-                        return await resp.__anext__()
+                        with use_span(self._start_run_span(session_id, user_id), end_on_exit=True):
+                            return await resp.__anext__()
             except ModelProviderError as e:
                 log_warning(f"Attempt {attempt + 1}/{num_attempts} failed: {str(e)}")
                 if isinstance(e, StopAgentRun):
@@ -1806,6 +1865,23 @@ class Agent:
         else:
             raise Exception(f"Failed after {num_attempts} attempts.")
 
+    def _start_run_span(self, session_id: str, user_id: Optional[str] = None, stream: bool = False) -> Optional[Span]:
+        """Start the span of a run, if tracing is enabled."""
+        if not is_tracing_enabled():
+            return None
+        return start_span(
+            AGENT_RUN,
+            {
+                "agno.agent.id": self.agent_id,
+                "agno.agent.name": self.name,
+                "agno.session_id": session_id,
+                "agno.user_id": user_id,
+                "agno.team.id": self.team_id,
+                "agno.run.stream": stream,
+                "gen_ai.request.model": self.model.id if self.model is not None else None,
+            },
+        )
+
     def create_run_response(
         self,
         content: Optional[Any] = None,
@@ -1854,6 +1930,9 @@ class Agent:
     ) -> None:
         session_messages: List[Message] = []
         self.memory = cast(Memory, self.memory)
+        if self.memory.memory_worker is not None:
+            self._queue_memories_and_summaries(run_messages, session_id, user_id, messages)
+            return
         if self.enable_user_memories and run_messages.user_message is not None:
             self.memory.create_user_memories(message=run_messages.user_message.get_content_string(), user_id=user_id)
 
@@ -1885,6 +1964,43 @@ class Agent:
         if self.enable_session_summaries:
             self.memory.create_session_summary(session_id=session_id, user_id=user_id)
 
+    def _queue_memories_and_summaries(
+        self,
+        run_messages: RunMessages,
+        session_id: str,
+        user_id: Optional[str] = None,
+        messages: Optional[List[Message]] = None,
+    ) -> None:
+        """Queue the memories and summary of the run on the memory worker, instead of creating them now"""
+        from agno.memory.v2.worker import MemoryTask
+
+        self.memory = cast(Memory, self.memory)
+        task_messages: List[Message] = []
+        if self.enable_user_memories and run_messages.user_message is not None:
+            task_messages.append(run_messages.user_message)
+            for _im in messages or []:
+                if isinstance(_im, Message):
+                    task_messages.append(_im)
+                elif isinstance(_im, dict):
+                    try:
+                        task_messages.append(Message(**_im))
+                    except Exception as e:
+                        log_warning(f"Failed to validate message: {e}")
+                else:
+                    log_warning(f"Unsupported message type: {type(_im)}")
+        if not task_messages and not self.enable_session_summaries:
+            return
+        self.memory.memory_worker.submit(  # type: ignore
+            MemoryTask(
+                memory=self.memory,
+                user_id=user_id or "default",
+                session_id=session_id,
+                messages=task_messages,
+                create_user_memories=self.enable_user_memories,
+                create_session_summary=self.enable_session_summaries,
+            )
+        )
+
     async def _amake_memories_and_summaries(
         self,
         run_messages: RunMessages,
@@ -1894,6 +2010,9 @@ class Agent:
     ) -> None:
         self.memory = cast(Memory, self.memory)
         session_messages: List[Message] = []
+        if self.memory.memory_worker is not None:
+            self._queue_memories_and_summaries(run_messages, session_id, user_id, messages)
+            return
         if self.enable_user_memories and run_messages.user_message is not None:
             await self.memory.acreate_user_memories(
                 message=run_messages.user_message.get_content_string(), user_id=user_id
@@ -1983,6 +2102,8 @@ class Agent:
         # Create new functions if we don't have any set on the model OR if the list of tool names is different than what is set on the model
         existing_model_functions = model.get_functions()
         if existing_model_functions is None or set(existing_model_functions.keys()) != set(agent_tool_names):
+            # Rebuild the tool instructions, so they are not repeated in the system message
+            self._tool_instructions = None
             # Get Agent tools
             if agent_tools is not None and len(agent_tools) > 0:
                 log_debug("Processing tools for model")
@@ -2123,6 +2244,26 @@ class Agent:
         if self.tool_call_limit is not None:
             self.model.tool_call_limit = self.tool_call_limit
 
+        # Set parallel tool execution on the Model
+        self.model.run_tools_in_parallel = self.run_tools_in_parallel
+        self.model.max_tool_workers = self.max_tool_workers
+        self.model.tool_call_timeout = self.tool_call_timeout
+
+        # Set the tool call memo on the Model
+        if self.deduplicate_tool_calls:
+            self.model.set_tool_call_memo(self._get_tool_call_memo(session_id=session_id))
+
+    def _get_tool_call_memo(self, session_id: Optional[str]) -> ToolCallMemo:
+        """Returns the tool call memo for a new run, keeping the memo of the session if tool_call_memo_scope="session"."""
+        if (
+            self._tool_call_memo is None
+            or self.tool_call_memo_scope == "run"
+            or self._tool_call_memo_session_id != session_id
+        ):
+            self._tool_call_memo = ToolCallMemo()
+            self._tool_call_memo_session_id = session_id
+        return self._tool_call_memo
+
     def resolve_run_context(self) -> None:
         from inspect import signature
 
@@ -2439,7 +2580,8 @@ class Agent:
         """
         if self.storage is not None:
             # Get a single session from storage
-            self.agent_session = cast(AgentSession, self.storage.read(session_id=session_id))
+            with phase(STORAGE), trace_span(STORAGE_READ, {"agno.session_id": session_id}):
+                self.agent_session = cast(AgentSession, self.storage.read(session_id=session_id))
             if self.agent_session is not None:
                 # Load the agent session
                 self.load_agent_session(session=self.agent_session)
@@ -2455,10 +2597,47 @@ class Agent:
             Optional[AgentSession]: The saved AgentSession or None if not saved.
         """
         if self.storage is not None:
-            self.agent_session = cast(
-                AgentSession,
-                self.storage.upsert(session=self.get_agent_session(session_id=session_id, user_id=user_id)),
-            )
+            with phase(STORAGE), trace_span(STORAGE_WRITE, {"agno.session_id": session_id}):
+                self.agent_session = cast(
+                    AgentSession,
+                    self.storage.upsert(session=self.get_agent_session(session_id=session_id, user_id=user_id)),
+                )
+        return self.agent_session
+
+    async def aread_from_storage(
+        self,
+        session_id: str,
+        user_id: Optional[str] = None,
+    ) -> Optional[AgentSession]:
+        """Load the AgentSession from storage without blocking the event loop
+
+        Returns:
+            Optional[AgentSession]: The loaded AgentSession or None if not found.
+        """
+        if self.storage is not None:
+            # Get a single session from storage
+            with phase(STORAGE), trace_span(STORAGE_READ, {"agno.session_id": session_id}):
+                self.agent_session = cast(AgentSession, await self.storage.aread(session_id=session_id))
+            if self.agent_session is not None:
+                # Load the agent session
+                self.load_agent_session(session=self.agent_session)
+            else:
+                # New session, just reset the state
+                self.session_name = None
+        return self.agent_session
+
+    async def awrite_to_storage(self, session_id: str, user_id: Optional[str] = None) -> Optional[AgentSession]:
+        """Save the AgentSession to storage without blocking the event loop
+
+        Returns:
+            Optional[AgentSession]: The saved AgentSession or None if not saved.
+        """
+        if self.storage is not None:
+            with phase(STORAGE), trace_span(STORAGE_WRITE, {"agno.session_id": session_id}):
+                self.agent_session = cast(
+                    AgentSession,
+                    await self.storage.aupsert(session=self.get_agent_session(session_id=session_id, user_id=user_id)),
+                )
         return self.agent_session
 
     def add_introduction(self, introduction: str) -> None:
@@ -2596,6 +2775,24 @@ class Agent:
             raise Exception("model not set")
 
         # 3. Build and return the default system message for the Agent.
+        # The static content comes first and the content that changes between runs (the current time, memories and
+        # summaries) last, so the prefix is stable and can be cached by the model provider.
+        static_content = self._get_system_message_prefix()
+        volatile_content = self._get_system_message_suffix(session_id=session_id, user_id=user_id)
+
+        system_message_content = "\n\n".join(content for content in (static_content, volatile_content) if content)
+        if not system_message_content:
+            return None
+        return Message(
+            role=self.system_message_role,
+            content=system_message_content,
+            cache_breakpoint=len(static_content) if static_content else None,
+        )
+
+    def _get_system_message_prefix(self) -> str:
+        """Return the static part of the default system message, which is only rebuilt when its inputs change."""
+        self.model = cast(Model, self.model)
+
         # 3.1 Build the list of instructions for the system message
         instructions: List[str] = []
         if self.instructions is not None:
@@ -2612,46 +2809,74 @@ class Agent:
         if _model_instructions is not None:
             instructions.extend(_model_instructions)
 
+        system_message_from_model = self.model.get_system_message_for_model()
+        add_json_output_prompt = self.response_model is not None and not (
+            self.model.supports_native_structured_outputs
+            and (not self.use_json_mode or self.structured_outputs is True)
+        )
+        prefix_key: Tuple[Any, ...] = (
+            self.description,
+            self.goal,
+            self.role,
+            tuple(instructions),
+            self.markdown and self.response_model is None,
+            self.name if self.add_name_to_instructions else None,
+            tuple(self._tool_instructions or ()),
+            self.expected_output,
+            self.additional_context,
+            # The rendered instructions, as the members can be changed in place
+            self.get_transfer_instructions() if self.has_team and self.add_transfer_instructions else None,
+            system_message_from_model,
+            self.response_model if add_json_output_prompt else None,
+        )
+
+        if self._system_message_prefix is None or self._system_message_prefix[0] != prefix_key:
+            template, static_content = self._build_system_message_prefix(
+                instructions=instructions,
+                system_message_from_model=system_message_from_model,
+                add_json_output_prompt=add_json_output_prompt,
+            )
+            self._system_message_prefix = (prefix_key, template, static_content)
+        else:
+            log_debug("Using cached system message prefix")
+
+        _, template, static_content = self._system_message_prefix
+        # Format the system message with the session state variables
+        if self.add_state_in_messages:
+            template = self.format_message_with_state_variables(template)
+        return (template + static_content).strip()
+
+    def _build_system_message_prefix(
+        self, instructions: List[str], system_message_from_model: Optional[str], add_json_output_prompt: bool
+    ) -> Tuple[str, str]:
+        """Build the static part of the default system message.
+
+        Returns:
+            Tuple[str, str]: The part formatted with the session state variables and the rest of the static part.
+        """
         # 3.2 Build a list of additional information for the system message
         additional_information: List[str] = []
         # 3.2.1 Add instructions for using markdown
         if self.markdown and self.response_model is None:
             additional_information.append("Use markdown to format your answers.")
-        # 3.2.2 Add the current datetime
-        if self.add_datetime_to_instructions:
-            from datetime import datetime
-
-            tz = None
-
-            if self.timezone_identifier:
-                try:
-                    from zoneinfo import ZoneInfo
-
-                    tz = ZoneInfo(self.timezone_identifier)
-                except Exception:
-                    log_warning("Invalid timezone identifier")
-
-            time = datetime.now(tz) if tz else datetime.now()
-
-            additional_information.append(f"The current time is {time}.")
-        # 3.2.3 Add agent name if provided
+        # 3.2.2 Add agent name if provided
         if self.name is not None and self.add_name_to_instructions:
             additional_information.append(f"Your name is: {self.name}.")
 
         # 3.3 Build the default system message for the Agent.
-        system_message_content: str = ""
+        template: str = ""
         # 3.3.1 First add the Agent description if provided
         if self.description is not None:
-            system_message_content += f"{self.description}\n"
+            template += f"{self.description}\n"
         # 3.3.2 Then add the Agent goal if provided
         if self.goal is not None:
-            system_message_content += f"\n<your_goal>\n{self.goal}\n</your_goal>\n\n"
+            template += f"\n<your_goal>\n{self.goal}\n</your_goal>\n\n"
         # 3.3.3 Then add the Agent role if provided
         if self.role is not None:
-            system_message_content += f"\n<your_role>\n{self.role}\n</your_role>\n\n"
+            template += f"\n<your_role>\n{self.role}\n</your_role>\n\n"
         # 3.3.4 Then add instructions for transferring tasks to team members
         if self.has_team and self.add_transfer_instructions:
-            system_message_content += (
+            template += (
                 "<agent_team>\n"
                 "You are the leader of a team of AI Agents:\n"
                 "- You can either respond directly or transfer tasks to other Agents in your team depending on the tools available to them.\n"
@@ -2665,40 +2890,67 @@ class Agent:
             )
         # 3.3.5 Then add instructions for the Agent
         if len(instructions) > 0:
-            system_message_content += "<instructions>"
+            template += "<instructions>"
             if len(instructions) > 1:
                 for _upi in instructions:
-                    system_message_content += f"\n- {_upi}"
+                    template += f"\n- {_upi}"
             else:
-                system_message_content += "\n" + instructions[0]
-            system_message_content += "\n</instructions>\n\n"
+                template += "\n" + instructions[0]
+            template += "\n</instructions>\n\n"
         # 3.3.6 Add additional information
         if len(additional_information) > 0:
-            system_message_content += "<additional_information>"
+            template += "<additional_information>"
             for _ai in additional_information:
-                system_message_content += f"\n- {_ai}"
-            system_message_content += "\n</additional_information>\n\n"
+                template += f"\n- {_ai}"
+            template += "\n</additional_information>\n\n"
         # 3.3.7 Then add instructions for the tools
         if self._tool_instructions is not None:
             for _ti in self._tool_instructions:
-                system_message_content += f"{_ti}\n"
+                template += f"{_ti}\n"
 
-        # Format the system message with the session state variables
-        if self.add_state_in_messages:
-            system_message_content = self.format_message_with_state_variables(system_message_content)
-
-        # 3.3.7 Then add the expected output
+        static_content: str = ""
+        # 3.3.8 Then add the expected output
         if self.expected_output is not None:
-            system_message_content += f"<expected_output>\n{self.expected_output.strip()}\n</expected_output>\n\n"
-        # 3.3.8 Then add additional context
+            static_content += f"<expected_output>\n{self.expected_output.strip()}\n</expected_output>\n\n"
+        # 3.3.9 Then add additional context
         if self.additional_context is not None:
-            system_message_content += f"{self.additional_context}\n"
-        # 3.3.9 Then add information about the team members
+            static_content += f"{self.additional_context}\n"
+        # 3.3.10 Then add information about the team members
         if self.has_team and self.add_transfer_instructions:
-            system_message_content += (
+            static_content += (
                 f"<transfer_instructions>\n{self.get_transfer_instructions().strip()}\n</transfer_instructions>\n\n"
             )
-        # 3.3.10 Then add memories to the system prompt
+        # 3.3.11 Then add the system message from the Model
+        if system_message_from_model is not None:
+            static_content += system_message_from_model
+        # Add the JSON output prompt if response_model is provided and structured_outputs is False (only applicable if the model supports structured outputs)
+        if add_json_output_prompt:
+            static_content += f"{get_json_output_prompt(self.response_model)}"  # type: ignore
+        return template, static_content
+
+    def _get_system_message_suffix(self, session_id: str, user_id: Optional[str] = None) -> str:
+        """Return the part of the default system message that changes between runs."""
+        system_message_content: str = ""
+        # 3.4.1 Add the current datetime
+        if self.add_datetime_to_instructions:
+            from datetime import datetime
+
+            tz = None
+
+            if self.timezone_identifier:
+                try:
+                    from zoneinfo import ZoneInfo
+
+                    tz = ZoneInfo(self.timezone_identifier)
+                except Exception:
+                    log_warning("Invalid timezone identifier")
+
+            time = datetime.now(tz) if tz else datetime.now()
+
+            system_message_content += (
+                f"<additional_information>\n- The current time is {time}.\n</additional_information>\n\n"
+            )
+        # 3.4.2 Then add memories to the system prompt
         if self.memory:
             if isinstance(self.memory, AgentMemory) and self.memory.create_user_memories:
                 if self.memory.memories and len(self.memory.memories) > 0:
@@ -2756,7 +3008,7 @@ class Agent:
                         "</updating_user_memories>\n\n"
                     )
 
-            # 3.3.11 Then add a summary of the interaction to the system prompt
+            # 3.4.3 Then add a summary of the interaction to the system prompt
             if isinstance(self.memory, AgentMemory) and self.memory.create_session_summary:
                 if self.memory.summary is not None:
                     system_message_content += "Here is a brief summary of your previous interactions:\n\n"
@@ -2781,24 +3033,7 @@ class Agent:
                         "You should ALWAYS prefer information from this conversation over the past summary.\n\n"
                     )
 
-        # 3.3.12 Finally, add the system message from the Model
-        system_message_from_model = self.model.get_system_message_for_model()
-        if system_message_from_model is not None:
-            system_message_content += system_message_from_model
-
-        # Add the JSON output prompt if response_model is provided and structured_outputs is False (only applicable if the model supports structured outputs)
-        if self.response_model is not None and not (
-            self.model.supports_native_structured_outputs
-            and (not self.use_json_mode or self.structured_outputs is True)
-        ):
-            system_message_content += f"{get_json_output_prompt(self.response_model)}"  # type: ignore
-
-        # Return the system message
-        return (
-            Message(role=self.system_message_role, content=system_message_content.strip())  # type: ignore
-            if system_message_content
-            else None
-        )
+        return system_message_content.strip()
 
     def get_user_message(
         self,
@@ -2960,7 +3195,8 @@ class Agent:
         self.run_response = cast(RunResponse, self.run_response)
 
         # 1. Add system message to run_messages
-        system_message = self.get_system_message(session_id=session_id, user_id=user_id)
+        with trace_span(SYSTEM_MESSAGE):
+            system_message = self.get_system_message(session_id=session_id, user_id=user_id)
         if system_message is not None:
             run_messages.system_message = system_message
             run_messages.messages.append(system_message)
@@ -2997,28 +3233,29 @@ class Agent:
 
         # 3. Add history to run_messages
         if self.add_history_to_messages:
-            from copy import deepcopy
-
-            history: List[Message] = []
-            if isinstance(self.memory, AgentMemory):
-                history = self.memory.get_messages_from_last_n_runs(
-                    last_n=self.num_history_runs, skip_role=self.system_message_role
-                )
-            elif isinstance(self.memory, Memory):
-                history = self.memory.get_messages_from_last_n_runs(
-                    session_id=session_id, last_n=self.num_history_runs, skip_role=self.system_message_role
-                )
-            if len(history) > 0:
-                # Create a deep copy of the history messages to avoid modifying the original messages
-                history_copy = [deepcopy(msg) for msg in history]
-
-                # Tag each message as coming from history
-                for _msg in history_copy:
-                    _msg.from_history = True
+            with trace_span(HISTORY) as span:
+                history: List[Message] = []
+                last_n = self.num_history_runs if self.max_history_tokens is None else None
+                if isinstance(self.memory, AgentMemory):
+                    history = self.memory.get_messages_from_last_n_runs(
+                        last_n=last_n, skip_role=self.system_message_role, max_tokens=self.max_history_tokens
+                    )
+                elif isinstance(self.memory, Memory):
+                    history = self.memory.get_messages_from_last_n_runs(
+                        session_id=session_id,
+                        last_n=last_n,
+                        skip_role=self.system_message_role,
+                        max_tokens=self.max_history_tokens,
+                    )
+                if len(history) > 0:
+                    # Tag each message as coming from history, without modifying or copying the original messages
+                    history_messages = get_history_messages(history)
 
-                log_debug(f"Adding {len(history_copy)} messages from history")
+                    log_debug(f"Adding {len(history_messages)} messages from history")
 
-                run_messages.messages += history_copy
+                    run_messages.messages += history_messages
+                if span is not None:
+                    span.set_attribute("agno.history.num_messages", len(history))
 
         # 4.Add user message to run_messages
         user_message: Optional[Message] = None
@@ -3296,6 +3533,15 @@ class Agent:
         self, query: str, num_documents: Optional[int] = None, **kwargs
     ) -> Optional[List[Dict[str, Any]]]:
         """Return a list of references from the knowledge base"""
+        with trace_span(KNOWLEDGE_SEARCH, {"agno.knowledge.num_documents": num_documents}) as span:
+            docs = self._get_relevant_docs_from_knowledge(query=query, num_documents=num_documents, **kwargs)
+            if span is not None:
+                span.set_attribute("agno.knowledge.num_results", len(docs or []))
+            return docs
+
+    def _get_relevant_docs_from_knowledge(
+        self, query: str, num_documents: Optional[int] = None, **kwargs
+    ) -> Optional[List[Dict[str, Any]]]:
         from agno.document import Document
 
         if self.retriever is not None and callable(self.retriever):
@@ -3324,6 +3570,15 @@ class Agent:
         self, query: str, num_documents: Optional[int] = None, **kwargs
     ) -> Optional[List[Dict[str, Any]]]:
         """Get relevant documents from knowledge base asynchronously."""
+        with trace_span(KNOWLEDGE_SEARCH, {"agno.knowledge.num_documents": num_documents}) as span:
+            docs = await self._aget_relevant_docs_from_knowledge(query=query, num_documents=num_documents, **kwargs)
+            if span is not None:
+                span.set_attribute("agno.knowledge.num_results", len(docs or []))
+            return docs
+
+    async def _aget_relevant_docs_from_knowledge(
+        self, query: str, num_documents: Optional[int] = None, **kwargs
+    ) -> Optional[List[Dict[str, Any]]]:
         from agno.document import Document
 
         if self.retriever is not None and callable(self.retriever):
@@ -0,0 +1,143 @@
+from collections import OrderedDict
+from contextlib import asynccontextmanager, contextmanager
+from copy import copy, deepcopy
+from threading import Lock
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional
+
+from agno.agent.agent import Agent
+from agno.memory.agent import AgentMemory
+from agno.models.base import Model
+from agno.tools.function import Function
+from agno.tools.toolkit import Toolkit
+from agno.utils.log import log_debug
+
+# State of an Agent that changes during a run and is reset when a pooled Agent is released
+RUN_STATE_FIELDS = (
+    "run_id",
+    "run_input",
+    "run_messages",
+    "run_response",
+    "agent_session",
+    "session_metrics",
+    "images",
+    "audio",
+    "videos",
+    "_tool_instructions",
+    "_tool_call_memo",
+    "_tool_call_memo_session_id",
+)
+
+
+def _copy_model(model: Optional[Model]) -> Optional[Model]:
+    """Copy a Model without its per-run state, the configuration and clients are shared."""
+    if model is None:
+        return None
+    model_copy = copy(model)
+    model_copy.clear()
+    model_copy.reset_tools_and_functions()
+    return model_copy
+
+
+def _copy_tools(tools: Optional[List[Any]]) -> Optional[List[Any]]:
+    """Copy the Functions of the tools, which hold the Agent they run for. Entrypoints and schemas are shared."""
+    if tools is None:
+        return None
+    tools_copy: List[Any] = []
+    for tool in tools:
+        if isinstance(tool, Toolkit):
+            toolkit = copy(tool)
+            toolkit.functions = OrderedDict((name, f.model_copy()) for name, f in tool.functions.items())
+            tools_copy.append(toolkit)
+        elif isinstance(tool, Function):
+            tools_copy.append(tool.model_copy())
+        else:
+            tools_copy.append(tool)
+    return tools_copy
+
+
+class AgentPool:
+    def __init__(self, agent: Agent, max_idle: int = 16):
+        """
+        A pool of lightweight copies of an Agent, so that concurrent runs (e.g. playground requests) don't share
+        run state, without paying for Agent.deep_copy on every request.
+
+        Pooled agents share the configuration of the agent: the model clients and settings, toolkits, knowledge,
+        storage and Memory. Each pooled agent has its own model state, tool Functions, AgentMemory and session
+        state, which are reset from the agent when it is released.
+
+        Args:
+            agent (Agent): The agent to pool copies of. Changes to it apply to pooled agents when they are released.
+            max_idle (int): The maximum number of idle agents kept for reuse.
+        """
+        self.agent = agent
+        self.max_idle = max_idle
+        self._idle: List[Agent] = []
+        self._lock = Lock()
+
+    @property
+    def num_idle(self) -> int:
+        return len(self._idle)
+
+    def _create(self) -> Agent:
+        pooled = copy(self.agent)
+        pooled.model = _copy_model(self.agent.model)
+        pooled.reasoning_model = _copy_model(self.agent.reasoning_model)
+        pooled.tools = _copy_tools(self.agent.tools)
+        if self.agent.reasoning_agent is not None:
+            pooled.reasoning_agent = self.agent.reasoning_agent.deep_copy()
+        self._reset(pooled)
+        log_debug(f"Created pooled agent for: {self.agent.agent_id}")
+        return pooled
+
+    def _reset(self, pooled: Agent) -> None:
+        """Reset the state of a pooled agent from the agent, keeping its own model, tools and reasoning agent."""
+        state: Dict[str, Any] = dict(self.agent.__dict__)
+        for field_name in ("model", "reasoning_model", "tools", "reasoning_agent"):
+            state[field_name] = pooled.__dict__[field_name]
+        pooled.__dict__.update(state)
+
+        for field_name in RUN_STATE_FIELDS:
+            setattr(pooled, field_name, None)
+        # State that is updated in place during a run
+        pooled.session_state = deepcopy(self.agent.session_state)
+        pooled.team_session_state = deepcopy(self.agent.team_session_state)
+        pooled.team_data = deepcopy(self.agent.team_data)
+        pooled.extra_data = deepcopy(self.agent.extra_data)
+        pooled.context = copy(self.agent.context)
+        if isinstance(self.agent.memory, AgentMemory):
+            # AgentMemory holds the runs of a single session, Memory is shared as it is keyed by session
+            pooled.memory = self.agent.memory.deep_copy()
+        if pooled.model is not None:
+            pooled.model.clear()
+
+    def acquire(self) -> Agent:
+        """Returns an idle pooled agent, or a new one if all are in use."""
+        with self._lock:
+            if self._idle:
+                return self._idle.pop()
+        return self._create()
+
+    def release(self, pooled: Agent) -> None:
+        """Reset a pooled agent and make it available again."""
+        self._reset(pooled)
+        with self._lock:
+            if len(self._idle) < self.max_idle:
+                self._idle.append(pooled)
+
+    @contextmanager
+    def lease(self) -> Iterator[Agent]:
+        """Use a pooled agent for the duration of the block."""
+        pooled = self.acquire()
+        try:
+            yield pooled
+        finally:
+            self.release(pooled)
+
+    @asynccontextmanager
+    async def alease(self) -> AsyncIterator[Agent]:
+        """Use a pooled agent for the duration of the async block."""
+        pooled = self.acquire()
+        try:
+            yield pooled
+        finally:
+            self.release(pooled)
@@ -10,14 +10,14 @@ def create_agent_session(session: AgentSessionCreate, monitor: bool = False) ->
         return
 
     log_debug("Logging Agent Session")
-    with api.AuthenticatedClient() as api_client:
-        try:
-            api_client.post(
-                ApiRoutes.AGENT_SESSION_CREATE if monitor else ApiRoutes.AGENT_TELEMETRY_SESSION_CREATE,
-                json={"session": session.model_dump(exclude_none=True)},
-            )
-        except Exception as e:
-            log_debug(f"Could not create Agent session: {e}")
+    api_client = api.AuthenticatedClient()
+    try:
+        api_client.post(
+            ApiRoutes.AGENT_SESSION_CREATE if monitor else ApiRoutes.AGENT_TELEMETRY_SESSION_CREATE,
+            json={"session": session.model_dump(exclude_none=True)},
+        )
+    except Exception as e:
+        log_debug(f"Could not create Agent session: {e}")
     return
 
 
@@ -26,14 +26,14 @@ def create_agent_run(run: AgentRunCreate, monitor: bool = False) -> None:
         return
 
     log_debug("Logging Agent Run")
-    with api.AuthenticatedClient() as api_client:
-        try:
-            api_client.post(
-                ApiRoutes.AGENT_RUN_CREATE if monitor else ApiRoutes.AGENT_TELEMETRY_RUN_CREATE,
-                json={"run": run.model_dump(exclude_none=True)},
-            )
-        except Exception as e:
-            log_debug(f"Could not create Agent run: {e}")
+    api_client = api.AuthenticatedClient()
+    try:
+        api_client.post(
+            ApiRoutes.AGENT_RUN_CREATE if monitor else ApiRoutes.AGENT_TELEMETRY_RUN_CREATE,
+            json={"run": run.model_dump(exclude_none=True)},
+        )
+    except Exception as e:
+        log_debug(f"Could not create Agent run: {e}")
     return
 
 
@@ -42,11 +42,11 @@ async def acreate_agent_run(run: AgentRunCreate, monitor: bool = False) -> None:
         return
 
     log_debug("Logging Agent Run (Async)")
-    async with api.AuthenticatedAsyncClient() as api_client:
-        try:
-            await api_client.post(
-                ApiRoutes.AGENT_RUN_CREATE if monitor else ApiRoutes.AGENT_TELEMETRY_RUN_CREATE,
-                json={"run": run.model_dump(exclude_none=True)},
-            )
-        except Exception as e:
-            log_debug(f"Could not create Agent run: {e}")
+    api_client = api.AuthenticatedAsyncClient()
+    try:
+        await api_client.post(
+            ApiRoutes.AGENT_RUN_CREATE if monitor else ApiRoutes.AGENT_TELEMETRY_RUN_CREATE,
+            json={"run": run.model_dump(exclude_none=True)},
+        )
+    except Exception as e:
+        log_debug(f"Could not create Agent run: {e}")
@@ -1,13 +1,15 @@
+import asyncio
 from os import getenv
-from typing import Dict, Optional
+from typing import Dict, Optional, Tuple
 
 from httpx import AsyncClient as HttpxAsyncClient
 from httpx import Client as HttpxClient
-from httpx import Response
+from httpx import Request, Response
 
 from agno.cli.credentials import read_auth_token
 from agno.cli.settings import agno_cli_settings
 from agno.constants import AGNO_API_KEY_ENV_VAR
+from agno.utils.http import DEFAULT_HTTP_LIMITS, close_async_client
 from agno.utils.log import logger
 
 
@@ -17,57 +19,88 @@ class Api:
             "user-agent": f"{agno_cli_settings.app_name}/{agno_cli_settings.app_version}",
             "Content-Type": "application/json",
         }
-        self._auth_token: Optional[str] = None
-        self._authenticated_headers = None
+        # Clients are reused across requests so connections are kept alive,
+        # async clients per event loop as their connections can't be shared across loops
+        self._clients: Dict[bool, HttpxClient] = {}
+        self._async_clients: Dict[bool, Tuple[asyncio.AbstractEventLoop, HttpxAsyncClient]] = {}
 
     @property
     def auth_token(self) -> Optional[str]:
-        if self._auth_token is None:
-            try:
-                self._auth_token = read_auth_token()
-            except Exception as e:
-                logger.debug(f"Failed to read auth token: {e}")
-        return self._auth_token
+        try:
+            return read_auth_token()
+        except Exception as e:
+            logger.debug(f"Failed to read auth token: {e}")
+        return None
 
     @property
     def authenticated_headers(self) -> Dict[str, str]:
-        if self._authenticated_headers is None:
-            self._authenticated_headers = self.headers.copy()
-            token = self.auth_token
-            if token is not None:
-                self._authenticated_headers[agno_cli_settings.auth_token_header] = token
-            agno_api_key = getenv(AGNO_API_KEY_ENV_VAR)
-            if agno_api_key is not None:
-                self._authenticated_headers["Authorization"] = f"Bearer {agno_api_key}"
-        return self._authenticated_headers
+        authenticated_headers = self.headers.copy()
+        token = self.auth_token
+        if token is not None:
+            authenticated_headers[agno_cli_settings.auth_token_header] = token
+        agno_api_key = getenv(AGNO_API_KEY_ENV_VAR)
+        if agno_api_key is not None:
+            authenticated_headers["Authorization"] = f"Bearer {agno_api_key}"
+        return authenticated_headers
+
+    def _authenticate(self, request: Request) -> None:
+        """Add the auth headers to a request, read for each request as the user can sign in or out"""
+        request.headers.update(self.authenticated_headers)
+
+    async def _aauthenticate(self, request: Request) -> None:
+        self._authenticate(request)
+
+    def _get_client(self, authenticated: bool) -> HttpxClient:
+        client = self._clients.get(authenticated)
+        if client is None or client.is_closed:
+            client = HttpxClient(
+                base_url=agno_cli_settings.api_url,
+                headers=self.headers,
+                timeout=60,
+                limits=DEFAULT_HTTP_LIMITS,
+                event_hooks={"request": [self._authenticate]} if authenticated else None,
+            )
+            self._clients[authenticated] = client
+        return client
+
+    def _get_async_client(self, authenticated: bool) -> HttpxAsyncClient:
+        loop = asyncio.get_running_loop()
+        loop_and_client = self._async_clients.get(authenticated)
+        if loop_and_client is None or loop_and_client[0] is not loop or loop_and_client[1].is_closed:
+            if loop_and_client is not None:
+                # Close the client of the previous event loop
+                close_async_client(loop_and_client[1], loop_and_client[0])
+            client = HttpxAsyncClient(
+                base_url=agno_cli_settings.api_url,
+                headers=self.headers,
+                timeout=60,
+                limits=DEFAULT_HTTP_LIMITS,
+                event_hooks={"request": [self._aauthenticate]} if authenticated else None,
+            )
+            loop_and_client = (loop, client)
+            self._async_clients[authenticated] = loop_and_client
+        return loop_and_client[1]
 
     def Client(self) -> HttpxClient:
-        return HttpxClient(
-            base_url=agno_cli_settings.api_url,
-            headers=self.headers,
-            timeout=60,
-        )
+        return self._get_client(authenticated=False)
 
     def AuthenticatedClient(self) -> HttpxClient:
-        return HttpxClient(
-            base_url=agno_cli_settings.api_url,
-            headers=self.authenticated_headers,
-            timeout=60,
-        )
+        return self._get_client(authenticated=True)
 
     def AsyncClient(self) -> HttpxAsyncClient:
-        return HttpxAsyncClient(
-            base_url=agno_cli_settings.api_url,
-            headers=self.headers,
-            timeout=60,
-        )
+        return self._get_async_client(authenticated=False)
 
     def AuthenticatedAsyncClient(self) -> HttpxAsyncClient:
-        return HttpxAsyncClient(
-            base_url=agno_cli_settings.api_url,
-            headers=self.authenticated_headers,
-            timeout=60,
-        )
+        return self._get_async_client(authenticated=True)
+
+    def close(self) -> None:
+        """Close the clients, new clients are created on the next request."""
+        for client in self._clients.values():
+            client.close()
+        self._clients.clear()
+        for loop, async_client in self._async_clients.values():
+            close_async_client(async_client, loop)
+        self._async_clients.clear()
 
 
 api = Api()
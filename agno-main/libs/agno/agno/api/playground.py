@@ -16,23 +16,23 @@ from agno.utils.log import logger
 
 def create_playground_endpoint(playground: PlaygroundEndpointCreate) -> bool:
     logger.debug("--**-- Creating Playground Endpoint")
-    with api.AuthenticatedClient() as api_client:
-        try:
-            r: Response = api_client.post(
-                ApiRoutes.PLAYGROUND_ENDPOINT_CREATE,
-                json={"playground": playground.model_dump(exclude_none=True)},
-            )
-            if invalid_response(r):
-                return False
-
-            response_json: Union[Dict, List] = r.json()
-            if response_json is None:
-                return False
-
-            # logger.debug(f"Response: {response_json}")
-            return True
-        except Exception as e:
-            logger.debug(f"Could not create Playground Endpoint: {e}")
+    api_client = api.AuthenticatedClient()
+    try:
+        r: Response = api_client.post(
+            ApiRoutes.PLAYGROUND_ENDPOINT_CREATE,
+            json={"playground": playground.model_dump(exclude_none=True)},
+        )
+        if invalid_response(r):
+            return False
+
+        response_json: Union[Dict, List] = r.json()
+        if response_json is None:
+            return False
+
+        # logger.debug(f"Response: {response_json}")
+        return True
+    except Exception as e:
+        logger.debug(f"Could not create Playground Endpoint: {e}")
     return False
 
 
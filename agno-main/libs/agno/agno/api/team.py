@@ -10,15 +10,15 @@ def create_team_run(run: TeamRunCreate, monitor: bool = False) -> None:
         return
 
     log_debug("--**-- Logging Team Run")
-    with api.AuthenticatedClient() as api_client:
-        try:
-            response = api_client.post(
-                ApiRoutes.TEAM_RUN_CREATE if monitor else ApiRoutes.TEAM_TELEMETRY_RUN_CREATE,
-                json={"run": run.model_dump(exclude_none=True)},
-            )
-            response.raise_for_status()
-        except Exception as e:
-            log_debug(f"Could not create Team run: {e}")
+    api_client = api.AuthenticatedClient()
+    try:
+        response = api_client.post(
+            ApiRoutes.TEAM_RUN_CREATE if monitor else ApiRoutes.TEAM_TELEMETRY_RUN_CREATE,
+            json={"run": run.model_dump(exclude_none=True)},
+        )
+        response.raise_for_status()
+    except Exception as e:
+        log_debug(f"Could not create Team run: {e}")
     return
 
 
@@ -27,15 +27,15 @@ async def acreate_team_run(run: TeamRunCreate, monitor: bool = False) -> None:
         return
 
     log_debug("--**-- Logging Team Run")
-    async with api.AuthenticatedAsyncClient() as api_client:
-        try:
-            response = await api_client.post(
-                ApiRoutes.TEAM_RUN_CREATE if monitor else ApiRoutes.TEAM_TELEMETRY_RUN_CREATE,
-                json={"run": run.model_dump(exclude_none=True)},
-            )
-            response.raise_for_status()
-        except Exception as e:
-            log_debug(f"Could not create Team run: {e}")
+    api_client = api.AuthenticatedAsyncClient()
+    try:
+        response = await api_client.post(
+            ApiRoutes.TEAM_RUN_CREATE if monitor else ApiRoutes.TEAM_TELEMETRY_RUN_CREATE,
+            json={"run": run.model_dump(exclude_none=True)},
+        )
+        response.raise_for_status()
+    except Exception as e:
+        log_debug(f"Could not create Team run: {e}")
 
 
 def upsert_team_session(session: TeamSessionCreate, monitor: bool = False) -> None:
@@ -43,13 +43,13 @@ def upsert_team_session(session: TeamSessionCreate, monitor: bool = False) -> No
         return
 
     log_debug("--**-- Logging Team Session")
-    with api.AuthenticatedClient() as api_client:
-        try:
-            if monitor:
-                api_client.post(
-                    ApiRoutes.TEAM_SESSION_CREATE,
-                    json={"session": session.model_dump(exclude_none=True)},
-                )
-        except Exception as e:
-            log_debug(f"Could not create Agent session: {e}")
+    api_client = api.AuthenticatedClient()
+    try:
+        if monitor:
+            api_client.post(
+                ApiRoutes.TEAM_SESSION_CREATE,
+                json={"session": session.model_dump(exclude_none=True)},
+            )
+    except Exception as e:
+        log_debug(f"Could not create Agent session: {e}")
     return
@@ -15,16 +15,16 @@ def user_ping() -> bool:
         return False
 
     logger.debug("--**-- Ping user api")
-    with api.Client() as api_client:
-        try:
-            r: Response = api_client.get(ApiRoutes.USER_HEALTH)
-            if invalid_response(r):
-                return False
-
-            if r.status_code == codes.OK:
-                return True
-        except Exception as e:
-            logger.debug(f"Could not ping user api: {e}")
+    api_client = api.Client()
+    try:
+        r: Response = api_client.get(ApiRoutes.USER_HEALTH)
+        if invalid_response(r):
+            return False
+
+        if r.status_code == codes.OK:
+            return True
+    except Exception as e:
+        logger.debug(f"Could not ping user api: {e}")
     return False
 
 
@@ -45,20 +45,20 @@ def authenticate_and_get_user(auth_token: str, existing_user: Optional[UserSchem
                 "id_user": existing_user.id_user,
                 "auth_token": read_auth_token() or "",
             }
-    with api.Client() as api_client:
-        try:
-            r: Response = api_client.post(ApiRoutes.USER_CLI_AUTH, headers=auth_header, json=anon_user)
-            if invalid_response(r):
-                return None
+    api_client = api.Client()
+    try:
+        r: Response = api_client.post(ApiRoutes.USER_CLI_AUTH, headers=auth_header, json=anon_user)
+        if invalid_response(r):
+            return None
 
-            user_data = r.json()
-            if not isinstance(user_data, dict):
-                return None
+        user_data = r.json()
+        if not isinstance(user_data, dict):
+            return None
 
-            return UserSchema.model_validate(user_data)
+        return UserSchema.model_validate(user_data)
 
-        except Exception as e:
-            logger.debug(f"Could not authenticate user: {e}")
+    except Exception as e:
+        logger.debug(f"Could not authenticate user: {e}")
     return None
 
 
@@ -69,28 +69,28 @@ def sign_in_user(sign_in_data: EmailPasswordAuthSchema) -> Optional[UserSchema]:
     from agno.cli.credentials import save_auth_token
 
     logger.debug("--**-- Signing in user")
-    with api.Client() as api_client:
-        try:
-            r: Response = api_client.post(ApiRoutes.USER_SIGN_IN, json=sign_in_data.model_dump())
-            if invalid_response(r):
-                return None
-
-            agno_auth_token = r.headers.get(agno_cli_settings.auth_token_header)
-            if agno_auth_token is None:
-                logger.error("Could not authenticate user")
-                return None
-
-            user_data = r.json()
-            if not isinstance(user_data, dict):
-                return None
-
-            current_user: UserSchema = UserSchema.model_validate(user_data)
-
-            if current_user is not None:
-                save_auth_token(agno_auth_token)
-                return current_user
-        except Exception as e:
-            logger.debug(f"Could not sign in user: {e}")
+    api_client = api.Client()
+    try:
+        r: Response = api_client.post(ApiRoutes.USER_SIGN_IN, json=sign_in_data.model_dump())
+        if invalid_response(r):
+            return None
+
+        agno_auth_token = r.headers.get(agno_cli_settings.auth_token_header)
+        if agno_auth_token is None:
+            logger.error("Could not authenticate user")
+            return None
+
+        user_data = r.json()
+        if not isinstance(user_data, dict):
+            return None
+
+        current_user: UserSchema = UserSchema.model_validate(user_data)
+
+        if current_user is not None:
+            save_auth_token(agno_auth_token)
+            return current_user
+    except Exception as e:
+        logger.debug(f"Could not sign in user: {e}")
     return None
 
 
@@ -106,22 +106,20 @@ def user_is_authenticated() -> bool:
     if user is None:
         return False
 
-    with api.AuthenticatedClient() as api_client:
-        try:
-            r: Response = api_client.post(
-                ApiRoutes.USER_AUTHENTICATE, json=user.model_dump(include={"id_user", "email"})
-            )
-            if invalid_response(r):
-                return False
-
-            response_json: Union[Dict, List] = r.json()
-            if response_json is None or not isinstance(response_json, dict):
-                logger.error("Could not parse response")
-                return False
-            if response_json.get("status") == "success":
-                return True
-        except Exception as e:
-            logger.debug(f"Could not check if user is authenticated: {e}")
+    api_client = api.AuthenticatedClient()
+    try:
+        r: Response = api_client.post(ApiRoutes.USER_AUTHENTICATE, json=user.model_dump(include={"id_user", "email"}))
+        if invalid_response(r):
+            return False
+
+        response_json: Union[Dict, List] = r.json()
+        if response_json is None or not isinstance(response_json, dict):
+            logger.error("Could not parse response")
+            return False
+        if response_json.get("status") == "success":
+            return True
+    except Exception as e:
+        logger.debug(f"Could not check if user is authenticated: {e}")
     return False
 
 
@@ -132,29 +130,29 @@ def create_anon_user() -> Optional[UserSchema]:
     from agno.cli.credentials import save_auth_token
 
     logger.debug("--**-- Creating anon user")
-    with api.Client() as api_client:
-        try:
-            r: Response = api_client.post(
-                ApiRoutes.USER_CREATE_ANON,
-                json={"user": {"email": "anon", "username": "anon", "is_machine": True}},
-                timeout=2.0,
-            )
-            if invalid_response(r):
-                return None
-
-            agno_auth_token = r.headers.get(agno_cli_settings.auth_token_header)
-            if agno_auth_token is None:
-                logger.debug("Could not create anon user")
-                return None
-
-            user_data = r.json()
-            if not isinstance(user_data, dict):
-                return None
-
-            current_user: UserSchema = UserSchema.model_validate(user_data)
-            if current_user is not None:
-                save_auth_token(agno_auth_token)
-                return current_user
-        except Exception as e:
-            logger.debug(f"Could not create anon user: {e}")
+    api_client = api.Client()
+    try:
+        r: Response = api_client.post(
+            ApiRoutes.USER_CREATE_ANON,
+            json={"user": {"email": "anon", "username": "anon", "is_machine": True}},
+            timeout=2.0,
+        )
+        if invalid_response(r):
+            return None
+
+        agno_auth_token = r.headers.get(agno_cli_settings.auth_token_header)
+        if agno_auth_token is None:
+            logger.debug("Could not create anon user")
+            return None
+
+        user_data = r.json()
+        if not isinstance(user_data, dict):
+            return None
+
+        current_user: UserSchema = UserSchema.model_validate(user_data)
+        if current_user is not None:
+            save_auth_token(agno_auth_token)
+            return current_user
+    except Exception as e:
+        logger.debug(f"Could not create anon user: {e}")
     return None
@@ -13,3 +13,7 @@ class Embedder:
 
     def get_embedding_and_usage(self, text: str) -> Tuple[List[float], Optional[Dict]]:
         raise NotImplementedError
+
+    def get_embeddings(self, texts: List[str]) -> List[List[float]]:
+        """Returns the embeddings of the texts. Embedders that support batch requests embed the texts in one request."""
+        return [self.get_embedding(text) for text in texts]
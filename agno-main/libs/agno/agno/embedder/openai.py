@@ -1,5 +1,5 @@
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 from typing_extensions import Literal
 
@@ -42,7 +42,7 @@ class OpenAIEmbedder(Embedder):
         self.openai_client = OpenAIClient(**_client_params)
         return self.openai_client
 
-    def response(self, text: str) -> CreateEmbeddingResponse:
+    def response(self, text: Union[str, List[str]]) -> CreateEmbeddingResponse:
         _request_params: Dict[str, Any] = {
             "input": text,
             "model": self.id,
@@ -64,6 +64,25 @@ class OpenAIEmbedder(Embedder):
             logger.warning(e)
             return []
 
+    def get_embeddings(self, texts: List[str]) -> List[List[float]]:
+        if not texts:
+            return []
+        try:
+            response: CreateEmbeddingResponse = self.response(text=texts)
+            # The embeddings are returned with the index of their input
+            return [embedding.embedding for embedding in sorted(response.data, key=lambda embedding: embedding.index)]
+        except Exception as e:
+            logger.warning(f"Error embedding {len(texts)} texts in one request, embedding them one by one: {e}")
+
+        embeddings: List[List[float]] = []
+        for text in texts:
+            try:
+                embeddings.append(self.get_embedding(text))
+            except Exception as e:
+                logger.warning(e)
+                embeddings.append([])
+        return embeddings
+
     def get_embedding_and_usage(self, text: str) -> Tuple[List[float], Optional[Dict]]:
         response: CreateEmbeddingResponse = self.response(text=text)
 
@@ -1,12 +1,19 @@
+import asyncio
+import contextvars
 import gc
+import json
 import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import asdict, dataclass, field
+from inspect import iscoroutinefunction
 from os import getenv
 from pathlib import Path
-from typing import TYPE_CHECKING, Callable, List, Optional
+from time import perf_counter, sleep
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Literal, Optional, Tuple
 from uuid import uuid4
 
 from agno.utils.log import logger, set_log_level_to_debug, set_log_level_to_info
+from agno.utils.phases import record_phases
 from agno.utils.timer import Timer
 
 if TYPE_CHECKING:
@@ -28,7 +35,9 @@ class PerfResult:
     max_run_time: float = field(init=False)
     std_dev_run_time: float = field(init=False)
     median_run_time: float = field(init=False)
+    p90_run_time: float = field(init=False)
     p95_run_time: float = field(init=False)
+    p99_run_time: float = field(init=False)
 
     # Memory performance in MiB
     memory_usages: List[float] = field(default_factory=list)
@@ -39,6 +48,21 @@ class PerfResult:
     median_memory_usage: float = field(init=False)
     p95_memory_usage: float = field(init=False)
 
+    # Load: the number of concurrent workers, and the wall time of the measured runs in seconds
+    concurrency: int = 1
+    total_time: float = 0.0
+    # Runs completed per second
+    throughput: float = field(init=False)
+    # Number of runs that raised an exception, only counted under load
+    num_errors: int = 0
+
+    # Time of each phase of the runs (model, tool, storage) in seconds, one value per run, see agno.utils.phases
+    phase_times: Dict[str, List[float]] = field(default_factory=dict)
+    avg_phase_times: Dict[str, float] = field(init=False)
+
+    # CPU profile of the function, as text
+    profile: Optional[str] = None
+
     def __post_init__(self):
         self.compute_stats()
 
@@ -54,9 +78,12 @@ class PerfResult:
             mx = data_sorted[-1]
             std = statistics.stdev(data_sorted) if len(data_sorted) > 1 else 0
             med = statistics.median(data_sorted)
-            # For 95th percentile, use statistics.quantiles
-            p95 = statistics.quantiles(data_sorted, n=100)[94] if len(data_sorted) > 1 else 0
-            return avg, mn, mx, std, med, p95
+            # For percentiles, use statistics.quantiles
+            percentiles = statistics.quantiles(data_sorted, n=100) if len(data_sorted) > 1 else None
+            p90 = percentiles[89] if percentiles else 0
+            p95 = percentiles[94] if percentiles else 0
+            p99 = percentiles[98] if percentiles else 0
+            return avg, mn, mx, std, med, p90, p95, p99
 
         # Populate runtime stats
         if self.run_times:
@@ -66,7 +93,9 @@ class PerfResult:
                 self.max_run_time,
                 self.std_dev_run_time,
                 self.median_run_time,
+                self.p90_run_time,
                 self.p95_run_time,
+                self.p99_run_time,
             ) = safe_stats(self.run_times)
         else:
             self.avg_run_time = 0
@@ -74,7 +103,18 @@ class PerfResult:
             self.max_run_time = 0
             self.std_dev_run_time = 0
             self.median_run_time = 0
+            self.p90_run_time = 0
             self.p95_run_time = 0
+            self.p99_run_time = 0
+
+        # Throughput: runs per second of wall time, or of run time for sequential runs
+        total_time = self.total_time or sum(self.run_times)
+        self.throughput = len(self.run_times) / total_time if total_time > 0 else 0
+
+        # Average time of each phase per run
+        self.avg_phase_times = {
+            name: sum(times) / len(times) for name, times in self.phase_times.items() if len(times) > 0
+        }
 
         # Populate memory stats
         if self.memory_usages:
@@ -84,7 +124,9 @@ class PerfResult:
                 self.max_memory_usage,
                 self.std_dev_memory_usage,
                 self.median_memory_usage,
+                _,
                 self.p95_memory_usage,
+                _,
             ) = safe_stats(self.memory_usages)
         else:
             self.avg_memory_usage = 0
@@ -116,9 +158,24 @@ class PerfResult:
         perf_table.add_row("Maximum", f"{self.max_run_time:.6f}", f"{self.max_memory_usage:.6f}")
         perf_table.add_row("Std Dev", f"{self.std_dev_run_time:.6f}", f"{self.std_dev_memory_usage:.6f}")
         perf_table.add_row("Median", f"{self.median_run_time:.6f}", f"{self.median_memory_usage:.6f}")
+        perf_table.add_row("90th %ile", f"{self.p90_run_time:.6f}", "-")
         perf_table.add_row("95th %ile", f"{self.p95_run_time:.6f}", f"{self.p95_memory_usage:.6f}")
+        perf_table.add_row("99th %ile", f"{self.p99_run_time:.6f}", "-")
 
         console.print(perf_table)
+        console.print(f"Throughput: {self.throughput:.2f} runs/s with {self.concurrency} worker(s)")
+        if self.num_errors > 0:
+            console.print(f"Errors: {self.num_errors}")
+
+        if self.avg_phase_times:
+            phase_table = Table(title="Phases (average per run)", show_header=True, header_style="bold magenta")
+            phase_table.add_column("Phase", style="cyan")
+            phase_table.add_column("Time (seconds)", style="green")
+            phase_table.add_column("Share of run time", style="yellow")
+            for name, avg_time in self.avg_phase_times.items():
+                share = avg_time / self.avg_run_time if self.avg_run_time > 0 else 0
+                phase_table.add_row(name, f"{avg_time:.6f}", f"{share:.1%}")
+            console.print(phase_table)
 
     def print_results(self, console: Optional["Console"] = None):
         """
@@ -138,10 +195,45 @@ class PerfResult:
 
         # Add rows
         for i in range(len(self.run_times)):
-            results_table.add_row(str(i + 1), f"{self.run_times[i]:.6f}", f"{self.memory_usages[i]:.6f}")
+            memory_usage = f"{self.memory_usages[i]:.6f}" if i < len(self.memory_usages) else "-"
+            results_table.add_row(str(i + 1), f"{self.run_times[i]:.6f}", memory_usage)
 
         console.print(results_table)
 
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+    def to_json(self) -> str:
+        return json.dumps(self.to_dict(), indent=4)
+
+    def to_csv(self) -> str:
+        """Returns the individual runs as CSV: the run time, memory usage and phase times of each run."""
+        import csv
+        import io
+
+        phase_names = list(self.phase_times)
+        output = io.StringIO()
+        writer = csv.writer(output)
+        writer.writerow(["run", "run_time", "memory_usage"] + [f"{name}_time" for name in phase_names])
+        for i in range(max(len(self.run_times), len(self.memory_usages))):
+            row: List[Any] = [
+                i + 1,
+                self.run_times[i] if i < len(self.run_times) else "",
+                self.memory_usages[i] if i < len(self.memory_usages) else "",
+            ]
+            for name in phase_names:
+                times = self.phase_times[name]
+                row.append(times[i] if i < len(times) else "")
+            writer.writerow(row)
+        return output.getvalue()
+
+    def save(self, path: str) -> None:
+        """Save the result to a file: as CSV if the path ends with .csv, otherwise as JSON."""
+        file_path = Path(path)
+        if not file_path.parent.exists():
+            file_path.parent.mkdir(parents=True, exist_ok=True)
+        file_path.write_text(self.to_csv() if file_path.suffix.lower() == ".csv" else self.to_json())
+
 
 @dataclass
 class PerfEval:
@@ -150,10 +242,13 @@ class PerfEval:
 
     - Warm-up runs are included to avoid measuring overhead on the first execution(s).
     - Debug mode can show top memory allocations using tracemalloc snapshots.
-    - Optionally, you can enable cProfile for CPU profiling stats.
+    - The function can be sync or async.
+    - With concurrency > 1 or a target_rps, the function is run under load and the run times are latencies under load.
+    - The run time of each run is broken down into its phases (model, tool, storage), see agno.utils.phases.
+    - Optionally, the function can be profiled with cProfile or pyinstrument.
     """
 
-    # Function to evaluate
+    # Function to evaluate, sync or async
     func: Callable
     measure_runtime: bool = True
     measure_memory: bool = True
@@ -168,6 +263,22 @@ class PerfEval:
     # Number of measured iterations
     num_iterations: int = 50
 
+    # Number of concurrent runs. Memory is only measured for sequential runs
+    concurrency: int = 1
+    # Number of runs started per second. Defaults to starting a run as soon as a worker is free.
+    # The run times are then measured from the scheduled start of each run, including the time waiting for a worker
+    target_rps: Optional[float] = None
+
+    # Break down the run time into the phases of the runs
+    measure_phases: bool = True
+
+    # Profile the function after the measured runs, with "cprofile" or "pyinstrument"
+    profiler: Optional[Literal["cprofile", "pyinstrument"]] = None
+    # Number of profiled runs
+    profile_runs: int = 10
+    # Save the profile to a file: pstats data for cprofile, HTML for pyinstrument
+    save_profile_to_file: Optional[str] = None
+
     # Result of the evaluation
     result: Optional[PerfResult] = None
 
@@ -175,7 +286,7 @@ class PerfEval:
     print_summary: bool = False
     # Print detailed results
     print_results: bool = False
-    # Save the result to a file
+    # Save the result to a file, as CSV if the file name ends with .csv, otherwise as JSON
     save_result_to_file: Optional[str] = None
 
     # Debug mode = True enables debug logs & top memory usage stats
@@ -197,18 +308,62 @@ class PerfEval:
         else:
             set_log_level_to_info()
 
-    def _measure_time(self) -> float:
-        """Utility method to measure execution time for a single run."""
+    @property
+    def is_async(self) -> bool:
+        return iscoroutinefunction(self.func)
+
+    @property
+    def under_load(self) -> bool:
+        return self.concurrency > 1 or self.target_rps is not None
+
+    def _measure_time(self) -> Tuple[float, Dict[str, float]]:
+        """Utility method to measure execution time and phase times for a single run."""
         # Create a timer
         timer = Timer()
-        # Start the timer
-        timer.start()
-        # Run the function
-        self.func()
-        # Stop the timer
-        timer.stop()
+        if not self.measure_phases:
+            timer.start()
+            self.func()
+            timer.stop()
+            return timer.elapsed, {}
+        with record_phases() as phases:
+            # Start the timer
+            timer.start()
+            # Run the function
+            self.func()
+            # Stop the timer
+            timer.stop()
         # Return the elapsed time
-        return timer.elapsed
+        return timer.elapsed, phases.times
+
+    def _measure_scheduled_time(self, scheduled_start: Optional[float]) -> Tuple[float, Dict[str, float]]:
+        """Measure a run under load, from its scheduled start if it has one, see _run_under_load."""
+        run_time, phase_times = self._measure_time()
+        if scheduled_start is None:
+            return run_time, phase_times
+        return perf_counter() - scheduled_start, phase_times
+
+    async def _ameasure_time(self) -> Tuple[float, Dict[str, float]]:
+        timer = Timer()
+        if not self.measure_phases:
+            timer.start()
+            await self.func()
+            timer.stop()
+            return timer.elapsed, {}
+        with record_phases() as phases:
+            timer.start()
+            await self.func()
+            timer.stop()
+        return timer.elapsed, phases.times
+
+    def _get_memory_usage(self, peak: int, baseline: float) -> float:
+        # Convert to MiB and subtract baseline
+        peak_mib = peak / 1024 / 1024
+        adjusted_usage = max(0, peak_mib - baseline)
+
+        if self.debug_mode:
+            logger.debug(f"[DEBUG] Raw peak usage: {peak_mib:.6f} MiB, Adjusted: {adjusted_usage:.6f} MiB")
+
+        return adjusted_usage
 
     def _measure_memory(self, baseline: float) -> float:
         """
@@ -225,15 +380,15 @@ class PerfEval:
         current, peak = tracemalloc.get_traced_memory()
         # Stop tracing memory
         tracemalloc.stop()
+        return self._get_memory_usage(peak, baseline)
 
-        # Convert to MiB and subtract baseline
-        peak_mib = peak / 1024 / 1024
-        adjusted_usage = max(0, peak_mib - baseline)
-
-        if self.debug_mode:
-            logger.debug(f"[DEBUG] Raw peak usage: {peak_mib:.6f} MiB, Adjusted: {adjusted_usage:.6f} MiB")
-
-        return adjusted_usage
+    async def _ameasure_memory(self, baseline: float) -> float:
+        gc.collect()
+        tracemalloc.start()
+        await self.func()
+        current, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        return self._get_memory_usage(peak, baseline)
 
     def _compute_tracemalloc_baseline(self, samples: int = 3) -> float:
         """
@@ -255,16 +410,168 @@ class PerfEval:
 
         return sum(results) / len(results) if results else 0
 
+    def _run_under_load(self) -> Tuple[List[Tuple[float, Dict[str, float]]], float, int]:
+        """
+        Run the measured iterations in a thread pool of `concurrency` workers, starting them at target_rps.
+
+        With a target_rps, a run is measured from its scheduled start rather than from when a worker picks it up.
+        Otherwise runs queued behind slow runs would not count their wait, hiding the latency under load
+        (coordinated omission).
+
+        Returns:
+            The run time and phase times of the successful runs, the wall time, and the number of failed runs.
+        """
+        measurements: List[Tuple[float, Dict[str, float]]] = []
+        num_errors = 0
+        start = perf_counter()
+        with ThreadPoolExecutor(max_workers=self.concurrency, thread_name_prefix="agno-perf") as executor:
+            futures = []
+            for i in range(self.num_iterations):
+                scheduled_start = None
+                if self.target_rps is not None:
+                    # Wait for the scheduled start of the run
+                    scheduled_start = start + i / self.target_rps
+                    delay = scheduled_start - perf_counter()
+                    if delay > 0:
+                        sleep(delay)
+                futures.append(
+                    executor.submit(contextvars.copy_context().run, self._measure_scheduled_time, scheduled_start)
+                )
+            for future in futures:
+                try:
+                    measurements.append(future.result())
+                except Exception as e:
+                    num_errors += 1
+                    logger.warning(f"Run failed: {e}")
+        return measurements, perf_counter() - start, num_errors
+
+    async def _arun_under_load(self) -> Tuple[List[Tuple[float, Dict[str, float]]], float, int]:
+        """Run the measured iterations as tasks, at most `concurrency` at a time, see _run_under_load."""
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def measure(scheduled_start: Optional[float]) -> Tuple[float, Dict[str, float]]:
+            async with semaphore:
+                run_time, phase_times = await self._ameasure_time()
+            if scheduled_start is None:
+                return run_time, phase_times
+            return perf_counter() - scheduled_start, phase_times
+
+        start = perf_counter()
+        tasks = []
+        for i in range(self.num_iterations):
+            scheduled_start = None
+            if self.target_rps is not None:
+                scheduled_start = start + i / self.target_rps
+                delay = scheduled_start - perf_counter()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+            tasks.append(asyncio.create_task(measure(scheduled_start)))
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+        total_time = perf_counter() - start
+
+        measurements: List[Tuple[float, Dict[str, float]]] = []
+        num_errors = 0
+        for result in results:
+            if isinstance(result, BaseException):
+                num_errors += 1
+                logger.warning(f"Run failed: {result}")
+            else:
+                measurements.append(result)
+        return measurements, total_time, num_errors
+
+    def _start_profiler(self) -> Any:
+        if self.profiler == "pyinstrument":
+            try:
+                from pyinstrument import Profiler
+            except ImportError:
+                raise ImportError("`pyinstrument` not installed. Please install using `pip install pyinstrument`")
+            profiler = Profiler(async_mode="enabled" if self.is_async else "disabled")
+        else:
+            import cProfile
+
+            profiler = cProfile.Profile()
+        profiler.start() if self.profiler == "pyinstrument" else profiler.enable()
+        return profiler
+
+    def _stop_profiler(self, profiler: Any) -> str:
+        """Stop the profiler, save the profile if requested and return it as text."""
+        if self.profiler == "pyinstrument":
+            profiler.stop()
+            if self.save_profile_to_file:
+                Path(self.save_profile_to_file).write_text(profiler.output_html())
+            return profiler.output_text()
+
+        import io
+        import pstats
+
+        profiler.disable()
+        if self.save_profile_to_file:
+            profiler.dump_stats(self.save_profile_to_file)
+        output = io.StringIO()
+        pstats.Stats(profiler, stream=output).sort_stats("cumulative").print_stats(30)
+        return output.getvalue()
+
+    def _profile(self) -> str:
+        profiler = self._start_profiler()
+        for _ in range(self.profile_runs):
+            self.func()
+        return self._stop_profiler(profiler)
+
+    async def _aprofile(self) -> str:
+        profiler = self._start_profiler()
+        for _ in range(self.profile_runs):
+            await self.func()
+        return self._stop_profiler(profiler)
+
+    def _get_result(
+        self,
+        measurements: List[Tuple[float, Dict[str, float]]],
+        memory_usages: List[float],
+        total_time: float = 0.0,
+        num_errors: int = 0,
+        profile: Optional[str] = None,
+    ) -> PerfResult:
+        phase_names: List[str] = []
+        for _, phases in measurements:
+            phase_names.extend(name for name in phases if name not in phase_names)
+        return PerfResult(
+            run_times=[run_time for run_time, _ in measurements],
+            memory_usages=memory_usages,
+            concurrency=self.concurrency if self.under_load else 1,
+            total_time=total_time,
+            num_errors=num_errors,
+            phase_times={name: [phases.get(name, 0.0) for _, phases in measurements] for name in phase_names},
+            profile=profile,
+        )
+
+    def _finish(self, console: Any) -> PerfResult:
+        # 5. Save results if requested
+        self._save_results()
+
+        # 6. Print results as requested
+        if self.print_results and self.result:
+            self.result.print_results(console)
+        if (self.print_summary or self.print_results) and self.result:
+            self.result.print_summary(console)
+
+        logger.debug(f"*********** Evaluation End: {self.eval_id} ***********")
+        return self.result  # type: ignore
+
     def run(self, *, print_summary: bool = False, print_results: bool = False) -> PerfResult:
         """
         Main method to perform the performance evaluation.
         1. Do optional warm-up runs.
-        2. Measure runtime
+        2. Measure runtime, sequentially or under load
         3. Measure memory
-        4. Collect results
+        4. Collect results, and profile if requested
         5. Save results if requested
         6. Print results as requested
+
+        Async functions are run in a new event loop, use arun from an event loop.
         """
+        if self.is_async:
+            return asyncio.run(self.arun(print_summary=print_summary, print_results=print_results))
+
         from rich.console import Console
         from rich.live import Live
         from rich.status import Status
@@ -278,8 +585,10 @@ class PerfEval:
         # Create a console for logging
         console = Console()
         # Initialize lists for run times and memory usages
-        run_times = []
+        measurements: List[Tuple[float, Dict[str, float]]] = []
         memory_usages = []
+        total_time = 0.0
+        num_errors = 0
 
         with Live(console=console, transient=True) as live_log:
             # 1. Warm-up runs (not measured)
@@ -290,7 +599,12 @@ class PerfEval:
                 status.stop()
 
             # 2. Measure runtime
-            if self.measure_runtime:
+            if self.measure_runtime and self.under_load:
+                live_log.update(
+                    Status(f"Load test with {self.concurrency} workers...", spinner="dots", refresh_per_second=10)
+                )
+                measurements, total_time, num_errors = self._run_under_load()
+            elif self.measure_runtime:
                 for i in range(self.num_iterations):
                     status = Status(
                         f"Runtime measurement {i + 1}/{self.num_iterations}...",
@@ -301,14 +615,14 @@ class PerfEval:
                     live_log.update(status)
 
                     # Measure runtime
-                    elapsed_time = self._measure_time()
-                    run_times.append(elapsed_time)
-                    logger.debug(f"Run {i + 1} - Time taken: {elapsed_time:.6f} seconds")
+                    measurement = self._measure_time()
+                    measurements.append(measurement)
+                    logger.debug(f"Run {i + 1} - Time taken: {measurement[0]:.6f} seconds")
 
                     status.stop()
 
             # 3. Measure memory
-            if self.measure_memory:
+            if self.measure_memory and not self.under_load:
                 # 3.1 Compute memory baseline
                 memory_baseline = 0.0
                 memory_baseline = self._compute_tracemalloc_baseline()
@@ -330,30 +644,66 @@ class PerfEval:
 
                     status.stop()
 
+            # 4. Profile
+            profile = None
+            if self.profiler is not None:
+                live_log.update(Status("Profiling...", spinner="dots", refresh_per_second=10))
+                profile = self._profile()
+
         # 4. Collect results
-        self.result = PerfResult(run_times=run_times, memory_usages=memory_usages)
+        self.result = self._get_result(measurements, memory_usages, total_time, num_errors, profile)
+        return self._finish(console)
 
-        # 5. Save results if requested
-        self._save_results()
+    async def arun(self, *, print_summary: bool = False, print_results: bool = False) -> PerfResult:
+        """Perform the performance evaluation of an async function, see run."""
+        from rich.console import Console
 
-        # 6. Print results as requested
-        if self.print_results and self.result:
-            self.result.print_results(console)
-        if (self.print_summary or self.print_results) and self.result:
-            self.result.print_summary(console)
+        if not self.is_async:
+            raise ValueError("arun requires an async function, use run for sync functions")
 
-        logger.debug(f"*********** Evaluation End: {self.eval_id} ***********")
-        return self.result
+        # Prepare environment
+        self.set_eval_id()
+        self.set_debug_mode()
+        self.print_results = print_results
+        self.print_summary = print_summary
+
+        console = Console()
+        measurements: List[Tuple[float, Dict[str, float]]] = []
+        memory_usages = []
+        total_time = 0.0
+        num_errors = 0
+
+        # 1. Warm-up runs (not measured)
+        for _ in range(self.warmup_runs):
+            await self.func()
+
+        # 2. Measure runtime
+        if self.measure_runtime and self.under_load:
+            measurements, total_time, num_errors = await self._arun_under_load()
+        elif self.measure_runtime:
+            for i in range(self.num_iterations):
+                measurement = await self._ameasure_time()
+                measurements.append(measurement)
+                logger.debug(f"Run {i + 1} - Time taken: {measurement[0]:.6f} seconds")
+
+        # 3. Measure memory
+        if self.measure_memory and not self.under_load:
+            memory_baseline = self._compute_tracemalloc_baseline()
+            logger.debug(f"Computed memory baseline: {memory_baseline:.6f} MiB")
+            for i in range(self.num_iterations):
+                usage = await self._ameasure_memory(memory_baseline)
+                memory_usages.append(usage)
+                logger.debug(f"Run {i + 1} - Memory usage: {usage:.6f} MiB (adjusted)")
+
+        # 4. Collect results, and profile if requested
+        profile = await self._aprofile() if self.profiler is not None else None
+        self.result = self._get_result(measurements, memory_usages, total_time, num_errors, profile)
+        return self._finish(console)
 
     def _save_results(self):
-        """Save the PerfResult to a JSON file if a path is provided."""
+        """Save the PerfResult to a JSON or CSV file if a path is provided."""
         if self.save_result_to_file and self.result:
             try:
-                import json
-
-                fn_path = Path(self.save_result_to_file.format(name=self.name, eval_id=self.eval_id))
-                if not fn_path.parent.exists():
-                    fn_path.parent.mkdir(parents=True, exist_ok=True)
-                fn_path.write_text(json.dumps(asdict(self.result), indent=4))
+                self.result.save(self.save_result_to_file.format(name=self.name, eval_id=self.eval_id))
             except Exception as e:
                 logger.warning(f"Failed to save result to file: {e}")
@@ -15,6 +15,7 @@ from agno.models.message import Message
 from agno.run.response import RunResponse
 from agno.run.team import TeamRunResponse
 from agno.utils.log import log_debug, log_info, log_warning
+from agno.utils.tokens import get_messages_within_token_budget, get_num_runs_within_token_budget
 
 
 @dataclass
@@ -210,13 +211,15 @@ class TeamMemory:
         return [message.model_dump() for message in self.messages]
 
     def get_messages_from_last_n_runs(
-        self, last_n: Optional[int] = None, skip_role: Optional[str] = None
+        self, last_n: Optional[int] = None, skip_role: Optional[str] = None, max_tokens: Optional[int] = None
     ) -> List[Message]:
         """Returns the messages from the last_n runs, excluding previously tagged history messages.
 
         Args:
             last_n: The number of runs to return from the end of the conversation.
             skip_role: Skip messages with this role.
+            max_tokens: Only return the messages of the most recent runs that fit in this number of tokens.
+                If the most recent run doesn't fit, its most recent messages that fit are returned.
 
         Returns:
             A list of Messages from the specified runs, excluding history messages.
@@ -225,6 +228,25 @@ class TeamMemory:
             return []
 
         runs_to_process = self.runs if last_n is None else self.runs[-last_n:]
+        # Token budget of the most recent run when it doesn't fit in max_tokens on its own
+        last_run_max_tokens: Optional[int] = None
+        if max_tokens is not None:
+            num_runs = get_num_runs_within_token_budget(
+                (
+                    [
+                        message
+                        for message in (run.response.messages if run.response and run.response.messages else [])
+                        if not (skip_role and message.role == skip_role) and not message.from_history
+                    ]
+                    for run in reversed(runs_to_process)
+                ),
+                max_tokens=max_tokens,
+            )
+            if num_runs == 0 and runs_to_process:
+                # Keep the most recent messages of the most recent run rather than no history at all
+                last_run_max_tokens = max_tokens
+                num_runs = 1
+            runs_to_process = runs_to_process[len(runs_to_process) - num_runs :]
         messages_from_history = []
 
         for run in runs_to_process:
@@ -241,6 +263,13 @@ class TeamMemory:
 
                 messages_from_history.append(message)
 
+        if last_run_max_tokens is not None:
+            messages_from_history = get_messages_within_token_budget(messages_from_history, last_run_max_tokens)
+            log_warning(
+                f"The most recent run does not fit in {last_run_max_tokens} tokens, "
+                f"only its last {len(messages_from_history)} messages are used as history"
+            )
+
         log_debug(f"Getting messages from previous runs: {len(messages_from_history)}")
         return messages_from_history
 
@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from datetime import datetime
 from typing import List, Optional
 
 from agno.memory.v2.db.schema import MemoryRow
@@ -21,6 +22,18 @@ class MemoryDb(ABC):
     ) -> List[MemoryRow]:
         raise NotImplementedError
 
+    def incremental_read_available(self) -> bool:
+        """True if the db can read the memories updated since a time, see read_memories_updated_since."""
+        return False
+
+    def read_memories_updated_since(self, since: datetime, user_id: Optional[str] = None) -> List[MemoryRow]:
+        """Read the memories created or updated at or after `since`, a last_updated time of a memory read before."""
+        raise NotImplementedError
+
+    def read_memory_ids(self, user_id: Optional[str] = None) -> List[str]:
+        """Read the ids of the memories, to find the memories that were deleted."""
+        raise NotImplementedError
+
     @abstractmethod
     def upsert_memory(self, memory: MemoryRow) -> Optional[MemoryRow]:
         raise NotImplementedError
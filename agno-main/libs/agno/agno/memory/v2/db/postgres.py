@@ -1,3 +1,4 @@
+from datetime import datetime, timedelta
 from typing import Any, Dict, List, Optional
 
 try:
@@ -6,7 +7,7 @@ try:
     from sqlalchemy.inspection import inspect
     from sqlalchemy.orm import scoped_session, sessionmaker
     from sqlalchemy.schema import Column, MetaData, Table
-    from sqlalchemy.sql.expression import delete, select, text
+    from sqlalchemy.sql.expression import delete, func, select, text
     from sqlalchemy.types import DateTime, String
 except ImportError:
     raise ImportError("`sqlalchemy` not installed.  Please install using `pip install sqlalchemy 'psycopg[binary]'`")
@@ -23,6 +24,7 @@ class PostgresMemoryDb(MemoryDb):
         schema: Optional[str] = "ai",
         db_url: Optional[str] = None,
         db_engine: Optional[Engine] = None,
+        page_size: int = 1000,
     ):
         """
         This class provides a memory store backed by a postgres table.
@@ -36,6 +38,7 @@ class PostgresMemoryDb(MemoryDb):
             schema (Optional[str]): The schema to store the table in. Defaults to "ai".
             db_url (Optional[str]): The database URL to connect to. Defaults to None.
             db_engine (Optional[Engine]): The database engine to use. Defaults to None.
+            page_size (int): The number of rows fetched at a time when reading memories. Defaults to 1000.
         """
         _engine: Optional[Engine] = db_engine
         if _engine is None and db_url is not None:
@@ -48,6 +51,7 @@ class PostgresMemoryDb(MemoryDb):
         self.schema: Optional[str] = schema
         self.db_url: Optional[str] = db_url
         self.db_engine: Engine = _engine
+        self.page_size: int = page_size
         self.inspector = inspect(self.db_engine)
         self.metadata: MetaData = MetaData(schema=self.schema)
         self.Session: scoped_session = scoped_session(sessionmaker(bind=self.db_engine))
@@ -92,27 +96,22 @@ class PostgresMemoryDb(MemoryDb):
             result = sess.execute(stmt).first()
             return result is not None
 
-    def read_memories(
-        self, user_id: Optional[str] = None, limit: Optional[int] = None, sort: Optional[str] = None
-    ) -> List[MemoryRow]:
+    def _read_rows(self, stmt: Any) -> List[MemoryRow]:
         memories: List[MemoryRow] = []
         try:
             with self.Session() as sess, sess.begin():
-                stmt = select(self.table)
-                if user_id is not None:
-                    stmt = stmt.where(self.table.c.user_id == user_id)
-                if limit is not None:
-                    stmt = stmt.limit(limit)
-
-                if sort == "asc":
-                    stmt = stmt.order_by(self.table.c.created_at.asc())
-                else:
-                    stmt = stmt.order_by(self.table.c.created_at.desc())
-
-                rows = sess.execute(stmt).fetchall()
-                for row in rows:
+                # Fetch the rows in pages, for users with many memories
+                result = sess.execute(stmt.execution_options(yield_per=self.page_size))
+                for row in result:
                     if row is not None:
-                        memories.append(MemoryRow.model_validate(row))
+                        memories.append(
+                            MemoryRow(
+                                id=row.id,
+                                user_id=row.user_id,
+                                memory=row.memory,
+                                last_updated=row.updated_at or row.created_at,
+                            )
+                        )
         except Exception as e:
             log_debug(f"Exception reading from table: {e}")
             log_debug(f"Table does not exist: {self.table.name}")
@@ -120,6 +119,45 @@ class PostgresMemoryDb(MemoryDb):
             self.create()
         return memories
 
+    def read_memories(
+        self, user_id: Optional[str] = None, limit: Optional[int] = None, sort: Optional[str] = None
+    ) -> List[MemoryRow]:
+        stmt = select(self.table)
+        if user_id is not None:
+            stmt = stmt.where(self.table.c.user_id == user_id)
+        if limit is not None:
+            stmt = stmt.limit(limit)
+
+        if sort == "asc":
+            stmt = stmt.order_by(self.table.c.created_at.asc())
+        else:
+            stmt = stmt.order_by(self.table.c.created_at.desc())
+        return self._read_rows(stmt)
+
+    def incremental_read_available(self) -> bool:
+        return True
+
+    def read_memories_updated_since(self, since: datetime, user_id: Optional[str] = None) -> List[MemoryRow]:
+        # now() is the start time of the transaction, so a memory committed after the last read can have an earlier
+        # updated_at. Read the rows of the last second again to include the memories of such transactions.
+        stmt = select(self.table).where(
+            func.coalesce(self.table.c.updated_at, self.table.c.created_at) >= since - timedelta(seconds=1)
+        )
+        if user_id is not None:
+            stmt = stmt.where(self.table.c.user_id == user_id)
+        return self._read_rows(stmt)
+
+    def read_memory_ids(self, user_id: Optional[str] = None) -> List[str]:
+        try:
+            with self.Session() as sess, sess.begin():
+                stmt = select(self.table.c.id)
+                if user_id is not None:
+                    stmt = stmt.where(self.table.c.user_id == user_id)
+                return [row.id for row in sess.execute(stmt)]
+        except Exception as e:
+            log_debug(f"Exception reading from table: {e}")
+            return []
+
     def upsert_memory(self, memory: MemoryRow, create_and_retry: bool = True) -> None:
         """Create a new memory if it does not exist, otherwise update the existing memory"""
 
@@ -139,6 +177,8 @@ class PostgresMemoryDb(MemoryDb):
                     set_=dict(
                         user_id=stmt.excluded.user_id,
                         memory=stmt.excluded.memory,
+                        # onupdate is not applied to upserts, it is needed to read the memories updated since a time
+                        updated_at=text("now()"),
                     ),
                 )
 
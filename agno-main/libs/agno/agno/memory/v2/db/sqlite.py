@@ -1,3 +1,6 @@
+import json
+from ast import literal_eval
+from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
@@ -22,7 +25,7 @@ except ImportError:
 
 from agno.memory.v2.db.base import MemoryDb
 from agno.memory.v2.db.schema import MemoryRow
-from agno.utils.log import log_debug, log_info, logger
+from agno.utils.log import log_debug, log_info, log_warning, logger
 
 
 class SqliteMemoryDb(MemoryDb):
@@ -32,6 +35,7 @@ class SqliteMemoryDb(MemoryDb):
         db_url: Optional[str] = None,
         db_file: Optional[str] = None,
         db_engine: Optional[Engine] = None,
+        page_size: int = 1000,
     ):
         """
         This class provides a memory store backed by a SQLite table.
@@ -47,6 +51,7 @@ class SqliteMemoryDb(MemoryDb):
             db_url: The database URL to connect to.
             db_file: The database file to connect to.
             db_engine: The database engine to use.
+            page_size: The number of rows fetched at a time when reading memories.
         """
         self.db_file = db_file
         _engine: Optional[Engine] = db_engine
@@ -68,6 +73,7 @@ class SqliteMemoryDb(MemoryDb):
         self.table_name: str = table_name
         self.db_url: Optional[str] = db_url
         self.db_engine: Engine = _engine
+        self.page_size: int = page_size
         self.metadata: MetaData = MetaData()
         self.inspector = inspect(self.db_engine)
 
@@ -92,7 +98,11 @@ class SqliteMemoryDb(MemoryDb):
             Column("memory", String),
             Column("created_at", DateTime, server_default=text("CURRENT_TIMESTAMP")),
             Column(
-                "updated_at", DateTime, server_default=text("CURRENT_TIMESTAMP"), onupdate=text("CURRENT_TIMESTAMP")
+                "updated_at",
+                DateTime,
+                server_default=text("CURRENT_TIMESTAMP"),
+                onupdate=text("CURRENT_TIMESTAMP"),
+                index=True,
             ),
             extend_existing=True,
         )
@@ -112,31 +122,34 @@ class SqliteMemoryDb(MemoryDb):
             result = session.execute(stmt).first()
             return result is not None
 
-    def read_memories(
-        self, user_id: Optional[str] = None, limit: Optional[int] = None, sort: Optional[str] = None
-    ) -> List[MemoryRow]:
+    @staticmethod
+    def _decode_memory(value: str) -> Optional[Dict[str, Any]]:
+        try:
+            return json.loads(value)
+        except json.JSONDecodeError:
+            pass
+        try:
+            # Memories written by earlier versions are stored as the str() of a dict
+            return literal_eval(value)
+        except (ValueError, SyntaxError) as e:
+            log_warning(f"Could not decode memory: {e}")
+            return None
+
+    def _read_rows(self, stmt: Any) -> List[MemoryRow]:
         memories: List[MemoryRow] = []
         try:
             with self.Session() as session:
-                stmt = select(self.table)
-                if user_id is not None:
-                    stmt = stmt.where(self.table.c.user_id == user_id)
-
-                if sort == "asc":
-                    stmt = stmt.order_by(self.table.c.created_at.asc())
-                else:
-                    stmt = stmt.order_by(self.table.c.created_at.desc())
-
-                if limit is not None:
-                    stmt = stmt.limit(limit)
-
-                result = session.execute(stmt)
+                # Fetch the rows in pages, for users with many memories
+                result = session.execute(stmt.execution_options(yield_per=self.page_size))
                 for row in result:
+                    memory = self._decode_memory(row.memory)
+                    if memory is None:
+                        continue
                     memories.append(
                         MemoryRow(
                             id=row.id,
                             user_id=row.user_id,
-                            memory=eval(row.memory),
+                            memory=memory,
                             last_updated=row.updated_at or row.created_at,
                         )
                     )
@@ -147,6 +160,43 @@ class SqliteMemoryDb(MemoryDb):
             self.create()
         return memories
 
+    def read_memories(
+        self, user_id: Optional[str] = None, limit: Optional[int] = None, sort: Optional[str] = None
+    ) -> List[MemoryRow]:
+        stmt = select(self.table)
+        if user_id is not None:
+            stmt = stmt.where(self.table.c.user_id == user_id)
+
+        if sort == "asc":
+            stmt = stmt.order_by(self.table.c.created_at.asc())
+        else:
+            stmt = stmt.order_by(self.table.c.created_at.desc())
+
+        if limit is not None:
+            stmt = stmt.limit(limit)
+        return self._read_rows(stmt)
+
+    def incremental_read_available(self) -> bool:
+        return True
+
+    def read_memories_updated_since(self, since: datetime, user_id: Optional[str] = None) -> List[MemoryRow]:
+        # CURRENT_TIMESTAMP is stored without fractions of a second, so read the rows of the whole second again
+        stmt = select(self.table).where(self.table.c.updated_at >= since - timedelta(seconds=1))
+        if user_id is not None:
+            stmt = stmt.where(self.table.c.user_id == user_id)
+        return self._read_rows(stmt)
+
+    def read_memory_ids(self, user_id: Optional[str] = None) -> List[str]:
+        try:
+            with self.Session() as session:
+                stmt = select(self.table.c.id)
+                if user_id is not None:
+                    stmt = stmt.where(self.table.c.user_id == user_id)
+                return [row.id for row in session.execute(stmt)]
+        except SQLAlchemyError as e:
+            log_debug(f"Exception reading from table: {e}")
+            return []
+
     def upsert_memory(self, memory: MemoryRow, create_and_retry: bool = True) -> None:
         try:
             with self.Session() as session:
@@ -158,11 +208,17 @@ class SqliteMemoryDb(MemoryDb):
                     stmt = (
                         self.table.update()
                         .where(self.table.c.id == memory.id)
-                        .values(user_id=memory.user_id, memory=str(memory.memory), updated_at=text("CURRENT_TIMESTAMP"))
+                        .values(
+                            user_id=memory.user_id,
+                            memory=json.dumps(memory.memory),
+                            updated_at=text("CURRENT_TIMESTAMP"),
+                        )
                     )
                 else:
                     # Insert new memory
-                    stmt = self.table.insert().values(id=memory.id, user_id=memory.user_id, memory=str(memory.memory))  # type: ignore
+                    stmt = self.table.insert().values(  # type: ignore
+                        id=memory.id, user_id=memory.user_id, memory=json.dumps(memory.memory)
+                    )
 
                 session.execute(stmt)
                 session.commit()
@@ -0,0 +1,245 @@
+import asyncio
+from hashlib import sha256
+from threading import Lock
+from typing import Any, Dict, List, Optional
+from uuid import NAMESPACE_URL, uuid5
+
+from agno.document import Document
+from agno.embedder.base import Embedder
+from agno.memory.v2.schema import UserMemory
+from agno.utils.log import log_debug, log_info, log_warning
+from agno.vectordb.base import VectorDb
+
+try:
+    import numpy as np
+except ImportError:
+    raise ImportError("`numpy` not installed. Please install using `pip install numpy`")
+
+
+def get_memory_text(memory: UserMemory) -> str:
+    """The text embedded for a memory"""
+    if memory.topics:
+        return f"{memory.memory}\nTopics: {', '.join(memory.topics)}"
+    return memory.memory
+
+
+def _get_text_hash(text: str) -> str:
+    return sha256(text.encode("utf-8")).hexdigest()
+
+
+class MemoryIndex:
+    """
+    Base class of the indexes used to search user memories by similarity, with Memory(memory_index=...) and
+    retrieval_method="semantic".
+
+    Memories are embedded when they are synced to the index: only new and changed memories are embedded, in batches.
+    """
+
+    def __init__(self, embedder: Optional[Embedder] = None, batch_size: int = 100):
+        if embedder is None:
+            from agno.embedder.openai import OpenAIEmbedder
+
+            embedder = OpenAIEmbedder()
+            log_info("Embedder not provided, using OpenAIEmbedder as default.")
+        self.embedder: Embedder = embedder
+        self.batch_size = batch_size
+        # Hash of the indexed text of each memory, per user
+        self._text_hashes: Dict[str, Dict[str, str]] = {}
+        self._lock = Lock()
+
+    def _get_changes(self, user_id: str, memories: Dict[str, UserMemory]) -> Dict[str, str]:
+        """Returns the text of the memories that are new or changed since the last sync, by memory id"""
+        text_hashes = self._text_hashes.get(user_id, {})
+        changed: Dict[str, str] = {}
+        for memory_id, memory in memories.items():
+            text = get_memory_text(memory)
+            if text_hashes.get(memory_id) != _get_text_hash(text):
+                changed[memory_id] = text
+        return changed
+
+    def _embed(self, texts: List[str]) -> List[List[float]]:
+        embeddings: List[List[float]] = []
+        for i in range(0, len(texts), self.batch_size):
+            embeddings.extend(self.embedder.get_embeddings(texts[i : i + self.batch_size]))
+        return embeddings
+
+    def sync(self, user_id: str, memories: Dict[str, UserMemory]) -> None:
+        """Update the index of a user with their current memories, by memory id"""
+        raise NotImplementedError
+
+    async def async_sync(self, user_id: str, memories: Dict[str, UserMemory]) -> None:
+        """Update the index of a user in a thread, so embedding the memories doesn't block the event loop"""
+        await asyncio.to_thread(self.sync, user_id, memories)
+
+    def search(self, user_id: str, query: str, limit: int) -> List[str]:
+        """Returns the ids of the memories of a user most similar to the query, most similar first"""
+        raise NotImplementedError
+
+    def clear(self) -> None:
+        """Remove all memories from the index"""
+        with self._lock:
+            self._text_hashes = {}
+
+    def __deepcopy__(self, memo):
+        """The index is shared by copies of the Memory."""
+        memo[id(self)] = self
+        return self
+
+
+class InMemoryMemoryIndex(MemoryIndex):
+    """
+    Keeps the normalized embeddings of the memories of each user in a matrix. A search is a single matrix product,
+    which takes milliseconds for users with thousands of memories.
+    """
+
+    def __init__(self, embedder: Optional[Embedder] = None, batch_size: int = 100):
+        super().__init__(embedder=embedder, batch_size=batch_size)
+        # Memory ids and the matrix of their embeddings (one row per memory), per user
+        self._memory_ids: Dict[str, List[str]] = {}
+        self._embeddings: Dict[str, Any] = {}
+
+    @staticmethod
+    def _normalize(vectors: Any) -> Any:
+        norms = np.linalg.norm(vectors, axis=-1, keepdims=True)
+        return vectors / np.where(norms == 0, 1, norms)
+
+    def sync(self, user_id: str, memories: Dict[str, UserMemory]) -> None:
+        with self._lock:
+            changed = self._get_changes(user_id, memories)
+            memory_ids = self._memory_ids.get(user_id, [])
+            if not changed and len(memory_ids) == len(memories):
+                return
+
+            # Keep the rows of the unchanged memories
+            rows: Dict[str, Any] = {}
+            if user_id in self._embeddings:
+                for row, memory_id in enumerate(memory_ids):
+                    if memory_id in memories and memory_id not in changed:
+                        rows[memory_id] = self._embeddings[user_id][row]
+
+            if changed:
+                log_debug(f"Embedding {len(changed)} memories of user: {user_id}")
+                embeddings = self._embed(list(changed.values()))
+                for memory_id, embedding in zip(changed, embeddings):
+                    # Memories that failed to embed are embedded again on the next sync
+                    if embedding:
+                        rows[memory_id] = self._normalize(np.asarray(embedding, dtype=np.float32))
+
+            self._memory_ids[user_id] = list(rows)
+            self._embeddings[user_id] = np.vstack(list(rows.values())) if rows else None
+            self._text_hashes[user_id] = {
+                memory_id: _get_text_hash(get_memory_text(memories[memory_id])) for memory_id in rows
+            }
+
+    def search(self, user_id: str, query: str, limit: int) -> List[str]:
+        embeddings = self._embeddings.get(user_id)
+        memory_ids = self._memory_ids.get(user_id, [])
+        if embeddings is None or not memory_ids or limit <= 0:
+            return []
+        query_embedding = self._normalize(np.asarray(self.embedder.get_embedding(query), dtype=np.float32))
+        scores = embeddings @ query_embedding
+        limit = min(limit, len(memory_ids))
+        # Select the top results before sorting them
+        top = np.argpartition(-scores, limit - 1)[:limit]
+        top = top[np.argsort(-scores[top])]
+        return [memory_ids[i] for i in top]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._text_hashes = {}
+            self._memory_ids = {}
+            self._embeddings = {}
+
+
+class VectorDbMemoryIndex(MemoryIndex):
+    """
+    Stores the memories in a VectorDb, e.g. to share the index between processes. Memories are stored as documents
+    with the user_id and memory_id in their meta data, and the VectorDb embeds them with its own embedder.
+
+    The id of a document is derived from the user and memory id, so a changed memory replaces its document, and the
+    name of a document includes the hash of its text, so memories indexed by another process are not sent again.
+    VectorDbs can't delete single documents, so deleted memories are filtered out of the search results by Memory.
+    """
+
+    def __init__(self, vector_db: VectorDb, batch_size: int = 100):
+        super().__init__(embedder=getattr(vector_db, "embedder", None), batch_size=batch_size)
+        self.vector_db = vector_db
+        self._created = False
+
+    @staticmethod
+    def get_document_id(user_id: str, memory_id: str) -> str:
+        return str(uuid5(NAMESPACE_URL, f"agno-memory/{user_id}/{memory_id}"))
+
+    def _is_indexed(self, document: Document) -> bool:
+        """Returns True if the document was indexed with the same text, e.g. by another process"""
+        try:
+            return self.vector_db.name_exists(document.name)  # type: ignore
+        except NotImplementedError:
+            return False
+
+    def _id_exists(self, id: str) -> bool:
+        try:
+            return self.vector_db.id_exists(id)
+        except NotImplementedError:
+            return False
+
+    def sync(self, user_id: str, memories: Dict[str, UserMemory]) -> None:
+        with self._lock:
+            changed = self._get_changes(user_id, memories)
+            if not changed:
+                return
+            if not self._created:
+                self.vector_db.create()
+                self._created = True
+
+            text_hashes = self._text_hashes.setdefault(user_id, {})
+            documents: List[Document] = []
+            for memory_id, text in changed.items():
+                text_hash = _get_text_hash(text)
+                document_id = self.get_document_id(user_id, memory_id)
+                document = Document(
+                    id=document_id,
+                    name=f"{document_id}:{text_hash}",
+                    content=text,
+                    meta_data={"user_id": user_id, "memory_id": memory_id, "text_hash": text_hash},
+                )
+                # Memories not synced by this index yet can already be in the VectorDb
+                if memory_id not in text_hashes and self._is_indexed(document):
+                    text_hashes[memory_id] = text_hash
+                    continue
+                documents.append(document)
+            if not documents:
+                return
+
+            upsert = self.vector_db.upsert_available()
+            new_documents = documents
+            if not upsert:
+                # Inserting a document again would duplicate it, so only new memories are inserted
+                new_documents = [document for document in documents if not self._id_exists(document.id)]  # type: ignore
+                if len(new_documents) < len(documents):
+                    log_warning(
+                        f"{self.vector_db.__class__.__name__} can't replace documents, "
+                        f"{len(documents) - len(new_documents)} changed memories keep their previous text in the index"
+                    )
+            log_debug(f"Indexing {len(new_documents)} memories of user: {user_id}")
+            for i in range(0, len(new_documents), self.batch_size):
+                batch = new_documents[i : i + self.batch_size]
+                if upsert:
+                    self.vector_db.upsert(batch, filters={"user_id": user_id})
+                else:
+                    self.vector_db.insert(batch, filters={"user_id": user_id})
+            for document in documents:
+                text_hashes[document.meta_data["memory_id"]] = document.meta_data["text_hash"]
+
+    def search(self, user_id: str, query: str, limit: int) -> List[str]:
+        if limit <= 0:
+            return []
+        documents = self.vector_db.search(query=query, limit=limit, filters={"user_id": user_id})
+        memory_ids: List[str] = []
+        for document in documents:
+            if document.meta_data.get("user_id", user_id) != user_id:
+                continue
+            memory_id = document.meta_data.get("memory_id") or document.id
+            if memory_id is not None and memory_id not in memory_ids:
+                memory_ids.append(memory_id)
+        return memory_ids
@@ -5,7 +5,7 @@ from typing import Any, Callable, Dict, List, Optional, cast
 
 from agno.memory.v2.db.base import MemoryDb
 from agno.memory.v2.db.schema import MemoryRow
-from agno.memory.v2.schema import UserMemory
+from agno.memory.v2.schema import UserMemory, get_input_hash
 from agno.models.base import Model
 from agno.models.message import Message
 from agno.tools.function import Function
@@ -163,13 +163,19 @@ class MemoryManager:
             input_string = messages[0].get_content_string()
         else:
             input_string = f"{', '.join([m.get_content_string() for m in messages if m.role == 'user' and m.content])}"
+        input_hashes = [get_input_hash(m.get_content_string()) for m in messages if m.content]
 
         model_copy = deepcopy(self.model)
         # Update the Model (set defaults, add logit etc.)
         self.add_tools_to_model(
             model_copy,
             self._get_db_tools(
-                user_id, db, input_string, enable_delete_memory=delete_memories, enable_clear_memory=clear_memories
+                user_id,
+                db,
+                input_string,
+                input_hashes=input_hashes,
+                enable_delete_memory=delete_memories,
+                enable_clear_memory=clear_memories,
             ),
         )
 
@@ -211,13 +217,19 @@ class MemoryManager:
             input_string = messages[0].get_content_string()
         else:
             input_string = f"{', '.join([m.get_content_string() for m in messages if m.role == 'user' and m.content])}"
+        input_hashes = [get_input_hash(m.get_content_string()) for m in messages if m.content]
 
         model_copy = deepcopy(self.model)
         # Update the Model (set defaults, add logit etc.)
         self.add_tools_to_model(
             model_copy,
             self._get_db_tools(
-                user_id, db, input_string, enable_delete_memory=delete_memories, enable_clear_memory=clear_memories
+                user_id,
+                db,
+                input_string,
+                input_hashes=input_hashes,
+                enable_delete_memory=delete_memories,
+                enable_clear_memory=clear_memories,
             ),
         )
 
@@ -330,6 +342,7 @@ class MemoryManager:
         user_id: str,
         db: MemoryDb,
         input_string: str,
+        input_hashes: Optional[List[str]] = None,
         enable_add_memory: bool = True,
         enable_update_memory: bool = True,
         enable_delete_memory: bool = True,
@@ -360,6 +373,7 @@ class MemoryManager:
                             topics=topics,
                             last_updated=last_updated,
                             input=input_string,
+                            input_hashes=input_hashes,
                         ).to_dict(),
                         last_updated=last_updated,
                     )
@@ -391,6 +405,7 @@ class MemoryManager:
                             topics=topics,
                             last_updated=last_updated,
                             input=input_string,
+                            input_hashes=input_hashes,
                         ).to_dict(),
                         last_updated=last_updated,
                     )
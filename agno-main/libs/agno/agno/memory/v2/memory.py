@@ -3,7 +3,9 @@ from copy import deepcopy
 from dataclasses import dataclass, field
 from datetime import datetime
 from os import getenv
-from typing import Any, Dict, List, Literal, Optional, Union
+from threading import RLock
+from time import monotonic
+from typing import TYPE_CHECKING, Any, Dict, List, Literal, Optional, Tuple, Union
 
 from pydantic import BaseModel, Field
 
@@ -12,7 +14,7 @@ from agno.memory.v2.db.base import MemoryDb
 from agno.memory.v2.db.schema import MemoryRow
 from agno.memory.v2.manager import MemoryManager
 from agno.memory.v2.schema import SessionSummary, UserMemory
-from agno.memory.v2.summarizer import SessionSummarizer
+from agno.memory.v2.summarizer import SessionSummarizer, SessionSummaryResponse
 from agno.models.base import Model
 from agno.models.message import Message
 from agno.run.response import RunResponse
@@ -20,6 +22,11 @@ from agno.run.team import TeamRunResponse
 from agno.utils.log import log_debug, log_warning, logger, set_log_level_to_debug, set_log_level_to_info
 from agno.utils.prompts import get_json_output_prompt
 from agno.utils.string import parse_response_model_str
+from agno.utils.tokens import get_messages_within_token_budget, get_num_runs_within_token_budget
+
+if TYPE_CHECKING:
+    from agno.memory.v2.index import MemoryIndex
+    from agno.memory.v2.worker import MemoryWorker
 
 
 class MemorySearchResponse(BaseModel):
@@ -87,6 +94,14 @@ class Memory:
 
     db: Optional[MemoryDb] = None
 
+    # Index to search user memories by similarity, see agno.memory.v2.index
+    memory_index: Optional["MemoryIndex"] = None
+    # Seconds for which the memories of a user read from the db are used without checking the db for changes.
+    # Otherwise, only the memories updated since the last read are read again, if the db supports it.
+    refresh_interval: Optional[float] = None
+    # Worker creating the memories and summaries of runs in the background, see agno.memory.v2.worker
+    memory_worker: Optional["MemoryWorker"] = None
+
     # runs per session
     runs: Optional[Dict[str, List[Union[RunResponse, TeamRunResponse]]]] = None
 
@@ -107,6 +122,9 @@ class Memory:
         memory_manager: Optional[MemoryManager] = None,
         summarizer: Optional[SessionSummarizer] = None,
         db: Optional[MemoryDb] = None,
+        memory_index: Optional["MemoryIndex"] = None,
+        refresh_interval: Optional[float] = None,
+        memory_worker: Optional["MemoryWorker"] = None,
         memories: Optional[Dict[str, Dict[str, UserMemory]]] = None,
         summaries: Optional[Dict[str, Dict[str, SessionSummary]]] = None,
         runs: Optional[Dict[str, List[Union[RunResponse, TeamRunResponse]]]] = None,
@@ -134,6 +152,14 @@ class Memory:
 
         self.db = db
 
+        self.memory_index = memory_index
+        self.refresh_interval = refresh_interval
+        self.memory_worker = memory_worker
+        # When the memories of each user were read from the db, and the last update time of the memories read
+        self._memory_syncs: Dict[str, Dict[str, Any]] = {}
+        # Guards the updates of the memories and summaries, which the memory_worker makes from its thread
+        self._lock = RLock()
+
         # We are making memories
         if self.model is not None:
             if self.memory_manager is None:
@@ -175,18 +201,81 @@ class Memory:
             self.model = OpenAIChat(id="gpt-4o")
         return self.model
 
-    def refresh_from_db(self, user_id: Optional[str] = None):
-        if self.db:
+    def refresh_from_db(self, user_id: Optional[str] = None, force: bool = False):
+        """
+        Read the memories from the db.
+
+        Args:
+            user_id: Read only the memories of this user.
+            force: Read the memories even if they were read less than refresh_interval seconds ago, e.g. after the
+                memory manager wrote to the db.
+        """
+        if not self.db:
+            return
+        with self._lock:
+            if self.memories is None:
+                self.memories = {}
+
+            # The memories are read into new dicts that replace the current ones, so they can be read while refreshed
             # If no user_id is provided, read all memories
             if user_id is None:
-                all_memories = self.db.read_memories()
-            else:
-                all_memories = self.db.read_memories(user_id=user_id)
-            # Reset the memories
-            self.memories = {}
-            for memory in all_memories:
-                if memory.user_id is not None and memory.id is not None:
-                    self.memories.setdefault(memory.user_id, {})[memory.id] = UserMemory.from_dict(memory.memory)
+                memories: Dict[str, Dict[str, UserMemory]] = {}
+                memory_syncs: Dict[str, Dict[str, Any]] = {}
+                self._load_memory_rows(self.db.read_memories(), memories, memory_syncs)
+                self.memories, self._memory_syncs = memories, memory_syncs
+                return
+
+            memory_sync = self._memory_syncs.get(user_id)
+            if memory_sync is not None:
+                if (
+                    not force
+                    and self.refresh_interval is not None
+                    and monotonic() - memory_sync["refreshed_at"] < self.refresh_interval
+                ):
+                    return
+                if memory_sync["updated_at"] is not None and self.db.incremental_read_available():
+                    # Read only the memories updated since the last read, and drop the deleted memories
+                    memory_rows = self.db.read_memories_updated_since(since=memory_sync["updated_at"], user_id=user_id)
+                    memory_ids = set(self.db.read_memory_ids(user_id=user_id))
+                    user_memories = {
+                        memory_id: memory
+                        for memory_id, memory in self.memories.get(user_id, {}).items()
+                        if memory_id in memory_ids
+                    }
+                    log_debug(f"Read {len(memory_rows)} updated memories of user: {user_id}")
+                    memories = {user_id: user_memories}
+                    self._load_memory_rows(memory_rows, memories, self._memory_syncs, user_id=user_id)
+                    self.memories.update(memories)
+                    return
+
+            # Read all the memories of the user
+            memories = {user_id: {}}
+            self._memory_syncs.pop(user_id, None)
+            self._load_memory_rows(
+                self.db.read_memories(user_id=user_id), memories, self._memory_syncs, user_id=user_id
+            )
+            self.memories.update(memories)
+
+    @staticmethod
+    def _load_memory_rows(
+        memory_rows: List[MemoryRow],
+        memories: Dict[str, Dict[str, UserMemory]],
+        memory_syncs: Dict[str, Dict[str, Any]],
+        user_id: Optional[str] = None,
+    ) -> None:
+        """Add memories read from the db, and record the last update time of the memories read per user"""
+        refreshed_at = monotonic()
+        if user_id is not None:
+            memory_syncs.setdefault(user_id, {"updated_at": None})["refreshed_at"] = refreshed_at
+        for memory in memory_rows:
+            if memory.user_id is not None and memory.id is not None:
+                memories.setdefault(memory.user_id, {})[memory.id] = UserMemory.from_dict(memory.memory)
+                memory_sync = memory_syncs.setdefault(memory.user_id, {"updated_at": None})
+                memory_sync["refreshed_at"] = refreshed_at
+                if memory.last_updated is not None and (
+                    memory_sync["updated_at"] is None or memory.last_updated > memory_sync["updated_at"]
+                ):
+                    memory_sync["updated_at"] = memory.last_updated
 
     def set_log_level(self):
         if self.debug_mode or getenv("AGNO_DEBUG", "false").lower() == "true":
@@ -300,7 +389,8 @@ class Memory:
         if not memory.last_updated:
             memory.last_updated = datetime.now()
 
-        self.memories.setdefault(user_id, {})[memory_id] = memory  # type: ignore
+        with self._lock:
+            self.memories.setdefault(user_id, {})[memory_id] = memory  # type: ignore
         if self.db:
             self._upsert_db_memory(
                 memory=MemoryRow(
@@ -339,11 +429,11 @@ class Memory:
         if not memory.last_updated:
             memory.last_updated = datetime.now()
 
-        if memory_id not in self.memories[user_id]:  # type: ignore
-            log_warning(f"Memory {memory_id} not found for user {user_id}")
-            return None
-
-        self.memories.setdefault(user_id, {})[memory_id] = memory  # type: ignore
+        with self._lock:
+            if memory_id not in self.memories[user_id]:  # type: ignore
+                log_warning(f"Memory {memory_id} not found for user {user_id}")
+                return None
+            self.memories.setdefault(user_id, {})[memory_id] = memory  # type: ignore
         if self.db:
             self._upsert_db_memory(
                 memory=MemoryRow(
@@ -374,7 +464,8 @@ class Memory:
         if refresh_from_db:
             self.refresh_from_db(user_id=user_id)
 
-        del self.memories[user_id][memory_id]  # type: ignore
+        with self._lock:
+            del self.memories[user_id][memory_id]  # type: ignore
         if self.db:
             self._delete_db_memory(memory_id=memory_id)
 
@@ -384,7 +475,8 @@ class Memory:
             user_id (str): The user id to delete the memory from
             session_id (str): The id of the session to delete
         """
-        del self.summaries[user_id][session_id]  # type: ignore
+        with self._lock:
+            del self.summaries[user_id][session_id]  # type: ignore
 
     def get_runs(self, session_id: str) -> List[Union[RunResponse, TeamRunResponse]]:
         """Get all runs for a given session id"""
@@ -393,6 +485,27 @@ class Memory:
         return self.runs.get(session_id, [])
 
     # -*- Agent Functions
+    def _get_conversation_to_summarize(
+        self, session_id: str, user_id: str
+    ) -> Tuple[List[Message], Optional[SessionSummaryResponse], int]:
+        """
+        Returns the messages of the session to summarize, the summary to add them to, and the number of messages of
+        the session. With an incremental summarizer, only the messages after the last summary are summarized.
+        """
+        messages = self.get_messages_for_session(session_id=session_id)
+        session_summary = (self.summaries or {}).get(user_id, {}).get(session_id)
+        if (
+            self.summary_manager is not None
+            and self.summary_manager.incremental
+            and session_summary is not None
+            and session_summary.num_messages is not None
+            and session_summary.num_messages <= len(messages)
+        ):
+            log_debug(f"Adding {len(messages) - session_summary.num_messages} messages to the summary of: {session_id}")
+            previous_summary = SessionSummaryResponse(summary=session_summary.summary, topics=session_summary.topics)
+            return messages[session_summary.num_messages :], previous_summary, len(messages)
+        return messages, None, len(messages)
+
     def create_session_summary(self, session_id: str, user_id: Optional[str] = None) -> Optional[SessionSummary]:
         """Creates a summary of the session"""
 
@@ -404,13 +517,20 @@ class Memory:
         if user_id is None:
             user_id = "default"
 
-        summary_response = self.summary_manager.run(conversation=self.get_messages_for_session(session_id=session_id))
+        conversation, previous_summary, num_messages = self._get_conversation_to_summarize(session_id, user_id)
+        if previous_summary is not None and not conversation:
+            return self.summaries[user_id][session_id]  # type: ignore
+        summary_response = self.summary_manager.run(conversation=conversation, previous_summary=previous_summary)
         if summary_response is None:
             return None
         session_summary = SessionSummary(
-            summary=summary_response.summary, topics=summary_response.topics, last_updated=datetime.now()
+            summary=summary_response.summary,
+            topics=summary_response.topics,
+            last_updated=datetime.now(),
+            num_messages=num_messages,
         )
-        self.summaries.setdefault(user_id, {})[session_id] = session_summary  # type: ignore
+        with self._lock:
+            self.summaries.setdefault(user_id, {})[session_id] = session_summary  # type: ignore
 
         return session_summary
 
@@ -424,15 +544,20 @@ class Memory:
         if user_id is None:
             user_id = "default"
 
-        summary_response = await self.summary_manager.arun(
-            conversation=self.get_messages_for_session(session_id=session_id)
-        )
+        conversation, previous_summary, num_messages = self._get_conversation_to_summarize(session_id, user_id)
+        if previous_summary is not None and not conversation:
+            return self.summaries[user_id][session_id]  # type: ignore
+        summary_response = await self.summary_manager.arun(conversation=conversation, previous_summary=previous_summary)
         if summary_response is None:
             return None
         session_summary = SessionSummary(
-            summary=summary_response.summary, topics=summary_response.topics, last_updated=datetime.now()
+            summary=summary_response.summary,
+            topics=summary_response.topics,
+            last_updated=datetime.now(),
+            num_messages=num_messages,
         )
-        self.summaries.setdefault(user_id, {})[session_id] = session_summary  # type: ignore
+        with self._lock:
+            self.summaries.setdefault(user_id, {})[session_id] = session_summary  # type: ignore
 
         return session_summary
 
@@ -480,8 +605,10 @@ class Memory:
             clear_memories=self.clear_memories,
         )
 
-        # We refresh from the DB
-        self.refresh_from_db(user_id=user_id)
+        # The memory manager wrote to the DB, so we refresh even within the refresh_interval
+        self.refresh_from_db(user_id=user_id, force=True)
+        # Embed the new memories in one batch
+        self.index_user_memories(user_id=user_id)
         return response
 
     async def acreate_user_memories(
@@ -529,8 +656,10 @@ class Memory:
             clear_memories=self.clear_memories,
         )
 
-        # We refresh from the DB
-        self.refresh_from_db()
+        # The memory manager wrote to the DB, so we refresh even within the refresh_interval
+        self.refresh_from_db(user_id=user_id, force=True)
+        # Embed the new memories in one batch
+        await self.aindex_user_memories(user_id=user_id)
 
         return response
 
@@ -562,8 +691,8 @@ class Memory:
             clear_memories=self.clear_memories,
         )
 
-        # We refresh from the DB
-        self.refresh_from_db(user_id=user_id)
+        # The memory manager wrote to the DB, so we refresh even within the refresh_interval
+        self.refresh_from_db(user_id=user_id, force=True)
 
         return response
 
@@ -596,8 +725,8 @@ class Memory:
             clear_memories=self.clear_memories,
         )
 
-        # We refresh from the DB
-        self.refresh_from_db(user_id=user_id)
+        # The memory manager wrote to the DB, so we refresh even within the refresh_interval
+        self.refresh_from_db(user_id=user_id, force=True)
 
         return response
 
@@ -678,6 +807,7 @@ class Memory:
         last_n: Optional[int] = None,
         skip_role: Optional[str] = None,
         skip_history_messages: bool = True,
+        max_tokens: Optional[int] = None,
     ) -> List[Message]:
         """Returns the messages from the last_n runs, excluding previously tagged history messages.
         Args:
@@ -685,6 +815,8 @@ class Memory:
             last_n: The number of runs to return from the end of the conversation. Defaults to all runs.
             skip_role: Skip messages with this role.
             skip_history_messages: Skip messages that were tagged as history in previous runs.
+            max_tokens: Only return the messages of the most recent runs that fit in this number of tokens.
+                If the most recent run doesn't fit, its most recent messages that fit are returned.
         Returns:
             A list of Messages from the specified runs, excluding history messages.
         """
@@ -693,6 +825,26 @@ class Memory:
 
         session_runs = self.runs.get(session_id, [])
         runs_to_process = session_runs[-last_n:] if last_n is not None else session_runs
+        # Token budget of the most recent run when it doesn't fit in max_tokens on its own
+        last_run_max_tokens: Optional[int] = None
+        if max_tokens is not None:
+            num_runs = get_num_runs_within_token_budget(
+                (
+                    [
+                        message
+                        for message in (run_response.messages if run_response and run_response.messages else [])
+                        if not (skip_role and message.role == skip_role)
+                        and not (message.from_history and skip_history_messages)
+                    ]
+                    for run_response in reversed(runs_to_process)
+                ),
+                max_tokens=max_tokens,
+            )
+            if num_runs == 0 and runs_to_process:
+                # Keep the most recent messages of the most recent run rather than no history at all
+                last_run_max_tokens = max_tokens
+                num_runs = 1
+            runs_to_process = runs_to_process[len(runs_to_process) - num_runs :]
         messages_from_history = []
         system_message = None
         for run_response in runs_to_process:
@@ -714,6 +866,13 @@ class Memory:
                 else:
                     messages_from_history.append(message)
 
+        if last_run_max_tokens is not None:
+            messages_from_history = get_messages_within_token_budget(messages_from_history, last_run_max_tokens)
+            log_warning(
+                f"The most recent run does not fit in {last_run_max_tokens} tokens, "
+                f"only its last {len(messages_from_history)} messages are used as history"
+            )
+
         log_debug(f"Getting messages from previous runs: {len(messages_from_history)}")
         return messages_from_history
 
@@ -736,20 +895,23 @@ class Memory:
         self,
         query: Optional[str] = None,
         limit: Optional[int] = None,
-        retrieval_method: Optional[Literal["last_n", "first_n", "agentic"]] = None,
+        retrieval_method: Optional[Literal["last_n", "first_n", "agentic", "semantic"]] = None,
         user_id: Optional[str] = None,
         refresh_from_db: bool = True,
+        rerank: bool = False,
     ) -> List[UserMemory]:
         """Search through user memories using the specified retrieval method.
 
         Args:
-            query: The search query for agentic search. Required if retrieval_method is "agentic".
+            query: The search query for agentic and semantic search. Required if retrieval_method is "agentic" or "semantic".
             limit: Maximum number of memories to return. Defaults to self.retrieval_limit if not specified. Optional.
             retrieval_method: The method to use for retrieving memories. Defaults to self.retrieval if not specified.
                 - "last_n": Return the most recent memories
                 - "first_n": Return the oldest memories
                 - "agentic": Return memories most similar to the query, but using an agentic approach
+                - "semantic": Return memories most similar to the query, using the embeddings of the memory_index
             user_id: The user to search for. Optional.
+            rerank: For semantic search, rerank the most similar memories with the agentic approach.
 
         Returns:
             A list of UserMemory objects matching the search criteria.
@@ -778,6 +940,12 @@ class Memory:
 
             return self._search_user_memories_agentic(user_id=user_id, query=query, limit=limit)
 
+        elif retrieval_method == "semantic":
+            if not query:
+                raise ValueError("Query is required for semantic search")
+
+            return self._search_user_memories_semantic(user_id=user_id, query=query, limit=limit, rerank=rerank)
+
         elif retrieval_method == "first_n":
             return self._get_first_n_memories(user_id=user_id, limit=limit)
 
@@ -803,8 +971,59 @@ class Memory:
             model.response_format = {"type": "json_object"}
             model.structured_outputs = False
 
-    def _search_user_memories_agentic(self, user_id: str, query: str, limit: Optional[int] = None) -> List[UserMemory]:
-        """Search through user memories using agentic search."""
+    def index_user_memories(self, user_id: Optional[str] = None) -> None:
+        """Embed the new and changed memories of a user in the memory_index"""
+        if self.memory_index is None or self.memories is None:
+            return
+        if user_id is None:
+            user_id = "default"
+        self.memory_index.sync(user_id, self.memories.get(user_id, {}))
+
+    async def aindex_user_memories(self, user_id: Optional[str] = None) -> None:
+        """Embed the new and changed memories of a user in the memory_index, without blocking the event loop"""
+        if self.memory_index is None or self.memories is None:
+            return
+        if user_id is None:
+            user_id = "default"
+        # The memories can change while they are embedded in a thread
+        await self.memory_index.async_sync(user_id, dict(self.memories.get(user_id, {})))
+
+    def _search_user_memories_semantic(
+        self, user_id: str, query: str, limit: Optional[int] = None, rerank: bool = False
+    ) -> List[UserMemory]:
+        """Search through user memories by the similarity of their embeddings to the query."""
+        if self.memory_index is None:
+            raise ValueError("A memory_index is required for semantic search")
+        if not self.memories:
+            return []
+        user_memories: Dict[str, UserMemory] = self.memories.get(user_id, {})
+        if not user_memories:
+            return []
+
+        self.index_user_memories(user_id=user_id)
+        limit = limit if limit is not None and limit > 0 else len(user_memories)
+        # Rerank a few more candidates than the limit
+        num_candidates = limit * 3 if rerank else limit
+        # Deleted memories can still be in the index
+        memory_ids = [
+            memory_id
+            for memory_id in self.memory_index.search(user_id, query, num_candidates)
+            if memory_id in user_memories
+        ]
+        log_debug(f"Found {len(memory_ids)} similar memories")
+        if rerank and memory_ids:
+            candidates = {memory_id: user_memories[memory_id] for memory_id in memory_ids}
+            return self._search_user_memories_agentic(user_id=user_id, query=query, limit=limit, candidates=candidates)
+        return [user_memories[memory_id] for memory_id in memory_ids[:limit]]
+
+    def _search_user_memories_agentic(
+        self,
+        user_id: str,
+        query: str,
+        limit: Optional[int] = None,
+        candidates: Optional[Dict[str, UserMemory]] = None,
+    ) -> List[UserMemory]:
+        """Search through user memories using agentic search. Only the candidates are searched, if provided."""
         if not self.memories:
             return []
 
@@ -815,7 +1034,7 @@ class Memory:
         log_debug("Searching for memories", center=True)
 
         # Get all memories as a list
-        user_memories: Dict[str, UserMemory] = self.memories[user_id]
+        user_memories: Dict[str, UserMemory] = candidates if candidates is not None else self.memories[user_id]
         system_message_str = "Your task is to search through user memories and return the IDs of the memories that are related to the query.\n"
         system_message_str += "\n<user_memories>\n"
         for memory in user_memories.values():
@@ -868,7 +1087,8 @@ class Memory:
         memories_to_return = []
         if memory_search:
             for memory_id in memory_search.memory_ids:
-                memories_to_return.append(user_memories[memory_id])
+                if memory_id in user_memories:
+                    memories_to_return.append(user_memories[memory_id])
         return memories_to_return[:limit]
 
     def _get_last_n_memories(self, user_id: str, limit: Optional[int] = None) -> List[UserMemory]:
@@ -941,8 +1161,12 @@ class Memory:
         """Clears the memory."""
         if self.db:
             self.db.clear()
-        self.memories = {}
-        self.summaries = {}
+        if self.memory_index is not None:
+            self.memory_index.clear()
+        with self._lock:
+            self._memory_syncs = {}
+            self.memories = {}
+            self.summaries = {}
 
     def deep_copy(self) -> "Memory":
         from copy import deepcopy
@@ -952,7 +1176,7 @@ class Memory:
 
         # Manually deepcopy fields that are known to be safe
         for field_name, field_value in self.__dict__.items():
-            if field_name not in ["db", "memory_manager", "summary_manager"]:
+            if field_name not in ["db", "memory_manager", "summary_manager", "_lock"]:
                 try:
                     setattr(copied_obj, field_name, deepcopy(field_value))
                 except Exception as e:
@@ -1,8 +1,14 @@
 from dataclasses import dataclass
 from datetime import datetime
+from hashlib import sha256
 from typing import Any, Dict, List, Optional
 
 
+def get_input_hash(input: str) -> str:
+    """The hash of a message memories are created from, to skip the messages memories were already created from"""
+    return sha256(input.encode("utf-8")).hexdigest()
+
+
 @dataclass
 class UserMemory:
     """Model for User Memories"""
@@ -12,6 +18,8 @@ class UserMemory:
     input: Optional[str] = None
     last_updated: Optional[datetime] = None
     memory_id: Optional[str] = None
+    # Hashes of each message the memory was created from, see get_input_hash
+    input_hashes: Optional[List[str]] = None
 
     def to_dict(self) -> Dict[str, Any]:
         _dict = {
@@ -20,6 +28,7 @@ class UserMemory:
             "topics": self.topics,
             "last_updated": self.last_updated.isoformat() if self.last_updated else None,
             "input": self.input,
+            "input_hashes": self.input_hashes,
         }
         return {k: v for k, v in _dict.items() if v is not None}
 
@@ -38,12 +47,15 @@ class SessionSummary:
     summary: str
     topics: Optional[List[str]] = None
     last_updated: Optional[datetime] = None
+    # Number of messages of the session the summary includes, the next summary only adds the messages after them
+    num_messages: Optional[int] = None
 
     def to_dict(self) -> Dict[str, Any]:
         _dict = {
             "summary": self.summary,
             "topics": self.topics,
             "last_updated": self.last_updated.isoformat() if self.last_updated else None,
+            "num_messages": self.num_messages,
         }
         return {k: v for k, v in _dict.items() if v is not None}
 
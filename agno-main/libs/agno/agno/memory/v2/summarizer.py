@@ -1,3 +1,4 @@
+import asyncio
 from copy import deepcopy
 from dataclasses import dataclass
 from textwrap import dedent
@@ -7,6 +8,7 @@ from pydantic import BaseModel, Field
 
 from agno.models.base import Model
 from agno.models.message import Message
+from agno.models.response import ModelResponse
 from agno.utils.log import log_debug, log_error, log_info, log_warning
 from agno.utils.prompts import get_json_output_prompt
 from agno.utils.string import parse_response_model_str
@@ -39,6 +41,13 @@ class SessionSummarizer:
     # Additional instructions for the summarizer. If not provided, a default prompt will be used.
     additional_instructions: Optional[str] = None
 
+    # If True, only the messages added to a session since its last summary are summarized, into the last summary
+    incremental: bool = True
+
+    # Maximum number of messages summarized in one request. Longer conversations are summarized in segments, and the
+    # summaries of the segments are merged, so the size of each request stays bounded.
+    max_messages: Optional[int] = 50
+
     # Whether the summarizer has created a summary
     summary_updated: bool = False
 
@@ -47,12 +56,18 @@ class SessionSummarizer:
         model: Optional[Model] = None,
         system_message: Optional[str] = None,
         additional_instructions: Optional[str] = None,
+        incremental: bool = True,
+        max_messages: Optional[int] = 50,
     ):
         self.model = model
         if self.model is not None and isinstance(self.model, str):
             raise ValueError("Model must be a Model object, not a string")
         self.system_message = system_message
         self.additional_instructions = additional_instructions
+        self.incremental = incremental
+        if max_messages is not None and max_messages < 2:
+            raise ValueError("max_messages must be at least 2")
+        self.max_messages = max_messages
 
     def update_model(self, model: Model) -> None:
         model = cast(Model, model)
@@ -72,27 +87,51 @@ class SessionSummarizer:
         else:
             model.response_format = {"type": "json_object"}
 
-    def get_system_message(self, conversation: List[Message], model: Model) -> Message:
+    def get_system_message(
+        self,
+        conversation: List[Message],
+        model: Model,
+        previous_summaries: Optional[List[SessionSummaryResponse]] = None,
+    ) -> Message:
         if self.system_message is not None:
             return Message(role="system", content=self.system_message)
 
-        # -*- Return a system message for summarization
-        system_prompt = dedent("""\
-        Analyze the following conversation between a user and an assistant, and extract the following details:
-          - Summary (str): Provide a concise summary of the session, focusing on important information that would be helpful for future interactions.
-          - Topics (Optional[List[str]]): List the topics discussed in the session.
-        Keep the summary concise and to the point. Only include relevant information.
-
-        <conversation>
-        """)
         conversation_messages = []
         for message in conversation:
             if message.role == "user":
                 conversation_messages.append(f"User: {message.content}")
             elif message.role in ["assistant", "model"]:
                 conversation_messages.append(f"Assistant: {message.content}\n")
-        system_prompt += "\n".join(conversation_messages)
-        system_prompt += "</conversation>"
+
+        # -*- Return a system message for summarization
+        if previous_summaries:
+            system_prompt = dedent("""\
+            Below are the summaries of the earlier parts of a session between a user and an assistant, in order, and the new messages of the session if any.
+            Combine them into a summary of the whole session, and extract the following details:
+              - Summary (str): Provide a concise summary of the session, focusing on important information that would be helpful for future interactions.
+              - Topics (Optional[List[str]]): List the topics discussed in the session.
+            Keep the summary concise and to the point. Only include relevant information.
+
+            <summaries>
+            """)
+            for previous_summary in previous_summaries:
+                system_prompt += f"Summary: {previous_summary.summary}\n"
+                if previous_summary.topics:
+                    system_prompt += f"Topics: {', '.join(previous_summary.topics)}\n"
+            system_prompt += "</summaries>\n"
+            if conversation_messages:
+                system_prompt += "\n<new_messages>\n" + "\n".join(conversation_messages) + "</new_messages>"
+        else:
+            system_prompt = dedent("""\
+            Analyze the following conversation between a user and an assistant, and extract the following details:
+              - Summary (str): Provide a concise summary of the session, focusing on important information that would be helpful for future interactions.
+              - Topics (Optional[List[str]]): List the topics discussed in the session.
+            Keep the summary concise and to the point. Only include relevant information.
+
+            <conversation>
+            """)
+            system_prompt += "\n".join(conversation_messages)
+            system_prompt += "</conversation>"
 
         if self.additional_instructions:
             system_prompt += "\n" + self.additional_instructions
@@ -102,41 +141,25 @@ class SessionSummarizer:
 
         return Message(role="system", content=system_prompt)
 
-    def run(
+    def _get_messages_for_model(
         self,
         conversation: List[Message],
-    ) -> Optional[SessionSummaryResponse]:
-        if self.model is None:
-            log_error("No model provided for summary_manager")
-            return None
-
-        log_debug("SessionSummarizer Start", center=True)
-
-        if conversation is None or len(conversation) == 0:
-            log_info("No conversation provided for summarization.")
-            return None
-
-        model_copy = deepcopy(self.model)
-        self.update_model(model_copy)
-
-        # Prepare the List of messages to send to the Model
-        messages_for_model: List[Message] = [
-            self.get_system_message(conversation, model=model_copy),
+        model: Model,
+        previous_summaries: Optional[List[SessionSummaryResponse]] = None,
+    ) -> List[Message]:
+        return [
+            self.get_system_message(conversation, model=model, previous_summaries=previous_summaries),
             # For models that require a non-system message
             Message(role="user", content="Provide the summary of the conversation."),
         ]
 
-        # Generate a response from the Model (includes running function calls)
-        response = model_copy.response(messages=messages_for_model)
-
+    def _parse_response(self, response: ModelResponse, model: Model) -> Optional[SessionSummaryResponse]:
         if response.content is not None:
             self.summary_updated = True
 
-        log_debug("SessionSummarizer End", center=True)
-
         # If the model natively supports structured outputs, the parsed value is already in the structured format
         if (
-            model_copy.supports_native_structured_outputs
+            model.supports_native_structured_outputs
             and response.parsed is not None
             and isinstance(response.parsed, SessionSummaryResponse)
         ):
@@ -159,10 +182,45 @@ class SessionSummarizer:
 
         return None
 
-    async def arun(
+    def _summarize(
+        self, conversation: List[Message], previous_summaries: Optional[List[SessionSummaryResponse]] = None
+    ) -> Optional[SessionSummaryResponse]:
+        """Summarize the conversation and the previous summaries in one request"""
+        model_copy = deepcopy(self.model)
+        self.update_model(model_copy)  # type: ignore
+        messages_for_model = self._get_messages_for_model(conversation, model_copy, previous_summaries)  # type: ignore
+        # Generate a response from the Model (includes running function calls)
+        response = model_copy.response(messages=messages_for_model)  # type: ignore
+        return self._parse_response(response, model_copy)  # type: ignore
+
+    async def _asummarize(
+        self, conversation: List[Message], previous_summaries: Optional[List[SessionSummaryResponse]] = None
+    ) -> Optional[SessionSummaryResponse]:
+        model_copy = deepcopy(self.model)
+        self.update_model(model_copy)  # type: ignore
+        messages_for_model = self._get_messages_for_model(conversation, model_copy, previous_summaries)  # type: ignore
+        response = await model_copy.aresponse(messages=messages_for_model)  # type: ignore
+        return self._parse_response(response, model_copy)  # type: ignore
+
+    def _split(self, items: List[Any]) -> List[List[Any]]:
+        """Split a list into groups of at most max_messages"""
+        if self.max_messages is None or len(items) <= self.max_messages:
+            return [items]
+        return [items[i : i + self.max_messages] for i in range(0, len(items), self.max_messages)]
+
+    def run(
         self,
         conversation: List[Message],
+        previous_summary: Optional[SessionSummaryResponse] = None,
     ) -> Optional[SessionSummaryResponse]:
+        """
+        Summarize a conversation.
+
+        Args:
+            conversation (List[Message]): The messages to summarize.
+            previous_summary (Optional[SessionSummaryResponse]): The summary of the earlier messages of the session.
+                The messages are summarized into it.
+        """
         if self.model is None:
             log_error("No model provided for summary_manager")
             return None
@@ -173,44 +231,60 @@ class SessionSummarizer:
             log_info("No conversation provided for summarization.")
             return None
 
-        model_copy = deepcopy(self.model)
-        self.update_model(model_copy)
+        segments = self._split(conversation)
+        if len(segments) == 1:
+            session_summary = self._summarize(conversation, [previous_summary] if previous_summary else None)
+        else:
+            # Summarize the segments separately, then merge their summaries level by level
+            log_debug(f"Summarizing {len(conversation)} messages in {len(segments)} segments")
+            summaries = [previous_summary] if previous_summary else []
+            for segment in segments:
+                segment_summary = self._summarize(segment)
+                if segment_summary is not None:
+                    summaries.append(segment_summary)
+            while len(summaries) > 1:
+                merged = []
+                for group in self._split(summaries):
+                    group_summary = self._summarize([], group) if len(group) > 1 else group[0]
+                    if group_summary is not None:
+                        merged.append(group_summary)
+                summaries = merged
+            session_summary = summaries[0] if summaries else None
 
-        # Prepare the List of messages to send to the Model
-        messages_for_model: List[Message] = [
-            self.get_system_message(conversation, model=model_copy),
-            # For models that require a non-system message
-            Message(role="user", content="Provide the summary of the conversation."),
-        ]
+        log_debug("SessionSummarizer End", center=True)
+        return session_summary
 
-        # Generate a response from the Model (includes running function calls)
-        response = await model_copy.aresponse(messages=messages_for_model)
+    async def arun(
+        self,
+        conversation: List[Message],
+        previous_summary: Optional[SessionSummaryResponse] = None,
+    ) -> Optional[SessionSummaryResponse]:
+        """Summarize a conversation, see run. The segments of long conversations are summarized concurrently."""
+        if self.model is None:
+            log_error("No model provided for summary_manager")
+            return None
 
-        if response.content is not None:
-            self.summary_updated = True
+        log_debug("SessionSummarizer Start", center=True)
 
-        log_debug("SessionSummarizer End", center=True)
+        if conversation is None or len(conversation) == 0:
+            log_info("No conversation provided for summarization.")
+            return None
 
-        # If the model natively supports structured outputs, the parsed value is already in the structured format
-        if (
-            model_copy.supports_native_structured_outputs
-            and response.parsed is not None
-            and isinstance(response.parsed, SessionSummaryResponse)
-        ):
-            return response.parsed
+        segments = self._split(conversation)
+        if len(segments) == 1:
+            session_summary = await self._asummarize(conversation, [previous_summary] if previous_summary else None)
+        else:
+            log_debug(f"Summarizing {len(conversation)} messages in {len(segments)} segments")
+            segment_summaries = await asyncio.gather(*[self._asummarize(segment) for segment in segments])
+            summaries = ([previous_summary] if previous_summary else []) + [s for s in segment_summaries if s]
 
-        # Otherwise convert the response to the structured format
-        if isinstance(response.content, str):
-            try:
-                session_summary: Optional[SessionSummaryResponse] = parse_response_model_str(  # type: ignore
-                    response.content, SessionSummaryResponse
-                )
+            async def merge(group: List[SessionSummaryResponse]) -> Optional[SessionSummaryResponse]:
+                return await self._asummarize([], group) if len(group) > 1 else group[0]
 
-                # Update RunResponse
-                if session_summary is not None:
-                    return session_summary
-                else:
-                    log_warning("Failed to convert session_summary response to SessionSummaryResponse")
-            except Exception as e:
-                log_warning(f"Failed to convert session_summary response to SessionSummaryResponse: {e}")
-        return None
+            while len(summaries) > 1:
+                merged = await asyncio.gather(*[merge(group) for group in self._split(summaries)])
+                summaries = [summary for summary in merged if summary is not None]
+            session_summary = summaries[0] if summaries else None
+
+        log_debug("SessionSummarizer End", center=True)
+        return session_summary
@@ -0,0 +1,178 @@
+import atexit
+from dataclasses import dataclass, field
+from threading import Condition, Thread
+from time import monotonic
+from typing import TYPE_CHECKING, Dict, List, Optional, Set, Tuple
+
+from agno.memory.v2.schema import get_input_hash
+from agno.models.message import Message
+from agno.utils.log import log_debug, log_warning
+
+if TYPE_CHECKING:
+    from agno.memory.v2.memory import Memory
+
+
+@dataclass
+class MemoryTask:
+    """The memories and summary to create for a run"""
+
+    memory: "Memory"
+    user_id: str
+    session_id: str
+    messages: List[Message] = field(default_factory=list)
+    create_user_memories: bool = True
+    create_session_summary: bool = False
+    created_at: float = field(default_factory=monotonic)
+
+
+class MemoryWorker:
+    def __init__(self, max_batch_size: int = 5, flush_interval: float = 2.0):
+        """
+        Creates user memories and session summaries in a background thread, so they don't add to the latency of
+        runs. Set it on a Memory with `memory_worker`.
+
+        Queued runs are processed in batches: the messages of all the queued runs of a user are sent in one call to
+        the memory manager, and the summary of each session is created once per batch.
+
+        Args:
+            max_batch_size (int): Process the queue when it holds this many runs.
+            flush_interval (float): Process the queue when its oldest run was queued this many seconds ago.
+        """
+        self.max_batch_size = max_batch_size
+        self.flush_interval = flush_interval
+
+        self._queue: List[MemoryTask] = []
+        self._condition = Condition()
+        self._processing = False
+        self._flush_requested = False
+        self._stopped = False
+        self._thread: Optional[Thread] = None
+
+    @property
+    def num_queued(self) -> int:
+        return len(self._queue)
+
+    def _start(self) -> None:
+        if self._thread is None or not self._thread.is_alive():
+            self._stopped = False
+            self._thread = Thread(target=self._run, name="agno-memory-worker", daemon=True)
+            self._thread.start()
+            # Process the queued runs before the interpreter exits
+            atexit.register(self.close)
+
+    def submit(self, task: MemoryTask) -> None:
+        """Queue the memories and summary to create for a run. Returns immediately."""
+        with self._condition:
+            self._start()
+            self._queue.append(task)
+            self._condition.notify_all()
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Process the queued runs and wait until they are done, e.g. before reading memories in tests.
+
+        Returns:
+            bool: False if the timeout expired before the queue was processed.
+        """
+        with self._condition:
+            self._flush_requested = True
+            self._condition.notify_all()
+            done = self._condition.wait_for(lambda: not self._queue and not self._processing, timeout=timeout)
+            self._flush_requested = False
+            return done
+
+    def close(self, timeout: Optional[float] = None) -> None:
+        """Process the queued runs and stop the worker thread."""
+        self.flush(timeout=timeout)
+        with self._condition:
+            self._stopped = True
+            self._condition.notify_all()
+        if self._thread is not None:
+            self._thread.join(timeout=timeout)
+            self._thread = None
+        atexit.unregister(self.close)
+
+    def _should_process(self) -> bool:
+        if not self._queue:
+            return False
+        return (
+            self._flush_requested
+            or self._stopped
+            or len(self._queue) >= self.max_batch_size
+            or monotonic() - self._queue[0].created_at >= self.flush_interval
+        )
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                while not self._should_process():
+                    if self._stopped:
+                        return
+                    timeout = self.flush_interval - (monotonic() - self._queue[0].created_at) if self._queue else None
+                    self._condition.wait(timeout=timeout)
+                batch, self._queue = self._queue, []
+                self._processing = True
+            try:
+                self._process(batch)
+            except Exception as e:
+                log_warning(f"Failed to process memory tasks: {e}")
+            finally:
+                with self._condition:
+                    self._processing = False
+                    self._condition.notify_all()
+
+    def _process(self, batch: List[MemoryTask]) -> None:
+        log_debug(f"Processing {len(batch)} memory tasks")
+        # Group the messages per memory and user, and the summaries per memory, session and user
+        memories_to_create: Dict[Tuple[int, str], Tuple["Memory", List[Message]]] = {}
+        summaries_to_create: Dict[Tuple[int, str, str], "Memory"] = {}
+        for task in batch:
+            if task.create_user_memories and task.messages:
+                _, messages = memories_to_create.setdefault((id(task.memory), task.user_id), (task.memory, []))
+                messages.extend(task.messages)
+            if task.create_session_summary:
+                summaries_to_create[(id(task.memory), task.session_id, task.user_id)] = task.memory
+
+        for (_, user_id), (memory, messages) in memories_to_create.items():
+            try:
+                messages = self._deduplicate(memory, user_id, messages)
+                if messages:
+                    memory.create_user_memories(messages=messages, user_id=user_id, refresh_from_db=False)
+            except Exception as e:
+                log_warning(f"Failed to create memories for user {user_id}: {e}")
+
+        for (_, session_id, user_id), memory in summaries_to_create.items():
+            try:
+                memory.create_session_summary(session_id=session_id, user_id=user_id)
+            except Exception as e:
+                log_warning(f"Failed to create summary for session {session_id}: {e}")
+
+    @staticmethod
+    def _deduplicate(memory: "Memory", user_id: str, messages: List[Message]) -> List[Message]:
+        """Drop repeated messages, and messages memories were already created from"""
+        memory.refresh_from_db(user_id=user_id)
+        seen: Set[str] = set()
+        for user_memory in (memory.memories or {}).get(user_id, {}).values():
+            if user_memory.input_hashes is not None:
+                seen.update(user_memory.input_hashes)
+            elif user_memory.input is not None:
+                # Memories created before the input hashes were stored
+                seen.add(get_input_hash(user_memory.input))
+        unique_messages: List[Message] = []
+        for message in messages:
+            content = message.get_content_string()
+            if not content:
+                continue
+            input_hash = get_input_hash(content)
+            if input_hash in seen:
+                continue
+            seen.add(input_hash)
+            unique_messages.append(message)
+        if len(unique_messages) < len(messages):
+            log_debug(f"Skipped {len(messages) - len(unique_messages)} duplicate messages")
+        return unique_messages
+
+    def __deepcopy__(self, memo):
+        """The worker is shared by copies of the Memory."""
+        memo[id(self)] = self
+        return self
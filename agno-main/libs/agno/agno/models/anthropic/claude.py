@@ -8,8 +8,10 @@ from agno.exceptions import ModelProviderError, ModelRateLimitError
 from agno.models.base import Model
 from agno.models.message import Citations, DocumentCitation, Message
 from agno.models.response import ModelResponse
+from agno.tools.function import Function
+from agno.utils.http import get_async_http_client, get_http_client, is_async_http_client_current
 from agno.utils.log import log_error, log_warning
-from agno.utils.models.claude import format_messages
+from agno.utils.models.claude import format_messages, format_system_blocks
 
 try:
     from anthropic import Anthropic as AnthropicClient
@@ -27,6 +29,40 @@ except (ModuleNotFoundError, ImportError):
     raise ImportError("`anthropic` not installed. Please install using `pip install anthropic`")
 
 
+def format_function_for_anthropic(func_def: Function) -> Dict[str, Any]:
+    """Transforms a function definition into a tool accepted by the Anthropic API."""
+    parameters: Dict[str, Any] = func_def.parameters or {}
+    properties: Dict[str, Any] = parameters.get("properties", {})
+    required_params: List[str] = []
+
+    for param_name, param_info in properties.items():
+        param_type = param_info.get("type", "")
+        param_type_list: List[str] = [param_type] if isinstance(param_type, str) else param_type or []
+
+        if "null" not in param_type_list:
+            required_params.append(param_name)
+
+    input_properties: Dict[str, Dict[str, Union[str, List[str]]]] = {}
+    for param_name, param_info in properties.items():
+        input_properties[param_name] = {
+            "description": param_info.get("description", ""),
+        }
+        if "type" not in param_info and "anyOf" in param_info:
+            input_properties[param_name]["anyOf"] = param_info["anyOf"]
+        else:
+            input_properties[param_name]["type"] = param_info.get("type", "")
+
+    return {
+        "name": func_def.name,
+        "description": func_def.description or "",
+        "input_schema": {
+            "type": parameters.get("type", "object"),
+            "properties": input_properties,
+            "required": required_params,
+        },
+    }
+
+
 @dataclass
 class Claude(Model):
     """
@@ -47,6 +83,9 @@ class Claude(Model):
     top_p: Optional[float] = None
     top_k: Optional[int] = None
     request_params: Optional[Dict[str, Any]] = None
+    # Cache the tools and the static prefix of the system prompt, so they are only billed in full on the first request.
+    # See https://docs.anthropic.com/en/docs/build-with-claude/prompt-caching
+    cache_system_prompt: bool = False
 
     # Client parameters
     api_key: Optional[str] = None
@@ -78,6 +117,9 @@ class Claude(Model):
             return self.client
 
         _client_params = self._get_client_params()
+        if "http_client" not in _client_params:
+            # Share connections with the other Claude models
+            _client_params["http_client"] = get_http_client(base_url=_client_params.get("base_url"))
         self.client = AnthropicClient(**_client_params)
         return self.client
 
@@ -85,10 +127,14 @@ class Claude(Model):
         """
         Returns an instance of the async Anthropic client.
         """
-        if self.async_client:
+        # The shared HTTP client is bound to the event loop it was created on, rebuild the client on another loop
+        if self.async_client and is_async_http_client_current(getattr(self.async_client, "_client", None)):
             return self.async_client
 
         _client_params = self._get_client_params()
+        if "http_client" not in _client_params:
+            # Share connections with the other Claude models
+            _client_params["http_client"] = get_async_http_client(base_url=_client_params.get("base_url"))
         self.async_client = AsyncAnthropicClient(**_client_params)
         return self.async_client
 
@@ -114,18 +160,23 @@ class Claude(Model):
             _request_params.update(self.request_params)
         return _request_params
 
-    def _prepare_request_kwargs(self, system_message: str) -> Dict[str, Any]:
+    def _prepare_request_kwargs(self, system_message: str, messages: Optional[List[Message]] = None) -> Dict[str, Any]:
         """
         Prepare the request keyword arguments for the API call.
 
         Args:
             system_message (str): The concatenated system messages.
+            messages (Optional[List[Message]]): The messages, used to find the cache breakpoints of the system messages.
 
         Returns:
             Dict[str, Any]: The request keyword arguments.
         """
         request_kwargs = self.request_kwargs.copy()
         request_kwargs["system"] = system_message
+        if self.cache_system_prompt and messages is not None:
+            system_blocks = format_system_blocks(messages)
+            if system_blocks:
+                request_kwargs["system"] = system_blocks
 
         if self._tools:
             request_kwargs["tools"] = self._format_tools_for_model()
@@ -141,40 +192,10 @@ class Claude(Model):
         if not self._functions:
             return None
 
-        tools: List[Dict[str, Any]] = []
-        for func_name, func_def in self._functions.items():
-            parameters: Dict[str, Any] = func_def.parameters or {}
-            properties: Dict[str, Any] = parameters.get("properties", {})
-            required_params: List[str] = []
-
-            for param_name, param_info in properties.items():
-                param_type = param_info.get("type", "")
-                param_type_list: List[str] = [param_type] if isinstance(param_type, str) else param_type or []
-
-                if "null" not in param_type_list:
-                    required_params.append(param_name)
-
-            input_properties: Dict[str, Dict[str, Union[str, List[str]]]] = {}
-            for param_name, param_info in properties.items():
-                input_properties[param_name] = {
-                    "description": param_info.get("description", ""),
-                }
-                if "type" not in param_info and "anyOf" in param_info:
-                    input_properties[param_name]["anyOf"] = param_info["anyOf"]
-                else:
-                    input_properties[param_name]["type"] = param_info.get("type", "")
-
-            tool = {
-                "name": func_name,
-                "description": func_def.description or "",
-                "input_schema": {
-                    "type": parameters.get("type", "object"),
-                    "properties": input_properties,
-                    "required": required_params,
-                },
-            }
-            tools.append(tool)
-        return tools
+        # The payloads are built once per function, as the tools are sent with every request
+        return [
+            func_def.get_payload("anthropic", format_function_for_anthropic) for func_def in self._functions.values()
+        ]
 
     def invoke(self, messages: List[Message]) -> AnthropicMessage:
         """
@@ -193,7 +214,7 @@ class Claude(Model):
         """
         try:
             chat_messages, system_message = format_messages(messages)
-            request_kwargs = self._prepare_request_kwargs(system_message)
+            request_kwargs = self._prepare_request_kwargs(system_message, messages)
 
             return self.get_client().messages.create(
                 model=self.id,
@@ -226,7 +247,7 @@ class Claude(Model):
             Any: The streamed response from the model.
         """
         chat_messages, system_message = format_messages(messages)
-        request_kwargs = self._prepare_request_kwargs(system_message)
+        request_kwargs = self._prepare_request_kwargs(system_message, messages)
 
         try:
             return (
@@ -270,7 +291,7 @@ class Claude(Model):
         """
         try:
             chat_messages, system_message = format_messages(messages)
-            request_kwargs = self._prepare_request_kwargs(system_message)
+            request_kwargs = self._prepare_request_kwargs(system_message, messages)
 
             return await self.get_async_client().messages.create(
                 model=self.id,
@@ -304,7 +325,7 @@ class Claude(Model):
         """
         try:
             chat_messages, system_message = format_messages(messages)
-            request_kwargs = self._prepare_request_kwargs(system_message)
+            request_kwargs = self._prepare_request_kwargs(system_message, messages)
             async with self.get_async_client().messages.stream(
                 model=self.id,
                 messages=chat_messages,  # type: ignore
@@ -7,6 +7,7 @@ from agno.exceptions import AgnoError, ModelProviderError
 from agno.models.base import MessageData, Model
 from agno.models.message import Message
 from agno.models.response import ModelResponse
+from agno.tools.function import Function
 from agno.utils.log import log_error, log_warning
 
 try:
@@ -18,6 +19,35 @@ except ImportError:
     raise
 
 
+def format_function_for_bedrock(function: Function) -> Dict[str, Any]:
+    """Transforms a function definition into a tool spec accepted by the Bedrock Converse API."""
+    properties = {}
+    required = []
+
+    for param_name, param_info in function.parameters.get("properties", {}).items():
+        param_type = param_info.get("type")
+        if isinstance(param_type, list):
+            param_type = [t for t in param_type if t != "null"][0]
+
+        properties[param_name] = {
+            "type": param_type or "string",
+            "description": param_info.get("description") or "",
+        }
+
+        if "null" not in (
+            param_info.get("type") if isinstance(param_info.get("type"), list) else [param_info.get("type")]
+        ):
+            required.append(param_name)
+
+    return {
+        "toolSpec": {
+            "name": function.name,
+            "description": function.description or "",
+            "inputSchema": {"json": {"type": "object", "properties": properties, "required": required}},
+        }
+    }
+
+
 @dataclass
 class AwsBedrock(Model):
     """
@@ -84,38 +114,10 @@ class AwsBedrock(Model):
         return self.client
 
     def _format_tools_for_request(self) -> List[Dict[str, Any]]:
-        tools = []
-        if self._functions is not None:
-            for f_name, function in self._functions.items():
-                properties = {}
-                required = []
-
-                for param_name, param_info in function.parameters.get("properties", {}).items():
-                    param_type = param_info.get("type")
-                    if isinstance(param_type, list):
-                        param_type = [t for t in param_type if t != "null"][0]
-
-                    properties[param_name] = {
-                        "type": param_type or "string",
-                        "description": param_info.get("description") or "",
-                    }
-
-                    if "null" not in (
-                        param_info.get("type") if isinstance(param_info.get("type"), list) else [param_info.get("type")]
-                    ):
-                        required.append(param_name)
-
-                tools.append(
-                    {
-                        "toolSpec": {
-                            "name": f_name,
-                            "description": function.description or "",
-                            "inputSchema": {"json": {"type": "object", "properties": properties, "required": required}},
-                        }
-                    }
-                )
-
-        return tools
+        if self._functions is None:
+            return []
+        # The payloads are built once per function, as the tools are sent with every request
+        return [function.get_payload("bedrock", format_function_for_bedrock) for function in self._functions.values()]
 
     def _get_inference_config(self) -> Dict[str, Any]:
         request_kwargs = {
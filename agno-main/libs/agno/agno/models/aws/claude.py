@@ -328,7 +328,7 @@ class Claude(AnthropicClaude):
 
         try:
             chat_messages, system_message = _format_messages(messages)
-            request_kwargs = self._prepare_request_kwargs(system_message)
+            request_kwargs = self._prepare_request_kwargs(system_message, messages)
 
             return self.get_client().messages.create(
                 model=self.id,
@@ -362,7 +362,7 @@ class Claude(AnthropicClaude):
         """
 
         chat_messages, system_message = _format_messages(messages)
-        request_kwargs = self._prepare_request_kwargs(system_message)
+        request_kwargs = self._prepare_request_kwargs(system_message, messages)
 
         try:
             return (
@@ -407,7 +407,7 @@ class Claude(AnthropicClaude):
 
         try:
             chat_messages, system_message = _format_messages(messages)
-            request_kwargs = self._prepare_request_kwargs(system_message)
+            request_kwargs = self._prepare_request_kwargs(system_message, messages)
 
             return await self.get_async_client().messages.create(
                 model=self.id,
@@ -442,7 +442,7 @@ class Claude(AnthropicClaude):
 
         try:
             chat_messages, system_message = _format_messages(messages)
-            request_kwargs = self._prepare_request_kwargs(system_message)
+            request_kwargs = self._prepare_request_kwargs(system_message, messages)
             async with self.get_async_client().messages.stream(
                 model=self.id,
                 messages=chat_messages,  # type: ignore
@@ -5,6 +5,7 @@ from typing import Any, Dict, Optional
 import httpx
 
 from agno.models.openai.like import OpenAILike
+from agno.utils.http import get_async_http_client, get_http_client, is_async_http_client_current
 
 try:
     from openai import AsyncAzureOpenAI as AsyncAzureOpenAIClient
@@ -94,6 +95,9 @@ class AzureOpenAI(OpenAILike):
             return self.client
 
         _client_params: Dict[str, Any] = self._get_client_params()
+        if "http_client" not in _client_params:
+            # Share connections with the other models using the same endpoint
+            _client_params["http_client"] = get_http_client(base_url=self.base_url or self.azure_endpoint)
 
         # -*- Create client
         self.client = AzureOpenAIClient(**_client_params)
@@ -106,18 +110,15 @@ class AzureOpenAI(OpenAILike):
         Returns:
             AsyncAzureOpenAIClient: An instance of the asynchronous OpenAI client.
         """
-        if self.async_client:
+        # The shared HTTP client is bound to the event loop it was created on, rebuild the client on another loop
+        if self.async_client and is_async_http_client_current(getattr(self.async_client, "_client", None)):
             return self.async_client
 
         _client_params: Dict[str, Any] = self._get_client_params()
 
-        if self.http_client:
-            _client_params["http_client"] = self.http_client
-        else:
-            # Create a new async HTTP client with custom limits
-            _client_params["http_client"] = httpx.AsyncClient(
-                limits=httpx.Limits(max_connections=1000, max_keepalive_connections=100)
-            )
+        if not isinstance(_client_params.get("http_client"), httpx.AsyncClient):
+            # Share connections with the other models using the same endpoint
+            _client_params["http_client"] = get_async_http_client(base_url=self.base_url or self.azure_endpoint)
 
         self.async_client = AsyncAzureOpenAIClient(**_client_params)
         return self.async_client
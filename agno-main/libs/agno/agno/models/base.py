@@ -1,20 +1,41 @@
 import asyncio
 import collections.abc
+import contextvars
 from abc import ABC, abstractmethod
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from concurrent.futures import TimeoutError as FuturesTimeoutError
 from dataclasses import dataclass, field
+from threading import BoundedSemaphore, Lock
+from time import perf_counter
 from types import AsyncGeneratorType, GeneratorType
 from typing import Any, AsyncGenerator, AsyncIterator, Dict, Iterator, List, Literal, Optional, Tuple, Union
 from uuid import uuid4
 
 from agno.exceptions import AgentRunException
 from agno.media import AudioResponse, ImageArtifact
+from agno.models.cache import get_response_from_entry
 from agno.models.message import Citations, Message, MessageMetrics
 from agno.models.response import ModelResponse, ModelResponseEvent
 from agno.tools.function import Function, FunctionCall
+from agno.tools.memo import ToolCallMemo
+from agno.tracing.span import Span
+from agno.tracing.tracer import (
+    MODEL_RESPONSE,
+    atrace_iterator,
+    is_tracing_enabled,
+    start_span,
+    trace_iterator,
+    use_span,
+)
 from agno.utils.log import log_debug, log_error, log_warning
+from agno.utils.phases import MODEL, aphase_iterator, phase, phase_iterator
 from agno.utils.timer import Timer
+from agno.utils.tokens import Tokenizer, count_text_tokens, get_tokenizer
 from agno.utils.tools import get_function_call_for_tool_call
 
+# Guards the lazy creation of the tool semaphores of Models
+_tool_semaphores_lock = Lock()
+
 
 @dataclass
 class MessageData:
@@ -31,6 +52,9 @@ class MessageData:
     # Data from the provider that we might need on subsequent messages
     response_provider_data: Optional[Dict[str, Any]] = None
 
+    # The streamed content deltas, only collected to cache the response
+    response_content_chunks: Optional[List[str]] = None
+
     extra: Optional[Dict[str, Any]] = None
 
 
@@ -68,6 +92,18 @@ class Model(ABC):
     show_tool_calls: Optional[bool] = None
     # Maximum number of tool calls allowed.
     tool_call_limit: Optional[int] = None
+    # If True, the tool calls of a response are run concurrently in a thread pool by run_function_calls.
+    run_tools_in_parallel: bool = False
+    # Maximum number of tool calls run concurrently. Defaults to the number of tool calls.
+    max_tool_workers: Optional[int] = None
+    # Seconds after which a tool call run in parallel is reported as failed. Can be overridden by Function.timeout.
+    tool_call_timeout: Optional[float] = None
+    # Cache of the responses of this Model, see agno.models.cache.ModelResponseCache.
+    # Typed as Any so that pydantic models holding a Model can be built.
+    response_cache: Optional[Any] = None
+    # Fits the messages of each request into the context window, see agno.models.budget.ContextBudget.
+    # Typed as Any so that pydantic models holding a Model can be built.
+    context_budget: Optional[Any] = None
 
     # A list of tools provided to the Model.
     # Tools are functions the model may generate JSON inputs for.
@@ -79,6 +115,13 @@ class Model(ABC):
     _functions: Optional[Dict[str, Function]] = None
     # Function call stack.
     _function_call_stack: Optional[List[FunctionCall]] = None
+    # Results of the tool calls of the current run (or session), used to deduplicate identical tool calls.
+    # A ToolCallMemo, typed as Any so that pydantic models holding a Model can be built.
+    _tool_call_memo: Optional[Any] = None
+    # Semaphores limiting the concurrent calls of functions with max_concurrency, by function name and limit.
+    # Shared by all tool calls run in parallel by this Model, see run_function_calls_in_parallel.
+    # BoundedSemaphores, typed as Any so that pydantic models holding a Model can be built.
+    _tool_semaphores: Optional[Dict[Tuple[str, int], Any]] = None
 
     # System prompt from the model added to the Agent.
     system_prompt: Optional[str] = None
@@ -161,6 +204,9 @@ class Model(ABC):
     def get_tools(self) -> List[Dict]:
         return self._tools or []
 
+    def set_tool_call_memo(self, tool_call_memo: Optional[ToolCallMemo]) -> None:
+        self._tool_call_memo = tool_call_memo
+
     def reset_tools_and_functions(self) -> None:
         self._tools = None
         self._functions = None
@@ -318,13 +364,24 @@ class Model(ABC):
         # Create assistant message
         assistant_message = Message(role=self.assistant_message_role)
 
+        # Get the response from the response cache if the request was seen before
+        cache_key = self._get_response_cache_key(messages)
+        cached_entry = self._get_cached_response_entry(cache_key)
+
         # Generate response
+        span = self._start_trace_span() if cached_entry is None else None
         assistant_message.metrics.start_timer()
-        response = self.invoke(messages=messages)
+        if cached_entry is None:
+            with phase(MODEL), use_span(span):
+                response = self.invoke(messages=self._get_request_messages(messages))
         assistant_message.metrics.stop_timer()
 
         # Parse provider response
-        provider_response: ModelResponse = self.parse_provider_response(response)
+        provider_response: ModelResponse
+        if cached_entry is not None:
+            provider_response = self._get_cached_provider_response(assistant_message, cached_entry)
+        else:
+            provider_response = self.parse_provider_response(response)
 
         # Add parsed data to model response
         if provider_response.parsed is not None:
@@ -332,6 +389,10 @@ class Model(ABC):
 
         # Populate the assistant message
         self._populate_assistant_message(assistant_message=assistant_message, provider_response=provider_response)
+        self._end_trace_span(span, assistant_message)
+
+        if cached_entry is None:
+            self._cache_response(cache_key, assistant_message, parsed=provider_response.parsed)
 
         # Add assistant message to messages
         messages.append(assistant_message)
@@ -376,13 +437,24 @@ class Model(ABC):
         # Create assistant message
         assistant_message = Message(role=self.assistant_message_role)
 
+        # Get the response from the response cache if the request was seen before
+        cache_key = self._get_response_cache_key(messages)
+        cached_entry = await self._aget_cached_response_entry(cache_key)
+
         # Generate response
+        span = self._start_trace_span() if cached_entry is None else None
         assistant_message.metrics.start_timer()
-        response = await self.ainvoke(messages=messages)
+        if cached_entry is None:
+            with phase(MODEL), use_span(span):
+                response = await self.ainvoke(messages=self._get_request_messages(messages))
         assistant_message.metrics.stop_timer()
 
         # Parse provider response
-        provider_response: ModelResponse = self.parse_provider_response(response)
+        provider_response: ModelResponse
+        if cached_entry is not None:
+            provider_response = self._get_cached_provider_response(assistant_message, cached_entry)
+        else:
+            provider_response = self.parse_provider_response(response)
 
         # Add parsed data to model response
         if provider_response.parsed is not None:
@@ -390,6 +462,10 @@ class Model(ABC):
 
         # Populate the assistant message
         self._populate_assistant_message(assistant_message=assistant_message, provider_response=provider_response)
+        self._end_trace_span(span, assistant_message)
+
+        if cached_entry is None:
+            await self._acache_response(cache_key, assistant_message, parsed=provider_response.parsed)
 
         # Add assistant message to messages
         messages.append(assistant_message)
@@ -489,7 +565,7 @@ class Model(ABC):
         """
         Process a streaming response from the model.
         """
-        for response_delta in self.invoke_stream(messages=messages):
+        for response_delta in phase_iterator(self.invoke_stream(messages=messages), MODEL):
             model_response_delta = self.parse_provider_response_delta(response_delta)
             yield from self._populate_stream_data_and_assistant_message(
                 stream_data=stream_data, assistant_message=assistant_message, model_response=model_response_delta
@@ -515,11 +591,25 @@ class Model(ABC):
             assistant_message = Message(role=self.assistant_message_role)
             stream_data = MessageData()
 
+            # Get the response from the response cache if the request was seen before
+            cache_key = self._get_response_cache_key(messages)
+            cached_entry = self._get_cached_response_entry(cache_key)
+
             # Generate response
             assistant_message.metrics.start_timer()
-            yield from self.process_response_stream(
-                messages=messages, assistant_message=assistant_message, stream_data=stream_data
-            )
+            if cached_entry is not None:
+                yield from self._replay_cached_response(
+                    assistant_message=assistant_message, stream_data=stream_data, cached_entry=cached_entry
+                )
+            else:
+                if cache_key is not None:
+                    stream_data.response_content_chunks = []
+                response_stream = self.process_response_stream(
+                    messages=self._get_request_messages(messages),
+                    assistant_message=assistant_message,
+                    stream_data=stream_data,
+                )
+                yield from self._trace_response_stream(response_stream, assistant_message)
             assistant_message.metrics.stop_timer()
 
             # Populate assistant message from stream data
@@ -537,6 +627,11 @@ class Model(ABC):
                 assistant_message.audio_output = stream_data.response_audio
             if stream_data.response_tool_calls and len(stream_data.response_tool_calls) > 0:
                 assistant_message.tool_calls = self.parse_tool_calls(stream_data.response_tool_calls)
+            if cached_entry is not None:
+                if cached_entry.get("tool_calls"):
+                    assistant_message.tool_calls = cached_entry["tool_calls"]
+            else:
+                self._cache_response(cache_key, assistant_message, chunks=stream_data.response_content_chunks)
 
             # Add assistant message to messages
             messages.append(assistant_message)
@@ -583,7 +678,7 @@ class Model(ABC):
         """
         Process a streaming response from the model.
         """
-        async for response_delta in self.ainvoke_stream(messages=messages):  # type: ignore
+        async for response_delta in aphase_iterator(self.ainvoke_stream(messages=messages), MODEL):  # type: ignore
             model_response_delta = self.parse_provider_response_delta(response_delta)
             for model_response in self._populate_stream_data_and_assistant_message(
                 stream_data=stream_data, assistant_message=assistant_message, model_response=model_response_delta
@@ -610,12 +705,27 @@ class Model(ABC):
             assistant_message = Message(role=self.assistant_message_role)
             stream_data = MessageData()
 
+            # Get the response from the response cache if the request was seen before
+            cache_key = self._get_response_cache_key(messages)
+            cached_entry = await self._aget_cached_response_entry(cache_key)
+
             # Generate response
             assistant_message.metrics.start_timer()
-            async for response in self.aprocess_response_stream(
-                messages=messages, assistant_message=assistant_message, stream_data=stream_data
-            ):
-                yield response
+            if cached_entry is not None:
+                for response in self._replay_cached_response(
+                    assistant_message=assistant_message, stream_data=stream_data, cached_entry=cached_entry
+                ):
+                    yield response
+            else:
+                if cache_key is not None:
+                    stream_data.response_content_chunks = []
+                aresponse_stream = self.aprocess_response_stream(
+                    messages=self._get_request_messages(messages),
+                    assistant_message=assistant_message,
+                    stream_data=stream_data,
+                )
+                async for response in self._atrace_response_stream(aresponse_stream, assistant_message):
+                    yield response
             assistant_message.metrics.stop_timer()
 
             # Populate assistant message from stream data
@@ -631,6 +741,11 @@ class Model(ABC):
                 assistant_message.audio_output = stream_data.response_audio
             if stream_data.response_tool_calls and len(stream_data.response_tool_calls) > 0:
                 assistant_message.tool_calls = self.parse_tool_calls(stream_data.response_tool_calls)
+            if cached_entry is not None:
+                if cached_entry.get("tool_calls"):
+                    assistant_message.tool_calls = cached_entry["tool_calls"]
+            else:
+                await self._acache_response(cache_key, assistant_message, chunks=stream_data.response_content_chunks)
 
             # Add assistant message to messages
             messages.append(assistant_message)
@@ -688,6 +803,8 @@ class Model(ABC):
         # Update stream_data content
         if model_response.content is not None:
             stream_data.response_content += model_response.content
+            if stream_data.response_content_chunks is not None:
+                stream_data.response_content_chunks.append(model_response.content)
             should_yield = True
 
         if model_response.thinking is not None:
@@ -751,6 +868,158 @@ class Model(ABC):
         if should_yield:
             yield model_response
 
+    def _start_trace_span(self, stream: bool = False) -> Optional[Span]:
+        """Start the span of a model response, if tracing is enabled."""
+        if not is_tracing_enabled():
+            return None
+        return start_span(
+            MODEL_RESPONSE,
+            {
+                "gen_ai.system": self.get_provider(),
+                "gen_ai.request.model": self.id,
+                "agno.model.stream": stream,
+            },
+        )
+
+    def _end_trace_span(self, span: Optional[Span], assistant_message: Message) -> None:
+        """Add the token usage of the response to its span and end the span."""
+        if span is None:
+            return
+        span.set_attributes(
+            {
+                "gen_ai.usage.input_tokens": assistant_message.metrics.input_tokens,
+                "gen_ai.usage.output_tokens": assistant_message.metrics.output_tokens,
+            }
+        )
+        span.end()
+
+    def _trace_response_stream(
+        self, response_stream: Iterator[ModelResponse], assistant_message: Message
+    ) -> Iterator[ModelResponse]:
+        """Trace a streamed model response, including the time to its first chunk, if tracing is enabled."""
+        span = self._start_trace_span(stream=True)
+        if span is None:
+            return response_stream
+        return self._traced_response_stream(response_stream, span, assistant_message)
+
+    def _traced_response_stream(
+        self, response_stream: Iterator[ModelResponse], span: Span, assistant_message: Message
+    ) -> Iterator[ModelResponse]:
+        try:
+            yield from trace_iterator(
+                response_stream, span, first_item_attribute="agno.model.time_to_first_token", end_on_exit=False
+            )
+        finally:
+            self._end_trace_span(span, assistant_message)
+
+    def _atrace_response_stream(
+        self, response_stream: AsyncIterator[ModelResponse], assistant_message: Message
+    ) -> AsyncIterator[ModelResponse]:
+        span = self._start_trace_span(stream=True)
+        if span is None:
+            return response_stream
+        return self._atraced_response_stream(response_stream, span, assistant_message)
+
+    async def _atraced_response_stream(
+        self, response_stream: AsyncIterator[ModelResponse], span: Span, assistant_message: Message
+    ) -> AsyncIterator[ModelResponse]:
+        try:
+            async for response in atrace_iterator(
+                response_stream, span, first_item_attribute="agno.model.time_to_first_token", end_on_exit=False
+            ):
+                yield response
+        finally:
+            self._end_trace_span(span, assistant_message)
+
+    def get_tokenizer(self) -> Tokenizer:
+        """Returns the tokenizer used to count the tokens of the messages sent to this Model."""
+        return get_tokenizer(provider=self.provider, model_id=self.id)
+
+    def _get_request_messages(self, messages: List[Message]) -> List[Message]:
+        """Returns the messages to send in a request, fitted into the context budget if one is set."""
+        if self.context_budget is None:
+            return messages
+        tokenizer = self.get_tokenizer()
+        reserved_tokens = count_text_tokens(self._tools, tokenizer) if self._tools else 0
+        return self.context_budget.fit(messages, tokenizer=tokenizer, reserved_tokens=reserved_tokens)
+
+    def _get_response_cache_key(self, messages: List[Message]) -> Optional[str]:
+        """Returns the response cache key of the request, or None if the response should not be cached."""
+        if self.response_cache is None:
+            return None
+        return self.response_cache.get_key(self, messages)
+
+    def _get_cached_response_entry(self, cache_key: Optional[str]) -> Optional[Dict[str, Any]]:
+        """Returns the cached response of the request with this cache key, or None on a miss."""
+        if cache_key is None or self.response_cache is None:
+            return None
+        return self.response_cache.get(cache_key)
+
+    async def _aget_cached_response_entry(self, cache_key: Optional[str]) -> Optional[Dict[str, Any]]:
+        if cache_key is None or self.response_cache is None:
+            return None
+        return await self.response_cache.aget(cache_key)
+
+    def _cache_response(
+        self,
+        cache_key: Optional[str],
+        assistant_message: Message,
+        parsed: Optional[Any] = None,
+        chunks: Optional[List[str]] = None,
+    ) -> None:
+        """Cache the response to the request with this cache key, only called on a cache miss."""
+        if cache_key is None or self.response_cache is None:
+            return
+        self.response_cache.set(cache_key, assistant_message, parsed=parsed, chunks=chunks)
+
+    async def _acache_response(
+        self,
+        cache_key: Optional[str],
+        assistant_message: Message,
+        parsed: Optional[Any] = None,
+        chunks: Optional[List[str]] = None,
+    ) -> None:
+        if cache_key is None or self.response_cache is None:
+            return
+        await self.response_cache.aset(cache_key, assistant_message, parsed=parsed, chunks=chunks)
+
+    def _get_cached_provider_response(self, assistant_message: Message, cached_entry: Dict[str, Any]) -> ModelResponse:
+        log_debug("Using cached model response")
+        assistant_message.metrics.additional_metrics = {"response_cache_hit": True}
+        return get_response_from_entry(cached_entry, response_format=self.response_format)
+
+    def _replay_cached_response(
+        self, assistant_message: Message, stream_data: MessageData, cached_entry: Dict[str, Any]
+    ) -> Iterator[ModelResponse]:
+        """Stream a cached response, in the chunks it was streamed in when it was cached."""
+        provider_response = self._get_cached_provider_response(assistant_message, cached_entry)
+        chunks: List[str] = cached_entry.get("chunks") or []
+        if not chunks and provider_response.content:
+            chunks = [provider_response.content]
+        for chunk in chunks:
+            yield from self._populate_stream_data_and_assistant_message(
+                stream_data=stream_data,
+                assistant_message=assistant_message,
+                model_response=ModelResponse(role=provider_response.role, content=chunk),
+            )
+        if not (
+            provider_response.thinking
+            or provider_response.redacted_thinking
+            or provider_response.citations
+            or provider_response.provider_data
+        ):
+            return
+        yield from self._populate_stream_data_and_assistant_message(
+            stream_data=stream_data,
+            assistant_message=assistant_message,
+            model_response=ModelResponse(
+                thinking=provider_response.thinking,
+                redacted_thinking=provider_response.redacted_thinking,
+                citations=provider_response.citations,
+                provider_data=provider_response.provider_data,
+            ),
+        )
+
     def parse_tool_calls(self, tool_calls_data: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """
         Parse the tool calls from the model provider into a list of tool calls.
@@ -833,9 +1102,187 @@ class Model(ABC):
             metrics=MessageMetrics(time=timer.elapsed),
         )
 
+    def _yield_function_call_result(
+        self, fc: FunctionCall, success: bool, timer: Timer, function_call_results: List[Message]
+    ) -> Iterator[ModelResponse]:
+        """Process the output of a finished function call and yield its result."""
+        function_call_output: str = ""
+
+        if isinstance(fc.result, (GeneratorType, collections.abc.Iterator)):
+            for item in fc.result:
+                function_call_output += str(item)
+                if fc.function.show_result:
+                    yield ModelResponse(content=str(item))
+        else:
+            function_call_output = str(fc.result)
+            if fc.function.show_result:
+                yield ModelResponse(content=function_call_output)
+
+        # Create and yield function call result
+        function_call_result = self._create_function_call_result(
+            fc, success=success, output=function_call_output, timer=timer
+        )
+        yield ModelResponse(
+            content=f"{fc.get_call_str()} completed in {timer.elapsed:.4f}s.",
+            tool_calls=[function_call_result.to_function_call_dict()],
+            event=ModelResponseEvent.tool_call_completed.value,
+        )
+
+        # Add function call to function call results
+        function_call_results.append(function_call_result)
+        self._function_call_stack.append(fc)  # type: ignore
+
+    def _execute_function_call(self, fc: FunctionCall) -> bool:
+        """Run a function call, reusing the result of an identical call of this run if there is a tool call memo."""
+        if self._tool_call_memo is not None:
+            return self._tool_call_memo.execute(fc, fc.execute)
+        return fc.execute()
+
+    def _get_tool_semaphore(self, function: Function) -> Optional[BoundedSemaphore]:
+        """Returns the semaphore limiting the concurrent calls of a function, None if its calls are not limited."""
+        if function.max_concurrency is None:
+            return None
+        key = (function.name, function.max_concurrency)
+        with _tool_semaphores_lock:
+            if self._tool_semaphores is None:
+                self._tool_semaphores = {}
+            if key not in self._tool_semaphores:
+                self._tool_semaphores[key] = BoundedSemaphore(function.max_concurrency)
+            return self._tool_semaphores[key]
+
+    def _run_function_call_in_thread(
+        self, fc: FunctionCall, semaphore: Optional[BoundedSemaphore] = None
+    ) -> Tuple[Union[bool, AgentRunException], Timer]:
+        """Run a single function call from a worker thread and return its success status and timer."""
+        if semaphore is not None:
+            semaphore.acquire()
+        try:
+            function_call_timer = Timer()
+            function_call_timer.start()
+            try:
+                success: Union[bool, AgentRunException] = self._execute_function_call(fc)
+            except AgentRunException as a_exc:
+                success = a_exc  # Pass the exception through to be handled by caller
+            function_call_timer.stop()
+            return success, function_call_timer
+        finally:
+            if semaphore is not None:
+                semaphore.release()
+
+    def run_function_calls_in_parallel(
+        self, function_calls: List[FunctionCall], function_call_results: List[Message]
+    ) -> Iterator[ModelResponse]:
+        """Run function calls concurrently in a thread pool, yielding their results in the original order.
+
+        Function calls of tools with parallel_safe=False run one at a time once the other calls have finished.
+        """
+        if self._function_call_stack is None:
+            self._function_call_stack = []
+
+        # Only run the function calls that fit in the function call limit, like the sequential path
+        if self.tool_call_limit:
+            function_calls = function_calls[: max(1, self.tool_call_limit - len(self._function_call_stack))]
+
+        # Additional messages from function calls that will be added to the function call results
+        additional_messages: List[Message] = []
+
+        # Yield tool_call_started events for all function calls
+        for fc in function_calls:
+            yield ModelResponse(
+                content=fc.get_call_str(),
+                tool_calls=[
+                    {
+                        "role": self.tool_message_role,
+                        "tool_call_id": fc.call_id,
+                        "tool_name": fc.function.name,
+                        "tool_args": fc.arguments,
+                    }
+                ],
+                event=ModelResponseEvent.tool_call_started.value,
+            )
+
+        parallel_calls = [fc for fc in function_calls if fc.function.parallel_safe]
+
+        executor = ThreadPoolExecutor(
+            max_workers=max(1, min(self.max_tool_workers or len(parallel_calls), len(parallel_calls) or 1)),
+            thread_name_prefix="agno-tool",
+        )
+        # The future, submission time, timeout and result holder of each function call run in the thread pool
+        futures: Dict[int, Tuple[Future, float, Optional[float], FunctionCall]] = {}
+        try:
+            for fc in parallel_calls:
+                # The thread writes the result into a copy of the function call, so a call that times out
+                # can't change the function call once its failure was reported
+                holder = fc.model_copy()
+                # Run each function call in a copy of the current context, like asyncio.to_thread
+                context = contextvars.copy_context()
+                future = executor.submit(
+                    context.run, self._run_function_call_in_thread, holder, self._get_tool_semaphore(fc.function)
+                )
+                timeout = fc.function.timeout if fc.function.timeout is not None else self.tool_call_timeout
+                futures[id(fc)] = (future, perf_counter(), timeout, holder)
+
+            for fc in function_calls:
+                if id(fc) in futures:
+                    future, submitted_at, timeout, holder = futures[id(fc)]
+                    try:
+                        remaining = None if timeout is None else max(0.0, submitted_at + timeout - perf_counter())
+                        function_call_success, function_call_timer = future.result(timeout=remaining)
+                        fc.result = holder.result
+                        fc.error = holder.error
+                    except FuturesTimeoutError:
+                        future.cancel()
+                        log_warning(f"Function call {fc.function.name} timed out after {timeout}s")
+                        fc.error = f"Function call timed out after {timeout} seconds"
+                        function_call_success, function_call_timer = False, Timer()
+                        function_call_timer.start_time = submitted_at
+                        function_call_timer.stop()
+                    except Exception as e:
+                        log_error(f"Error executing function {fc.function.name}: {e}")
+                        raise e
+                else:
+                    # Function calls that are not parallel safe run alone, once all other function calls finished.
+                    # Function calls that time out are abandoned, they are reported as failed in their turn.
+                    for future, submitted_at, timeout, _ in futures.values():
+                        wait(
+                            [future],
+                            timeout=None if timeout is None else max(0.0, submitted_at + timeout - perf_counter()),
+                        )
+                    function_call_success, function_call_timer = self._run_function_call_in_thread(fc)
+
+                # Handle AgentRunException
+                if isinstance(function_call_success, AgentRunException):
+                    # Update additional messages from function call
+                    self._handle_agent_exception(function_call_success, additional_messages)
+                    # Set function call success to False if an exception occurred
+                    function_call_success = False
+
+                yield from self._yield_function_call_result(
+                    fc,
+                    success=function_call_success,
+                    timer=function_call_timer,
+                    function_call_results=function_call_results,
+                )
+        finally:
+            # Don't wait for function calls that timed out
+            executor.shutdown(wait=False)
+
+        # Check function call limit
+        if self.tool_call_limit and len(self._function_call_stack) >= self.tool_call_limit:
+            # Deactivate tool calls by setting future tool calls to "none"
+            self.tool_choice = "none"
+
+        # Add any additional messages at the end
+        if additional_messages:
+            function_call_results.extend(additional_messages)
+
     def run_function_calls(
         self, function_calls: List[FunctionCall], function_call_results: List[Message]
     ) -> Iterator[ModelResponse]:
+        if self.run_tools_in_parallel and len(function_calls) > 1:
+            yield from self.run_function_calls_in_parallel(function_calls, function_call_results)
+            return
+
         if self._function_call_stack is None:
             self._function_call_stack = []
 
@@ -864,7 +1311,7 @@ class Model(ABC):
             function_call_success = False
             # Run function calls sequentially
             try:
-                function_call_success = fc.execute()
+                function_call_success = self._execute_function_call(fc)
             except AgentRunException as a_exc:
                 # Update additional messages from function call
                 self._handle_agent_exception(a_exc, additional_messages)
@@ -878,32 +1325,13 @@ class Model(ABC):
             # Stop function call timer
             function_call_timer.stop()
 
-            # Process function call output
-            function_call_output: str = ""
-
-            if isinstance(fc.result, (GeneratorType, collections.abc.Iterator)):
-                for item in fc.result:
-                    function_call_output += str(item)
-                    if fc.function.show_result:
-                        yield ModelResponse(content=str(item))
-            else:
-                function_call_output = str(fc.result)
-                if fc.function.show_result:
-                    yield ModelResponse(content=function_call_output)
-
-            # Create and yield function call result
-            function_call_result = self._create_function_call_result(
-                fc, success=function_call_success, output=function_call_output, timer=function_call_timer
+            # Process function call output and yield the function call result
+            yield from self._yield_function_call_result(
+                fc,
+                success=function_call_success,
+                timer=function_call_timer,
+                function_call_results=function_call_results,
             )
-            yield ModelResponse(
-                content=f"{fc.get_call_str()} completed in {function_call_timer.elapsed:.4f}s.",
-                tool_calls=[function_call_result.to_function_call_dict()],
-                event=ModelResponseEvent.tool_call_completed.value,
-            )
-
-            # Add function call to function call results
-            function_call_results.append(function_call_result)
-            self._function_call_stack.append(fc)
 
             # Check function call limit
             if self.tool_call_limit and len(self._function_call_stack) >= self.tool_call_limit:
@@ -925,20 +1353,27 @@ class Model(ABC):
         function_call_timer.start()
         success: Union[bool, AgentRunException] = False
 
-        try:
+        async def execute() -> bool:
             if (
                 iscoroutinefunction(function_call.function.entrypoint)
                 or isasyncgenfunction(function_call.function.entrypoint)
                 or iscoroutine(function_call.function.entrypoint)
             ):
-                success = await function_call.aexecute()
+                return await function_call.aexecute()
             # If any of the hooks are async, we need to run the function call asynchronously
             elif function_call.function.tool_hooks is not None and any(
                 iscoroutinefunction(f) for f in function_call.function.tool_hooks
             ):
-                success = await function_call.aexecute()
+                return await function_call.aexecute()
+            else:
+                return await asyncio.to_thread(function_call.execute)
+
+        try:
+            if self._tool_call_memo is not None:
+                # Identical function calls that run concurrently share a single execution
+                success = await self._tool_call_memo.aexecute(function_call, execute)
             else:
-                success = await asyncio.to_thread(function_call.execute)
+                success = await execute()
         except AgentRunException as e:
             success = e  # Pass the exception through to be handled by caller
         except Exception as e:
@@ -1111,6 +1546,11 @@ class Model(ABC):
                 assistant_message.metrics.total_tokens = (
                     assistant_message.metrics.input_tokens + assistant_message.metrics.output_tokens
                 )
+            # Prompt cache reads and writes (e.g. from Anthropic)
+            if getattr(response_usage, "cache_read_input_tokens", None):
+                assistant_message.metrics.cached_tokens = response_usage.cache_read_input_tokens
+            if getattr(response_usage, "cache_creation_input_tokens", None):
+                assistant_message.metrics.cache_write_tokens = response_usage.cache_creation_input_tokens
 
         # Additional metrics (e.g., from Groq, Ollama)
         if isinstance(response_usage, dict) and "additional_metrics" in response_usage:
@@ -1205,6 +1645,7 @@ class Model(ABC):
         self.response_format = None
         self._functions = None
         self._function_call_stack = None
+        self._tool_call_memo = None
 
     def __deepcopy__(self, memo):
         """Create a deep copy of the Model instance.
@@ -1224,7 +1665,14 @@ class Model(ABC):
 
         # Deep copy all attributes
         for k, v in self.__dict__.items():
-            if k in {"response_format", "_tools", "_functions", "_function_call_stack"}:
+            if k in {
+                "response_format",
+                "_tools",
+                "_functions",
+                "_function_call_stack",
+                "_tool_call_memo",
+                "_tool_semaphores",
+            }:
                 continue
             try:
                 setattr(new_model, k, deepcopy(v, memo))
@@ -0,0 +1,130 @@
+import re
+from dataclasses import dataclass
+from typing import List, Optional
+
+from agno.models.message import Message
+from agno.utils.log import log_debug, log_warning
+from agno.utils.tokens import HEURISTIC_TOKENIZER, TRUNCATION_MARKER, Tokenizer, count_message_tokens
+
+# Knowledge references added to the user message by the Agent
+_REFERENCES_PATTERN = re.compile(r"(<references>\n)(.*?)(\n?</references>)", re.DOTALL)
+
+
+def _copy_with_content(message: Message, content: str) -> Message:
+    """Copy a message with new content, without sharing the cached token counts of the original."""
+    message_copy = message.model_copy(update={"content": content})
+    message_copy._token_counts = {}
+    return message_copy
+
+
+@dataclass
+class ContextBudget:
+    """
+    Fits the messages of each request to a Model into its context window. Set it on a Model with `context_budget`.
+
+    The messages sent to the model are trimmed in order, until they fit:
+    1. Tool results and knowledge references longer than their limits are truncated.
+    2. The oldest history runs are dropped.
+    3. The longest tool results of the current run are truncated, down to min_tool_result_tokens.
+
+    The messages of the run are not modified, only the messages sent in the request.
+    """
+
+    # The size of the context window of the model, in tokens
+    context_window: int
+    # Tokens reserved for the response of the model
+    reserve_output_tokens: int = 0
+    # Maximum number of tokens of a tool result
+    max_tool_result_tokens: Optional[int] = None
+    # Maximum number of tokens of the knowledge references added to a user message
+    max_reference_tokens: Optional[int] = None
+    # Tool results are not truncated below this many tokens to fit the context window
+    min_tool_result_tokens: int = 100
+    # Tokenizer used to count tokens. Defaults to the tokenizer of the model, see agno.utils.tokens.get_tokenizer
+    tokenizer: Optional[Tokenizer] = None
+
+    @property
+    def max_input_tokens(self) -> int:
+        return self.context_window - self.reserve_output_tokens
+
+    def _truncate_references(self, message: Message, tokenizer: Tokenizer) -> Message:
+        if self.max_reference_tokens is None or not isinstance(message.content, str):
+            return message
+        match = _REFERENCES_PATTERN.search(message.content)
+        if match is None:
+            return message
+        references = tokenizer.truncate(match.group(2), self.max_reference_tokens)
+        if references is match.group(2):
+            return message
+        content = message.content[: match.start(2)] + references + message.content[match.end(2) :]
+        return _copy_with_content(message, content)
+
+    def fit(
+        self, messages: List[Message], tokenizer: Optional[Tokenizer] = None, reserved_tokens: int = 0
+    ) -> List[Message]:
+        """
+        Returns the messages to send to the model, trimmed to fit the context window.
+
+        Args:
+            messages (List[Message]): The messages of the run.
+            tokenizer (Optional[Tokenizer]): The tokenizer of the model, used if no tokenizer is set on the budget.
+            reserved_tokens (int): Tokens used by the rest of the request, e.g. the tool definitions.
+        """
+        tokenizer = self.tokenizer or tokenizer or HEURISTIC_TOKENIZER
+        budget = self.max_input_tokens - reserved_tokens
+
+        # 1. Truncate tool results and references longer than their limits
+        fitted: List[Message] = []
+        for message in messages:
+            if message.role == "tool" and self.max_tool_result_tokens is not None and isinstance(message.content, str):
+                content = tokenizer.truncate(message.content, self.max_tool_result_tokens)
+                if content is not message.content:
+                    message = _copy_with_content(message, content)
+            elif message.references is not None:
+                message = self._truncate_references(message, tokenizer)
+            fitted.append(message)
+
+        total_tokens = sum(count_message_tokens(message, tokenizer) for message in fitted)
+        if total_tokens <= budget:
+            return fitted
+        log_debug(f"Messages use {total_tokens} tokens, fitting them into {budget} tokens")
+
+        # 2. Drop the oldest history runs, a run starts at a user message
+        history_indices = [i for i, message in enumerate(fitted) if message.from_history]
+        history_runs: List[List[int]] = []
+        for i in history_indices:
+            if not history_runs or fitted[i].role == "user":
+                history_runs.append([])
+            history_runs[-1].append(i)
+        dropped = set()
+        for run in history_runs:
+            if total_tokens <= budget:
+                break
+            dropped.update(run)
+            total_tokens -= sum(count_message_tokens(fitted[i], tokenizer) for i in run)
+        if dropped:
+            log_debug(f"Dropped {len(dropped)} history messages")
+            fitted = [message for i, message in enumerate(fitted) if i not in dropped]
+
+        # 3. Truncate the longest tool results
+        if total_tokens > budget:
+            marker_tokens = tokenizer.count(TRUNCATION_MARKER)
+            tool_results = sorted(
+                (i for i, message in enumerate(fitted) if message.role == "tool" and isinstance(message.content, str)),
+                key=lambda i: count_message_tokens(fitted[i], tokenizer),
+                reverse=True,
+            )
+            for i in tool_results:
+                if total_tokens <= budget:
+                    break
+                tokens = count_message_tokens(fitted[i], tokenizer)
+                content_tokens = tokenizer.count(fitted[i].content)  # type: ignore
+                max_tokens = max(content_tokens - (total_tokens - budget) - marker_tokens, self.min_tool_result_tokens)
+                if max_tokens >= content_tokens:
+                    continue
+                fitted[i] = _copy_with_content(fitted[i], tokenizer.truncate(fitted[i].content, max_tokens))  # type: ignore
+                total_tokens += count_message_tokens(fitted[i], tokenizer) - tokens
+
+        if total_tokens > budget:
+            log_warning(f"Messages use {total_tokens} tokens and do not fit into the context budget of {budget} tokens")
+        return fitted
@@ -0,0 +1,181 @@
+import json
+from copy import deepcopy
+from hashlib import sha256
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
+
+from pydantic import BaseModel
+
+from agno.models.message import Citations, Message
+from agno.models.response import ModelResponse
+from agno.tools.cache.base import ToolCache
+from agno.tools.cache.memory import InMemoryToolCache
+from agno.utils.log import log_debug
+
+if TYPE_CHECKING:
+    from agno.models.base import Model
+
+# Namespace of the cached responses in the ToolCache
+RESPONSE_CACHE_NAMESPACE = "model_responses"
+
+# Request parameters of the model providers that change the response, added to the cache key if set
+_REQUEST_PARAMETERS = (
+    "temperature",
+    "top_p",
+    "top_k",
+    "max_tokens",
+    "max_completion_tokens",
+    "seed",
+    "stop",
+    "stop_sequences",
+    "frequency_penalty",
+    "presence_penalty",
+    "reasoning_effort",
+    "thinking",
+    "request_params",
+)
+
+# Fields of a Message that are not sent to the model, excluded from the cache key
+_EXCLUDED_MESSAGE_FIELDS = (
+    "created_at",
+    "metrics",
+    "from_history",
+    "stop_after_tool_call",
+    "reasoning_content",
+    "tool_name",
+    "tool_args",
+    "tool_call_error",
+    "references",
+)
+
+
+class ModelResponseCache:
+    def __init__(self, cache: Optional[ToolCache] = None, ttl: Optional[float] = None, force: bool = False):
+        """
+        Cache of model responses, keyed by the provider, model id, messages, tools, response format and request
+        parameters (e.g. temperature) of the request. Set it on a Model with `response_cache`.
+
+        Responses are cached per request to the model, so tool calls from a cached response are still run.
+        Responses with audio or image output are not cached.
+
+        Args:
+            cache (Optional[ToolCache]): Where to store the responses, e.g. a DiskToolCache or a TieredToolCache
+                of an InMemoryToolCache and a DiskToolCache. Defaults to an InMemoryToolCache.
+            ttl (Optional[float]): Seconds after which a cached response expires.
+            force (bool): Also cache responses of requests that are not deterministic, i.e. with a temperature above 0
+                or without a temperature, where the provider's default temperature applies.
+        """
+        self.cache: ToolCache = cache if cache is not None else InMemoryToolCache()
+        self.ttl: Optional[float] = ttl
+        self.force: bool = force
+
+    def get_key(self, model: "Model", messages: List[Message]) -> Optional[str]:
+        """Returns the cache key of a request, or None if the response should not be cached."""
+        # Without a temperature the provider's default applies, which is not deterministic
+        temperature = getattr(model, "temperature", None)
+        if not self.force and (temperature is None or temperature > 0):
+            return None
+
+        response_format = model.response_format
+        if isinstance(response_format, type) and issubclass(response_format, BaseModel):
+            response_format = response_format.model_json_schema()
+
+        canonical_messages: List[Dict[str, Any]] = []
+        for message in messages:
+            message_dict = message.to_dict()
+            for field_name in _EXCLUDED_MESSAGE_FIELDS:
+                message_dict.pop(field_name, None)
+            if message.files:
+                message_dict["files"] = message.files
+            canonical_messages.append(message_dict)
+
+        request = {
+            "provider": model.get_provider(),
+            "id": model.id,
+            "messages": canonical_messages,
+            "tools": model._tools,
+            "tool_choice": model.tool_choice,
+            "response_format": response_format,
+            "parameters": {name: getattr(model, name, None) for name in _REQUEST_PARAMETERS},
+        }
+        canonical = json.dumps(request, sort_keys=True, separators=(",", ":"), ensure_ascii=False, default=str)
+        return sha256(canonical.encode("utf-8")).hexdigest()
+
+    def _to_entry(
+        self, assistant_message: Message, parsed: Optional[Any], chunks: Optional[List[str]]
+    ) -> Optional[Dict]:
+        if assistant_message.audio_output is not None or assistant_message.image_output is not None:
+            return None
+        if parsed is not None and not isinstance(parsed, BaseModel):
+            return None
+
+        entry: Dict[str, Any] = {
+            "role": assistant_message.role,
+            "content": assistant_message.content,
+            "tool_calls": assistant_message.tool_calls,
+            "thinking": assistant_message.thinking,
+            "redacted_thinking": assistant_message.redacted_thinking,
+            "reasoning_content": assistant_message.reasoning_content,
+            "provider_data": assistant_message.provider_data,
+            "citations": assistant_message.citations.model_dump() if assistant_message.citations else None,
+            "parsed": parsed.model_dump(mode="json") if parsed is not None else None,
+            "chunks": chunks,
+        }
+        try:
+            # Entries are JSON, so they can be stored in any ToolCache
+            return json.loads(json.dumps(entry))
+        except (TypeError, ValueError):
+            log_debug("Response is not JSON serializable and is not cached")
+            return None
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Returns the cached response entry for the key, or None."""
+        entry = self.cache.get(RESPONSE_CACHE_NAMESPACE, key)
+        return deepcopy(entry) if entry is not None else None
+
+    async def aget(self, key: str) -> Optional[Dict[str, Any]]:
+        """Returns the cached response entry for the key without blocking the event loop, or None."""
+        entry = await self.cache.aget(RESPONSE_CACHE_NAMESPACE, key)
+        return deepcopy(entry) if entry is not None else None
+
+    def set(
+        self, key: str, assistant_message: Message, parsed: Optional[Any] = None, chunks: Optional[List[str]] = None
+    ) -> None:
+        """Cache the assistant message generated for the request with this key."""
+        entry = self._to_entry(assistant_message, parsed, chunks)
+        if entry is not None:
+            self.cache.set(RESPONSE_CACHE_NAMESPACE, key, entry, ttl=self.ttl)
+
+    async def aset(
+        self, key: str, assistant_message: Message, parsed: Optional[Any] = None, chunks: Optional[List[str]] = None
+    ) -> None:
+        """Cache the assistant message generated for the request with this key without blocking the event loop."""
+        entry = self._to_entry(assistant_message, parsed, chunks)
+        if entry is not None:
+            await self.cache.aset(RESPONSE_CACHE_NAMESPACE, key, entry, ttl=self.ttl)
+
+    def clear(self) -> None:
+        """Remove all cached responses."""
+        self.cache.clear(RESPONSE_CACHE_NAMESPACE)
+
+    def __deepcopy__(self, memo):
+        """The cache is shared by copies of the model (e.g. Agent.deep_copy)."""
+        memo[id(self)] = self
+        return self
+
+
+def get_response_from_entry(entry: Dict[str, Any], response_format: Optional[Any] = None) -> ModelResponse:
+    """Build the provider response from a cached entry, as if it was returned by Model.parse_provider_response."""
+    parsed = entry.get("parsed")
+    if parsed is not None and isinstance(response_format, type) and issubclass(response_format, BaseModel):
+        parsed = response_format.model_validate(parsed)
+    return ModelResponse(
+        role=entry.get("role"),
+        content=entry.get("content"),
+        parsed=parsed,
+        tool_calls=entry.get("tool_calls") or [],
+        thinking=entry.get("thinking"),
+        redacted_thinking=entry.get("redacted_thinking"),
+        reasoning_content=entry.get("reasoning_content"),
+        provider_data=entry.get("provider_data"),
+        citations=Citations.model_validate(entry["citations"]) if entry.get("citations") else None,
+    )
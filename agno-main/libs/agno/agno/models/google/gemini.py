@@ -785,7 +785,7 @@ class Gemini(Model):
         # Deep copy all attributes except client and unpickleable attributes
         for key, value in self.__dict__.items():
             # Skip client and other unpickleable attributes
-            if key in {"client", "response_format", "_tools", "_functions", "_function_call_stack"}:
+            if key in {"client", "response_format", "_tools", "_functions", "_function_call_stack", "_tool_call_memo"}:
                 continue
 
             # Try deep copy first, fall back to shallow copy, then direct assignment
@@ -3,7 +3,7 @@ from dataclasses import asdict, dataclass
 from time import time
 from typing import Any, Dict, List, Optional, Sequence, Union
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr
 
 from agno.media import Audio, AudioResponse, File, Image, ImageArtifact, Video
 from agno.utils.log import log_debug, log_error, log_info, log_warning
@@ -58,7 +58,10 @@ class MessageMetrics:
     audio_tokens: int = 0
     input_audio_tokens: int = 0
     output_audio_tokens: int = 0
+    # Input tokens read from the provider's prompt cache
     cached_tokens: int = 0
+    # Input tokens written to the provider's prompt cache
+    cache_write_tokens: int = 0
     reasoning_tokens: int = 0
     prompt_tokens: int = 0
     completion_tokens: int = 0
@@ -109,6 +112,7 @@ class MessageMetrics:
             input_audio_tokens=self.input_audio_tokens + other.input_audio_tokens,
             output_audio_tokens=self.output_audio_tokens + other.output_audio_tokens,
             cached_tokens=self.cached_tokens + other.cached_tokens,
+            cache_write_tokens=self.cache_write_tokens + other.cache_write_tokens,
             reasoning_tokens=self.reasoning_tokens + other.reasoning_tokens,
         )
 
@@ -195,6 +199,10 @@ class Message(BaseModel):
     # Citations received from the model
     citations: Optional[Citations] = None
 
+    # Length of the content prefix that is stable across runs (e.g. the static part of the system prompt).
+    # Models that support prompt caching mark the end of this prefix as a cache breakpoint.
+    cache_breakpoint: Optional[int] = None
+
     # --- Data not sent to the Model API ---
     # The reasoning content from the model
     reasoning_content: Optional[str] = None
@@ -217,6 +225,9 @@ class Message(BaseModel):
     # The Unix timestamp the message was created.
     created_at: int = Field(default_factory=lambda: int(time()))
 
+    # Cached number of tokens of the message per tokenizer, see agno.utils.tokens.count_message_tokens
+    _token_counts: Dict[str, int] = PrivateAttr(default_factory=dict)
+
     model_config = ConfigDict(extra="allow", populate_by_name=True, arbitrary_types_allowed=True)
 
     def get_content_string(self) -> str:
@@ -360,6 +371,8 @@ class Message(BaseModel):
                 token_metrics.append(f"total={self.metrics.total_tokens}")
             if self.metrics.cached_tokens:
                 token_metrics.append(f"cached={self.metrics.cached_tokens}")
+            if self.metrics.cache_write_tokens:
+                token_metrics.append(f"cache_write={self.metrics.cache_write_tokens}")
             if self.metrics.reasoning_tokens:
                 token_metrics.append(f"reasoning={self.metrics.reasoning_tokens}")
             if self.metrics.audio_tokens:
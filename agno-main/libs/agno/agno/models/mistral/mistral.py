@@ -7,6 +7,7 @@ from agno.media import Image
 from agno.models.base import Model
 from agno.models.message import Message
 from agno.models.response import ModelResponse
+from agno.utils.http import get_async_http_client, get_http_client, is_async_http_client_current
 from agno.utils.log import log_error, log_warning
 
 try:
@@ -173,6 +174,23 @@ class MistralChat(Model):
         self.mistral_client = MistralClient(**_client_params)
         return self.mistral_client
 
+    def get_async_client(self) -> MistralClient:
+        """
+        Get the Mistral client for async requests.
+
+        Returns:
+            MistralClient: The Mistral client instance, using the HTTP client of the running event loop.
+        """
+        # The shared HTTP client is bound to the event loop it was created on, rebuild the client on another loop
+        if self.mistral_client:
+            sdk_configuration = getattr(self.mistral_client, "sdk_configuration", None)
+            if is_async_http_client_current(getattr(sdk_configuration, "async_client", None)):
+                return self.mistral_client
+
+        _client_params = self._get_client_params()
+        self.mistral_client = MistralClient(**_client_params)
+        return self.mistral_client
+
     def _get_client_params(self) -> Dict[str, Any]:
         """
         Get the client parameters for initializing Mistral clients.
@@ -198,6 +216,12 @@ class MistralChat(Model):
         if self.client_params is not None:
             client_params.update(self.client_params)
 
+        # Share connections with the other models using the same endpoint
+        if "client" not in client_params:
+            client_params["client"] = get_http_client(base_url=self.endpoint)
+        if "async_client" not in client_params:
+            client_params["async_client"] = get_async_http_client(base_url=self.endpoint)
+
         # Remove None values
         return {k: v for k, v in client_params.items() if v is not None}
 
@@ -327,14 +351,14 @@ class MistralChat(Model):
         try:
             response: Union[ChatCompletionResponse, ParsedChatCompletionResponse]
             if self.response_format is not None and self.structured_outputs:
-                response = await self.get_client().chat.parse_async(
+                response = await self.get_async_client().chat.parse_async(
                     model=self.id,
                     messages=mistral_messages,
                     response_format=self.response_format,  # type: ignore
                     **self.request_kwargs,
                 )
             else:
-                response = await self.get_client().chat.complete_async(
+                response = await self.get_async_client().chat.complete_async(
                     model=self.id,
                     messages=mistral_messages,
                     **self.request_kwargs,
@@ -359,7 +383,7 @@ class MistralChat(Model):
         """
         mistral_messages = _format_messages(messages)
         try:
-            stream = await self.get_client().chat.stream_async(
+            stream = await self.get_async_client().chat.stream_async(
                 model=self.id,
                 messages=mistral_messages,
                 **self.request_kwargs,
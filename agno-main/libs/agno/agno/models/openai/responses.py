@@ -10,6 +10,7 @@ from agno.media import File
 from agno.models.base import MessageData, Model
 from agno.models.message import Citations, Message, UrlCitation
 from agno.models.response import ModelResponse
+from agno.utils.http import get_async_http_client, get_http_client, is_async_http_client_current
 from agno.utils.log import log_error, log_warning
 from agno.utils.models.openai_responses import images_to_message, sanitize_response_schema
 
@@ -125,6 +126,9 @@ class OpenAIResponses(Model):
         client_params: Dict[str, Any] = self._get_client_params()
         if self.http_client is not None:
             client_params["http_client"] = self.http_client
+        elif "http_client" not in client_params:
+            # Share connections with the other models using the same API
+            client_params["http_client"] = get_http_client(base_url=self.base_url)
 
         self.client = OpenAI(**client_params)
         return self.client
@@ -136,17 +140,16 @@ class OpenAIResponses(Model):
         Returns:
             AsyncOpenAI: An instance of the asynchronous OpenAI client.
         """
-        if self.async_client:
+        # The shared HTTP client is bound to the event loop it was created on, rebuild the client on another loop
+        if self.async_client and is_async_http_client_current(getattr(self.async_client, "_client", None)):
             return self.async_client
 
         client_params: Dict[str, Any] = self._get_client_params()
-        if self.http_client:
+        if isinstance(self.http_client, httpx.AsyncClient):
             client_params["http_client"] = self.http_client
-        else:
-            # Create a new async HTTP client with custom limits
-            client_params["http_client"] = httpx.AsyncClient(
-                limits=httpx.Limits(max_connections=1000, max_keepalive_connections=100)
-            )
+        elif "http_client" not in client_params:
+            # Share connections with the other models using the same API
+            client_params["http_client"] = get_async_http_client(base_url=self.base_url)
 
         self.async_client = AsyncOpenAI(**client_params)
         return self.async_client
@@ -1,4 +1,5 @@
-from typing import List, Optional, Set
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, List, Optional, Set
 from uuid import uuid4
 
 from fastapi import FastAPI, HTTPException
@@ -13,10 +14,18 @@ from agno.playground.async_router import get_async_playground_router
 from agno.playground.settings import PlaygroundSettings
 from agno.playground.sync_router import get_sync_playground_router
 from agno.team.team import Team
+from agno.utils.http import aclose_http_clients
 from agno.utils.log import logger
 from agno.workflow.workflow import Workflow
 
 
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    yield
+    # Close the HTTP clients shared by the models when the app shuts down
+    await aclose_http_clients()
+
+
 class Playground:
     def __init__(
         self,
@@ -70,6 +79,7 @@ class Playground:
                 docs_url="/docs" if self.settings.docs_enabled else None,
                 redoc_url="/redoc" if self.settings.docs_enabled else None,
                 openapi_url="/openapi.json" if self.settings.docs_enabled else None,
+                lifespan=lifespan,
             )
 
         if not self.api_app:
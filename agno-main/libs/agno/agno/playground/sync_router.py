@@ -8,6 +8,7 @@ from fastapi import APIRouter, File, Form, HTTPException, Query, UploadFile
 from fastapi.responses import JSONResponse, StreamingResponse
 
 from agno.agent.agent import Agent, RunResponse
+from agno.agent.pool import AgentPool
 from agno.media import Audio, Image, Video
 from agno.media import File as FileMedia
 from agno.memory.agent import AgentMemory
@@ -15,9 +16,6 @@ from agno.memory.v2 import Memory
 from agno.playground.operator import (
     format_tools,
     get_agent_by_id,
-    get_session_title,
-    get_session_title_from_team_session,
-    get_session_title_from_workflow_session,
     get_team_by_id,
     get_workflow_by_id,
 )
@@ -55,6 +53,7 @@ def chat_response_streamer(
     images: Optional[List[Image]] = None,
     audio: Optional[List[Audio]] = None,
     videos: Optional[List[Video]] = None,
+    agent_pool: Optional[AgentPool] = None,
 ) -> Generator:
     try:
         run_response = agent.run(
@@ -77,6 +76,10 @@ def chat_response_streamer(
         )
         yield error_response.to_json()
         return
+    finally:
+        # Release the pooled agent once the response is streamed
+        if agent_pool is not None:
+            agent_pool.release(agent)
 
 
 def team_chat_response_streamer(
@@ -134,6 +137,15 @@ def get_sync_playground_router(
             if workflow.workflow_id is None:
                 workflow.workflow_id = str(uuid4())
 
+    # Runs use pooled copies of the agents, so that concurrent requests don't share run state
+    agent_pools: Dict[str, AgentPool] = {}
+
+    def get_agent_pool(agent: Agent) -> AgentPool:
+        agent_id = cast(str, agent.agent_id)
+        if agent_id not in agent_pools:
+            agent_pools[agent_id] = AgentPool(agent)
+        return agent_pools[agent_id]
+
     @playground_router.get("/status")
     def playground_status():
         return {"playground": "available"}
@@ -228,11 +240,6 @@ def get_sync_playground_router(
             logger.debug("Creating new session")
             session_id = str(uuid4())
 
-        if monitor:
-            agent.monitoring = True
-        else:
-            agent.monitoring = False
-
         base64_images: List[Image] = []
         base64_audios: List[Audio] = []
         base64_videos: List[Video] = []
@@ -325,36 +332,49 @@ def get_sync_playground_router(
                     else:
                         raise HTTPException(status_code=400, detail="Unsupported file type")
 
-        if stream and agent.is_streamable:
+        agent_pool = get_agent_pool(agent)
+        pooled_agent = agent_pool.acquire()
+        pooled_agent.monitoring = monitor
+
+        if stream and pooled_agent.is_streamable:
             return StreamingResponse(
                 chat_response_streamer(
-                    agent,
+                    pooled_agent,
                     message,
                     session_id=session_id,
                     user_id=user_id,
                     images=base64_images if base64_images else None,
                     audio=base64_audios if base64_audios else None,
                     videos=base64_videos if base64_videos else None,
+                    agent_pool=agent_pool,
                 ),
                 media_type="text/event-stream",
             )
         else:
-            run_response = cast(
-                RunResponse,
-                agent.run(
-                    message=message,
-                    session_id=session_id,
-                    user_id=user_id,
-                    images=base64_images if base64_images else None,
-                    audio=base64_audios if base64_audios else None,
-                    videos=base64_videos if base64_videos else None,
-                    stream=False,
-                ),
-            )
+            try:
+                run_response = cast(
+                    RunResponse,
+                    pooled_agent.run(
+                        message=message,
+                        session_id=session_id,
+                        user_id=user_id,
+                        images=base64_images if base64_images else None,
+                        audio=base64_audios if base64_audios else None,
+                        videos=base64_videos if base64_videos else None,
+                        stream=False,
+                    ),
+                )
+            finally:
+                agent_pool.release(pooled_agent)
             return run_response.to_dict()
 
     @playground_router.get("/agents/{agent_id}/sessions")
-    def get_agent_sessions(agent_id: str, user_id: Optional[str] = Query(None, min_length=1)):
+    def get_agent_sessions(
+        agent_id: str,
+        user_id: Optional[str] = Query(None, min_length=1),
+        limit: Optional[int] = Query(None, ge=1),
+        offset: int = Query(0, ge=0),
+    ):
         logger.debug(f"AgentSessionsRequest: {agent_id} {user_id}")
         agent = get_agent_by_id(agent_id, agents)
         if agent is None:
@@ -364,15 +384,14 @@ def get_sync_playground_router(
             return JSONResponse(status_code=404, content="Agent does not have storage enabled.")
 
         agent_sessions: List[AgentSessionsResponse] = []
-        all_agent_sessions: List[AgentSession] = agent.storage.get_all_sessions(user_id=user_id)  # type: ignore
-        for session in all_agent_sessions:
-            title = get_session_title(session)
+        listings = agent.storage.list_sessions(user_id=user_id, limit=limit, offset=offset)
+        for listing in listings:
             agent_sessions.append(
                 AgentSessionsResponse(
-                    title=title,
-                    session_id=session.session_id,
-                    session_name=session.session_data.get("session_name") if session.session_data else None,
-                    created_at=session.created_at,
+                    title=listing.title or "Unnamed session",
+                    session_id=listing.session_id,
+                    session_name=listing.session_name,
+                    created_at=listing.created_at,
                 )
             )
         return agent_sessions
@@ -424,11 +443,10 @@ def get_sync_playground_router(
         if agent.storage is None:
             return JSONResponse(status_code=404, content="Agent does not have storage enabled.")
 
-        all_agent_sessions: List[AgentSession] = agent.storage.get_all_sessions(user_id=body.user_id)  # type: ignore
-        for session in all_agent_sessions:
-            if session.session_id == session_id:
-                agent.rename_session(body.name, session_id=session_id)
-                return JSONResponse(content={"message": f"successfully renamed agent {agent.name}"})
+        if session_id in agent.storage.get_all_session_ids(user_id=body.user_id):
+            with get_agent_pool(agent).lease() as pooled_agent:
+                pooled_agent.rename_session(body.name, session_id=session_id)
+            return JSONResponse(content={"message": f"successfully renamed agent {agent.name}"})
 
         return JSONResponse(status_code=404, content="Session not found.")
 
@@ -441,11 +459,9 @@ def get_sync_playground_router(
         if agent.storage is None:
             return JSONResponse(status_code=404, content="Agent does not have storage enabled.")
 
-        all_agent_sessions: List[AgentSession] = agent.storage.get_all_sessions(user_id=user_id)  # type: ignore
-        for session in all_agent_sessions:
-            if session.session_id == session_id:
-                agent.delete_session(session_id)
-                return JSONResponse(content={"message": f"successfully deleted agent {agent.name}"})
+        if session_id in agent.storage.get_all_session_ids(user_id=user_id):
+            agent.delete_session(session_id)
+            return JSONResponse(content={"message": f"successfully deleted agent {agent.name}"})
 
         return JSONResponse(status_code=404, content="Session not found.")
 
@@ -523,7 +539,12 @@ def get_sync_playground_router(
             raise HTTPException(status_code=500, detail=f"Error running workflow: {str(e)}")
 
     @playground_router.get("/workflows/{workflow_id}/sessions", response_model=List[WorkflowSessionResponse])
-    def get_all_workflow_sessions(workflow_id: str, user_id: Optional[str] = Query(None, min_length=1)):
+    def get_all_workflow_sessions(
+        workflow_id: str,
+        user_id: Optional[str] = Query(None, min_length=1),
+        limit: Optional[int] = Query(None, ge=1),
+        offset: int = Query(0, ge=0),
+    ):
         # Retrieve the workflow by ID
         workflow = get_workflow_by_id(workflow_id, workflows)
         if not workflow:
@@ -535,21 +556,21 @@ def get_sync_playground_router(
 
         # Retrieve all sessions for the given workflow and user
         try:
-            all_workflow_sessions: List[WorkflowSession] = workflow.storage.get_all_sessions(
-                user_id=user_id, entity_id=workflow_id
-            )  # type: ignore
+            listings = workflow.storage.list_sessions(
+                user_id=user_id, entity_id=workflow_id, limit=limit, offset=offset
+            )
         except Exception as e:
             raise HTTPException(status_code=500, detail=f"Error retrieving sessions: {str(e)}")
 
         # Return the sessions
         return [
             WorkflowSessionResponse(
-                title=get_session_title_from_workflow_session(session),
-                session_id=session.session_id,
-                session_name=session.session_data.get("session_name") if session.session_data else None,
-                created_at=session.created_at,
+                title=listing.title or "Unnamed session",
+                session_id=listing.session_id,
+                session_name=listing.session_name,
+                created_at=listing.created_at,
             )
-            for session in all_workflow_sessions
+            for listing in listings
         ]
 
     @playground_router.get("/workflows/{workflow_id}/sessions/{session_id}", response_model=WorkflowSession)
@@ -720,7 +741,12 @@ def get_sync_playground_router(
             return run_response.to_dict()
 
     @playground_router.get("/teams/{team_id}/sessions", response_model=List[TeamSessionResponse])
-    def get_all_team_sessions(team_id: str, user_id: Optional[str] = Query(None, min_length=1)):
+    def get_all_team_sessions(
+        team_id: str,
+        user_id: Optional[str] = Query(None, min_length=1),
+        limit: Optional[int] = Query(None, ge=1),
+        offset: int = Query(0, ge=0),
+    ):
         team = get_team_by_id(team_id, teams)
         if team is None:
             raise HTTPException(status_code=404, detail="Team not found")
@@ -729,19 +755,18 @@ def get_sync_playground_router(
             raise HTTPException(status_code=404, detail="Team does not have storage enabled")
 
         try:
-            all_team_sessions: List[TeamSession] = team.storage.get_all_sessions(user_id=user_id, entity_id=team_id)  # type: ignore
+            listings = team.storage.list_sessions(user_id=user_id, entity_id=team_id, limit=limit, offset=offset)
         except Exception as e:
             raise HTTPException(status_code=500, detail=f"Error retrieving sessions: {str(e)}")
 
         team_sessions: List[TeamSessionResponse] = []
-        for session in all_team_sessions:
-            title = get_session_title_from_team_session(session)
+        for listing in listings:
             team_sessions.append(
                 TeamSessionResponse(
-                    title=title,
-                    session_id=session.session_id,
-                    session_name=session.session_data.get("session_name") if session.session_data else None,
-                    created_at=session.created_at,
+                    title=listing.title or "Unnamed session",
+                    session_id=listing.session_id,
+                    session_name=listing.session_name,
+                    created_at=listing.created_at,
                 )
             )
         return team_sessions
@@ -795,11 +820,9 @@ def get_sync_playground_router(
         if team.storage is None:
             raise HTTPException(status_code=404, detail="Team does not have storage enabled")
 
-        all_team_sessions: List[TeamSession] = team.storage.get_all_sessions(user_id=body.user_id, entity_id=team_id)  # type: ignore
-        for session in all_team_sessions:
-            if session.session_id == session_id:
-                team.rename_session(body.name, session_id=session_id)
-                return JSONResponse(content={"message": f"successfully renamed team session {body.name}"})
+        if session_id in team.storage.get_all_session_ids(user_id=body.user_id, entity_id=team_id):
+            team.rename_session(body.name, session_id=session_id)
+            return JSONResponse(content={"message": f"successfully renamed team session {body.name}"})
 
         raise HTTPException(status_code=404, detail="Session not found")
 
@@ -812,11 +835,9 @@ def get_sync_playground_router(
         if team.storage is None:
             raise HTTPException(status_code=404, detail="Team does not have storage enabled")
 
-        all_team_sessions: List[TeamSession] = team.storage.get_all_sessions(user_id=user_id, entity_id=team_id)  # type: ignore
-        for session in all_team_sessions:
-            if session.session_id == session_id:
-                team.delete_session(session_id)
-                return JSONResponse(content={"message": f"successfully deleted team session {session_id}"})
+        if session_id in team.storage.get_all_session_ids(user_id=user_id, entity_id=team_id):
+            team.delete_session(session_id)
+            return JSONResponse(content={"message": f"successfully deleted team session {session_id}"})
 
         raise HTTPException(status_code=404, detail="Session not found")
 
@@ -1,4 +1,4 @@
-from typing import List
+from typing import Dict, List
 
 from pydantic import BaseModel, ConfigDict
 
@@ -12,3 +12,24 @@ class Reranker(BaseModel):
 
     def rerank(self, query: str, documents: List[Document]) -> List[Document]:
         raise NotImplementedError
+
+    def fuse(self, query: str, ranked_lists: List[List[Document]]) -> List[Document]:
+        """Merge several ranked lists (e.g. vector and keyword hits) into a single reranked list.
+
+        The default implementation de-duplicates the candidates and reranks their union.
+        """
+        return self.rerank(query=query, documents=merge_ranked_lists(ranked_lists))
+
+
+def document_key(document: Document) -> str:
+    """Returns the key used to identify the same document across ranked lists"""
+    return document.id or document.content
+
+
+def merge_ranked_lists(ranked_lists: List[List[Document]]) -> List[Document]:
+    """De-duplicate documents across ranked lists, keeping the first occurrence of each document"""
+    merged: Dict[str, Document] = {}
+    for ranked_list in ranked_lists:
+        for document in ranked_list:
+            merged.setdefault(document_key(document), document)
+    return list(merged.values())
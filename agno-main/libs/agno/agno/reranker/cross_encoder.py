@@ -0,0 +1,126 @@
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from agno.document import Document
+from agno.reranker.base import Reranker
+from agno.utils.log import log_debug, logger
+
+try:
+    from sentence_transformers import CrossEncoder
+except ImportError:
+    raise ImportError("`sentence-transformers` not installed, please run `pip install sentence-transformers`")
+
+# Cross-encoder models are expensive to load, so they are shared across reranker instances
+_cross_encoder_cache: Dict[Tuple[str, Optional[str], Optional[int]], CrossEncoder] = {}
+_cross_encoder_cache_lock = Lock()
+
+
+def get_cross_encoder(model: str, device: Optional[str] = None, max_length: Optional[int] = None) -> CrossEncoder:
+    """Returns a cached CrossEncoder for the given model, loading it on first use"""
+    key = (model, device, max_length)
+    with _cross_encoder_cache_lock:
+        if key not in _cross_encoder_cache:
+            log_debug(f"Loading cross-encoder: {model}")
+            _cross_encoder_cache[key] = CrossEncoder(model, device=device, max_length=max_length)
+        return _cross_encoder_cache[key]
+
+
+class CrossEncoderReranker(Reranker):
+    """Reranks documents locally with a sentence-transformers cross-encoder, without any network calls."""
+
+    model: str = "cross-encoder/ms-marco-MiniLM-L-6-v2"
+    device: Optional[str] = None
+    max_length: Optional[int] = None
+    cross_encoder_client: Optional[CrossEncoder] = None
+    top_n: Optional[int] = None
+    # Number of (query, document) pairs scored per model call
+    batch_size: int = 32
+    # Number of batches scored concurrently
+    max_workers: int = 1
+    # Documents scoring below this threshold are dropped.
+    # When top_n is also set, scoring stops as soon as top_n documents pass the threshold.
+    score_threshold: Optional[float] = None
+
+    @property
+    def client(self) -> CrossEncoder:
+        if self.cross_encoder_client:
+            return self.cross_encoder_client
+        return get_cross_encoder(model=self.model, device=self.device, max_length=self.max_length)
+
+    def _predict(self, client: CrossEncoder, pairs: Sequence[Tuple[str, str]]) -> List[float]:
+        scores = client.predict(list(pairs), batch_size=self.batch_size, show_progress_bar=False)
+        return [float(score) for score in scores]
+
+    def _score(self, query: str, documents: List[Document], top_n: Optional[int]) -> List[Optional[float]]:
+        client = self.client
+        pairs = [(query, doc.content) for doc in documents]
+        batch_size = max(1, self.batch_size)
+        batches = [range(i, min(i + batch_size, len(pairs))) for i in range(0, len(pairs), batch_size)]
+        max_workers = max(1, self.max_workers)
+        early_termination = self.score_threshold is not None and top_n is not None
+
+        scores: List[Optional[float]] = [None] * len(documents)
+        num_passing = 0
+        executor = ThreadPoolExecutor(max_workers=max_workers) if max_workers > 1 and len(batches) > 1 else None
+        try:
+            # Batches are scored in windows of max_workers so that we can stop early between windows
+            for window_start in range(0, len(batches), max_workers):
+                window = batches[window_start : window_start + max_workers]
+                if executor is not None:
+                    futures = [executor.submit(self._predict, client, pairs[b.start : b.stop]) for b in window]
+                    window_scores = [future.result() for future in futures]
+                else:
+                    window_scores = [self._predict(client, pairs[b.start : b.stop]) for b in window]
+
+                for batch, batch_scores in zip(window, window_scores):
+                    for index, score in zip(batch, batch_scores):
+                        scores[index] = score
+                        if self.score_threshold is not None and score >= self.score_threshold:
+                            num_passing += 1
+
+                if early_termination and num_passing >= top_n:  # type: ignore
+                    log_debug(f"Found {num_passing} documents above the score threshold, skipping remaining batches")
+                    break
+        finally:
+            if executor is not None:
+                executor.shutdown(wait=False)
+        return scores
+
+    def _rerank(self, query: str, documents: List[Document]) -> List[Document]:
+        # Validate input documents and top_n
+        if not documents:
+            return []
+
+        top_n = self.top_n
+        if top_n is not None and not (0 < top_n):
+            logger.warning(f"top_n should be a positive integer, got {self.top_n}, setting top_n to None")
+            top_n = None
+
+        compressed_docs: List[Document] = []
+        for doc, score in zip(documents, self._score(query=query, documents=documents, top_n=top_n)):
+            if score is None:
+                continue
+            if self.score_threshold is not None and score < self.score_threshold:
+                continue
+            doc.reranking_score = score
+            compressed_docs.append(doc)
+
+        # Order by relevance score
+        compressed_docs.sort(
+            key=lambda x: x.reranking_score if x.reranking_score is not None else float("-inf"),
+            reverse=True,
+        )
+
+        # Limit to top_n if specified
+        if top_n:
+            compressed_docs = compressed_docs[:top_n]
+
+        return compressed_docs
+
+    def rerank(self, query: str, documents: List[Document]) -> List[Document]:
+        try:
+            return self._rerank(query=query, documents=documents)
+        except Exception as e:
+            logger.error(f"Error reranking documents: {e}. Returning original documents")
+            return documents
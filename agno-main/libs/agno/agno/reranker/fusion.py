@@ -0,0 +1,62 @@
+from typing import Dict, List, Optional
+
+from agno.document import Document
+from agno.reranker.base import Reranker, document_key
+from agno.utils.log import logger
+
+
+class ReciprocalRankFusionReranker(Reranker):
+    """Zero-model reranker that merges ranked lists with Reciprocal Rank Fusion.
+
+    Each document scores sum(weight / (k + rank)) over the lists it appears in, so documents
+    ranked highly by several retrievers (e.g. vector and keyword search) float to the top.
+    """
+
+    # Smoothing constant, 60 is the value used in the original RRF paper
+    k: int = 60
+    # Optional per-list weights, in the same order as the ranked lists
+    weights: Optional[List[float]] = None
+    top_n: Optional[int] = None
+    # Documents with a fused score below this threshold are dropped
+    score_threshold: Optional[float] = None
+
+    def _fuse(self, ranked_lists: List[List[Document]]) -> List[Document]:
+        if self.weights is not None and len(self.weights) != len(ranked_lists):
+            logger.warning(
+                f"Got {len(self.weights)} weights for {len(ranked_lists)} ranked lists, using equal weights instead"
+            )
+            weights = [1.0] * len(ranked_lists)
+        else:
+            weights = self.weights or [1.0] * len(ranked_lists)
+
+        scores: Dict[str, float] = {}
+        documents: Dict[str, Document] = {}
+        for weight, ranked_list in zip(weights, ranked_lists):
+            for rank, document in enumerate(ranked_list, start=1):
+                key = document_key(document)
+                documents.setdefault(key, document)
+                scores[key] = scores.get(key, 0.0) + weight / (self.k + rank)
+
+        fused_docs: List[Document] = []
+        for key in sorted(scores, key=lambda x: scores[x], reverse=True):
+            if self.score_threshold is not None and scores[key] < self.score_threshold:
+                # Scores are sorted, nothing after this document can pass the threshold
+                break
+            doc = documents[key]
+            doc.reranking_score = scores[key]
+            fused_docs.append(doc)
+
+        top_n = self.top_n
+        if top_n is not None and top_n <= 0:
+            logger.warning(f"top_n should be a positive integer, got {self.top_n}, setting top_n to None")
+            top_n = None
+        if top_n:
+            fused_docs = fused_docs[:top_n]
+        return fused_docs
+
+    def fuse(self, query: str, ranked_lists: List[List[Document]]) -> List[Document]:
+        return self._fuse(ranked_lists)
+
+    def rerank(self, query: str, documents: List[Document]) -> List[Document]:
+        # A single ranked list keeps its order, but gets RRF scores, top_n and the score threshold applied
+        return self._fuse([documents])
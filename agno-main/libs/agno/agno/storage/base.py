@@ -1,7 +1,9 @@
+import asyncio
 from abc import ABC, abstractmethod
-from typing import List, Literal, Optional
+from typing import Any, Dict, List, Literal, Optional
 
 from agno.storage.session import Session
+from agno.storage.session.listing import SessionListing, paginate_listings
 
 
 class Storage(ABC):
@@ -27,17 +29,68 @@ class Storage(ABC):
         raise NotImplementedError
 
     @abstractmethod
-    def get_all_session_ids(self, user_id: Optional[str] = None, agent_id: Optional[str] = None) -> List[str]:
+    def get_all_session_ids(self, user_id: Optional[str] = None, entity_id: Optional[str] = None) -> List[str]:
         raise NotImplementedError
 
     @abstractmethod
     def get_all_sessions(self, user_id: Optional[str] = None, entity_id: Optional[str] = None) -> List[Session]:
         raise NotImplementedError
 
+    def list_sessions(
+        self,
+        user_id: Optional[str] = None,
+        entity_id: Optional[str] = None,
+        limit: Optional[int] = None,
+        offset: int = 0,
+    ) -> List[SessionListing]:
+        """List sessions newest first, optionally filtered by user_id and/or entity_id and paginated.
+
+        Storages with a session index override this to avoid deserializing full sessions.
+        The default loads all matching sessions.
+        """
+        listings = [
+            SessionListing.from_session_dict(session.to_dict())
+            for session in self.get_all_sessions(user_id=user_id, entity_id=entity_id)
+        ]
+        return paginate_listings(listings, limit=limit, offset=offset)
+
     @abstractmethod
     def upsert(self, session: Session) -> Optional[Session]:
         raise NotImplementedError
 
+    # Async interface.
+    # Storages backed by an async driver override these, the defaults run the sync methods in a worker thread
+    # so the event loop is not blocked on storage I/O.
+
+    async def aread(self, session_id: str, user_id: Optional[str] = None) -> Optional[Session]:
+        return await asyncio.to_thread(self.read, session_id, user_id)
+
+    async def aget_all_session_ids(self, user_id: Optional[str] = None, entity_id: Optional[str] = None) -> List[str]:
+        return await asyncio.to_thread(self.get_all_session_ids, user_id, entity_id)
+
+    async def aget_all_sessions(self, user_id: Optional[str] = None, entity_id: Optional[str] = None) -> List[Session]:
+        return await asyncio.to_thread(self.get_all_sessions, user_id, entity_id)
+
+    async def alist_sessions(
+        self,
+        user_id: Optional[str] = None,
+        entity_id: Optional[str] = None,
+        limit: Optional[int] = None,
+        offset: int = 0,
+    ) -> List[SessionListing]:
+        return await asyncio.to_thread(self.list_sessions, user_id, entity_id, limit, offset)
+
+    async def aupsert(self, session: Session) -> Optional[Session]:
+        return await asyncio.to_thread(self.upsert, session)
+
+    def upsert_runs(self, session: Session, new_runs: List[Dict[str, Any]]) -> Optional[Session]:
+        """Persist a session whose stored copy already holds every run in `session.memory["runs"]` except `new_runs`.
+
+        Storages that can append to the stored runs in place override this to avoid rewriting the whole session.
+        The default performs a full upsert.
+        """
+        return self.upsert(session)
+
     @abstractmethod
     def delete_session(self, session_id: Optional[str] = None):
         raise NotImplementedError
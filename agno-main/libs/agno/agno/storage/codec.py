@@ -0,0 +1,289 @@
+import json
+import zlib
+from collections import Counter
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Literal, Optional, Union
+
+from agno.storage.base import Storage
+from agno.utils.log import log_debug, log_info, logger
+
+# Encoded sessions start with a null byte, so they can never be mistaken for a (legacy) JSON document
+MAGIC = b"\x00AGS"
+# Version of the header layout: MAGIC, version, format id, flags
+FORMAT_VERSION = 1
+HEADER_SIZE = len(MAGIC) + 3
+
+FLAG_ZSTD = 1
+FLAG_ZLIB = 2
+FLAG_INTERNED = 4
+
+# Key of the dicts that reference an interned string
+INTERNED_REF_KEY = "\x00s"
+
+
+@dataclass
+class SessionFormat:
+    """A serialization format for session dicts, identified in the header by format_id"""
+
+    name: str
+    format_id: int
+    dumps: Callable[[Any], bytes]
+    loads: Callable[[bytes], Any]
+
+
+_formats_by_name: Dict[str, SessionFormat] = {}
+_formats_by_id: Dict[int, SessionFormat] = {}
+
+
+def register_format(session_format: SessionFormat) -> None:
+    """Register a serialization format, so it can be used by a SessionCodec and decoded from any header"""
+    existing = _formats_by_id.get(session_format.format_id)
+    if existing is not None and existing.name != session_format.name:
+        raise ValueError(f"Format id {session_format.format_id} is already used by '{existing.name}'")
+    _formats_by_name[session_format.name] = session_format
+    _formats_by_id[session_format.format_id] = session_format
+
+
+def _json_format() -> SessionFormat:
+    return SessionFormat(
+        name="json",
+        format_id=1,
+        dumps=lambda data: json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8"),
+        loads=json.loads,
+    )
+
+
+def _orjson_format() -> SessionFormat:
+    try:
+        import orjson
+    except ImportError:
+        raise ImportError("`orjson` not installed. Please install it using `pip install orjson`")
+
+    return SessionFormat(
+        name="orjson",
+        format_id=2,
+        dumps=lambda data: orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS),
+        loads=orjson.loads,
+    )
+
+
+def _msgpack_format() -> SessionFormat:
+    try:
+        import msgpack
+    except ImportError:
+        raise ImportError("`msgpack` not installed. Please install it using `pip install msgpack`")
+
+    return SessionFormat(
+        name="msgpack",
+        format_id=3,
+        dumps=lambda data: msgpack.packb(data, use_bin_type=True),
+        loads=lambda payload: msgpack.unpackb(payload, raw=False, strict_map_key=False),
+    )
+
+
+# Built-in formats are loaded lazily, as orjson and msgpack are optional dependencies
+_builtin_formats: Dict[str, Callable[[], SessionFormat]] = {
+    "json": _json_format,
+    "orjson": _orjson_format,
+    "msgpack": _msgpack_format,
+}
+_builtin_format_ids: Dict[int, str] = {1: "json", 2: "orjson", 3: "msgpack"}
+
+
+def get_format(name: Optional[str] = None, format_id: Optional[int] = None) -> SessionFormat:
+    """Returns a registered serialization format by name or by format id"""
+    if name is None and format_id is not None:
+        if format_id in _formats_by_id:
+            return _formats_by_id[format_id]
+        if format_id not in _builtin_format_ids:
+            raise ValueError(f"Unknown session format id: {format_id}")
+        name = _builtin_format_ids[format_id]
+    if name is None:
+        raise ValueError("Either name or format_id must be provided")
+    if name not in _formats_by_name:
+        if name not in _builtin_formats:
+            raise ValueError(f"Unknown session format: {name}")
+        register_format(_builtin_formats[name]())
+    return _formats_by_name[name]
+
+
+def _get_zstd() -> Any:
+    try:
+        import zstandard
+    except ImportError:
+        raise ImportError("`zstandard` not installed. Please install it using `pip install zstandard`")
+    return zstandard
+
+
+def intern_strings(data: Any, min_length: int = 32) -> Optional[Dict[str, Any]]:
+    """Replace strings of at least min_length characters that occur more than once with references to a table.
+
+    Returns:
+        Optional[Dict[str, Any]]: {"strings": table, "data": data} or None if no string is repeated.
+    """
+    counts: Counter = Counter()
+
+    def count(value: Any) -> None:
+        if isinstance(value, str):
+            if len(value) >= min_length:
+                counts[value] += 1
+        elif isinstance(value, dict):
+            for v in value.values():
+                count(v)
+        elif isinstance(value, (list, tuple)):
+            for v in value:
+                count(v)
+
+    count(data)
+    table: List[str] = [s for s, n in counts.items() if n > 1]
+    if not table:
+        return None
+    index = {s: i for i, s in enumerate(table)}
+
+    def replace(value: Any) -> Any:
+        if isinstance(value, str):
+            i = index.get(value)
+            return value if i is None else {INTERNED_REF_KEY: i}
+        elif isinstance(value, dict):
+            return {k: replace(v) for k, v in value.items()}
+        elif isinstance(value, (list, tuple)):
+            return [replace(v) for v in value]
+        return value
+
+    return {"strings": table, "data": replace(data)}
+
+
+def restore_strings(interned: Dict[str, Any]) -> Any:
+    """Inverse of intern_strings"""
+    table: List[str] = interned["strings"]
+
+    def restore(value: Any) -> Any:
+        if isinstance(value, dict):
+            if len(value) == 1 and INTERNED_REF_KEY in value:
+                return table[value[INTERNED_REF_KEY]]
+            return {k: restore(v) for k, v in value.items()}
+        elif isinstance(value, list):
+            return [restore(v) for v in value]
+        return value
+
+    return restore(interned["data"])
+
+
+def is_encoded(payload: Union[bytes, str]) -> bool:
+    """Whether the payload was written by a SessionCodec, rather than being a plain JSON document"""
+    if isinstance(payload, str):
+        return payload.startswith(MAGIC.decode("latin-1"))
+    return payload[: len(MAGIC)] == MAGIC
+
+
+class SessionCodec:
+    def __init__(
+        self,
+        format: Literal["json", "orjson", "msgpack"] = "msgpack",
+        compression: Optional[Literal["zstd", "zlib"]] = None,
+        compression_level: Optional[int] = None,
+        intern: bool = True,
+        min_intern_length: int = 32,
+    ):
+        """
+        Encodes serialized sessions (see Session.to_dict) to compact bytes with a versioned header,
+        and decodes sessions written with any format, compression or codec version, as well as plain JSON.
+
+        Args:
+            format: The serialization format, "json", "orjson", "msgpack" or a name registered with register_format.
+            compression: Compress the serialized session with "zstd" (requires `zstandard`) or "zlib".
+            compression_level: The compression level. Defaults to the default level of the compressor.
+            intern: Store strings that are repeated across the session (e.g. message content that is copied to
+                every run) only once.
+            min_intern_length: Only intern strings of at least this many characters.
+        """
+        self.format: SessionFormat = get_format(format)
+        self.compression: Optional[Literal["zstd", "zlib"]] = compression
+        self.compression_level: Optional[int] = compression_level
+        self.intern: bool = intern
+        self.min_intern_length: int = min_intern_length
+        if compression == "zstd":
+            # Fail early if zstandard is not installed
+            _get_zstd()
+        elif compression is not None and compression != "zlib":
+            raise ValueError(f"Unsupported compression: {compression}")
+
+    def encode(self, data: Dict[str, Any]) -> bytes:
+        """Encode a serialized session."""
+        flags = 0
+        value: Any = data
+        if self.intern:
+            interned = intern_strings(data, min_length=self.min_intern_length)
+            if interned is not None:
+                value = interned
+                flags |= FLAG_INTERNED
+
+        payload = self.format.dumps(value)
+        if self.compression == "zstd":
+            level = self.compression_level if self.compression_level is not None else 3
+            payload = _get_zstd().ZstdCompressor(level=level).compress(payload)
+            flags |= FLAG_ZSTD
+        elif self.compression == "zlib":
+            level = self.compression_level if self.compression_level is not None else -1
+            payload = zlib.compress(payload, level)
+            flags |= FLAG_ZLIB
+
+        return MAGIC + bytes([FORMAT_VERSION, self.format.format_id, flags]) + payload
+
+    def decode(self, payload: Union[bytes, str]) -> Dict[str, Any]:
+        """Decode a session encoded by any SessionCodec, or a plain JSON document."""
+        return decode_session(payload)
+
+
+def decode_session(payload: Union[bytes, str]) -> Dict[str, Any]:
+    """Decode a session encoded by any SessionCodec, or a plain JSON document"""
+    if not is_encoded(payload):
+        return json.loads(payload)
+    if isinstance(payload, str):
+        payload = payload.encode("latin-1")
+
+    version, format_id, flags = payload[len(MAGIC) : HEADER_SIZE]
+    if version > FORMAT_VERSION:
+        raise ValueError(f"Session was encoded with a newer codec version: {version}")
+
+    body = payload[HEADER_SIZE:]
+    if flags & FLAG_ZSTD:
+        body = _get_zstd().ZstdDecompressor().decompress(body)
+    elif flags & FLAG_ZLIB:
+        body = zlib.decompress(body)
+
+    value = get_format(format_id=format_id).loads(body)
+    if flags & FLAG_INTERNED:
+        value = restore_strings(value)
+    return value
+
+
+def migrate_sessions(
+    source: Storage,
+    target: Optional[Storage] = None,
+    user_id: Optional[str] = None,
+    entity_id: Optional[str] = None,
+) -> int:
+    """
+    Copy sessions from one storage to another, e.g. to re-encode them with a different codec.
+    If no target is provided, the sessions are rewritten in place with the codec of the source storage.
+
+    Args:
+        source (Storage): The storage to read the sessions from, sessions in any codec or plain JSON are read.
+        target (Optional[Storage]): The storage to write the sessions to. Defaults to the source storage.
+        user_id (Optional[str]): Only migrate the sessions of this user.
+        entity_id (Optional[str]): Only migrate the sessions of this agent, team or workflow.
+
+    Returns:
+        int: The number of migrated sessions.
+    """
+    target = target or source
+    migrated = 0
+    for session in source.get_all_sessions(user_id=user_id, entity_id=entity_id):
+        if target.upsert(session) is None:
+            logger.error(f"Failed to migrate session: {session.session_id}")
+            continue
+        log_debug(f"Migrated session: {session.session_id}")
+        migrated += 1
+    log_info(f"Migrated {migrated} sessions")
+    return migrated
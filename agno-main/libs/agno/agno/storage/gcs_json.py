@@ -46,6 +46,8 @@ class GCSJsonStorage(JsonStorage):
         if prefix is not None and prefix != "" and not prefix.endswith("/"):
             prefix += "/"
         self.prefix = prefix
+        # The local session index of JsonStorage is not used for GCS buckets
+        self.use_index = False
         self.project = project
         self.location = location
 
@@ -1,22 +1,72 @@
 import json
+import os
+import shutil
+import sys
 import time
+from contextlib import contextmanager
 from dataclasses import asdict
 from pathlib import Path
-from typing import List, Literal, Optional, Union
+from threading import Lock
+from typing import IO, Any, Dict, Iterable, Iterator, List, Literal, Optional, Tuple, Union
+from urllib.parse import quote
 
 from agno.storage.base import Storage
+from agno.storage.codec import SessionCodec, decode_session, is_encoded
 from agno.storage.session import Session
 from agno.storage.session.agent import AgentSession
+from agno.storage.session.listing import SessionListing, paginate_listings
 from agno.storage.session.team import TeamSession
 from agno.storage.session.workflow import WorkflowSession
-from agno.utils.log import logger
+from agno.utils.log import log_debug, logger
+
+if sys.platform == "win32":
+    import msvcrt
+
+    def _lock_file(file: IO[bytes]) -> None:
+        file.seek(0)
+        msvcrt.locking(file.fileno(), msvcrt.LK_LOCK, 1)
+
+    def _unlock_file(file: IO[bytes]) -> None:
+        file.seek(0)
+        msvcrt.locking(file.fileno(), msvcrt.LK_UNLCK, 1)
+
+else:
+    import fcntl
+
+    def _lock_file(file: IO[bytes]) -> None:
+        fcntl.flock(file.fileno(), fcntl.LOCK_EX)
+
+    def _unlock_file(file: IO[bytes]) -> None:
+        fcntl.flock(file.fileno(), fcntl.LOCK_UN)
 
 
 class JsonStorage(Storage):
-    def __init__(self, dir_path: Union[str, Path], mode: Optional[Literal["agent", "team", "workflow"]] = "agent"):
+    def __init__(
+        self,
+        dir_path: Union[str, Path],
+        mode: Optional[Literal["agent", "team", "workflow"]] = "agent",
+        use_index: bool = False,
+        codec: Optional[SessionCodec] = None,
+    ):
+        """
+        This class provides session storage using one JSON file per session.
+
+        Args:
+            dir_path: The directory to store the session files in.
+            mode: The mode of the storage.
+            use_index: Keep a per-user and per-entity index of the sessions in `<dir_path>/.index`, so sessions
+                can be listed and filtered without parsing every session file. The index is built on first use and
+                session files written without the index, e.g. by other processes or older versions, are indexed
+                when sessions are listed.
+            codec: Encode the session files with this SessionCodec instead of writing indented JSON.
+                Session files written with any codec or as JSON can always be read, see migrate_sessions.
+        """
         super().__init__(mode)
         self.dir_path = Path(dir_path)
         self.dir_path.mkdir(parents=True, exist_ok=True)
+        self.use_index = use_index
+        self.codec = codec
+        self._index_lock = Lock()
 
     def serialize(self, data: dict) -> str:
         return json.dumps(data, ensure_ascii=False, indent=4)
@@ -24,6 +74,198 @@ class JsonStorage(Storage):
     def deserialize(self, data: str) -> dict:
         return json.loads(data)
 
+    def _load_file(self, path: Path) -> Dict[str, Any]:
+        with open(path, "rb") as f:
+            raw = f.read()
+        return decode_session(raw) if is_encoded(raw) else self.deserialize(raw.decode("utf-8"))
+
+    def _dump_file(self, path: Path, data: Dict[str, Any]) -> None:
+        raw = self.codec.encode(data) if self.codec is not None else self.serialize(data).encode("utf-8")
+        with open(path, "wb") as f:
+            f.write(raw)
+
+    @property
+    def index_dir(self) -> Path:
+        return self.dir_path / ".index"
+
+    @property
+    def entity_field(self) -> str:
+        """The session field holding the ID of the agent, team or workflow."""
+        return f"{self.mode}_id"
+
+    @contextmanager
+    def _lock_index(self) -> Iterator[None]:
+        """Lock the index against other threads and processes using the same directory."""
+        # The lock file is kept outside the index directory, which is removed when the index is rebuilt
+        with self._index_lock, open(self.dir_path / ".index.lock", "a+b") as lock_file:
+            _lock_file(lock_file)
+            try:
+                yield
+            finally:
+                _unlock_file(lock_file)
+
+    def _get_index_path(self, field: str, value: Optional[str]) -> Path:
+        # Prefix values so that IDs can never collide with the file used for sessions without an ID
+        file_name = "none" if value is None else f"v_{quote(value, safe='')}"
+        return self.index_dir / field / f"{file_name}.json"
+
+    @property
+    def _manifest_path(self) -> Path:
+        # The modification time and index fields of each indexed session file, by session_id
+        return self.index_dir / "sessions.json"
+
+    def _read_index_file(self, path: Path) -> Dict[str, Dict[str, Any]]:
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                return json.loads(f.read())
+        except FileNotFoundError:
+            return {}
+
+    def _write_index_file(self, path: Path, entries: Dict[str, Dict[str, Any]]) -> None:
+        if not entries and path != self._manifest_path:
+            path.unlink(missing_ok=True)
+            return
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Write to a temporary file first so that readers never see a partially written index
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(json.dumps(entries, ensure_ascii=False))
+        os.replace(tmp_path, path)
+
+    def _index_fields(self, data: Dict[str, Any]) -> List[Tuple[str, Optional[str]]]:
+        return [("user_id", data.get("user_id")), (self.entity_field, data.get(self.entity_field))]
+
+    def _scan_session_files(self) -> Dict[str, int]:
+        """The modification times of the session files in nanoseconds, by session_id."""
+        mtimes: Dict[str, int] = {}
+        with os.scandir(self.dir_path) as entries:
+            for entry in entries:
+                if entry.name.endswith(".json") and entry.is_file():
+                    mtimes[entry.name[: -len(".json")]] = entry.stat().st_mtime_ns
+        return mtimes
+
+    def _update_index(
+        self,
+        manifest: Dict[str, Dict[str, Any]],
+        updated: Dict[str, Tuple[int, Dict[str, Any]]],
+        removed: Iterable[str] = (),
+    ) -> None:
+        """
+        Update the index for changed and removed sessions. Must be called holding the index lock.
+
+        Args:
+            manifest: The manifest of the index, updated in place.
+            updated: The modification time and data of the changed sessions, by session_id.
+            removed: The IDs of the removed sessions.
+        """
+        index_files: Dict[Path, Dict[str, Dict[str, Any]]] = {}
+
+        def get_entries(path: Path) -> Dict[str, Dict[str, Any]]:
+            if path not in index_files:
+                index_files[path] = self._read_index_file(path)
+            return index_files[path]
+
+        # Drop the previous entries first, so sessions whose user or entity changed are not listed under the old one
+        for session_id in [*updated, *removed]:
+            previous = manifest.pop(session_id, None)
+            if previous is not None:
+                for field, value in self._index_fields(previous):
+                    get_entries(self._get_index_path(field, value)).pop(session_id, None)
+
+        for session_id, (mtime, data) in updated.items():
+            listing = SessionListing.from_session_dict(data).to_dict()
+            for field, value in self._index_fields(data):
+                get_entries(self._get_index_path(field, value))[session_id] = listing
+            manifest[session_id] = {
+                "mtime": mtime,
+                "user_id": data.get("user_id"),
+                self.entity_field: data.get(self.entity_field),
+            }
+
+        for path, entries in index_files.items():
+            self._write_index_file(path, entries)
+        self._write_index_file(self._manifest_path, manifest)
+
+    def _sync_index(self, rebuild: bool = False) -> None:
+        """
+        Bring the index up to date with the session files, including sessions written by other processes, without
+        the index or by older versions. Only session files that changed since they were indexed are parsed.
+        """
+        with self._lock_index():
+            if rebuild or not self._manifest_path.exists():
+                # Also drops indexes written without a manifest
+                shutil.rmtree(self.index_dir, ignore_errors=True)
+            manifest = self._read_index_file(self._manifest_path)
+            mtimes = self._scan_session_files()
+
+            removed = [session_id for session_id in manifest if session_id not in mtimes]
+            updated: Dict[str, Tuple[int, Dict[str, Any]]] = {}
+            for session_id, mtime in mtimes.items():
+                if session_id in manifest and manifest[session_id]["mtime"] == mtime:
+                    continue
+                try:
+                    data = self._read_data(session_id)
+                except Exception as e:
+                    logger.warning(f"Could not index session file {session_id}.json: {e}")
+                    continue
+                if data is not None:
+                    updated[session_id] = (mtime, data)
+
+            if updated or removed or not self._manifest_path.exists():
+                log_debug(f"Updating session index for {self.dir_path}: {len(updated)} changed, {len(removed)} removed")
+                self._update_index(manifest, updated, removed)
+
+    def rebuild_index(self) -> None:
+        """Rebuild the session index from the session files."""
+        self._sync_index(rebuild=True)
+
+    def _get_indexed_listings(
+        self, user_id: Optional[str] = None, entity_id: Optional[str] = None
+    ) -> List[SessionListing]:
+        self._sync_index()
+
+        if user_id is not None:
+            entries = self._read_index_file(self._get_index_path("user_id", user_id))
+        elif entity_id is not None:
+            entries = self._read_index_file(self._get_index_path(self.entity_field, entity_id))
+        else:
+            entries = {}
+            for path in (self.index_dir / self.entity_field).glob("*.json"):
+                entries.update(self._read_index_file(path))
+
+        listings = [SessionListing.from_dict(entry) for entry in entries.values()]
+        if entity_id is not None:
+            listings = [listing for listing in listings if listing.entity_id == entity_id]
+        return listings
+
+    def list_sessions(
+        self,
+        user_id: Optional[str] = None,
+        entity_id: Optional[str] = None,
+        limit: Optional[int] = None,
+        offset: int = 0,
+    ) -> List[SessionListing]:
+        """List sessions newest first, optionally filtered by user_id and/or entity_id and paginated."""
+        if not self.use_index:
+            return super().list_sessions(user_id=user_id, entity_id=entity_id, limit=limit, offset=offset)
+        listings = self._get_indexed_listings(user_id=user_id, entity_id=entity_id)
+        return paginate_listings(listings, limit=limit, offset=offset)
+
+    def _read_data(self, session_id: str) -> Optional[Dict[str, Any]]:
+        try:
+            return self._load_file(self.dir_path / f"{session_id}.json")
+        except FileNotFoundError:
+            return None
+
+    def _session_from_dict(self, data: Dict[str, Any]) -> Optional[Session]:
+        if self.mode == "agent":
+            return AgentSession.from_dict(data)
+        elif self.mode == "team":
+            return TeamSession.from_dict(data)
+        elif self.mode == "workflow":
+            return WorkflowSession.from_dict(data)
+        return None
+
     def create(self) -> None:
         """Create the storage if it doesn't exist."""
         if not self.dir_path.exists():
@@ -32,94 +274,100 @@ class JsonStorage(Storage):
     def read(self, session_id: str, user_id: Optional[str] = None) -> Optional[Session]:
         """Read an AgentSession from storage."""
         try:
-            with open(self.dir_path / f"{session_id}.json", "r", encoding="utf-8") as f:
-                data = self.deserialize(f.read())
-                if user_id and data["user_id"] != user_id:
-                    return None
-                if self.mode == "agent":
-                    return AgentSession.from_dict(data)
-                elif self.mode == "team":
-                    return TeamSession.from_dict(data)
-                elif self.mode == "workflow":
-                    return WorkflowSession.from_dict(data)
+            data = self._load_file(self.dir_path / f"{session_id}.json")
+            if user_id and data["user_id"] != user_id:
+                return None
+            if self.mode == "agent":
+                return AgentSession.from_dict(data)
+            elif self.mode == "team":
+                return TeamSession.from_dict(data)
+            elif self.mode == "workflow":
+                return WorkflowSession.from_dict(data)
         except FileNotFoundError:
             return None
+        return None
 
     def get_all_session_ids(self, user_id: Optional[str] = None, entity_id: Optional[str] = None) -> List[str]:
         """Get all session IDs, optionally filtered by user_id and/or entity_id."""
+        if self.use_index:
+            return [listing.session_id for listing in self.list_sessions(user_id=user_id, entity_id=entity_id)]
+
         session_ids = []
         for file in self.dir_path.glob("*.json"):
-            with open(file, "r", encoding="utf-8") as f:
-                data = self.deserialize(f.read())
-                if user_id or entity_id:
-                    if user_id and entity_id:
-                        if self.mode == "agent" and data["agent_id"] == entity_id and data["user_id"] == user_id:
-                            session_ids.append(data["session_id"])
-                        elif self.mode == "team" and data["team_id"] == entity_id and data["user_id"] == user_id:
-                            session_ids.append(data["session_id"])
-                        elif (
-                            self.mode == "workflow" and data["workflow_id"] == entity_id and data["user_id"] == user_id
-                        ):
-                            session_ids.append(data["session_id"])
-                    elif user_id and data["user_id"] == user_id:
+            data = self._load_file(file)
+            if user_id or entity_id:
+                if user_id and entity_id:
+                    if self.mode == "agent" and data["agent_id"] == entity_id and data["user_id"] == user_id:
+                        session_ids.append(data["session_id"])
+                    elif self.mode == "team" and data["team_id"] == entity_id and data["user_id"] == user_id:
+                        session_ids.append(data["session_id"])
+                    elif self.mode == "workflow" and data["workflow_id"] == entity_id and data["user_id"] == user_id:
                         session_ids.append(data["session_id"])
-                    elif entity_id:
-                        if self.mode == "agent" and data["agent_id"] == entity_id:
-                            session_ids.append(data["session_id"])
-                        elif self.mode == "team" and data["team_id"] == entity_id:
-                            session_ids.append(data["session_id"])
-                        elif self.mode == "workflow" and data["workflow_id"] == entity_id:
-                            session_ids.append(data["session_id"])
-                else:
-                    # No filters applied, add all session_ids
+                elif user_id and data["user_id"] == user_id:
                     session_ids.append(data["session_id"])
+                elif entity_id:
+                    if self.mode == "agent" and data["agent_id"] == entity_id:
+                        session_ids.append(data["session_id"])
+                    elif self.mode == "team" and data["team_id"] == entity_id:
+                        session_ids.append(data["session_id"])
+                    elif self.mode == "workflow" and data["workflow_id"] == entity_id:
+                        session_ids.append(data["session_id"])
+            else:
+                # No filters applied, add all session_ids
+                session_ids.append(data["session_id"])
         return session_ids
 
     def get_all_sessions(self, user_id: Optional[str] = None, entity_id: Optional[str] = None) -> List[Session]:
         """Get all sessions, optionally filtered by user_id and/or entity_id."""
         sessions: List[Session] = []
+        if self.use_index:
+            # Only parse the session files that match the filters
+            for listing in self.list_sessions(user_id=user_id, entity_id=entity_id):
+                data = self._read_data(listing.session_id)
+                indexed_session = self._session_from_dict(data) if data is not None else None
+                if indexed_session:
+                    sessions.append(indexed_session)
+            return sessions
+
         for file in self.dir_path.glob("*.json"):
-            with open(file, "r", encoding="utf-8") as f:
-                data = self.deserialize(f.read())
-                if user_id or entity_id:
-                    _session: Optional[Session] = None
-
-                    if user_id and entity_id:
-                        if self.mode == "agent" and data["agent_id"] == entity_id and data["user_id"] == user_id:
-                            _session = AgentSession.from_dict(data)
-                        elif self.mode == "team" and data["team_id"] == entity_id and data["user_id"] == user_id:
-                            _session = TeamSession.from_dict(data)
-                        elif (
-                            self.mode == "workflow" and data["workflow_id"] == entity_id and data["user_id"] == user_id
-                        ):
-                            _session = WorkflowSession.from_dict(data)
-                    elif user_id and data["user_id"] == user_id:
-                        if self.mode == "agent":
-                            _session = AgentSession.from_dict(data)
-                        elif self.mode == "team":
-                            _session = TeamSession.from_dict(data)
-                        elif self.mode == "workflow":
-                            _session = WorkflowSession.from_dict(data)
-                    elif entity_id:
-                        if self.mode == "agent" and data["agent_id"] == entity_id:
-                            _session = AgentSession.from_dict(data)
-                        elif self.mode == "team" and data["team_id"] == entity_id:
-                            _session = TeamSession.from_dict(data)
-                        elif self.mode == "workflow" and data["workflow_id"] == entity_id:
-                            _session = WorkflowSession.from_dict(data)
-
-                    if _session:
-                        sessions.append(_session)
-                else:
-                    # No filters applied, add all sessions
+            data = self._load_file(file)
+            if user_id or entity_id:
+                _session: Optional[Session] = None
+
+                if user_id and entity_id:
+                    if self.mode == "agent" and data["agent_id"] == entity_id and data["user_id"] == user_id:
+                        _session = AgentSession.from_dict(data)
+                    elif self.mode == "team" and data["team_id"] == entity_id and data["user_id"] == user_id:
+                        _session = TeamSession.from_dict(data)
+                    elif self.mode == "workflow" and data["workflow_id"] == entity_id and data["user_id"] == user_id:
+                        _session = WorkflowSession.from_dict(data)
+                elif user_id and data["user_id"] == user_id:
                     if self.mode == "agent":
                         _session = AgentSession.from_dict(data)
                     elif self.mode == "team":
                         _session = TeamSession.from_dict(data)
                     elif self.mode == "workflow":
                         _session = WorkflowSession.from_dict(data)
-                    if _session:
-                        sessions.append(_session)
+                elif entity_id:
+                    if self.mode == "agent" and data["agent_id"] == entity_id:
+                        _session = AgentSession.from_dict(data)
+                    elif self.mode == "team" and data["team_id"] == entity_id:
+                        _session = TeamSession.from_dict(data)
+                    elif self.mode == "workflow" and data["workflow_id"] == entity_id:
+                        _session = WorkflowSession.from_dict(data)
+
+                if _session:
+                    sessions.append(_session)
+            else:
+                # No filters applied, add all sessions
+                if self.mode == "agent":
+                    _session = AgentSession.from_dict(data)
+                elif self.mode == "team":
+                    _session = TeamSession.from_dict(data)
+                elif self.mode == "workflow":
+                    _session = WorkflowSession.from_dict(data)
+                if _session:
+                    sessions.append(_session)
         return sessions
 
     def upsert(self, session: Session) -> Optional[Session]:
@@ -130,8 +378,14 @@ class JsonStorage(Storage):
             if "created_at" not in data:
                 data["created_at"] = data["updated_at"]
 
-            with open(self.dir_path / f"{session.session_id}.json", "w", encoding="utf-8") as f:
-                f.write(self.serialize(data))
+            path = self.dir_path / f"{session.session_id}.json"
+            self._dump_file(path, data)
+            if self.use_index:
+                with self._lock_index():
+                    if self._manifest_path.exists():
+                        manifest = self._read_index_file(self._manifest_path)
+                        self._update_index(manifest, {session.session_id: (path.stat().st_mtime_ns, data)})
+                # Without a manifest the index is built on first use
             return session
         except Exception as e:
             logger.error(f"Error upserting session: {e}")
@@ -143,6 +397,11 @@ class JsonStorage(Storage):
             return
         try:
             (self.dir_path / f"{session_id}.json").unlink(missing_ok=True)
+            if self.use_index:
+                with self._lock_index():
+                    if self._manifest_path.exists():
+                        manifest = self._read_index_file(self._manifest_path)
+                        self._update_index(manifest, {}, removed=[session_id])
         except Exception as e:
             logger.error(f"Error deleting session: {e}")
 
@@ -150,6 +409,8 @@ class JsonStorage(Storage):
         """Drop all sessions from storage."""
         for file in self.dir_path.glob("*.json"):
             file.unlink()
+        with self._lock_index():
+            shutil.rmtree(self.index_dir, ignore_errors=True)
 
     def upgrade_schema(self) -> None:
         """Upgrade the schema of the storage."""
@@ -1,5 +1,6 @@
+import asyncio
 from datetime import datetime, timezone
-from typing import List, Literal, Optional
+from typing import Any, Dict, List, Literal, Optional
 from uuid import UUID
 
 from agno.storage.base import Storage
@@ -17,6 +18,12 @@ try:
 except ImportError:
     raise ImportError("`pymongo` not installed. Please install it with `pip install pymongo`")
 
+try:
+    from pymongo import AsyncMongoClient
+except ImportError:
+    # The async client was added in pymongo 4.9, older versions run the async methods in a thread
+    AsyncMongoClient = None  # type: ignore
+
 
 class MongoDbStorage(Storage):
     def __init__(
@@ -26,6 +33,7 @@ class MongoDbStorage(Storage):
         db_name: str = "agno",
         client: Optional[MongoClient] = None,
         mode: Optional[Literal["agent", "team", "workflow"]] = "agent",
+        async_client: Optional[Any] = None,
     ):
         """
         This class provides agent storage using MongoDB.
@@ -35,6 +43,8 @@ class MongoDbStorage(Storage):
             db_url: MongoDB connection URL
             db_name: Name of the database
             client: Optional existing MongoDB client
+            async_client: Optional existing async MongoDB client (pymongo AsyncMongoClient or motor) used by the
+                async methods. Defaults to an AsyncMongoClient for the db_url.
         """
         super().__init__(mode)
         self._client: Optional[MongoClient] = client
@@ -47,10 +57,18 @@ class MongoDbStorage(Storage):
             raise ValueError("Must provide either db_url or client")
 
         self.collection_name: str = collection_name
+        self.db_url: Optional[str] = db_url
         self.db_name: str = db_name
         self.db: Database = self._client[self.db_name]
         self.collection: Collection = self.db[self.collection_name]
 
+        self.async_client: Optional[Any] = async_client
+        # Async client created from the db_url, per event loop as async connections can't be shared across loops
+        self._async_client: Optional[Any] = None
+        self._async_client_loop: Optional[asyncio.AbstractEventLoop] = None
+        # The async client can only be created if we know where the sync client connects to
+        self._can_create_async_client: bool = AsyncMongoClient is not None and (db_url is not None or client is None)
+
     def create(self) -> None:
         """Create necessary indexes for the collection"""
         try:
@@ -68,6 +86,30 @@ class MongoDbStorage(Storage):
             logger.error(f"Error creating indexes: {e}")
             raise
 
+    def _get_query(self, user_id: Optional[str] = None, entity_id: Optional[str] = None) -> Dict[str, Any]:
+        query: Dict[str, Any] = {}
+        if user_id is not None:
+            query["user_id"] = user_id
+        if entity_id is not None:
+            if self.mode == "agent":
+                query["agent_id"] = entity_id
+            elif self.mode == "team":
+                query["team_id"] = entity_id
+            elif self.mode == "workflow":
+                query["workflow_id"] = entity_id
+        return query
+
+    def _session_from_doc(self, doc: Dict[str, Any]) -> Optional[Session]:
+        # Remove MongoDB _id before converting to a Session
+        doc.pop("_id", None)
+        if self.mode == "agent":
+            return AgentSession.from_dict(doc)
+        elif self.mode == "team":
+            return TeamSession.from_dict(doc)
+        elif self.mode == "workflow":
+            return WorkflowSession.from_dict(doc)
+        return None
+
     def read(self, session_id: str, user_id: Optional[str] = None) -> Optional[Session]:
         """Read a Session from MongoDB
         Args:
@@ -83,14 +125,7 @@ class MongoDbStorage(Storage):
 
             doc = self.collection.find_one(query)
             if doc:
-                # Remove MongoDB _id before converting to AgentSession
-                doc.pop("_id", None)
-                if self.mode == "agent":
-                    return AgentSession.from_dict(doc)
-                elif self.mode == "team":
-                    return TeamSession.from_dict(doc)
-                elif self.mode == "workflow":
-                    return WorkflowSession.from_dict(doc)
+                return self._session_from_doc(doc)
             return None
         except PyMongoError as e:
             logger.error(f"Error reading session: {e}")
@@ -105,17 +140,7 @@ class MongoDbStorage(Storage):
             List[str]: List of session IDs
         """
         try:
-            query = {}
-            if user_id is not None:
-                query["user_id"] = user_id
-            if entity_id is not None:
-                if self.mode == "agent":
-                    query["agent_id"] = entity_id
-                elif self.mode == "team":
-                    query["team_id"] = entity_id
-                elif self.mode == "workflow":
-                    query["workflow_id"] = entity_id
-
+            query = self._get_query(user_id=user_id, entity_id=entity_id)
             cursor = self.collection.find(query, {"session_id": 1}).sort("created_at", -1)
 
             return [str(doc["session_id"]) for doc in cursor]
@@ -132,39 +157,36 @@ class MongoDbStorage(Storage):
             List[Session]: List of sessions
         """
         try:
-            query = {}
-            if user_id is not None:
-                query["user_id"] = user_id
-            if entity_id is not None:
-                if self.mode == "agent":
-                    query["agent_id"] = entity_id
-                elif self.mode == "team":
-                    query["team_id"] = entity_id
-                elif self.mode == "workflow":
-                    query["workflow_id"] = entity_id
-
+            query = self._get_query(user_id=user_id, entity_id=entity_id)
             cursor = self.collection.find(query).sort("created_at", -1)
             sessions: List[Session] = []
             for doc in cursor:
-                # Remove MongoDB _id before converting to AgentSession
-                doc.pop("_id", None)
-                if self.mode == "agent":
-                    _agent_session = AgentSession.from_dict(doc)
-                    if _agent_session is not None:
-                        sessions.append(_agent_session)
-                elif self.mode == "team":
-                    _team_session = TeamSession.from_dict(doc)
-                    if _team_session is not None:
-                        sessions.append(_team_session)
-                elif self.mode == "workflow":
-                    _workflow_session = WorkflowSession.from_dict(doc)
-                    if _workflow_session is not None:
-                        sessions.append(_workflow_session)
+                _session = self._session_from_doc(doc)
+                if _session is not None:
+                    sessions.append(_session)
             return sessions
         except PyMongoError as e:
             logger.error(f"Error getting sessions: {e}")
             return []
 
+    def _get_update_data(self, session: Session) -> Dict[str, Any]:
+        # Convert session to dict and add timestamps
+        session_dict = session.to_dict()
+        now = datetime.now(timezone.utc)
+        timestamp = int(now.timestamp())
+
+        # Handle UUID serialization
+        if isinstance(session.session_id, UUID):
+            session_dict["session_id"] = str(session.session_id)
+
+        # Add version field for optimistic locking
+        if "_version" not in session_dict:
+            session_dict["_version"] = 1
+        else:
+            session_dict["_version"] += 1
+
+        return {**session_dict, "updated_at": timestamp}
+
     def upsert(self, session: Session, create_and_retry: bool = True) -> Optional[Session]:
         """Upsert a session
         Args:
@@ -174,36 +196,132 @@ class MongoDbStorage(Storage):
             Optional[Session]: The upserted session, otherwise None
         """
         try:
-            # Convert session to dict and add timestamps
-            session_dict = session.to_dict()
-            now = datetime.now(timezone.utc)
-            timestamp = int(now.timestamp())
-
-            # Handle UUID serialization
-            if isinstance(session.session_id, UUID):
-                session_dict["session_id"] = str(session.session_id)
-
-            # Add version field for optimistic locking
-            if "_version" not in session_dict:
-                session_dict["_version"] = 1
-            else:
-                session_dict["_version"] += 1
-
-            update_data = {**session_dict, "updated_at": timestamp}
+            update_data = self._get_update_data(session)
+            query = {"session_id": update_data["session_id"]}
 
             # For new documents, set created_at
-            query = {"session_id": session_dict["session_id"]}
-
             doc = self.collection.find_one(query)
             if not doc:
-                update_data["created_at"] = timestamp
+                update_data["created_at"] = update_data["updated_at"]
 
             result = self.collection.update_one(query, {"$set": update_data}, upsert=True)
 
             if result.acknowledged:
-                return self.read(session_id=session_dict["session_id"])
+                return self.read(session_id=update_data["session_id"])
+            return None
+
+        except PyMongoError as e:
+            logger.warning(f"Error upserting session: {e}")
+            return None
+
+    def _get_async_collection(self) -> Optional[Any]:
+        """Returns the collection of the async client, or None if the async methods run the sync ones in a thread."""
+        client = self.async_client
+        if client is None:
+            if not self._can_create_async_client:
+                return None
+            loop = asyncio.get_running_loop()
+            if self._async_client is None or self._async_client_loop is not loop:
+                self._async_client = AsyncMongoClient(self.db_url) if self.db_url else AsyncMongoClient()
+                self._async_client_loop = loop
+            client = self._async_client
+        return client[self.db_name][self.collection_name]
+
+    async def aread(self, session_id: str, user_id: Optional[str] = None) -> Optional[Session]:
+        """Read a Session from MongoDB without blocking the event loop
+        Args:
+            session_id: ID of the session to read
+            user_id: ID of the user to read
+        Returns:
+            Optional[Session]: The session if found, otherwise None
+        """
+        collection = self._get_async_collection()
+        if collection is None:
+            return await super().aread(session_id=session_id, user_id=user_id)
+
+        try:
+            query = {"session_id": session_id}
+            if user_id:
+                query["user_id"] = user_id
+
+            doc = await collection.find_one(query)
+            if doc:
+                return self._session_from_doc(doc)
+            return None
+        except PyMongoError as e:
+            logger.error(f"Error reading session: {e}")
             return None
 
+    async def aget_all_session_ids(self, user_id: Optional[str] = None, entity_id: Optional[str] = None) -> List[str]:
+        """Get all session IDs matching the criteria without blocking the event loop
+        Args:
+            user_id: ID of the user to read
+            entity_id: ID of the entity to read
+        Returns:
+            List[str]: List of session IDs
+        """
+        collection = self._get_async_collection()
+        if collection is None:
+            return await super().aget_all_session_ids(user_id=user_id, entity_id=entity_id)
+
+        try:
+            query = self._get_query(user_id=user_id, entity_id=entity_id)
+            cursor = collection.find(query, {"session_id": 1}).sort("created_at", -1)
+            return [str(doc["session_id"]) async for doc in cursor]
+        except PyMongoError as e:
+            logger.error(f"Error getting session IDs: {e}")
+            return []
+
+    async def aget_all_sessions(self, user_id: Optional[str] = None, entity_id: Optional[str] = None) -> List[Session]:
+        """Get all sessions matching the criteria without blocking the event loop
+        Args:
+            user_id: ID of the user to read
+            entity_id: ID of the agent / workflow to read
+        Returns:
+            List[Session]: List of sessions
+        """
+        collection = self._get_async_collection()
+        if collection is None:
+            return await super().aget_all_sessions(user_id=user_id, entity_id=entity_id)
+
+        try:
+            query = self._get_query(user_id=user_id, entity_id=entity_id)
+            cursor = collection.find(query).sort("created_at", -1)
+            sessions: List[Session] = []
+            async for doc in cursor:
+                _session = self._session_from_doc(doc)
+                if _session is not None:
+                    sessions.append(_session)
+            return sessions
+        except PyMongoError as e:
+            logger.error(f"Error getting sessions: {e}")
+            return []
+
+    async def aupsert(self, session: Session) -> Optional[Session]:
+        """Upsert a session without blocking the event loop
+        Args:
+            session (Session): The session to upsert
+        Returns:
+            Optional[Session]: The upserted session, otherwise None
+        """
+        collection = self._get_async_collection()
+        if collection is None:
+            return await super().aupsert(session)
+
+        try:
+            update_data = self._get_update_data(session)
+            query = {"session_id": update_data["session_id"]}
+
+            # For new documents, set created_at
+            doc = await collection.find_one(query)
+            if not doc:
+                update_data["created_at"] = update_data["updated_at"]
+
+            result = await collection.update_one(query, {"$set": update_data}, upsert=True)
+
+            if result.acknowledged:
+                return await self.aread(session_id=update_data["session_id"])
+            return None
         except PyMongoError as e:
             logger.warning(f"Error upserting session: {e}")
             return None
@@ -253,7 +371,7 @@ class MongoDbStorage(Storage):
 
         # Deep copy attributes
         for k, v in self.__dict__.items():
-            if k in {"_client", "db", "collection"}:
+            if k in {"_client", "db", "collection", "async_client", "_async_client", "_async_client_loop"}:
                 # Reuse MongoDB connections without copying
                 setattr(copied_obj, k, v)
             else:
@@ -1,5 +1,6 @@
+import asyncio
 import time
-from typing import List, Literal, Optional
+from typing import Any, Dict, List, Literal, Optional
 
 from agno.storage.base import Storage
 from agno.storage.session import Session
@@ -11,10 +12,11 @@ from agno.utils.log import log_debug, log_info, log_warning, logger
 try:
     from sqlalchemy.dialects import postgresql
     from sqlalchemy.engine import Engine, create_engine
+    from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
     from sqlalchemy.inspection import inspect
     from sqlalchemy.orm import scoped_session, sessionmaker
     from sqlalchemy.schema import Column, MetaData, Table
-    from sqlalchemy.sql.expression import select, text
+    from sqlalchemy.sql.expression import bindparam, cast, func, literal, select, text
     from sqlalchemy.types import BigInteger, String
 except ImportError:
     raise ImportError("`sqlalchemy` not installed. Please install it using `pip install sqlalchemy`")
@@ -30,6 +32,8 @@ class PostgresStorage(Storage):
         schema_version: int = 1,
         auto_upgrade_schema: bool = False,
         mode: Optional[Literal["agent", "team", "workflow"]] = "agent",
+        async_db_url: Optional[str] = None,
+        async_db_engine: Optional[AsyncEngine] = None,
     ):
         """
         This class provides agent storage using a PostgreSQL table.
@@ -47,6 +51,9 @@ class PostgresStorage(Storage):
             schema_version (int): Version of the schema. Defaults to 1.
             auto_upgrade_schema (bool): Whether to automatically upgrade the schema.
             mode (Optional[Literal["agent", "team", "workflow"]]): The mode of the storage.
+            async_db_url (Optional[str]): The database URL used by the async methods (aread, aupsert, ...).
+                Defaults to the URL of the sync engine, using asyncpg unless the driver is psycopg (3).
+            async_db_engine (Optional[AsyncEngine]): The SQLAlchemy async engine used by the async methods.
         Raises:
             ValueError: If neither db_url nor db_engine is provided.
         """
@@ -63,6 +70,8 @@ class PostgresStorage(Storage):
         self.schema: Optional[str] = schema
         self.db_url: Optional[str] = db_url
         self.db_engine: Engine = _engine
+        self.async_db_url: Optional[str] = async_db_url
+        self.async_db_engine: Optional[AsyncEngine] = async_db_engine
         self.metadata: MetaData = MetaData(schema=self.schema)
         self.inspector = inspect(self.db_engine)
 
@@ -74,6 +83,10 @@ class PostgresStorage(Storage):
 
         # Database session
         self.Session: scoped_session = scoped_session(sessionmaker(bind=self.db_engine))
+        # Async engine created from the db_url, per event loop as async connections can't be shared across loops
+        self._async_engine: Optional[AsyncEngine] = None
+        self._async_engine_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._async_driver_available: bool = True
         # Database table for storage
         self.table: Table = self.get_table()
         log_debug(f"Created PostgresStorage: '{self.schema}.{self.table_name}'")
@@ -240,6 +253,29 @@ class PostgresStorage(Storage):
                 logger.error(f"Could not create table: '{self.table.fullname}': {e}")
                 raise
 
+    def _session_from_row(self, row: Any) -> Optional[Session]:
+        if self.mode == "agent":
+            return AgentSession.from_dict(row._mapping)
+        elif self.mode == "team":
+            return TeamSession.from_dict(row._mapping)
+        elif self.mode == "workflow":
+            return WorkflowSession.from_dict(row._mapping)
+        return None
+
+    def _get_sessions_stmt(self, stmt: Any, user_id: Optional[str] = None, entity_id: Optional[str] = None) -> Any:
+        """Filter a select statement by user_id and/or entity_id, newest sessions first"""
+        if user_id is not None:
+            stmt = stmt.where(self.table.c.user_id == user_id)
+        if entity_id is not None:
+            if self.mode == "agent":
+                stmt = stmt.where(self.table.c.agent_id == entity_id)
+            elif self.mode == "team":
+                stmt = stmt.where(self.table.c.team_id == entity_id)
+            elif self.mode == "workflow":
+                stmt = stmt.where(self.table.c.workflow_id == entity_id)
+        # order by created_at desc
+        return stmt.order_by(self.table.c.created_at.desc())
+
     def read(self, session_id: str, user_id: Optional[str] = None) -> Optional[Session]:
         """
         Read an Session from the database.
@@ -257,12 +293,7 @@ class PostgresStorage(Storage):
                 if user_id:
                     stmt = stmt.where(self.table.c.user_id == user_id)
                 result = sess.execute(stmt).fetchone()
-                if self.mode == "agent":
-                    return AgentSession.from_dict(result._mapping) if result is not None else None
-                elif self.mode == "team":
-                    return TeamSession.from_dict(result._mapping) if result is not None else None
-                elif self.mode == "workflow":
-                    return WorkflowSession.from_dict(result._mapping) if result is not None else None
+                return self._session_from_row(result) if result is not None else None
         except Exception as e:
             if "does not exist" in str(e):
                 log_debug(f"Table does not exist: {self.table.name}")
@@ -286,20 +317,7 @@ class PostgresStorage(Storage):
         try:
             with self.Session() as sess, sess.begin():
                 # get all session_ids
-                stmt = select(self.table.c.session_id)
-                if user_id is not None:
-                    stmt = stmt.where(self.table.c.user_id == user_id)
-                if entity_id is not None:
-                    if self.mode == "agent":
-                        stmt = stmt.where(self.table.c.agent_id == entity_id)
-                    elif self.mode == "team":
-                        stmt = stmt.where(self.table.c.team_id == entity_id)
-                    elif self.mode == "workflow":
-                        stmt = stmt.where(self.table.c.workflow_id == entity_id)
-
-                # order by created_at desc
-                stmt = stmt.order_by(self.table.c.created_at.desc())
-                # execute query
+                stmt = self._get_sessions_stmt(select(self.table.c.session_id), user_id=user_id, entity_id=entity_id)
                 rows = sess.execute(stmt).fetchall()
                 return [row[0] for row in rows] if rows is not None else []
         except Exception as e:
@@ -323,29 +341,9 @@ class PostgresStorage(Storage):
         try:
             with self.Session() as sess, sess.begin():
                 # get all sessions
-                stmt = select(self.table)
-                if user_id is not None:
-                    stmt = stmt.where(self.table.c.user_id == user_id)
-                if entity_id is not None:
-                    if self.mode == "agent":
-                        stmt = stmt.where(self.table.c.agent_id == entity_id)
-                    elif self.mode == "team":
-                        stmt = stmt.where(self.table.c.team_id == entity_id)
-                    else:
-                        stmt = stmt.where(self.table.c.workflow_id == entity_id)
-                # order by created_at desc
-                stmt = stmt.order_by(self.table.c.created_at.desc())
-                # execute query
+                stmt = self._get_sessions_stmt(select(self.table), user_id=user_id, entity_id=entity_id)
                 rows = sess.execute(stmt).fetchall()
-                if rows is not None:
-                    if self.mode == "agent":
-                        return [AgentSession.from_dict(row._mapping) for row in rows]  # type: ignore
-                    elif self.mode == "team":
-                        return [TeamSession.from_dict(row._mapping) for row in rows]  # type: ignore
-                    else:
-                        return [WorkflowSession.from_dict(row._mapping) for row in rows]  # type: ignore
-                else:
-                    return []
+                return [self._session_from_row(row) for row in rows] if rows is not None else []  # type: ignore
         except Exception as e:
             log_debug(f"Exception reading from table: {e}")
             log_debug(f"Table does not exist: {self.table.name}")
@@ -391,6 +389,86 @@ class PostgresStorage(Storage):
             logger.error(f"Error during schema upgrade: {e}")
             raise
 
+    def _get_upsert_stmt(self, session: Session) -> Any:
+        """Build the insert statement that upserts a session"""
+        if self.mode == "agent":
+            stmt = postgresql.insert(self.table).values(
+                session_id=session.session_id,
+                agent_id=session.agent_id,  # type: ignore
+                team_session_id=session.team_session_id,  # type: ignore
+                user_id=session.user_id,
+                memory=session.memory,
+                agent_data=session.agent_data,  # type: ignore
+                session_data=session.session_data,
+                extra_data=session.extra_data,
+            )
+            # Define the upsert if the session_id already exists
+            # See: https://docs.sqlalchemy.org/en/20/dialects/postgresql.html#postgresql-insert-on-conflict
+            stmt = stmt.on_conflict_do_update(
+                index_elements=["session_id"],
+                set_=dict(
+                    agent_id=session.agent_id,  # type: ignore
+                    team_session_id=session.team_session_id,  # type: ignore
+                    user_id=session.user_id,
+                    memory=session.memory,
+                    agent_data=session.agent_data,  # type: ignore
+                    session_data=session.session_data,
+                    extra_data=session.extra_data,
+                    updated_at=int(time.time()),
+                ),  # The updated value for each column
+            )
+        elif self.mode == "team":
+            stmt = postgresql.insert(self.table).values(
+                session_id=session.session_id,
+                team_id=session.team_id,  # type: ignore
+                user_id=session.user_id,
+                team_session_id=session.team_session_id,  # type: ignore
+                memory=session.memory,
+                team_data=session.team_data,  # type: ignore
+                session_data=session.session_data,
+                extra_data=session.extra_data,
+            )
+            # Define the upsert if the session_id already exists
+            # See: https://docs.sqlalchemy.org/en/20/dialects/postgresql.html#postgresql-insert-on-conflict
+            stmt = stmt.on_conflict_do_update(
+                index_elements=["session_id"],
+                set_=dict(
+                    team_id=session.team_id,  # type: ignore
+                    user_id=session.user_id,
+                    team_session_id=session.team_session_id,  # type: ignore
+                    memory=session.memory,
+                    team_data=session.team_data,  # type: ignore
+                    session_data=session.session_data,
+                    extra_data=session.extra_data,
+                    updated_at=int(time.time()),
+                ),  # The updated value for each column
+            )
+        else:
+            stmt = postgresql.insert(self.table).values(
+                session_id=session.session_id,
+                workflow_id=session.workflow_id,  # type: ignore
+                user_id=session.user_id,
+                memory=session.memory,
+                workflow_data=session.workflow_data,  # type: ignore
+                session_data=session.session_data,
+                extra_data=session.extra_data,
+            )
+            # Define the upsert if the session_id already exists
+            # See: https://docs.sqlalchemy.org/en/20/dialects/postgresql.html#postgresql-insert-on-conflict
+            stmt = stmt.on_conflict_do_update(
+                index_elements=["session_id"],
+                set_=dict(
+                    workflow_id=session.workflow_id,  # type: ignore
+                    user_id=session.user_id,
+                    memory=session.memory,
+                    workflow_data=session.workflow_data,  # type: ignore
+                    session_data=session.session_data,
+                    extra_data=session.extra_data,
+                    updated_at=int(time.time()),
+                ),  # The updated value for each column
+            )
+        return stmt
+
     def upsert(self, session: Session, create_and_retry: bool = True) -> Optional[Session]:
         """
         Insert or update an Session in the database.
@@ -408,85 +486,7 @@ class PostgresStorage(Storage):
 
         try:
             with self.Session() as sess, sess.begin():
-                # Create an insert statement
-                if self.mode == "agent":
-                    stmt = postgresql.insert(self.table).values(
-                        session_id=session.session_id,
-                        agent_id=session.agent_id,  # type: ignore
-                        team_session_id=session.team_session_id,  # type: ignore
-                        user_id=session.user_id,
-                        memory=session.memory,
-                        agent_data=session.agent_data,  # type: ignore
-                        session_data=session.session_data,
-                        extra_data=session.extra_data,
-                    )
-                    # Define the upsert if the session_id already exists
-                    # See: https://docs.sqlalchemy.org/en/20/dialects/postgresql.html#postgresql-insert-on-conflict
-                    stmt = stmt.on_conflict_do_update(
-                        index_elements=["session_id"],
-                        set_=dict(
-                            agent_id=session.agent_id,  # type: ignore
-                            team_session_id=session.team_session_id,  # type: ignore
-                            user_id=session.user_id,
-                            memory=session.memory,
-                            agent_data=session.agent_data,  # type: ignore
-                            session_data=session.session_data,
-                            extra_data=session.extra_data,
-                            updated_at=int(time.time()),
-                        ),  # The updated value for each column
-                    )
-                elif self.mode == "team":
-                    stmt = postgresql.insert(self.table).values(
-                        session_id=session.session_id,
-                        team_id=session.team_id,  # type: ignore
-                        user_id=session.user_id,
-                        team_session_id=session.team_session_id,  # type: ignore
-                        memory=session.memory,
-                        team_data=session.team_data,  # type: ignore
-                        session_data=session.session_data,
-                        extra_data=session.extra_data,
-                    )
-                    # Define the upsert if the session_id already exists
-                    # See: https://docs.sqlalchemy.org/en/20/dialects/postgresql.html#postgresql-insert-on-conflict
-                    stmt = stmt.on_conflict_do_update(
-                        index_elements=["session_id"],
-                        set_=dict(
-                            team_id=session.team_id,  # type: ignore
-                            user_id=session.user_id,
-                            team_session_id=session.team_session_id,  # type: ignore
-                            memory=session.memory,
-                            team_data=session.team_data,  # type: ignore
-                            session_data=session.session_data,
-                            extra_data=session.extra_data,
-                            updated_at=int(time.time()),
-                        ),  # The updated value for each column
-                    )
-                else:
-                    stmt = postgresql.insert(self.table).values(
-                        session_id=session.session_id,
-                        workflow_id=session.workflow_id,  # type: ignore
-                        user_id=session.user_id,
-                        memory=session.memory,
-                        workflow_data=session.workflow_data,  # type: ignore
-                        session_data=session.session_data,
-                        extra_data=session.extra_data,
-                    )
-                    # Define the upsert if the session_id already exists
-                    # See: https://docs.sqlalchemy.org/en/20/dialects/postgresql.html#postgresql-insert-on-conflict
-                    stmt = stmt.on_conflict_do_update(
-                        index_elements=["session_id"],
-                        set_=dict(
-                            workflow_id=session.workflow_id,  # type: ignore
-                            user_id=session.user_id,
-                            memory=session.memory,
-                            workflow_data=session.workflow_data,  # type: ignore
-                            session_data=session.session_data,
-                            extra_data=session.extra_data,
-                            updated_at=int(time.time()),
-                        ),  # The updated value for each column
-                    )
-
-                sess.execute(stmt)
+                sess.execute(self._get_upsert_stmt(session))
         except Exception as e:
             if create_and_retry and not self.table_exists():
                 log_debug(f"Table does not exist: {self.table.name}")
@@ -501,6 +501,197 @@ class PostgresStorage(Storage):
                 return None
         return self.read(session_id=session.session_id)
 
+    def upsert_runs(self, session: Session, new_runs: List[Dict[str, Any]]) -> Optional[Session]:
+        """
+        Update a stored Session, appending new_runs to the stored memory runs instead of rewriting them.
+        Falls back to a full upsert if the session is not stored yet.
+
+        Args:
+            session (Session): The session data to persist.
+            new_runs (List[Dict[str, Any]]): The runs to append to the stored memory runs.
+
+        Returns:
+            Optional[Session]: The persisted Session, or None if operation failed.
+        """
+        memory_without_runs = {k: v for k, v in (session.memory or {}).items() if k != "runs"}
+        stored_memory = func.coalesce(self.table.c.memory, cast(literal("{}"), postgresql.JSONB))
+        stored_runs = func.coalesce(self.table.c.memory["runs"], cast(literal("[]"), postgresql.JSONB))
+
+        # Replace every memory key except runs, then append the new runs to the stored runs
+        memory_expr = func.jsonb_set(
+            stored_memory.op("||", return_type=postgresql.JSONB)(
+                bindparam("memory_without_runs", value=memory_without_runs, type_=postgresql.JSONB)
+            ),
+            text("'{runs}'"),
+            stored_runs.op("||", return_type=postgresql.JSONB)(
+                bindparam("new_runs", value=new_runs, type_=postgresql.JSONB)
+            ),
+        )
+
+        columns = {
+            column.name: getattr(session, column.name)
+            for column in self.table.columns
+            if column.name not in ("session_id", "memory", "created_at", "updated_at")
+        }
+        stmt = (
+            self.table.update()
+            .where(self.table.c.session_id == session.session_id)
+            .values(memory=memory_expr, updated_at=int(time.time()), **columns)
+        )
+        try:
+            with self.Session() as sess, sess.begin():
+                result = sess.execute(stmt)
+        except Exception as e:
+            log_debug(f"Exception appending runs, falling back to a full upsert: {e}")
+            return self.upsert(session)
+
+        if result.rowcount == 0:
+            return self.upsert(session)
+        return session
+
+    def _get_async_engine(self) -> Optional[AsyncEngine]:
+        """Returns the async engine for the running event loop, or None if no async driver is installed."""
+        if self.async_db_engine is not None:
+            return self.async_db_engine
+        if not self._async_driver_available:
+            return None
+
+        loop = asyncio.get_running_loop()
+        if self._async_engine is None or self._async_engine_loop is not loop:
+            async_db_url: Any = self.async_db_url
+            if async_db_url is None:
+                async_db_url = self.db_engine.url
+                # psycopg 3 supports asyncio itself, other drivers are swapped for asyncpg
+                if async_db_url.drivername != "postgresql+psycopg":
+                    async_db_url = async_db_url.set(drivername="postgresql+asyncpg")
+            try:
+                self._async_engine = create_async_engine(async_db_url)
+            except ImportError as e:
+                log_warning(f"Async driver not available, running PostgresStorage calls in a thread instead: {e}")
+                self._async_driver_available = False
+                return None
+            self._async_engine_loop = loop
+        return self._async_engine
+
+    async def aread(self, session_id: str, user_id: Optional[str] = None) -> Optional[Session]:
+        """
+        Read a Session from the database without blocking the event loop.
+
+        Args:
+            session_id (str): ID of the session to read.
+            user_id (Optional[str]): User ID to filter by. Defaults to None.
+
+        Returns:
+            Optional[Session]: Session object if found, None otherwise.
+        """
+        engine = self._get_async_engine()
+        if engine is None:
+            return await super().aread(session_id=session_id, user_id=user_id)
+
+        try:
+            async with engine.connect() as conn:
+                stmt = select(self.table).where(self.table.c.session_id == session_id)
+                if user_id:
+                    stmt = stmt.where(self.table.c.user_id == user_id)
+                result = (await conn.execute(stmt)).fetchone()
+                return self._session_from_row(result) if result is not None else None
+        except Exception as e:
+            if "does not exist" in str(e):
+                log_debug(f"Table does not exist: {self.table.name}")
+                log_debug("Creating table for future transactions")
+                await asyncio.to_thread(self.create)
+            else:
+                log_debug(f"Exception reading from table: {e}")
+        return None
+
+    async def aget_all_session_ids(self, user_id: Optional[str] = None, entity_id: Optional[str] = None) -> List[str]:
+        """
+        Get all session IDs without blocking the event loop, optionally filtered by user_id and/or entity_id.
+
+        Args:
+            user_id (Optional[str]): The ID of the user to filter by.
+            entity_id (Optional[str]): The ID of the agent / workflow to filter by.
+
+        Returns:
+            List[str]: List of session IDs matching the criteria.
+        """
+        engine = self._get_async_engine()
+        if engine is None:
+            return await super().aget_all_session_ids(user_id=user_id, entity_id=entity_id)
+
+        try:
+            async with engine.connect() as conn:
+                stmt = self._get_sessions_stmt(select(self.table.c.session_id), user_id=user_id, entity_id=entity_id)
+                rows = (await conn.execute(stmt)).fetchall()
+                return [row[0] for row in rows]
+        except Exception as e:
+            log_debug(f"Exception reading from table: {e}")
+            if "does not exist" in str(e):
+                await asyncio.to_thread(self.create)
+        return []
+
+    async def aget_all_sessions(self, user_id: Optional[str] = None, entity_id: Optional[str] = None) -> List[Session]:
+        """
+        Get all sessions without blocking the event loop, optionally filtered by user_id and/or entity_id.
+
+        Args:
+            user_id (Optional[str]): The ID of the user to filter by.
+            entity_id (Optional[str]): The ID of the agent / workflow to filter by.
+
+        Returns:
+            List[Session]: List of Session objects matching the criteria.
+        """
+        engine = self._get_async_engine()
+        if engine is None:
+            return await super().aget_all_sessions(user_id=user_id, entity_id=entity_id)
+
+        try:
+            async with engine.connect() as conn:
+                stmt = self._get_sessions_stmt(select(self.table), user_id=user_id, entity_id=entity_id)
+                rows = (await conn.execute(stmt)).fetchall()
+                return [self._session_from_row(row) for row in rows]  # type: ignore
+        except Exception as e:
+            log_debug(f"Exception reading from table: {e}")
+            if "does not exist" in str(e):
+                await asyncio.to_thread(self.create)
+        return []
+
+    async def aupsert(self, session: Session, create_and_retry: bool = True) -> Optional[Session]:
+        """
+        Insert or update a Session in the database without blocking the event loop.
+
+        Args:
+            session (Session): The session data to upsert.
+            create_and_retry (bool): Retry upsert if table does not exist.
+
+        Returns:
+            Optional[Session]: The upserted Session, or None if operation failed.
+        """
+        engine = self._get_async_engine()
+        if engine is None:
+            return await super().aupsert(session)
+
+        # Perform schema upgrade if auto_upgrade_schema is enabled
+        if self.auto_upgrade_schema and not self._schema_up_to_date:
+            await asyncio.to_thread(self.upgrade_schema)
+
+        try:
+            async with engine.begin() as conn:
+                await conn.execute(self._get_upsert_stmt(session))
+        except Exception as e:
+            if create_and_retry and not await asyncio.to_thread(self.table_exists):
+                log_debug(f"Table does not exist: {self.table.name}")
+                log_debug("Creating table and retrying upsert")
+                await asyncio.to_thread(self.create)
+                return await self.aupsert(session, create_and_retry=False)
+            else:
+                log_warning(f"Exception upserting into table: {e}")
+                log_warning(
+                    "A table upgrade might be required, please review these docs for more information: https://agno.link/upgrade-schema"
+                )
+                return None
+        return await self.aread(session_id=session.session_id)
+
     def delete_session(self, session_id: Optional[str] = None):
         """
         Delete a session from the database.
@@ -561,7 +752,7 @@ class PostgresStorage(Storage):
             if k in {"metadata", "table", "inspector"}:
                 continue
             # Reuse db_engine and Session without copying
-            elif k in {"db_engine", "SqlSession"}:
+            elif k in {"db_engine", "SqlSession", "async_db_engine", "_async_engine", "_async_engine_loop"}:
                 setattr(copied_obj, k, v)
             else:
                 setattr(copied_obj, k, deepcopy(v, memo))
@@ -1,17 +1,21 @@
+import asyncio
 import json
 import time
 from dataclasses import asdict
-from typing import List, Literal, Optional
+from typing import Any, Dict, Iterable, List, Literal, Optional, Set, Union, cast
 
 from agno.storage.base import Storage
+from agno.storage.codec import SessionCodec, decode_session, is_encoded
 from agno.storage.session import Session
 from agno.storage.session.agent import AgentSession
+from agno.storage.session.listing import SessionListing, paginate_listings
 from agno.storage.session.team import TeamSession
 from agno.storage.session.workflow import WorkflowSession
 from agno.utils.log import log_debug, log_info, logger
 
 try:
     from redis import ConnectionError, Redis
+    from redis.asyncio import Redis as AsyncRedis
 except ImportError:
     raise ImportError("`redis` not installed. Please install it using `pip install redis`")
 
@@ -25,6 +29,8 @@ class RedisStorage(Storage):
         db: int = 0,
         password: Optional[str] = None,
         mode: Optional[Literal["agent", "team", "workflow"]] = "agent",
+        use_index: bool = False,
+        codec: Optional[SessionCodec] = None,
     ):
         """
         Initialize Redis storage for sessions.
@@ -36,9 +42,18 @@ class RedisStorage(Storage):
             db (int): Redis database number
             password (Optional[str]): Redis password if authentication is required
             mode (Optional[Literal["agent", "team", "workflow"]]): Storage mode
+            use_index (bool): Maintain sets of session IDs per user and entity, a sorted set of all sessions and a
+                lightweight listing per session, so sessions can be listed and filtered without reading every
+                session. Existing sessions are indexed on first use.
+            codec (Optional[SessionCodec]): Encode the sessions with this SessionCodec instead of storing JSON strings.
+                Sessions written with any codec or as JSON can always be read, see migrate_sessions.
         """
         super().__init__(mode)
         self.prefix = prefix
+        self.host = host
+        self.port = port
+        self.db = db
+        self.password = password
         self.redis_client = Redis(
             host=host,
             port=port,
@@ -46,12 +61,130 @@ class RedisStorage(Storage):
             password=password,
             decode_responses=True,  # Automatically decode responses to str
         )
+        self.use_index = use_index
+        self.codec = codec
+        # Encoded sessions are binary, so they are read with a client that doesn't decode responses
+        self._binary_redis_client: Optional[Redis] = None
+        # Async client used by the async methods, per event loop as async connections can't be shared across loops
+        self._async_redis_client: Optional[AsyncRedis] = None
+        self._async_redis_client_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._async_binary_redis_client: Optional[AsyncRedis] = None
+        self._async_binary_redis_client_loop: Optional[asyncio.AbstractEventLoop] = None
         log_debug(f"Created RedisStorage with prefix: '{self.prefix}'")
 
     def _get_key(self, session_id: str) -> str:
         """Generate Redis key for a session."""
         return f"{self.prefix}:{session_id}"
 
+    def _get_index_key(self, *parts: str) -> str:
+        """Generate Redis key for the session index, outside of the `{prefix}:*` keyspace of the sessions."""
+        return ":".join([f"{self.prefix}-index", *parts])
+
+    def _get_set_key(self, field: str, value: Optional[str]) -> str:
+        """Generate Redis key for the set of session IDs with the given user_id / entity ID."""
+        # Prefix values so that IDs can never collide with the key used for sessions without an ID
+        return self._get_index_key(field, "none") if value is None else self._get_index_key(field, "v", value)
+
+    @property
+    def entity_field(self) -> str:
+        """The session field holding the ID of the agent, team or workflow."""
+        return f"{self.mode}_id"
+
+    def _index_session(self, pipeline: Any, data: Dict[str, Any]) -> None:
+        """Queue the commands indexing a serialized session on a pipeline."""
+        session_id = data["session_id"]
+        listing = SessionListing.from_session_dict(data)
+        pipeline.set(self._get_index_key("listing", session_id), self.serialize(listing.to_dict()))
+        pipeline.sadd(self._get_set_key("user_id", data.get("user_id")), session_id)
+        pipeline.sadd(self._get_set_key(self.entity_field, data.get(self.entity_field)), session_id)
+        pipeline.zadd(self._get_index_key("sessions"), {session_id: listing.created_at or listing.updated_at or 0})
+
+    def rebuild_index(self) -> None:
+        """Rebuild the session index from the stored sessions."""
+        log_debug(f"Building session index for prefix: '{self.prefix}'")
+        self._drop_index()
+        keys = list(self.redis_client.scan_iter(match=f"{self.prefix}:*"))
+        for i in range(0, len(keys), 100):
+            pipeline = self.redis_client.pipeline(transaction=False)
+            for value in self.session_client.mget(keys[i : i + 100]):
+                if value is not None:
+                    self._index_session(pipeline, self._decode_session(value))  # type: ignore
+            pipeline.execute()
+        self.redis_client.set(self._get_index_key("built"), "1")
+
+    def _ensure_index(self) -> None:
+        if not self.redis_client.exists(self._get_index_key("built")):
+            self.rebuild_index()
+
+    def _drop_index(self) -> None:
+        for key in self.redis_client.scan_iter(match=f"{self.prefix}-index:*"):
+            self.redis_client.delete(key)
+
+    def _get_indexed_listings(
+        self,
+        user_id: Optional[str] = None,
+        entity_id: Optional[str] = None,
+        limit: Optional[int] = None,
+        offset: int = 0,
+    ) -> List[SessionListing]:
+        self._ensure_index()
+
+        filtered = user_id is not None or entity_id is not None
+        if filtered:
+            set_keys = []
+            if user_id is not None:
+                set_keys.append(self._get_set_key("user_id", user_id))
+            if entity_id is not None:
+                set_keys.append(self._get_set_key(self.entity_field, entity_id))
+            session_ids = list(cast(Set[str], self.redis_client.sinter(set_keys)))
+        else:
+            # The sorted set is already ordered newest first, so only the requested page is read
+            end = -1 if limit is None else offset + limit - 1
+            session_ids = cast(List[str], self.redis_client.zrevrange(self._get_index_key("sessions"), offset, end))
+
+        listings: List[SessionListing] = []
+        for i in range(0, len(session_ids), 100):
+            listing_keys = [self._get_index_key("listing", session_id) for session_id in session_ids[i : i + 100]]
+            for value in self.redis_client.mget(listing_keys):
+                if value is None:
+                    continue
+                listing = SessionListing.from_dict(self.deserialize(value))  # type: ignore
+                # Skip stale index entries, e.g. when the user of a session changed
+                if user_id is not None and listing.user_id != user_id:
+                    continue
+                if entity_id is not None and listing.entity_id != entity_id:
+                    continue
+                listings.append(listing)
+
+        if filtered:
+            return paginate_listings(listings, limit=limit, offset=offset)
+        return listings
+
+    def list_sessions(
+        self,
+        user_id: Optional[str] = None,
+        entity_id: Optional[str] = None,
+        limit: Optional[int] = None,
+        offset: int = 0,
+    ) -> List[SessionListing]:
+        """List sessions newest first, optionally filtered by user_id and/or entity_id and paginated."""
+        if not self.use_index:
+            return super().list_sessions(user_id=user_id, entity_id=entity_id, limit=limit, offset=offset)
+        try:
+            return self._get_indexed_listings(user_id=user_id, entity_id=entity_id, limit=limit, offset=offset)
+        except Exception as e:
+            logger.error(f"Error listing sessions: {e}")
+            return []
+
+    def _session_from_dict(self, data: Dict[str, Any]) -> Optional[Session]:
+        if self.mode == "agent":
+            return AgentSession.from_dict(data)
+        elif self.mode == "team":
+            return TeamSession.from_dict(data)
+        elif self.mode == "workflow":
+            return WorkflowSession.from_dict(data)
+        return None
+
     def serialize(self, data: dict) -> str:
         """Serialize data to JSON string."""
         return json.dumps(data, ensure_ascii=False)
@@ -60,6 +193,33 @@ class RedisStorage(Storage):
         """Deserialize JSON string to dict."""
         return json.loads(data)
 
+    @property
+    def session_client(self) -> Redis:
+        """The client used to read sessions, which returns bytes if a codec is used."""
+        if self.codec is None:
+            return self.redis_client
+        if self._binary_redis_client is None:
+            self._binary_redis_client = Redis(
+                host=self.host,
+                port=self.port,
+                db=self.db,
+                password=self.password,
+                decode_responses=False,
+            )
+        return self._binary_redis_client
+
+    def _encode_session(self, data: Dict[str, Any]) -> Union[str, bytes]:
+        if self.codec is not None:
+            return self.codec.encode(data)
+        return self.serialize(data)
+
+    def _decode_session(self, value: Union[str, bytes]) -> Dict[str, Any]:
+        if is_encoded(value):
+            return decode_session(value)
+        if isinstance(value, bytes):
+            value = value.decode("utf-8")
+        return self.deserialize(value)
+
     def create(self) -> None:
         """
         Create storage if it doesn't exist.
@@ -76,11 +236,11 @@ class RedisStorage(Storage):
     def read(self, session_id: str, user_id: Optional[str] = None) -> Optional[Session]:
         """Read a Session from Redis."""
         try:
-            data = self.redis_client.get(self._get_key(session_id))
+            data = self.session_client.get(self._get_key(session_id))
             if data is None:
                 return None
 
-            session_data = self.deserialize(data)  # type: ignore
+            session_data = self._decode_session(data)  # type: ignore
             if user_id and session_data.get("user_id") != user_id:
                 return None
 
@@ -97,12 +257,15 @@ class RedisStorage(Storage):
 
     def get_all_session_ids(self, user_id: Optional[str] = None, entity_id: Optional[str] = None) -> List[str]:
         """Get all session IDs, optionally filtered by user_id and/or entity_id."""
+        if self.use_index:
+            return [listing.session_id for listing in self.list_sessions(user_id=user_id, entity_id=entity_id)]
+
         session_ids = []
         try:
             # Get all keys matching the prefix pattern
             pattern = f"{self.prefix}:*"
             for key in self.redis_client.scan_iter(match=pattern):
-                data = self.deserialize(self.redis_client.get(key))  # type: ignore
+                data = self._decode_session(self.session_client.get(key))  # type: ignore
 
                 if user_id or entity_id:
                     if user_id and entity_id:
@@ -135,10 +298,26 @@ class RedisStorage(Storage):
     def get_all_sessions(self, user_id: Optional[str] = None, entity_id: Optional[str] = None) -> List[Session]:
         """Get all sessions, optionally filtered by user_id and/or entity_id."""
         sessions: List[Session] = []
+        if self.use_index:
+            try:
+                session_ids = self.get_all_session_ids(user_id=user_id, entity_id=entity_id)
+                # Read the matching sessions in batches with MGET
+                for i in range(0, len(session_ids), 100):
+                    keys = [self._get_key(session_id) for session_id in session_ids[i : i + 100]]
+                    for value in self.session_client.mget(keys):
+                        if value is None:
+                            continue
+                        indexed_session = self._session_from_dict(self._decode_session(value))  # type: ignore
+                        if indexed_session:
+                            sessions.append(indexed_session)
+            except Exception as e:
+                logger.error(f"Error getting all sessions: {e}")
+            return sessions
+
         try:
             pattern = f"{self.prefix}:*"
             for key in self.redis_client.scan_iter(match=pattern):
-                data = self.deserialize(self.redis_client.get(key))  # type: ignore
+                data = self._decode_session(self.session_client.get(key))  # type: ignore
 
                 if user_id or entity_id:
                     _session: Optional[Session] = None
@@ -195,7 +374,134 @@ class RedisStorage(Storage):
                 data["created_at"] = data["updated_at"]
 
             key = self._get_key(session.session_id)
-            self.redis_client.set(key, self.serialize(data))
+            if self.use_index:
+                self._ensure_index()
+                pipeline = self.redis_client.pipeline()
+                pipeline.set(key, self._encode_session(data))
+                self._index_session(pipeline, data)
+                pipeline.execute()
+            else:
+                self.redis_client.set(key, self._encode_session(data))
+            return session
+        except Exception as e:
+            logger.error(f"Error upserting session: {e}")
+            return None
+
+    @property
+    def async_redis_client(self) -> AsyncRedis:
+        """The redis.asyncio client for the running event loop."""
+        loop = asyncio.get_running_loop()
+        if self._async_redis_client is None or self._async_redis_client_loop is not loop:
+            self._async_redis_client = AsyncRedis(
+                host=self.host,
+                port=self.port,
+                db=self.db,
+                password=self.password,
+                decode_responses=True,
+            )
+            self._async_redis_client_loop = loop
+        return self._async_redis_client
+
+    @property
+    def async_session_client(self) -> AsyncRedis:
+        """The redis.asyncio client used to read sessions for the running event loop."""
+        if self.codec is None:
+            return self.async_redis_client
+        loop = asyncio.get_running_loop()
+        if self._async_binary_redis_client is None or self._async_binary_redis_client_loop is not loop:
+            self._async_binary_redis_client = AsyncRedis(
+                host=self.host,
+                port=self.port,
+                db=self.db,
+                password=self.password,
+                decode_responses=False,
+            )
+            self._async_binary_redis_client_loop = loop
+        return self._async_binary_redis_client
+
+    def _matches(self, data: Dict[str, Any], user_id: Optional[str] = None, entity_id: Optional[str] = None) -> bool:
+        if user_id is not None and data.get("user_id") != user_id:
+            return False
+        if entity_id is not None and data.get(self.entity_field) != entity_id:
+            return False
+        return True
+
+    async def aread(self, session_id: str, user_id: Optional[str] = None) -> Optional[Session]:
+        """Read a Session from Redis without blocking the event loop."""
+        try:
+            data = await self.async_session_client.get(self._get_key(session_id))
+            if data is None:
+                return None
+
+            session_data = self._decode_session(data)
+            if user_id and session_data.get("user_id") != user_id:
+                return None
+            return self._session_from_dict(session_data)
+        except Exception as e:
+            logger.error(f"Error reading session: {e}")
+            return None
+
+    async def _aget_candidate_keys(self, user_id: Optional[str] = None, entity_id: Optional[str] = None) -> List[str]:
+        """Keys of the sessions that may match the filters, from the index if enabled."""
+        client = self.async_redis_client
+        if not self.use_index:
+            return [key async for key in client.scan_iter(match=f"{self.prefix}:*")]
+
+        if not await client.exists(self._get_index_key("built")):
+            await asyncio.to_thread(self.rebuild_index)
+        set_keys = []
+        if user_id is not None:
+            set_keys.append(self._get_set_key("user_id", user_id))
+        if entity_id is not None:
+            set_keys.append(self._get_set_key(self.entity_field, entity_id))
+        session_ids: Iterable[str]
+        if set_keys:
+            session_ids = cast(Set[str], await client.sinter(set_keys))
+        else:
+            session_ids = cast(List[str], await client.zrevrange(self._get_index_key("sessions"), 0, -1))
+        return [self._get_key(session_id) for session_id in session_ids]
+
+    async def aget_all_sessions(self, user_id: Optional[str] = None, entity_id: Optional[str] = None) -> List[Session]:
+        """Get all sessions without blocking the event loop, optionally filtered by user_id and/or entity_id."""
+        sessions: List[Session] = []
+        try:
+            client = self.async_session_client
+            keys = await self._aget_candidate_keys(user_id=user_id, entity_id=entity_id)
+            # Read the sessions in batches with MGET
+            for i in range(0, len(keys), 100):
+                for value in await client.mget(keys[i : i + 100]):
+                    if value is None:
+                        continue
+                    data = self._decode_session(value)
+                    if not self._matches(data, user_id=user_id, entity_id=entity_id):
+                        continue
+                    _session = self._session_from_dict(data)
+                    if _session:
+                        sessions.append(_session)
+        except Exception as e:
+            logger.error(f"Error getting all sessions: {e}")
+        sessions.sort(key=lambda x: x.created_at or 0, reverse=True)
+        return sessions
+
+    async def aupsert(self, session: Session) -> Optional[Session]:
+        """Insert or update a Session in Redis without blocking the event loop."""
+        try:
+            data = asdict(session)
+            data["updated_at"] = int(time.time())
+            if "created_at" not in data:
+                data["created_at"] = data["updated_at"]
+
+            client = self.async_redis_client
+            key = self._get_key(session.session_id)
+            if self.use_index:
+                if not await client.exists(self._get_index_key("built")):
+                    await asyncio.to_thread(self.rebuild_index)
+                async with client.pipeline() as pipeline:
+                    pipeline.set(key, self._encode_session(data))
+                    self._index_session(pipeline, data)
+                    await pipeline.execute()
+            else:
+                await client.set(key, self._encode_session(data))
             return session
         except Exception as e:
             logger.error(f"Error upserting session: {e}")
@@ -207,7 +513,20 @@ class RedisStorage(Storage):
             return
         try:
             key = self._get_key(session_id)
-            self.redis_client.delete(key)
+            if self.use_index:
+                listing_key = self._get_index_key("listing", session_id)
+                listing_data = self.redis_client.get(listing_key)
+                pipeline = self.redis_client.pipeline()
+                pipeline.delete(key)
+                pipeline.delete(listing_key)
+                pipeline.zrem(self._get_index_key("sessions"), session_id)
+                if listing_data is not None:
+                    listing = SessionListing.from_dict(self.deserialize(listing_data))  # type: ignore
+                    pipeline.srem(self._get_set_key("user_id", listing.user_id), session_id)
+                    pipeline.srem(self._get_set_key(self.entity_field, listing.entity_id), session_id)
+                pipeline.execute()
+            else:
+                self.redis_client.delete(key)
             log_debug(f"Deleted session: {session_id}")
         except Exception as e:
             logger.error(f"Error deleting session: {e}")
@@ -218,6 +537,8 @@ class RedisStorage(Storage):
             pattern = f"{self.prefix}:*"
             for key in self.redis_client.scan_iter(match=pattern):
                 self.redis_client.delete(key)
+            if self.use_index:
+                self._drop_index()
             log_info(f"Dropped all sessions with prefix: {self.prefix}")
         except Exception as e:
             logger.error(f"Error dropping sessions: {e}")
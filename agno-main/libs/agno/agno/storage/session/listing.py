@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+from dataclasses import asdict, dataclass
+from typing import Any, Dict, List, Mapping, Optional
+
+
+@dataclass
+class SessionListing:
+    """Lightweight description of a stored session, used to list sessions without loading their memory"""
+
+    # Session UUID
+    session_id: str
+    # ID of the user interacting with the agent, team or workflow
+    user_id: Optional[str] = None
+    # ID of the agent, team or workflow that this session is associated with
+    entity_id: Optional[str] = None
+    # Name of the session, if it was named
+    session_name: Optional[str] = None
+    # Session name, or the first user message of the session
+    title: Optional[str] = None
+    # The unix timestamp when this session was created
+    created_at: Optional[int] = None
+    # The unix timestamp when this session was last updated
+    updated_at: Optional[int] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> SessionListing:
+        return cls(
+            session_id=data["session_id"],
+            user_id=data.get("user_id"),
+            entity_id=data.get("entity_id"),
+            session_name=data.get("session_name"),
+            title=data.get("title"),
+            created_at=data.get("created_at"),
+            updated_at=data.get("updated_at"),
+        )
+
+    @classmethod
+    def from_session_dict(cls, data: Mapping[str, Any]) -> SessionListing:
+        """Build a SessionListing from a serialized AgentSession, TeamSession or WorkflowSession"""
+        session_data = data.get("session_data") or {}
+        session_name = session_data.get("session_name")
+        return cls(
+            session_id=data["session_id"],
+            user_id=data.get("user_id"),
+            entity_id=data.get("agent_id") or data.get("team_id") or data.get("workflow_id"),
+            session_name=session_name,
+            title=session_name or get_title_from_memory(data.get("memory")),
+            created_at=data.get("created_at"),
+            updated_at=data.get("updated_at"),
+        )
+
+
+def _get_text(content: Any) -> Optional[str]:
+    if isinstance(content, str):
+        return content or None
+    if isinstance(content, list):
+        # Multimodal content is a list of parts
+        texts = [part.get("text") for part in content if isinstance(part, dict) and part.get("type") == "text"]
+        return " ".join(t for t in texts if t) or None
+    return None
+
+
+def get_title_from_memory(memory: Optional[Mapping[str, Any]]) -> Optional[str]:
+    """Returns the first user message of the stored runs, or the first line of the first workflow response"""
+    if not memory:
+        return None
+    runs: List[Dict[str, Any]] = memory.get("runs") or []
+    for run in runs:
+        if not isinstance(run, dict):
+            continue
+        # AgentMemory stores the user message on the AgentRun, Memory stores the messages on the RunResponse
+        messages = [run["message"]] if run.get("message") else run.get("messages") or []
+        for message in messages:
+            if isinstance(message, dict) and message.get("role") == "user" and not message.get("from_history"):
+                text = _get_text(message.get("content"))
+                if text:
+                    return text
+        response = run.get("response")
+        if "input" in run and isinstance(response, dict):
+            # WorkflowRuns are titled by their response
+            text = _get_text(response.get("content"))
+            if text:
+                return text.split("\n")[0]
+    return None
+
+
+def paginate_listings(
+    listings: List[SessionListing], limit: Optional[int] = None, offset: int = 0
+) -> List[SessionListing]:
+    """Sort listings newest first and return the requested page"""
+    listings = sorted(listings, key=lambda x: x.created_at or 0, reverse=True)
+    if limit is None:
+        return listings[offset:]
+    return listings[offset : offset + limit]
@@ -1,23 +1,27 @@
+import asyncio
+import json
 import time
 from pathlib import Path
-from typing import List, Literal, Optional
+from typing import Any, Callable, Dict, List, Literal, Optional, cast
 
 from agno.storage.base import Storage
 from agno.storage.session import Session
 from agno.storage.session.agent import AgentSession
+from agno.storage.session.listing import SessionListing
 from agno.storage.session.team import TeamSession
 from agno.storage.session.workflow import WorkflowSession
 from agno.utils.log import log_debug, log_info, log_warning, logger
 
 try:
     from sqlalchemy.dialects import sqlite
-    from sqlalchemy.engine import Engine, create_engine
+    from sqlalchemy.engine import CursorResult, Engine, create_engine
+    from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
     from sqlalchemy.inspection import inspect
     from sqlalchemy.orm import Session as SqlSession
     from sqlalchemy.orm import sessionmaker
     from sqlalchemy.schema import Column, MetaData, Table
     from sqlalchemy.sql import text
-    from sqlalchemy.sql.expression import select
+    from sqlalchemy.sql.expression import func, literal, select
     from sqlalchemy.types import String
 except ImportError:
     raise ImportError("`sqlalchemy` not installed. Please install it using `pip install sqlalchemy`")
@@ -33,6 +37,8 @@ class SqliteStorage(Storage):
         schema_version: int = 1,
         auto_upgrade_schema: bool = False,
         mode: Optional[Literal["agent", "team", "workflow"]] = "agent",
+        async_db_url: Optional[str] = None,
+        async_db_engine: Optional[AsyncEngine] = None,
     ):
         """
         This class provides agent storage using a sqlite database.
@@ -48,6 +54,9 @@ class SqliteStorage(Storage):
             db_url: The database URL to connect to.
             db_file: The database file to connect to.
             db_engine: The SQLAlchemy database engine to use.
+            async_db_url: The database URL used by the async methods (aread, aupsert, ...).
+                Defaults to the URL of the sync engine with the aiosqlite driver.
+            async_db_engine: The SQLAlchemy async engine used by the async methods.
         """
         super().__init__(mode)
         _engine: Optional[Engine] = db_engine
@@ -69,6 +78,8 @@ class SqliteStorage(Storage):
         self.table_name: str = table_name
         self.db_url: Optional[str] = db_url
         self.db_engine: Engine = _engine
+        self.async_db_url: Optional[str] = async_db_url
+        self.async_db_engine: Optional[AsyncEngine] = async_db_engine
         self.metadata: MetaData = MetaData()
         self.inspector = inspect(self.db_engine)
 
@@ -80,6 +91,10 @@ class SqliteStorage(Storage):
 
         # Database session
         self.SqlSession: sessionmaker[SqlSession] = sessionmaker(bind=self.db_engine)
+        # Async engine created from the db_url, per event loop as async connections can't be shared across loops
+        self._async_engine: Optional[AsyncEngine] = None
+        self._async_engine_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._async_driver_available: bool = True
         # Database table for storage
         self.table: Table = self.get_table()
 
@@ -218,6 +233,29 @@ class SqliteStorage(Storage):
                 logger.error(f"Error creating table: {e}")
                 raise
 
+    def _session_from_row(self, row: Any) -> Optional[Session]:
+        if self.mode == "agent":
+            return AgentSession.from_dict(row._mapping)  # type: ignore
+        elif self.mode == "team":
+            return TeamSession.from_dict(row._mapping)  # type: ignore
+        elif self.mode == "workflow":
+            return WorkflowSession.from_dict(row._mapping)  # type: ignore
+        return None
+
+    def _get_sessions_stmt(self, stmt: Any, user_id: Optional[str] = None, entity_id: Optional[str] = None) -> Any:
+        """Filter a select statement by user_id and/or entity_id, newest sessions first"""
+        if user_id is not None:
+            stmt = stmt.where(self.table.c.user_id == user_id)
+        if entity_id is not None:
+            if self.mode == "agent":
+                stmt = stmt.where(self.table.c.agent_id == entity_id)
+            elif self.mode == "team":
+                stmt = stmt.where(self.table.c.team_id == entity_id)
+            elif self.mode == "workflow":
+                stmt = stmt.where(self.table.c.workflow_id == entity_id)
+        # order by created_at desc
+        return stmt.order_by(self.table.c.created_at.desc())
+
     def read(self, session_id: str, user_id: Optional[str] = None) -> Optional[Session]:
         """
         Read a Session from the database.
@@ -235,12 +273,7 @@ class SqliteStorage(Storage):
                 if user_id:
                     stmt = stmt.where(self.table.c.user_id == user_id)
                 result = sess.execute(stmt).fetchone()
-                if self.mode == "agent":
-                    return AgentSession.from_dict(result._mapping) if result is not None else None  # type: ignore
-                elif self.mode == "team":
-                    return TeamSession.from_dict(result._mapping) if result is not None else None  # type: ignore
-                elif self.mode == "workflow":
-                    return WorkflowSession.from_dict(result._mapping) if result is not None else None  # type: ignore
+                return self._session_from_row(result) if result is not None else None
         except Exception as e:
             if "no such table" in str(e):
                 log_debug(f"Table does not exist: {self.table.name}")
@@ -263,19 +296,7 @@ class SqliteStorage(Storage):
         try:
             with self.SqlSession() as sess, sess.begin():
                 # get all session_ids
-                stmt = select(self.table.c.session_id)
-                if user_id is not None:
-                    stmt = stmt.where(self.table.c.user_id == user_id)
-                if entity_id is not None:
-                    if self.mode == "agent":
-                        stmt = stmt.where(self.table.c.agent_id == entity_id)
-                    elif self.mode == "team":
-                        stmt = stmt.where(self.table.c.team_id == entity_id)
-                    elif self.mode == "workflow":
-                        stmt = stmt.where(self.table.c.workflow_id == entity_id)
-                # order by created_at desc
-                stmt = stmt.order_by(self.table.c.created_at.desc())
-                # execute query
+                stmt = self._get_sessions_stmt(select(self.table.c.session_id), user_id=user_id, entity_id=entity_id)
                 rows = sess.execute(stmt).fetchall()
                 return [row[0] for row in rows] if rows is not None else []
         except Exception as e:
@@ -300,29 +321,9 @@ class SqliteStorage(Storage):
         try:
             with self.SqlSession() as sess, sess.begin():
                 # get all sessions
-                stmt = select(self.table)
-                if user_id is not None:
-                    stmt = stmt.where(self.table.c.user_id == user_id)
-                if entity_id is not None:
-                    if self.mode == "agent":
-                        stmt = stmt.where(self.table.c.agent_id == entity_id)
-                    elif self.mode == "team":
-                        stmt = stmt.where(self.table.c.team_id == entity_id)
-                    elif self.mode == "workflow":
-                        stmt = stmt.where(self.table.c.workflow_id == entity_id)
-                # order by created_at desc
-                stmt = stmt.order_by(self.table.c.created_at.desc())
-                # execute query
+                stmt = self._get_sessions_stmt(select(self.table), user_id=user_id, entity_id=entity_id)
                 rows = sess.execute(stmt).fetchall()
-                if rows is not None:
-                    if self.mode == "agent":
-                        return [AgentSession.from_dict(row._mapping) for row in rows]  # type: ignore
-                    elif self.mode == "team":
-                        return [TeamSession.from_dict(row._mapping) for row in rows]  # type: ignore
-                    elif self.mode == "workflow":
-                        return [WorkflowSession.from_dict(row._mapping) for row in rows]  # type: ignore
-                else:
-                    return []
+                return [self._session_from_row(row) for row in rows] if rows is not None else []  # type: ignore
         except Exception as e:
             if "no such table" in str(e):
                 log_debug(f"Table does not exist: {self.table.name}")
@@ -359,6 +360,92 @@ class SqliteStorage(Storage):
             logger.error(f"Error during schema upgrade: {e}")
             raise
 
+    def _get_upsert_stmt(self, session: Session) -> Any:
+        """Build the insert statement that upserts a session"""
+        if self.mode == "agent":
+            # Create an insert statement
+            stmt = sqlite.insert(self.table).values(
+                session_id=session.session_id,
+                agent_id=session.agent_id,  # type: ignore
+                team_session_id=session.team_session_id,  # type: ignore
+                user_id=session.user_id,
+                memory=session.memory,
+                agent_data=session.agent_data,  # type: ignore
+                session_data=session.session_data,
+                extra_data=session.extra_data,
+            )
+
+            # Define the upsert if the session_id already exists
+            # See: https://docs.sqlalchemy.org/en/20/dialects/sqlite.html#insert-on-conflict-upsert
+            stmt = stmt.on_conflict_do_update(
+                index_elements=["session_id"],
+                set_=dict(
+                    agent_id=session.agent_id,  # type: ignore
+                    team_session_id=session.team_session_id,  # type: ignore
+                    user_id=session.user_id,
+                    memory=session.memory,
+                    agent_data=session.agent_data,  # type: ignore
+                    session_data=session.session_data,
+                    extra_data=session.extra_data,
+                    updated_at=int(time.time()),
+                ),  # The updated value for each column
+            )
+        elif self.mode == "team":
+            # Create an insert statement
+            stmt = sqlite.insert(self.table).values(
+                session_id=session.session_id,
+                team_id=session.team_id,  # type: ignore
+                user_id=session.user_id,
+                team_session_id=session.team_session_id,  # type: ignore
+                memory=session.memory,
+                team_data=session.team_data,  # type: ignore
+                session_data=session.session_data,
+                extra_data=session.extra_data,
+            )
+
+            # Define the upsert if the session_id already exists
+            # See: https://docs.sqlalchemy.org/en/20/dialects/sqlite.html#insert-on-conflict-upsert
+            stmt = stmt.on_conflict_do_update(
+                index_elements=["session_id"],
+                set_=dict(
+                    team_id=session.team_id,  # type: ignore
+                    user_id=session.user_id,
+                    team_session_id=session.team_session_id,  # type: ignore
+                    memory=session.memory,
+                    team_data=session.team_data,  # type: ignore
+                    session_data=session.session_data,
+                    extra_data=session.extra_data,
+                    updated_at=int(time.time()),
+                ),  # The updated value for each column
+            )
+        elif self.mode == "workflow":
+            # Create an insert statement
+            stmt = sqlite.insert(self.table).values(
+                session_id=session.session_id,
+                workflow_id=session.workflow_id,  # type: ignore
+                user_id=session.user_id,
+                memory=session.memory,
+                workflow_data=session.workflow_data,  # type: ignore
+                session_data=session.session_data,
+                extra_data=session.extra_data,
+            )
+
+            # Define the upsert if the session_id already exists
+            # See: https://docs.sqlalchemy.org/en/20/dialects/sqlite.html#insert-on-conflict-upsert
+            stmt = stmt.on_conflict_do_update(
+                index_elements=["session_id"],
+                set_=dict(
+                    workflow_id=session.workflow_id,  # type: ignore
+                    user_id=session.user_id,
+                    memory=session.memory,
+                    workflow_data=session.workflow_data,  # type: ignore
+                    session_data=session.session_data,
+                    extra_data=session.extra_data,
+                    updated_at=int(time.time()),
+                ),  # The updated value for each column
+            )
+        return stmt
+
     def upsert(self, session: Session, create_and_retry: bool = True) -> Optional[Session]:
         """
         Insert or update a Session in the database.
@@ -376,90 +463,7 @@ class SqliteStorage(Storage):
 
         try:
             with self.SqlSession() as sess, sess.begin():
-                if self.mode == "agent":
-                    # Create an insert statement
-                    stmt = sqlite.insert(self.table).values(
-                        session_id=session.session_id,
-                        agent_id=session.agent_id,  # type: ignore
-                        team_session_id=session.team_session_id,  # type: ignore
-                        user_id=session.user_id,
-                        memory=session.memory,
-                        agent_data=session.agent_data,  # type: ignore
-                        session_data=session.session_data,
-                        extra_data=session.extra_data,
-                    )
-
-                    # Define the upsert if the session_id already exists
-                    # See: https://docs.sqlalchemy.org/en/20/dialects/sqlite.html#insert-on-conflict-upsert
-                    stmt = stmt.on_conflict_do_update(
-                        index_elements=["session_id"],
-                        set_=dict(
-                            agent_id=session.agent_id,  # type: ignore
-                            team_session_id=session.team_session_id,  # type: ignore
-                            user_id=session.user_id,
-                            memory=session.memory,
-                            agent_data=session.agent_data,  # type: ignore
-                            session_data=session.session_data,
-                            extra_data=session.extra_data,
-                            updated_at=int(time.time()),
-                        ),  # The updated value for each column
-                    )
-                elif self.mode == "team":
-                    # Create an insert statement
-                    stmt = sqlite.insert(self.table).values(
-                        session_id=session.session_id,
-                        team_id=session.team_id,  # type: ignore
-                        user_id=session.user_id,
-                        team_session_id=session.team_session_id,  # type: ignore
-                        memory=session.memory,
-                        team_data=session.team_data,  # type: ignore
-                        session_data=session.session_data,
-                        extra_data=session.extra_data,
-                    )
-
-                    # Define the upsert if the session_id already exists
-                    # See: https://docs.sqlalchemy.org/en/20/dialects/sqlite.html#insert-on-conflict-upsert
-                    stmt = stmt.on_conflict_do_update(
-                        index_elements=["session_id"],
-                        set_=dict(
-                            team_id=session.team_id,  # type: ignore
-                            user_id=session.user_id,
-                            team_session_id=session.team_session_id,  # type: ignore
-                            memory=session.memory,
-                            team_data=session.team_data,  # type: ignore
-                            session_data=session.session_data,
-                            extra_data=session.extra_data,
-                            updated_at=int(time.time()),
-                        ),  # The updated value for each column
-                    )
-                elif self.mode == "workflow":
-                    # Create an insert statement
-                    stmt = sqlite.insert(self.table).values(
-                        session_id=session.session_id,
-                        workflow_id=session.workflow_id,  # type: ignore
-                        user_id=session.user_id,
-                        memory=session.memory,
-                        workflow_data=session.workflow_data,  # type: ignore
-                        session_data=session.session_data,
-                        extra_data=session.extra_data,
-                    )
-
-                    # Define the upsert if the session_id already exists
-                    # See: https://docs.sqlalchemy.org/en/20/dialects/sqlite.html#insert-on-conflict-upsert
-                    stmt = stmt.on_conflict_do_update(
-                        index_elements=["session_id"],
-                        set_=dict(
-                            workflow_id=session.workflow_id,  # type: ignore
-                            user_id=session.user_id,
-                            memory=session.memory,
-                            workflow_data=session.workflow_data,  # type: ignore
-                            session_data=session.session_data,
-                            extra_data=session.extra_data,
-                            updated_at=int(time.time()),
-                        ),  # The updated value for each column
-                    )
-
-                sess.execute(stmt)
+                sess.execute(self._get_upsert_stmt(session))
         except Exception as e:
             if create_and_retry and not self.table_exists():
                 log_debug(f"Table does not exist: {self.table.name}")
@@ -474,6 +478,220 @@ class SqliteStorage(Storage):
                 return None
         return self.read(session_id=session.session_id)
 
+    def upsert_runs(self, session: Session, new_runs: List[Dict[str, Any]]) -> Optional[Session]:
+        """
+        Update a stored Session, appending new_runs to the stored memory runs instead of rewriting them.
+        Falls back to a full upsert if the session is not stored yet.
+
+        Args:
+            session (Session): The session data to persist.
+            new_runs (List[Dict[str, Any]]): The runs to append to the stored memory runs.
+
+        Returns:
+            Optional[Session]: The persisted Session, or None if operation failed.
+        """
+        memory = session.memory or {}
+        stored_memory = func.coalesce(self.table.c.memory, literal("{}", String))
+
+        # Make sure the runs array exists and replace every other memory key
+        set_args: List[Any] = ["$.runs", func.json(func.coalesce(func.json_extract(stored_memory, "$.runs"), "[]"))]
+        for key, value in memory.items():
+            if key != "runs":
+                set_args.extend([f'$."{key}"', func.json(json.dumps(value))])
+        memory_expr = func.json_set(stored_memory, *set_args)
+
+        # Append the new runs, in chunks to stay below the SQLite function argument limit
+        for i in range(0, len(new_runs), 50):
+            insert_args: List[Any] = []
+            for run in new_runs[i : i + 50]:
+                insert_args.extend(["$.runs[#]", func.json(json.dumps(run))])
+            memory_expr = func.json_insert(memory_expr, *insert_args)
+
+        columns = {
+            column.name: getattr(session, column.name)
+            for column in self.table.columns
+            if column.name not in ("session_id", "memory", "created_at", "updated_at")
+        }
+        stmt = (
+            self.table.update()
+            .where(self.table.c.session_id == session.session_id)
+            .values(memory=memory_expr, updated_at=int(time.time()), **columns)
+        )
+        try:
+            with self.SqlSession() as sess, sess.begin():
+                result = cast(CursorResult, sess.execute(stmt))
+        except Exception as e:
+            log_debug(f"Exception appending runs, falling back to a full upsert: {e}")
+            return self.upsert(session)
+
+        if result.rowcount == 0:
+            return self.upsert(session)
+        return session
+
+    @property
+    def in_memory(self) -> bool:
+        """Whether the sync engine uses an in-memory database."""
+        return self.db_engine.url.database in (None, "", ":memory:")
+
+    async def _run_sync(self, fn: Callable[..., Any], *args: Any) -> Any:
+        # In-memory databases are only visible to the connection of the thread that created them,
+        # so they are queried from the calling thread instead of a worker thread
+        if self.in_memory:
+            return fn(*args)
+        return await asyncio.to_thread(fn, *args)
+
+    def _get_async_engine(self) -> Optional[AsyncEngine]:
+        """Returns the async engine for the running event loop, or None if the async methods use the sync engine."""
+        if self.async_db_engine is not None:
+            return self.async_db_engine
+        if not self._async_driver_available or (self.async_db_url is None and self.in_memory):
+            return None
+
+        loop = asyncio.get_running_loop()
+        if self._async_engine is None or self._async_engine_loop is not loop:
+            async_db_url: Any = self.async_db_url or self.db_engine.url.set(drivername="sqlite+aiosqlite")
+            try:
+                self._async_engine = create_async_engine(async_db_url)
+            except ImportError as e:
+                log_warning(f"Async driver not available, running SqliteStorage calls in a thread instead: {e}")
+                self._async_driver_available = False
+                return None
+            self._async_engine_loop = loop
+        return self._async_engine
+
+    async def aread(self, session_id: str, user_id: Optional[str] = None) -> Optional[Session]:
+        """
+        Read a Session from the database without blocking the event loop.
+
+        Args:
+            session_id (str): ID of the session to read.
+            user_id (Optional[str]): User ID to filter by. Defaults to None.
+
+        Returns:
+            Optional[Session]: Session object if found, None otherwise.
+        """
+        engine = self._get_async_engine()
+        if engine is None:
+            return await self._run_sync(self.read, session_id, user_id)
+
+        try:
+            async with engine.connect() as conn:
+                stmt = select(self.table).where(self.table.c.session_id == session_id)
+                if user_id:
+                    stmt = stmt.where(self.table.c.user_id == user_id)
+                result = (await conn.execute(stmt)).fetchone()
+                return self._session_from_row(result) if result is not None else None
+        except Exception as e:
+            if "no such table" in str(e):
+                log_debug(f"Table does not exist: {self.table.name}")
+                await self._run_sync(self.create)
+            else:
+                log_debug(f"Exception reading from table: {e}")
+        return None
+
+    async def aget_all_session_ids(self, user_id: Optional[str] = None, entity_id: Optional[str] = None) -> List[str]:
+        """
+        Get all session IDs without blocking the event loop, optionally filtered by user_id and/or entity_id.
+
+        Args:
+            user_id (Optional[str]): The ID of the user to filter by.
+            entity_id (Optional[str]): The ID of the agent / workflow to filter by.
+
+        Returns:
+            List[str]: List of session IDs matching the criteria.
+        """
+        engine = self._get_async_engine()
+        if engine is None:
+            return await self._run_sync(self.get_all_session_ids, user_id, entity_id)
+
+        try:
+            async with engine.connect() as conn:
+                stmt = self._get_sessions_stmt(select(self.table.c.session_id), user_id=user_id, entity_id=entity_id)
+                rows = (await conn.execute(stmt)).fetchall()
+                return [row[0] for row in rows]
+        except Exception as e:
+            if "no such table" in str(e):
+                log_debug(f"Table does not exist: {self.table.name}")
+                await self._run_sync(self.create)
+            else:
+                log_debug(f"Exception reading from table: {e}")
+        return []
+
+    async def aget_all_sessions(self, user_id: Optional[str] = None, entity_id: Optional[str] = None) -> List[Session]:
+        """
+        Get all sessions without blocking the event loop, optionally filtered by user_id and/or entity_id.
+
+        Args:
+            user_id (Optional[str]): The ID of the user to filter by.
+            entity_id (Optional[str]): The ID of the agent / workflow to filter by.
+
+        Returns:
+            List[Session]: List of Session objects matching the criteria.
+        """
+        engine = self._get_async_engine()
+        if engine is None:
+            return await self._run_sync(self.get_all_sessions, user_id, entity_id)
+
+        try:
+            async with engine.connect() as conn:
+                stmt = self._get_sessions_stmt(select(self.table), user_id=user_id, entity_id=entity_id)
+                rows = (await conn.execute(stmt)).fetchall()
+                return [self._session_from_row(row) for row in rows]  # type: ignore
+        except Exception as e:
+            if "no such table" in str(e):
+                log_debug(f"Table does not exist: {self.table.name}")
+                await self._run_sync(self.create)
+            else:
+                log_debug(f"Exception reading from table: {e}")
+        return []
+
+    async def alist_sessions(
+        self,
+        user_id: Optional[str] = None,
+        entity_id: Optional[str] = None,
+        limit: Optional[int] = None,
+        offset: int = 0,
+    ) -> List[SessionListing]:
+        if self._get_async_engine() is None:
+            return await self._run_sync(self.list_sessions, user_id, entity_id, limit, offset)
+        return await super().alist_sessions(user_id=user_id, entity_id=entity_id, limit=limit, offset=offset)
+
+    async def aupsert(self, session: Session, create_and_retry: bool = True) -> Optional[Session]:
+        """
+        Insert or update a Session in the database without blocking the event loop.
+
+        Args:
+            session (Session): The session data to upsert.
+            create_and_retry (bool): Retry upsert if table does not exist.
+
+        Returns:
+            Optional[Session]: The upserted Session, or None if operation failed.
+        """
+        engine = self._get_async_engine()
+        if engine is None:
+            return await self._run_sync(self.upsert, session)
+
+        # Perform schema upgrade if auto_upgrade_schema is enabled
+        if self.auto_upgrade_schema and not self._schema_up_to_date:
+            await self._run_sync(self.upgrade_schema)
+
+        try:
+            async with engine.begin() as conn:
+                await conn.execute(self._get_upsert_stmt(session))
+        except Exception as e:
+            if create_and_retry and not await self._run_sync(self.table_exists):
+                log_debug(f"Table does not exist: {self.table.name}")
+                log_debug("Creating table and retrying upsert")
+                await self._run_sync(self.create)
+                return await self.aupsert(session, create_and_retry=False)
+            else:
+                log_warning(f"Exception upserting into table: {e}")
+                log_warning(
+                    "A table upgrade might be required, please review these docs for more information: https://agno.link/upgrade-schema"
+                )
+                return None
+        return await self.aread(session_id=session.session_id)
+
     def delete_session(self, session_id: Optional[str] = None):
         """
         Delete a workflow session from the database.
@@ -492,7 +710,7 @@ class SqliteStorage(Storage):
             with self.SqlSession() as sess, sess.begin():
                 # Delete the session with the given session_id
                 delete_stmt = self.table.delete().where(self.table.c.session_id == session_id)
-                result = sess.execute(delete_stmt)
+                result = cast(CursorResult, sess.execute(delete_stmt))
                 if result.rowcount == 0:
                     log_debug(f"No session found with session_id: {session_id}")
                 else:
@@ -534,7 +752,7 @@ class SqliteStorage(Storage):
             if k in {"metadata", "table", "inspector"}:
                 continue
             # Reuse db_engine and Session without copying
-            elif k in {"db_engine", "SqlSession"}:
+            elif k in {"db_engine", "SqlSession", "async_db_engine", "_async_engine", "_async_engine_loop"}:
                 setattr(copied_obj, k, v)
             else:
                 setattr(copied_obj, k, deepcopy(v, memo))
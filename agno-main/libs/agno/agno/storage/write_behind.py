@@ -0,0 +1,293 @@
+import asyncio
+import atexit
+import json
+from hashlib import sha256
+from threading import Event, Lock, RLock, Thread
+from typing import Any, Dict, List, Literal, Optional, Tuple
+
+from agno.storage.base import Storage
+from agno.storage.session import Session, SessionListing
+from agno.utils.log import log_debug, logger
+
+
+class WriteBehindStorage(Storage):
+    def __init__(
+        self,
+        storage: Storage,
+        durability: Literal["write_through", "batched"] = "batched",
+        flush_interval: Optional[float] = 1.0,
+        max_pending_sessions: int = 100,
+        flush_on_exit: bool = True,
+    ):
+        """
+        Wraps a Storage (e.g. PostgresStorage, SqliteStorage, RedisStorage or JsonStorage) with a write-behind
+        buffer that coalesces upserts of the same session and only persists appended runs where the wrapped
+        storage supports it (see Storage.upsert_runs).
+
+        Args:
+            storage (Storage): The storage to persist sessions to.
+            durability (Literal["write_through", "batched"]): "write_through" persists every upsert before
+                returning. "batched" keeps the latest version of each session in memory and persists it on the
+                next flush, so up to flush_interval seconds of writes can be lost if the process crashes.
+            flush_interval (Optional[float]): Seconds between background flushes in "batched" mode.
+                If None, sessions are only flushed when max_pending_sessions is reached, on flush() or close().
+            max_pending_sessions (int): Flush as soon as this many sessions are pending.
+            flush_on_exit (bool): Flush pending sessions when the interpreter exits.
+        """
+        super().__init__(storage.mode)
+        self.storage: Storage = storage
+        self.durability: Literal["write_through", "batched"] = durability
+        self.flush_interval: Optional[float] = flush_interval
+        self.max_pending_sessions: int = max_pending_sessions
+
+        # Latest version of each session that is not persisted yet
+        self._pending: Dict[str, Session] = {}
+        # Sessions being persisted by a flush, read until they are persisted
+        self._flushing: Dict[str, Session] = {}
+        # Number of runs known to be persisted for each session and the hash of those runs,
+        # used to only write the appended runs
+        self._persisted_runs: Dict[str, Tuple[int, str]] = {}
+        # Number of sessions persisted, to detect reads racing with writes
+        self._num_writes = 0
+        # Guards the buffers, it is never held while writing to the wrapped storage
+        self._lock = RLock()
+        # Orders the writes to the wrapped storage
+        self._write_lock = Lock()
+
+        self._closed = Event()
+        self._flush_thread: Optional[Thread] = None
+        if self.durability == "batched" and self.flush_interval is not None:
+            self._flush_thread = Thread(target=self._flush_periodically, name="agno-write-behind", daemon=True)
+            self._flush_thread.start()
+
+        self._flush_on_exit = flush_on_exit
+        if flush_on_exit:
+            atexit.register(self.close)
+        log_debug(f"Created WriteBehindStorage for {type(storage).__name__} with durability '{durability}'")
+
+    @property
+    def mode(self) -> Literal["agent", "team", "workflow"]:
+        """Get the mode of the wrapped storage."""
+        return self.storage.mode
+
+    @mode.setter
+    def mode(self, value: Optional[Literal["agent", "team", "workflow"]]) -> None:
+        """Set the mode of the wrapped storage, flushing sessions pending for the previous mode first."""
+        if value != self.storage.mode:
+            self.flush()
+        self.storage.mode = value
+
+    @property
+    def pending_session_ids(self) -> List[str]:
+        """IDs of the sessions that are not persisted yet."""
+        with self._lock:
+            return list(self._pending.keys())
+
+    def _flush_periodically(self) -> None:
+        while not self._closed.wait(self.flush_interval):
+            try:
+                self.flush()
+            except Exception as e:
+                logger.error(f"Error flushing sessions: {e}")
+
+    @staticmethod
+    def _get_runs(session: Session) -> Optional[List[Dict[str, Any]]]:
+        if session.memory is None:
+            return None
+        runs = session.memory.get("runs")
+        return runs if isinstance(runs, list) else None
+
+    @staticmethod
+    def _get_runs_hash(runs: List[Dict[str, Any]]) -> str:
+        return sha256(json.dumps(runs, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+
+    def _track_persisted(self, session: Optional[Session]) -> None:
+        if session is None:
+            return
+        runs = self._get_runs(session)
+        if runs is None:
+            self._persisted_runs.pop(session.session_id, None)
+        else:
+            self._persisted_runs[session.session_id] = (len(runs), self._get_runs_hash(runs))
+
+    def _get_new_runs(self, session: Session) -> Optional[List[Dict[str, Any]]]:
+        """
+        Returns the runs appended since the session was last persisted, or None if they are unknown or any of the
+        persisted runs changed since.
+        """
+        runs = self._get_runs(session)
+        with self._lock:
+            persisted = self._persisted_runs.get(session.session_id)
+        if runs is None or persisted is None:
+            return None
+        persisted_run_count, persisted_runs_hash = persisted
+        if persisted_run_count > len(runs):
+            return None
+        if self._get_runs_hash(runs[:persisted_run_count]) != persisted_runs_hash:
+            return None
+        return runs[persisted_run_count:]
+
+    def _persist(self, session: Session) -> Optional[Session]:
+        """
+        Persist a session, only writing the appended runs if the persisted runs are known. Called holding the
+        write lock, and not the lock of the buffers.
+        """
+        new_runs = self._get_new_runs(session)
+        if new_runs is not None:
+            result = self.storage.upsert_runs(session, new_runs=new_runs)
+        else:
+            result = self.storage.upsert(session)
+
+        with self._lock:
+            self._num_writes += 1
+            if result is None:
+                # The write failed, the stored runs are unknown now
+                self._persisted_runs.pop(session.session_id, None)
+            else:
+                self._track_persisted(session)
+        return result
+
+    def create(self) -> None:
+        self.storage.create()
+
+    def _get_buffered(self, session_id: str, user_id: Optional[str]) -> Tuple[bool, Optional[Session]]:
+        """Returns whether the session is pending or being flushed, and that version of the session"""
+        with self._lock:
+            session = self._pending.get(session_id) or self._flushing.get(session_id)
+            if session is None:
+                return False, None
+            if user_id and session.user_id != user_id:
+                return True, None
+            return True, session
+
+    def _track_read(self, session: Optional[Session], num_writes: int) -> None:
+        with self._lock:
+            # A session persisted during the read can be newer than the one read
+            if self._num_writes == num_writes:
+                self._track_persisted(session)
+
+    def read(self, session_id: str, user_id: Optional[str] = None) -> Optional[Session]:
+        """Read a Session, returning the pending version if it is not persisted yet."""
+        buffered, session = self._get_buffered(session_id, user_id)
+        if buffered:
+            return session
+
+        num_writes = self._num_writes
+        session = self.storage.read(session_id=session_id, user_id=user_id)
+        self._track_read(session, num_writes)
+        return session
+
+    async def aread(self, session_id: str, user_id: Optional[str] = None) -> Optional[Session]:
+        """Read a Session without blocking the event loop, returning the pending version if it is not persisted yet."""
+        buffered, session = self._get_buffered(session_id, user_id)
+        if buffered:
+            return session
+
+        num_writes = self._num_writes
+        session = await self.storage.aread(session_id=session_id, user_id=user_id)
+        self._track_read(session, num_writes)
+        return session
+
+    def get_all_session_ids(self, user_id: Optional[str] = None, entity_id: Optional[str] = None) -> List[str]:
+        self.flush()
+        return self.storage.get_all_session_ids(user_id, entity_id)
+
+    def get_all_sessions(self, user_id: Optional[str] = None, entity_id: Optional[str] = None) -> List[Session]:
+        self.flush()
+        return self.storage.get_all_sessions(user_id, entity_id)
+
+    def list_sessions(
+        self,
+        user_id: Optional[str] = None,
+        entity_id: Optional[str] = None,
+        limit: Optional[int] = None,
+        offset: int = 0,
+    ) -> List[SessionListing]:
+        self.flush()
+        return self.storage.list_sessions(user_id=user_id, entity_id=entity_id, limit=limit, offset=offset)
+
+    def upsert(self, session: Session) -> Optional[Session]:
+        """Insert or update a Session. In "batched" mode the session is persisted on the next flush."""
+        if self.durability == "write_through":
+            with self._write_lock:
+                return self._persist(session)
+
+        with self._lock:
+            self._pending[session.session_id] = session
+            num_pending = len(self._pending)
+        if num_pending >= self.max_pending_sessions:
+            self.flush()
+        return session
+
+    async def aupsert(self, session: Session) -> Optional[Session]:
+        """Insert or update a Session without blocking the event loop.
+
+        In "batched" mode the session is only buffered, the wrapped storage is written to in a thread when
+        max_pending_sessions is reached.
+        """
+        if self.durability == "write_through":
+            return await asyncio.to_thread(self.upsert, session)
+
+        with self._lock:
+            self._pending[session.session_id] = session
+            num_pending = len(self._pending)
+        if num_pending >= self.max_pending_sessions:
+            await asyncio.to_thread(self.flush)
+        return session
+
+    def upsert_runs(self, session: Session, new_runs: List[Dict[str, Any]]) -> Optional[Session]:
+        return self.upsert(session)
+
+    def flush(self) -> None:
+        """Persist all pending sessions. Sessions are read and upserted as usual while they are persisted."""
+        with self._write_lock:
+            with self._lock:
+                if not self._pending:
+                    return
+                pending, self._pending = self._pending, {}
+                self._flushing = pending.copy()
+            log_debug(f"Flushing {len(pending)} pending sessions")
+            try:
+                for session_id, session in pending.items():
+                    try:
+                        if self._persist(session) is None:
+                            logger.error(f"Failed to persist session: {session_id}")
+                    except Exception as e:
+                        logger.error(f"Error persisting session {session_id}: {e}")
+                    with self._lock:
+                        self._flushing.pop(session_id, None)
+            finally:
+                with self._lock:
+                    self._flushing = {}
+
+    def close(self) -> None:
+        """Stop the background flush and persist all pending sessions."""
+        self._closed.set()
+        self.flush()
+        if self._flush_on_exit:
+            atexit.unregister(self.close)
+            self._flush_on_exit = False
+
+    def delete_session(self, session_id: Optional[str] = None):
+        with self._write_lock:
+            with self._lock:
+                if session_id is not None:
+                    self._pending.pop(session_id, None)
+                    self._persisted_runs.pop(session_id, None)
+            self.storage.delete_session(session_id)
+
+    def drop(self) -> None:
+        with self._write_lock:
+            with self._lock:
+                self._pending.clear()
+                self._persisted_runs.clear()
+            self.storage.drop()
+
+    def upgrade_schema(self) -> None:
+        self.flush()
+        self.storage.upgrade_schema()
+
+    def __deepcopy__(self, memo):
+        """The write-behind buffer is shared by copies (e.g. Agent.deep_copy) so pending sessions are not lost."""
+        memo[id(self)] = self
+        return self
@@ -1,7 +1,10 @@
 import asyncio
+import contextvars
 import json
 from collections import ChainMap, defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import asdict, dataclass, replace
+from functools import partial
 from os import getenv
 from typing import (
     Any,
@@ -42,7 +45,25 @@ from agno.run.team import TeamRunResponse
 from agno.storage.base import Storage
 from agno.storage.session.team import TeamSession
 from agno.tools.function import Function
+from agno.tools.memo import ToolCallMemo
 from agno.tools.toolkit import Toolkit
+from agno.tracing.span import Span
+from agno.tracing.tracer import (
+    HISTORY,
+    KNOWLEDGE_SEARCH,
+    MEMORY_UPDATE,
+    STORAGE_READ,
+    STORAGE_WRITE,
+    SYSTEM_MESSAGE,
+    TEAM_RUN,
+    atrace_iterator,
+    is_tracing_enabled,
+    start_span,
+    trace_iterator,
+    trace_span,
+    use_span,
+)
+from agno.utils.concurrency import StreamSerializer, amerge_iterators, merge_iterators
 from agno.utils.log import (
     log_debug,
     log_error,
@@ -55,7 +76,8 @@ from agno.utils.log import (
     use_team_logger,
 )
 from agno.utils.merge_dict import merge_dictionaries
-from agno.utils.message import get_text_from_message
+from agno.utils.message import get_history_messages, get_text_from_message
+from agno.utils.phases import STORAGE, phase
 from agno.utils.response import (
     check_if_run_cancelled,
     create_panel,
@@ -147,6 +169,11 @@ class Team:
     enable_agentic_context: bool = False
     # If True, send all previous member interactions to members
     share_member_interactions: bool = False
+    # If True, run the members in threads in collaborate mode, and interleave their streams in async mode.
+    # Members must not share a Model instance. Async runs without streaming always run the members concurrently.
+    run_members_in_parallel: bool = False
+    # Maximum number of members run concurrently in collaborate mode. Defaults to the number of members.
+    max_member_workers: Optional[int] = None
     # If True, add a tool to get information about the team members
     get_member_information_tool: bool = False
     # Add a tool to search the knowledge base (aka Agentic RAG)
@@ -171,6 +198,19 @@ class Team:
     tool_choice: Optional[Union[str, Dict[str, Any]]] = None
     # Maximum number of tool calls allowed.
     tool_call_limit: Optional[int] = None
+    # If True, run the tool calls of a model response concurrently in a thread pool.
+    # Tools with Function.parallel_safe=False run one at a time after the others.
+    run_tools_in_parallel: bool = False
+    # Maximum number of tool calls run concurrently. Defaults to the number of tool calls.
+    max_tool_workers: Optional[int] = None
+    # Seconds after which a tool call run in parallel is reported as failed. Can be overridden by Function.timeout.
+    tool_call_timeout: Optional[float] = None
+    # If True, identical tool calls (same function and arguments) reuse the result of the first call,
+    # and identical tool calls running concurrently share a single execution.
+    # Tools with Function.deduplicate=False always run.
+    deduplicate_tool_calls: bool = False
+    # Reuse the results of identical tool calls within a "run" or across the runs of a "session".
+    tool_call_memo_scope: Literal["run", "session"] = "run"
     # A list of hooks to be called before and after the tool call
     tool_hooks: Optional[List[Callable]] = None
 
@@ -203,6 +243,9 @@ class Team:
     num_of_interactions_from_history: Optional[int] = None
     # Number of historical runs to include in the messages
     num_history_runs: int = 3
+    # Maximum number of tokens of history to include in the messages.
+    # If set, the most recent runs that fit in this budget are included instead of the last num_history_runs.
+    max_history_tokens: Optional[int] = None
 
     # --- Team Storage ---
     storage: Optional[Storage] = None
@@ -253,12 +296,19 @@ class Team:
         references_format: Literal["json", "yaml"] = "json",
         enable_agentic_context: bool = False,
         share_member_interactions: bool = False,
+        run_members_in_parallel: bool = False,
+        max_member_workers: Optional[int] = None,
         get_member_information_tool: bool = False,
         search_knowledge: bool = True,
         read_team_history: bool = False,
         tools: Optional[List[Union[Toolkit, Callable, Function, Dict]]] = None,
         show_tool_calls: bool = True,
         tool_call_limit: Optional[int] = None,
+        run_tools_in_parallel: bool = False,
+        max_tool_workers: Optional[int] = None,
+        tool_call_timeout: Optional[float] = None,
+        deduplicate_tool_calls: bool = False,
+        tool_call_memo_scope: Literal["run", "session"] = "run",
         tool_choice: Optional[Union[str, Dict[str, Any]]] = None,
         tool_hooks: Optional[List[Callable]] = None,
         response_model: Optional[Type[BaseModel]] = None,
@@ -273,6 +323,7 @@ class Team:
         enable_team_history: bool = False,
         num_of_interactions_from_history: Optional[int] = None,
         num_history_runs: int = 3,
+        max_history_tokens: Optional[int] = None,
         storage: Optional[Storage] = None,
         extra_data: Optional[Dict[str, Any]] = None,
         reasoning: bool = False,
@@ -317,6 +368,8 @@ class Team:
 
         self.enable_agentic_context = enable_agentic_context
         self.share_member_interactions = share_member_interactions
+        self.run_members_in_parallel = run_members_in_parallel
+        self.max_member_workers = max_member_workers
         self.get_member_information_tool = get_member_information_tool
         self.search_knowledge = search_knowledge
         self.read_team_history = read_team_history
@@ -325,6 +378,11 @@ class Team:
         self.show_tool_calls = show_tool_calls
         self.tool_choice = tool_choice
         self.tool_call_limit = tool_call_limit
+        self.run_tools_in_parallel = run_tools_in_parallel
+        self.max_tool_workers = max_tool_workers
+        self.tool_call_timeout = tool_call_timeout
+        self.deduplicate_tool_calls = deduplicate_tool_calls
+        self.tool_call_memo_scope = tool_call_memo_scope
         self.tool_hooks = tool_hooks
 
         self.response_model = response_model
@@ -341,6 +399,7 @@ class Team:
         self.enable_team_history = enable_team_history
         self.num_of_interactions_from_history = num_of_interactions_from_history
         self.num_history_runs = num_history_runs
+        self.max_history_tokens = max_history_tokens
 
         self.storage = storage
         self.extra_data = extra_data
@@ -377,6 +436,10 @@ class Team:
 
         self._tool_instructions: Optional[List[str]] = None
 
+        # Results of the tool calls of the current run or session, see deduplicate_tool_calls
+        self._tool_call_memo: Optional[ToolCallMemo] = None
+        self._tool_call_memo_session_id: Optional[str] = None
+
         # True if we should parse a member response model
         self._member_response_model: Optional[Type[BaseModel]] = None
 
@@ -595,7 +658,7 @@ class Team:
             log_debug("Disabling stream as response_model is set")
 
         # Configure the model for runs
-        self._configure_model(show_tool_calls=show_tool_calls)
+        self._configure_model(show_tool_calls=show_tool_calls, session_id=session_id)
 
         # Run the team
         last_exception = None
@@ -691,30 +754,32 @@ class Team:
                 self.run_response = TeamRunResponse(run_id=self.run_id, session_id=session_id, team_id=self.team_id)
                 # Configure the team leader model
                 self.run_response.model = self.model.id if self.model is not None else None
+                span = self._start_run_span(session_id, user_id, stream=stream)
 
-                # Prepare run messages
-                if self.mode == "route":
-                    run_messages: RunMessages = self.get_run_messages(
-                        session_id=session_id,
-                        user_id=user_id,
-                        message=message,
-                        audio=audio,
-                        images=images,
-                        videos=videos,
-                        files=files,
-                        **kwargs,
-                    )
-                else:
-                    run_messages = self.get_run_messages(
-                        session_id=session_id,
-                        user_id=user_id,
-                        message=message,
-                        audio=audio,
-                        images=images,
-                        videos=videos,
-                        files=files,
-                        **kwargs,
-                    )
+                with use_span(span):
+                    # Prepare run messages
+                    if self.mode == "route":
+                        run_messages: RunMessages = self.get_run_messages(
+                            session_id=session_id,
+                            user_id=user_id,
+                            message=message,
+                            audio=audio,
+                            images=images,
+                            videos=videos,
+                            files=files,
+                            **kwargs,
+                        )
+                    else:
+                        run_messages = self.get_run_messages(
+                            session_id=session_id,
+                            user_id=user_id,
+                            message=message,
+                            audio=audio,
+                            images=images,
+                            videos=videos,
+                            files=files,
+                            **kwargs,
+                        )
 
                 if stream:
                     resp = self._run_stream(
@@ -725,14 +790,15 @@ class Team:
                         user_id=user_id,
                     )
 
-                    return resp
+                    return trace_iterator(resp, span)
                 else:
-                    self._run(
-                        run_response=self.run_response,
-                        run_messages=run_messages,
-                        session_id=session_id,
-                        user_id=user_id,
-                    )
+                    with use_span(span, end_on_exit=True):
+                        self._run(
+                            run_response=self.run_response,
+                            run_messages=run_messages,
+                            session_id=session_id,
+                            user_id=user_id,
+                        )
 
                     return self.run_response
 
@@ -762,6 +828,24 @@ class Team:
         else:
             raise Exception(f"Failed after {num_attempts} attempts.")
 
+    def _start_run_span(self, session_id: str, user_id: Optional[str] = None, stream: bool = False) -> Optional[Span]:
+        """Start the span of a run, if tracing is enabled."""
+        if not is_tracing_enabled():
+            return None
+        return start_span(
+            TEAM_RUN,
+            {
+                "agno.team.id": self.team_id,
+                "agno.team.name": self.name,
+                "agno.team.mode": self.mode,
+                "agno.run_id": self.run_id,
+                "agno.session_id": session_id,
+                "agno.user_id": user_id,
+                "agno.run.stream": stream,
+                "gen_ai.request.model": self.model.id if self.model is not None else None,
+            },
+        )
+
     def _run(
         self,
         run_response: TeamRunResponse,
@@ -895,7 +979,8 @@ class Team:
         elif isinstance(self.memory, Memory):
             self.memory.add_run(session_id, run_response)
 
-            self._make_memories_and_summaries(run_messages, session_id, user_id)
+            with trace_span(MEMORY_UPDATE, {"agno.session_id": session_id}):
+                self._make_memories_and_summaries(run_messages, session_id, user_id)
 
             session_messages: List[Message] = []
             for run in self.memory.runs[session_id]:  # type: ignore
@@ -1216,7 +1301,8 @@ class Team:
         elif isinstance(self.memory, Memory):
             self.memory.add_run(session_id, run_response)
 
-            self._make_memories_and_summaries(run_messages, session_id, user_id)
+            with trace_span(MEMORY_UPDATE, {"agno.session_id": session_id}):
+                self._make_memories_and_summaries(run_messages, session_id, user_id)
 
             session_messages: List[Message] = []
             for run in self.memory.runs[session_id]:  # type: ignore
@@ -1320,7 +1406,7 @@ class Team:
         show_tool_calls = self.show_tool_calls
 
         # Read existing session from storage
-        self.read_from_storage(session_id=session_id)
+        await self.aread_from_storage(session_id=session_id)
 
         # Initialize memory if not yet set
         if self.memory is None:
@@ -1341,7 +1427,7 @@ class Team:
             log_debug("Disabling stream as response_model is set")
 
         # Configure the model for runs
-        self._configure_model(show_tool_calls=show_tool_calls)
+        self._configure_model(show_tool_calls=show_tool_calls, session_id=session_id)
 
         # Run the team
         last_exception = None
@@ -1434,31 +1520,33 @@ class Team:
                 self.run_response = TeamRunResponse(run_id=self.run_id, session_id=session_id, team_id=self.team_id)
                 # Configure the team leader model
                 self.run_response.model = self.model.id if self.model is not None else None
+                span = self._start_run_span(session_id, user_id, stream=stream)
 
-                # Prepare run messages
-                if self.mode == "route":
-                    # In route mode the model shouldn't get images/audio/video
-                    run_messages: RunMessages = self.get_run_messages(
-                        session_id=session_id,
-                        user_id=user_id,
-                        message=message,
-                        audio=audio,
-                        images=images,
-                        videos=videos,
-                        files=files,
-                        **kwargs,
-                    )
-                else:
-                    run_messages = self.get_run_messages(
-                        session_id=session_id,
-                        user_id=user_id,
-                        message=message,
-                        audio=audio,
-                        images=images,
-                        videos=videos,
-                        files=files,
-                        **kwargs,
-                    )
+                with use_span(span):
+                    # Prepare run messages
+                    if self.mode == "route":
+                        # In route mode the model shouldn't get images/audio/video
+                        run_messages: RunMessages = self.get_run_messages(
+                            session_id=session_id,
+                            user_id=user_id,
+                            message=message,
+                            audio=audio,
+                            images=images,
+                            videos=videos,
+                            files=files,
+                            **kwargs,
+                        )
+                    else:
+                        run_messages = self.get_run_messages(
+                            session_id=session_id,
+                            user_id=user_id,
+                            message=message,
+                            audio=audio,
+                            images=images,
+                            videos=videos,
+                            files=files,
+                            **kwargs,
+                        )
 
                 if stream:
                     resp = self._arun_stream(
@@ -1468,14 +1556,15 @@ class Team:
                         user_id=user_id,
                         stream_intermediate_steps=stream_intermediate_steps,
                     )
-                    return resp
+                    return atrace_iterator(resp, span)
                 else:
-                    await self._arun(
-                        run_response=self.run_response,
-                        run_messages=run_messages,
-                        session_id=session_id,
-                        user_id=user_id,
-                    )
+                    with use_span(span, end_on_exit=True):
+                        await self._arun(
+                            run_response=self.run_response,
+                            run_messages=run_messages,
+                            session_id=session_id,
+                            user_id=user_id,
+                        )
 
                     return self.run_response
 
@@ -1635,7 +1724,8 @@ class Team:
         elif isinstance(self.memory, Memory):
             self.memory.add_run(session_id, run_response)
 
-            await self._amake_memories_and_summaries(run_messages, session_id, user_id)
+            with trace_span(MEMORY_UPDATE, {"agno.session_id": session_id}):
+                await self._amake_memories_and_summaries(run_messages, session_id, user_id)
 
             session_messages: List[Message] = []
             for run in self.memory.runs[session_id]:
@@ -1646,7 +1736,7 @@ class Team:
             self.session_metrics = self._calculate_session_metrics(session_messages)
 
         # 6. Save session to storage
-        self.write_to_storage(session_id=session_id, user_id=user_id)
+        await self.awrite_to_storage(session_id=session_id, user_id=user_id)
 
         # 7. Parse team response model
         if self.response_model is not None and not isinstance(run_response.content, self.response_model):
@@ -1963,7 +2053,8 @@ class Team:
         elif isinstance(self.memory, Memory):
             self.memory.add_run(session_id, run_response)
 
-            await self._amake_memories_and_summaries(run_messages, session_id, user_id)
+            with trace_span(MEMORY_UPDATE, {"agno.session_id": session_id}):
+                await self._amake_memories_and_summaries(run_messages, session_id, user_id)
 
             session_messages: List[Message] = []
             for run in self.memory.runs[session_id]:  # type: ignore
@@ -1975,7 +2066,7 @@ class Team:
             self.session_metrics = self._calculate_session_metrics(session_messages)
 
         # 6. Save session to storage
-        self.write_to_storage(session_id=session_id, user_id=user_id)
+        await self.awrite_to_storage(session_id=session_id, user_id=user_id)
 
         # Log Team Run
         await self._alog_team_run(session_id=session_id, user_id=user_id)
@@ -1994,6 +2085,9 @@ class Team:
         self, run_messages: RunMessages, session_id: str, user_id: Optional[str] = None
     ) -> None:
         self.memory = cast(Memory, self.memory)
+        if self.memory.memory_worker is not None:
+            self._queue_memories_and_summaries(run_messages, session_id, user_id)
+            return
         user_message_str = (
             run_messages.user_message.get_content_string() if run_messages.user_message is not None else None
         )
@@ -2004,10 +2098,37 @@ class Team:
         if self.enable_session_summaries:
             self.memory.create_session_summary(session_id=session_id, user_id=user_id)
 
+    def _queue_memories_and_summaries(
+        self, run_messages: RunMessages, session_id: str, user_id: Optional[str] = None
+    ) -> None:
+        """Queue the memories and summary of the run on the memory worker, instead of creating them now"""
+        from agno.memory.v2.worker import MemoryTask
+
+        self.memory = cast(Memory, self.memory)
+        task_messages: List[Message] = []
+        if self.enable_user_memories and run_messages.user_message is not None:
+            if run_messages.user_message.get_content_string():
+                task_messages.append(run_messages.user_message)
+        if not task_messages and not self.enable_session_summaries:
+            return
+        self.memory.memory_worker.submit(  # type: ignore
+            MemoryTask(
+                memory=self.memory,
+                user_id=user_id or "default",
+                session_id=session_id,
+                messages=task_messages,
+                create_user_memories=self.enable_user_memories,
+                create_session_summary=self.enable_session_summaries,
+            )
+        )
+
     async def _amake_memories_and_summaries(
         self, run_messages: RunMessages, session_id: str, user_id: Optional[str] = None
     ) -> None:
         self.memory = cast(Memory, self.memory)
+        if self.memory.memory_worker is not None:
+            self._queue_memories_and_summaries(run_messages, session_id, user_id)
+            return
         user_message_str = (
             run_messages.user_message.get_content_string() if run_messages.user_message is not None else None
         )
@@ -4249,7 +4370,7 @@ class Team:
             else:
                 log_warning("Context is not a dict")
 
-    def _configure_model(self, show_tool_calls: bool = False) -> None:
+    def _configure_model(self, show_tool_calls: bool = False, session_id: Optional[str] = None) -> None:
         self._set_default_model()
 
         self.model = cast(Model, self.model)
@@ -4301,6 +4422,27 @@ class Team:
         if self.tool_call_limit is not None:
             self.model.tool_call_limit = self.tool_call_limit
 
+        # Set parallel tool execution on the Model
+        if self.run_tools_in_parallel:
+            self.model.run_tools_in_parallel = True
+            self.model.max_tool_workers = self.max_tool_workers
+            self.model.tool_call_timeout = self.tool_call_timeout
+
+        # Set the tool call memo on the Model
+        if self.deduplicate_tool_calls:
+            self.model.set_tool_call_memo(self._get_tool_call_memo(session_id=session_id))
+
+    def _get_tool_call_memo(self, session_id: Optional[str]) -> ToolCallMemo:
+        """Returns the tool call memo for a new run, keeping the memo of the session if tool_call_memo_scope="session"."""
+        if (
+            self._tool_call_memo is None
+            or self.tool_call_memo_scope == "run"
+            or self._tool_call_memo_session_id != session_id
+        ):
+            self._tool_call_memo = ToolCallMemo()
+            self._tool_call_memo_session_id = session_id
+        return self._tool_call_memo
+
     def _add_tools_to_model(self, model: Model, tools: List[Union[Function, Callable, Toolkit, Dict]]) -> None:
         # We have to reset for every run, because we will have new images/audio/video to attach
         _functions_for_model: Dict[str, Function] = {}
@@ -4660,37 +4802,38 @@ class Team:
         run_messages = RunMessages()
 
         # 1. Add system message to run_messages
-        system_message = self.get_system_message(
-            session_id=session_id, user_id=user_id, images=images, audio=audio, videos=videos, files=files
-        )
+        with trace_span(SYSTEM_MESSAGE):
+            system_message = self.get_system_message(
+                session_id=session_id, user_id=user_id, images=images, audio=audio, videos=videos, files=files
+            )
         if system_message is not None:
             run_messages.system_message = system_message
             run_messages.messages.append(system_message)
 
         # 2. Add history to run_messages
         if self.enable_team_history:
-            from copy import deepcopy
-
-            history = []
-            if isinstance(self.memory, TeamMemory):
-                history = self.memory.get_messages_from_last_n_runs(last_n=self.num_history_runs, skip_role="system")
-            elif isinstance(self.memory, Memory):
-                history = self.memory.get_messages_from_last_n_runs(
-                    session_id=session_id, last_n=self.num_history_runs, skip_role="system"
-                )
-
-            if len(history) > 0:
-                # Create a deep copy of the history messages to avoid modifying the original messages
-                history_copy = [deepcopy(msg) for msg in history]
+            with trace_span(HISTORY) as span:
+                history = []
+                last_n = self.num_history_runs if self.max_history_tokens is None else None
+                if isinstance(self.memory, TeamMemory):
+                    history = self.memory.get_messages_from_last_n_runs(
+                        last_n=last_n, skip_role="system", max_tokens=self.max_history_tokens
+                    )
+                elif isinstance(self.memory, Memory):
+                    history = self.memory.get_messages_from_last_n_runs(
+                        session_id=session_id, last_n=last_n, skip_role="system", max_tokens=self.max_history_tokens
+                    )
 
-                # Tag each message as coming from history
-                for _msg in history_copy:
-                    _msg.from_history = True
+                if len(history) > 0:
+                    # Tag each message as coming from history, without modifying or copying the original messages
+                    history_messages = get_history_messages(history)
 
-                log_debug(f"Adding {len(history_copy)} messages from history")
+                    log_debug(f"Adding {len(history_messages)} messages from history")
 
-                # Extend the messages with the history
-                run_messages.messages += history_copy
+                    # Extend the messages with the history
+                    run_messages.messages += history_messages
+                if span is not None:
+                    span.set_attribute("agno.history.num_messages", len(history))
 
         # 3. Add user message to run_messages
         user_message = self._get_user_message(message, audio=audio, images=images, videos=videos, files=files, **kwargs)
@@ -5036,19 +5179,7 @@ class Team:
         if not files:
             files = []
 
-        def run_member_agents(task_description: str, expected_output: Optional[str] = None) -> Iterator[str]:
-            """
-            Send the same task to all the member agents and return the responses.
-
-            Args:
-                task_description (str): The task description to send to the member agents.
-                expected_output (str): The expected output from the member agents.
-
-            Returns:
-                str: The responses from the member agents.
-            """
-            # Make sure for the member agent, we are using the agent logger
-            use_agent_logger()
+        def get_member_agent_task(task_description: str, expected_output: Optional[str] = None) -> str:
             self.memory = cast(TeamMemory, self.memory)
 
             # 2. Determine team context to send
@@ -5094,78 +5225,177 @@ class Team:
                 member_agent_task += f"\n\n{team_context_str}"
             if team_member_interactions_str:
                 member_agent_task += f"\n\n{team_member_interactions_str}"
+            return member_agent_task
 
-            for member_agent_index, member_agent in enumerate(self.members):
-                self._initialize_member(member_agent, session_id=session_id)
-                if stream:
-                    member_agent_run_response_stream = member_agent.run(
-                        member_agent_task, images=images, videos=videos, audio=audio, files=files, stream=True
-                    )
-                    for member_agent_run_response_chunk in member_agent_run_response_stream:
-                        check_if_run_cancelled(member_agent_run_response_chunk)
-                        if member_agent_run_response_chunk.content is not None:
-                            yield member_agent_run_response_chunk.content
-                        elif (
-                            member_agent_run_response_chunk.tools is not None
-                            and len(member_agent_run_response_chunk.tools) > 0
-                        ):
-                            yield ",".join([tool.get("content", "") for tool in member_agent_run_response_chunk.tools])
-                else:
-                    member_agent_run_response = member_agent.run(
-                        member_agent_task, images=images, videos=videos, audio=audio, files=files, stream=False
-                    )
+        def get_member_name(member_agent_index: int) -> str:
+            member_agent = self.members[member_agent_index]
+            return member_agent.name if member_agent.name else f"agent_{member_agent_index}"
 
-                    check_if_run_cancelled(member_agent_run_response)
+        def get_member_chunk_content(member_agent_run_response_chunk: Any) -> Optional[str]:
+            if member_agent_run_response_chunk.content is not None:
+                return member_agent_run_response_chunk.content
+            elif member_agent_run_response_chunk.tools is not None and len(member_agent_run_response_chunk.tools) > 0:
+                return ",".join([tool.get("content", "") for tool in member_agent_run_response_chunk.tools])
+            return None
 
-                    if member_agent_run_response.content is None and (
-                        member_agent_run_response.tools is None or len(member_agent_run_response.tools) == 0
-                    ):
-                        yield f"Agent {member_agent.name}: No response from the member agent."
-                    elif isinstance(member_agent_run_response.content, str):
-                        if len(member_agent_run_response.content.strip()) > 0:
-                            yield f"Agent {member_agent.name}: {member_agent_run_response.content}"
-                        elif member_agent_run_response.tools is not None and len(member_agent_run_response.tools) > 0:
-                            yield f"Agent {member_agent.name}: {','.join([tool.get('content', '') for tool in member_agent_run_response.tools])}"
-                    elif issubclass(type(member_agent_run_response.content), BaseModel):
-                        try:
-                            yield f"Agent {member_agent.name}: {member_agent_run_response.content.model_dump_json(indent=2)}"  # type: ignore
-                        except Exception as e:
-                            yield f"Agent {member_agent.name}: Error - {str(e)}"
-                    else:
-                        try:
-                            import json
+        def get_member_response_content(member_name: str, response: Any) -> str:
+            if response.content is None and (response.tools is None or len(response.tools) == 0):
+                return f"Agent {member_name}: No response from the member agent."
+            elif isinstance(response.content, str):
+                if len(response.content.strip()) > 0:
+                    return f"Agent {member_name}: {response.content}"
+                elif response.tools is not None and len(response.tools) > 0:
+                    return f"Agent {member_name}: {','.join([tool.get('content', '') for tool in response.tools])}"
+            elif issubclass(type(response.content), BaseModel):
+                try:
+                    return f"Agent {member_name}: {response.content.model_dump_json(indent=2)}"  # type: ignore
+                except Exception as e:
+                    return f"Agent {member_name}: Error - {str(e)}"
+            else:
+                try:
+                    return f"Agent {member_name}: {json.dumps(response.content, indent=2)}"
+                except Exception as e:
+                    return f"Agent {member_name}: Error - {str(e)}"
+            return f"Agent {member_name}: No Response"
+
+        def get_member_stream_content(
+            serializer: StreamSerializer, index: int, chunk: Any, finished: bool, last_index: List[Optional[int]]
+        ) -> List[str]:
+            """Serialize the merged member streams, adding the name of the member when the streamed member changes."""
+            contents: List[str] = []
+            for member_agent_index, member_agent_run_response_chunk in serializer.push(index, chunk, finished):
+                check_if_run_cancelled(member_agent_run_response_chunk)
+                content = get_member_chunk_content(member_agent_run_response_chunk)
+                if content is None:
+                    continue
+                if member_agent_index != last_index[0]:
+                    separator = "\n\n" if last_index[0] is not None else ""
+                    contents.append(f"{separator}Agent {get_member_name(member_agent_index)}: ")
+                    last_index[0] = member_agent_index
+                contents.append(content)
+            return contents
+
+        def update_team_with_member_run(member_agent_index: int, task_description: str) -> None:
+            member_agent = self.members[member_agent_index]
+            member_name = get_member_name(member_agent_index)
 
-                            yield f"Agent {member_agent.name}: {json.dumps(member_agent_run_response.content, indent=2)}"
-                        except Exception as e:
-                            yield f"Agent {member_agent.name}: Error - {str(e)}"
+            # Update the memory
+            if isinstance(self.memory, TeamMemory):
+                self.memory = cast(TeamMemory, self.memory)
+                self.memory.add_interaction_to_team_context(
+                    member_name=member_name,
+                    task=task_description,
+                    run_response=member_agent.run_response,  # type: ignore
+                )
+            else:
+                self.memory = cast(Memory, self.memory)
+                self.memory.add_interaction_to_team_context(
+                    session_id=session_id,
+                    member_name=member_name,
+                    task=task_description,
+                    run_response=member_agent.run_response,  # type: ignore
+                )
 
-                # Update the memory
-                member_name = member_agent.name if member_agent.name else f"agent_{member_agent_index}"
-                if isinstance(self.memory, TeamMemory):
-                    self.memory = cast(TeamMemory, self.memory)
-                    self.memory.add_interaction_to_team_context(
-                        member_name=member_name,
-                        task=task_description,
-                        run_response=member_agent.run_response,  # type: ignore
-                    )
-                else:
-                    self.memory = cast(Memory, self.memory)
-                    self.memory.add_interaction_to_team_context(
-                        session_id=session_id,
-                        member_name=member_name,
-                        task=task_description,
-                        run_response=member_agent.run_response,  # type: ignore
-                    )
+            # Add the member run to the team run response
+            self.run_response = cast(TeamRunResponse, self.run_response)
+            self.run_response.add_member_run(member_agent.run_response)  # type: ignore
+
+            # Update team session state
+            self._update_team_session_state(member_agent)
+
+            # Update the team media
+            self._update_team_media(member_agent.run_response)  # type: ignore
+
+        def run_member_agents(task_description: str, expected_output: Optional[str] = None) -> Iterator[str]:
+            """
+            Send the same task to all the member agents and return the responses.
+
+            Args:
+                task_description (str): The task description to send to the member agents.
+                expected_output (str): The expected output from the member agents.
+
+            Returns:
+                str: The responses from the member agents.
+            """
+            # Make sure for the member agent, we are using the agent logger
+            use_agent_logger()
 
-                # Add the member run to the team run response
-                self.run_response = cast(TeamRunResponse, self.run_response)
-                self.run_response.add_member_run(member_agent.run_response)  # type: ignore
+            member_agent_task = get_member_agent_task(task_description, expected_output)
+            for member_agent in self.members:
+                self._initialize_member(member_agent, session_id=session_id)
 
-                # Update team session state
-                self._update_team_session_state(member_agent)
+            if not self.run_members_in_parallel or len(self.members) < 2:
+                for member_agent_index, member_agent in enumerate(self.members):
+                    if stream:
+                        member_agent_run_response_stream = member_agent.run(
+                            member_agent_task, images=images, videos=videos, audio=audio, files=files, stream=True
+                        )
+                        for member_agent_run_response_chunk in member_agent_run_response_stream:
+                            check_if_run_cancelled(member_agent_run_response_chunk)
+                            content = get_member_chunk_content(member_agent_run_response_chunk)
+                            if content is not None:
+                                yield content
+                    else:
+                        member_agent_run_response = member_agent.run(
+                            member_agent_task, images=images, videos=videos, audio=audio, files=files, stream=False
+                        )
+                        check_if_run_cancelled(member_agent_run_response)
+                        yield get_member_response_content(
+                            get_member_name(member_agent_index), member_agent_run_response
+                        )
+                    update_team_with_member_run(member_agent_index, task_description)
+
+            elif stream:
+                # Run the members in threads and stream the response of one member at a time
+                member_streams = [
+                    cast(
+                        Callable[[], Iterator[Union[RunResponse, TeamRunResponse]]],
+                        partial(
+                            member_agent.run,
+                            member_agent_task,
+                            images=images,
+                            videos=videos,
+                            audio=audio,
+                            files=files,
+                            stream=True,
+                        ),
+                    )
+                    for member_agent in self.members
+                ]
+                serializer = StreamSerializer()
+                last_index: List[Optional[int]] = [None]
+                for index, chunk, finished in merge_iterators(member_streams, max_workers=self.max_member_workers):
+                    yield from get_member_stream_content(serializer, index, chunk, finished, last_index)
+                for member_agent_index in range(len(self.members)):
+                    update_team_with_member_run(member_agent_index, task_description)
 
-                # Update the team media
-                self._update_team_media(member_agent.run_response)  # type: ignore
+            else:
+                # Run the members in threads, each in a copy of the current context
+                with ThreadPoolExecutor(
+                    max_workers=self.max_member_workers or len(self.members), thread_name_prefix="agno-member"
+                ) as executor:
+                    futures = [
+                        executor.submit(
+                            contextvars.copy_context().run,
+                            partial(
+                                member_agent.run,
+                                member_agent_task,
+                                images=images,
+                                videos=videos,
+                                audio=audio,
+                                files=files,
+                                stream=False,
+                            ),
+                        )
+                        for member_agent in self.members
+                    ]
+                    for member_agent_index, future in enumerate(futures):
+                        member_agent_run_response = cast(Union[RunResponse, TeamRunResponse], future.result())
+                        check_if_run_cancelled(member_agent_run_response)
+                        yield get_member_response_content(
+                            get_member_name(member_agent_index), member_agent_run_response
+                        )
+                        update_team_with_member_run(member_agent_index, task_description)
 
             # Afterward, switch back to the team logger
             use_team_logger()
@@ -5185,120 +5415,49 @@ class Team:
             """
             # Make sure for the member agent, we are using the agent logger
             use_agent_logger()
-            self.memory = cast(TeamMemory, self.memory)
-
-            # 2. Determine team context to send
-            if isinstance(self.memory, TeamMemory):
-                self.memory = cast(TeamMemory, self.memory)
-                team_context_str = None
-                if self.enable_agentic_context:
-                    team_context_str = self.memory.get_team_context_str()
-
-                team_member_interactions_str = None
-                if self.share_member_interactions:
-                    team_member_interactions_str = self.memory.get_team_member_interactions_str()
-                    if context_images := self.memory.get_team_context_images():
-                        images.extend([Image.from_artifact(img) for img in context_images])
-                    if context_videos := self.memory.get_team_context_videos():
-                        videos.extend([Video.from_artifact(vid) for vid in context_videos])
-                    if context_audio := self.memory.get_team_context_audio():
-                        audio.extend([Audio.from_artifact(aud) for aud in context_audio])
-            else:
-                self.memory = cast(Memory, self.memory)
-                team_context_str = None
-                if self.enable_agentic_context:
-                    team_context_str = self.memory.get_team_context_str(session_id=session_id)  # type: ignore
-
-                team_member_interactions_str = None
-                if self.share_member_interactions:
-                    team_member_interactions_str = self.memory.get_team_member_interactions_str(session_id=session_id)  # type: ignore
-                    if context_images := self.memory.get_team_context_images(session_id=session_id):  # type: ignore
-                        images.extend([Image.from_artifact(img) for img in context_images])
-                    if context_videos := self.memory.get_team_context_videos(session_id=session_id):  # type: ignore
-                        videos.extend([Video.from_artifact(vid) for vid in context_videos])
-                    if context_audio := self.memory.get_team_context_audio(session_id=session_id):  # type: ignore
-                        audio.extend([Audio.from_artifact(aud) for aud in context_audio])
-
-            # 3. Create the member agent task
-            member_agent_task = "You are a member of a team of agents that collaborate to complete a task."
-            member_agent_task += f"\n\n<task>\n{task_description}\n</task>"
 
-            if expected_output is not None:
-                member_agent_task += f"\n\n<expected_output>\n{expected_output}\n</expected_output>"
+            member_agent_task = get_member_agent_task(task_description, expected_output)
+            for member_agent in self.members:
+                self._initialize_member(member_agent, session_id=session_id)
 
-            if team_context_str:
-                member_agent_task += f"\n\n{team_context_str}"
-            if team_member_interactions_str:
-                member_agent_task += f"\n\n{team_member_interactions_str}"
+            if stream:
+                member_streams = [
+                    await member_agent.arun(
+                        member_agent_task, images=images, videos=videos, audio=audio, files=files, stream=True
+                    )
+                    for member_agent in self.members
+                ]
+                if not self.run_members_in_parallel or len(self.members) < 2:
+                    for member_agent_index, member_agent_run_response_stream in enumerate(member_streams):
+                        async for member_agent_run_response_chunk in member_agent_run_response_stream:
+                            check_if_run_cancelled(member_agent_run_response_chunk)
+                            content = get_member_chunk_content(member_agent_run_response_chunk)
+                            if content is not None:
+                                yield content
+                        update_team_with_member_run(member_agent_index, task_description)
+                else:
+                    # Interleave the member streams as they arrive and stream the response of one member at a time
+                    serializer = StreamSerializer()
+                    last_index: List[Optional[int]] = [None]
+                    async for index, chunk, finished in amerge_iterators(member_streams):
+                        for content in get_member_stream_content(serializer, index, chunk, finished, last_index):
+                            yield content
+                    for member_agent_index in range(len(self.members)):
+                        update_team_with_member_run(member_agent_index, task_description)
 
-            # Create tasks for all member agents
-            tasks = []
-            for member_agent_index, member_agent in enumerate(self.members):
-                # We cannot stream responses with async gather
-                current_agent = member_agent  # Create a reference to the current agent
-                current_index = member_agent_index  # Create a reference to the current index
-                self._initialize_member(current_agent, session_id=session_id)
+            else:
 
-                async def run_member_agent(agent=current_agent, idx=current_index) -> str:
-                    response = await agent.arun(
+                async def run_member_agent(member_agent_index: int) -> str:
+                    response = await self.members[member_agent_index].arun(
                         member_agent_task, images=images, videos=videos, audio=audio, files=files, stream=False
                     )
                     check_if_run_cancelled(response)
+                    return get_member_response_content(get_member_name(member_agent_index), response)
 
-                    member_name = agent.name if agent.name else f"agent_{idx}"
-                    self.memory = cast(TeamMemory, self.memory)
-                    if isinstance(self.memory, TeamMemory):
-                        self.memory = cast(TeamMemory, self.memory)
-                        self.memory.add_interaction_to_team_context(
-                            member_name=member_name, task=task_description, run_response=agent.run_response
-                        )
-                    else:
-                        self.memory = cast(Memory, self.memory)
-                        self.memory.add_interaction_to_team_context(
-                            session_id=session_id,
-                            member_name=member_name,
-                            task=task_description,
-                            run_response=agent.run_response,
-                        )
-
-                    # Add the member run to the team run response
-                    self.run_response = cast(TeamRunResponse, self.run_response)
-                    self.run_response.add_member_run(agent.run_response)
-
-                    # Update team session state
-                    self._update_team_session_state(current_agent)
-
-                    # Update the team media
-                    self._update_team_media(agent.run_response)
-
-                    if response.content is None and (response.tools is None or len(response.tools) == 0):
-                        return f"Agent {member_name}: No response from the member agent."
-                    elif isinstance(response.content, str):
-                        if len(response.content.strip()) > 0:
-                            return f"Agent {member_name}: {response.content}"
-                        elif response.tools is not None and len(response.tools) > 0:
-                            return f"Agent {member_name}: {','.join([tool.get('content') for tool in response.tools])}"
-                    elif issubclass(type(response.content), BaseModel):
-                        try:
-                            return f"Agent {member_name}: {response.content.model_dump_json(indent=2)}"  # type: ignore
-                        except Exception as e:
-                            return f"Agent {member_name}: Error - {str(e)}"
-                    else:
-                        try:
-                            import json
-
-                            return f"Agent {member_name}: {json.dumps(response.content, indent=2)}"
-                        except Exception as e:
-                            return f"Agent {member_name}: Error - {str(e)}"
-
-                    return f"Agent {member_name}: No Response"
-
-                tasks.append(run_member_agent)
-
-            # Need to collect and process yielded values from each task
-            results = await asyncio.gather(*[task() for task in tasks])
-            for result in results:
-                yield result
+                results = await asyncio.gather(*[run_member_agent(i) for i in range(len(self.members))])
+                for member_agent_index, result in enumerate(results):
+                    update_team_with_member_run(member_agent_index, task_description)
+                    yield result
 
             # Afterward, switch back to the team logger
             use_team_logger()
@@ -5916,7 +6075,8 @@ class Team:
             Optional[TeamSession]: The loaded TeamSession or None if not found.
         """
         if self.storage is not None and session_id is not None:
-            self.team_session = cast(TeamSession, self.storage.read(session_id=session_id))
+            with phase(STORAGE), trace_span(STORAGE_READ, {"agno.session_id": session_id}):
+                self.team_session = cast(TeamSession, self.storage.read(session_id=session_id))
             if self.team_session is not None:
                 self.load_team_session(session=self.team_session)
             else:
@@ -5931,9 +6091,41 @@ class Team:
             Optional[TeamSession]: The saved TeamSession or None if not saved.
         """
         if self.storage is not None:
-            self.team_session = cast(
-                TeamSession, self.storage.upsert(session=self._get_team_session(session_id=session_id, user_id=user_id))
-            )
+            with phase(STORAGE), trace_span(STORAGE_WRITE, {"agno.session_id": session_id}):
+                self.team_session = cast(
+                    TeamSession,
+                    self.storage.upsert(session=self._get_team_session(session_id=session_id, user_id=user_id)),
+                )
+        return self.team_session
+
+    async def aread_from_storage(self, session_id: str) -> Optional[TeamSession]:
+        """Load the TeamSession from storage without blocking the event loop
+
+        Returns:
+            Optional[TeamSession]: The loaded TeamSession or None if not found.
+        """
+        if self.storage is not None and session_id is not None:
+            with phase(STORAGE), trace_span(STORAGE_READ, {"agno.session_id": session_id}):
+                self.team_session = cast(TeamSession, await self.storage.aread(session_id=session_id))
+            if self.team_session is not None:
+                self.load_team_session(session=self.team_session)
+            else:
+                # New session, just reset the state
+                self.session_name = None
+        return self.team_session
+
+    async def awrite_to_storage(self, session_id: str, user_id: Optional[str] = None) -> Optional[TeamSession]:
+        """Save the TeamSession to storage without blocking the event loop
+
+        Returns:
+            Optional[TeamSession]: The saved TeamSession or None if not saved.
+        """
+        if self.storage is not None:
+            with phase(STORAGE), trace_span(STORAGE_WRITE, {"agno.session_id": session_id}):
+                self.team_session = cast(
+                    TeamSession,
+                    await self.storage.aupsert(session=self._get_team_session(session_id=session_id, user_id=user_id)),
+                )
         return self.team_session
 
     def rename_session(self, session_name: str, session_id: Optional[str] = None) -> None:
@@ -6406,6 +6598,15 @@ class Team:
         self, query: str, num_documents: Optional[int] = None, **kwargs
     ) -> Optional[List[Dict[str, Any]]]:
         """Return a list of references from the knowledge base"""
+        with trace_span(KNOWLEDGE_SEARCH, {"agno.knowledge.num_documents": num_documents}) as span:
+            docs = self._get_relevant_docs_from_knowledge(query=query, num_documents=num_documents, **kwargs)
+            if span is not None:
+                span.set_attribute("agno.knowledge.num_results", len(docs or []))
+            return docs
+
+    def _get_relevant_docs_from_knowledge(
+        self, query: str, num_documents: Optional[int] = None, **kwargs
+    ) -> Optional[List[Dict[str, Any]]]:
         from agno.document import Document
 
         if self.retriever is not None and callable(self.retriever):
@@ -6434,6 +6635,15 @@ class Team:
         self, query: str, num_documents: Optional[int] = None, **kwargs
     ) -> Optional[List[Dict[str, Any]]]:
         """Get relevant documents from knowledge base asynchronously."""
+        with trace_span(KNOWLEDGE_SEARCH, {"agno.knowledge.num_documents": num_documents}) as span:
+            docs = await self._aget_relevant_docs_from_knowledge(query=query, num_documents=num_documents, **kwargs)
+            if span is not None:
+                span.set_attribute("agno.knowledge.num_results", len(docs or []))
+            return docs
+
+    async def _aget_relevant_docs_from_knowledge(
+        self, query: str, num_documents: Optional[int] = None, **kwargs
+    ) -> Optional[List[Dict[str, Any]]]:
         from agno.document import Document
 
         if self.retriever is not None and callable(self.retriever):
@@ -0,0 +1,13 @@
+from agno.tools.cache.base import ToolCache, ToolCacheStats, get_cache_key
+from agno.tools.cache.disk import DiskToolCache
+from agno.tools.cache.memory import InMemoryToolCache
+from agno.tools.cache.tiered import TieredToolCache
+
+__all__ = [
+    "DiskToolCache",
+    "InMemoryToolCache",
+    "TieredToolCache",
+    "ToolCache",
+    "ToolCacheStats",
+    "get_cache_key",
+]
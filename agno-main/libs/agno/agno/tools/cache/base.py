@@ -0,0 +1,95 @@
+import asyncio
+import json
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from hashlib import sha256
+from threading import Lock
+from typing import Any, Dict, Optional, Tuple
+
+
+def get_cache_key(arguments: Optional[Dict[str, Any]] = None) -> str:
+    """Returns a stable key for the arguments of a tool call, independent of the order of the arguments."""
+    canonical = json.dumps(arguments or {}, sort_keys=True, separators=(",", ":"), ensure_ascii=False, default=str)
+    return sha256(canonical.encode("utf-8")).hexdigest()
+
+
+@dataclass
+class ToolCacheStats:
+    """Hit and miss counts of a ToolCache"""
+
+    hits: int = 0
+    misses: int = 0
+
+    @property
+    def requests(self) -> int:
+        return self.hits + self.misses
+
+    @property
+    def hit_rate(self) -> float:
+        return self.hits / self.requests if self.requests else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"hits": self.hits, "misses": self.misses, "hit_rate": self.hit_rate}
+
+
+class ToolCache(ABC):
+    """Base class for caching the results of tool calls.
+
+    Results are stored per namespace (the name of the function) and key (see get_cache_key).
+    A cached result of None is treated as a miss.
+    """
+
+    def __init__(self):
+        self.stats = ToolCacheStats()
+        self._stats_lock = Lock()
+
+    def _record(self, hit: bool) -> None:
+        with self._stats_lock:
+            if hit:
+                self.stats.hits += 1
+            else:
+                self.stats.misses += 1
+
+    @abstractmethod
+    def get(self, namespace: str, key: str) -> Optional[Any]:
+        """Returns the cached result, or None if it is missing or expired."""
+        raise NotImplementedError
+
+    def get_with_ttl(self, namespace: str, key: str) -> Tuple[Optional[Any], Optional[float]]:
+        """
+        Returns the cached result and its remaining time to live in seconds, None if it never expires.
+        Caches with expiring results override this, so a TieredToolCache copies results to faster tiers with the
+        time they have left.
+        """
+        return self.get(namespace, key), None
+
+    @abstractmethod
+    def set(self, namespace: str, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        """Cache a result, for ttl seconds if provided."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def delete(self, namespace: str, key: str) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def clear(self, namespace: Optional[str] = None) -> None:
+        """Remove all cached results, or only those of a namespace."""
+        raise NotImplementedError
+
+    async def aget(self, namespace: str, key: str) -> Optional[Any]:
+        """Returns the cached result without blocking the event loop."""
+        return await asyncio.to_thread(self.get, namespace, key)
+
+    async def aget_with_ttl(self, namespace: str, key: str) -> Tuple[Optional[Any], Optional[float]]:
+        """Returns the cached result and its remaining time to live without blocking the event loop."""
+        return await asyncio.to_thread(self.get_with_ttl, namespace, key)
+
+    async def aset(self, namespace: str, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        """Cache a result without blocking the event loop."""
+        await asyncio.to_thread(self.set, namespace, key, value, ttl)
+
+    def __deepcopy__(self, memo):
+        """Caches are shared by copies of the tools that use them (e.g. Agent.deep_copy)."""
+        memo[id(self)] = self
+        return self
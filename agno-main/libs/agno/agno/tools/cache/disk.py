@@ -0,0 +1,146 @@
+import json
+import os
+import shutil
+from pathlib import Path
+from tempfile import NamedTemporaryFile, gettempdir
+from threading import Event, Lock, Thread
+from time import time
+from typing import Any, Dict, Optional, Tuple, Union
+
+from agno.tools.cache.base import ToolCache
+from agno.utils.log import log_debug, log_error
+
+
+class DiskToolCache(ToolCache):
+    def __init__(
+        self,
+        cache_dir: Optional[Union[str, Path]] = None,
+        max_size_bytes: int = 100 * 1024 * 1024,
+    ):
+        """
+        Cache of tool results stored as JSON files in `<cache_dir>/functions/<namespace>/`, so results survive
+        restarts and are shared by processes on the same machine.
+
+        Args:
+            cache_dir (Optional[Union[str, Path]]): The directory to store the results in.
+                Defaults to `agno_cache` in the system temp directory.
+            max_size_bytes (int): Once the cached results exceed this size, expired and then least recently written
+                results are evicted in a background thread until the cache is below 80% of this size.
+        """
+        super().__init__()
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else Path(gettempdir()) / "agno_cache"
+        self.max_size_bytes = max_size_bytes
+        # Size of the cached results, computed on first write
+        self._size_bytes: Optional[int] = None
+        self._size_lock = Lock()
+        self._evicting = Event()
+
+    @property
+    def functions_dir(self) -> Path:
+        return self.cache_dir / "functions"
+
+    def _get_path(self, namespace: str, key: str) -> Path:
+        return self.functions_dir / namespace / f"{key}.json"
+
+    def get(self, namespace: str, key: str) -> Optional[Any]:
+        return self.get_with_ttl(namespace, key)[0]
+
+    def get_with_ttl(self, namespace: str, key: str) -> Tuple[Optional[Any], Optional[float]]:
+        path = self._get_path(namespace, key)
+        result = None
+        ttl = None
+        try:
+            with path.open("r") as f:
+                cache_data = json.load(f)
+            expires_at = cache_data.get("expires_at")
+            now = time()
+            if expires_at is None or now < expires_at:
+                result = cache_data.get("result")
+                ttl = expires_at - now if expires_at is not None else None
+            else:
+                # Remove expired entry
+                path.unlink(missing_ok=True)
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            log_error(f"Error reading cache: {e}")
+        self._record(result is not None)
+        return result, ttl if result is not None else None
+
+    def set(self, namespace: str, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        path = self._get_path(namespace, key)
+        cache_data: Dict[str, Any] = {"timestamp": time(), "result": value}
+        if ttl is not None:
+            cache_data["expires_at"] = cache_data["timestamp"] + ttl
+        try:
+            payload = json.dumps(cache_data)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            # Write to a unique temporary file first so that readers never see a partially written result
+            with NamedTemporaryFile("w", dir=path.parent, suffix=".tmp", delete=False) as tmp_file:
+                tmp_file.write(payload)
+            try:
+                os.replace(tmp_file.name, path)
+            except BaseException:
+                os.unlink(tmp_file.name)
+                raise
+        except Exception as e:
+            log_error(f"Error writing cache: {e}")
+            return
+        self._track_size(len(payload))
+
+    def delete(self, namespace: str, key: str) -> None:
+        self._get_path(namespace, key).unlink(missing_ok=True)
+
+    def clear(self, namespace: Optional[str] = None) -> None:
+        target = self.functions_dir if namespace is None else self.functions_dir / namespace
+        shutil.rmtree(target, ignore_errors=True)
+        with self._size_lock:
+            self._size_bytes = None
+
+    def _get_size(self) -> int:
+        return sum(path.stat().st_size for path in self.functions_dir.glob("*/*.json") if path.is_file())
+
+    def _track_size(self, num_bytes: int) -> None:
+        with self._size_lock:
+            if self._size_bytes is None:
+                self._size_bytes = self._get_size()
+            else:
+                self._size_bytes += num_bytes
+            over_limit = self._size_bytes > self.max_size_bytes
+        if over_limit and not self._evicting.is_set():
+            self._evicting.set()
+            Thread(target=self.evict, name="agno-tool-cache-eviction", daemon=True).start()
+
+    def evict(self) -> None:
+        """Remove expired results, then the least recently written results until the cache is below 80% of its size."""
+        try:
+            now = time()
+            entries = []
+            for path in self.functions_dir.glob("*/*.json"):
+                try:
+                    stat = path.stat()
+                    with path.open("r") as f:
+                        expires_at = json.load(f).get("expires_at")
+                except Exception:
+                    continue
+                if expires_at is not None and expires_at <= now:
+                    path.unlink(missing_ok=True)
+                else:
+                    entries.append((stat.st_mtime, stat.st_size, path))
+
+            size = sum(entry[1] for entry in entries)
+            target_size = int(self.max_size_bytes * 0.8)
+            num_evicted = 0
+            for _, file_size, path in sorted(entries, key=lambda x: x[0]):
+                if size <= target_size:
+                    break
+                path.unlink(missing_ok=True)
+                size -= file_size
+                num_evicted += 1
+            with self._size_lock:
+                self._size_bytes = size
+            log_debug(f"Evicted {num_evicted} cached tool results from {self.functions_dir}")
+        except Exception as e:
+            log_error(f"Error evicting cached tool results: {e}")
+        finally:
+            self._evicting.clear()
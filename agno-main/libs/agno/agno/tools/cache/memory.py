@@ -0,0 +1,71 @@
+from collections import OrderedDict
+from threading import Lock
+from time import monotonic
+from typing import Any, Optional, Tuple
+
+from agno.tools.cache.base import ToolCache
+
+
+class InMemoryToolCache(ToolCache):
+    def __init__(self, max_entries: int = 1024):
+        """
+        Least recently used cache of tool results, local to the process.
+
+        Args:
+            max_entries (int): The maximum number of cached results, the least recently used result is evicted first.
+        """
+        super().__init__()
+        self.max_entries = max_entries
+        # (namespace, key) -> (expires_at, value), ordered from least to most recently used
+        self._entries: "OrderedDict[Tuple[str, str], Tuple[Optional[float], Any]]" = OrderedDict()
+        self._lock = Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, namespace: str, key: str) -> Optional[Any]:
+        return self.get_with_ttl(namespace, key)[0]
+
+    def get_with_ttl(self, namespace: str, key: str) -> Tuple[Optional[Any], Optional[float]]:
+        now = monotonic()
+        with self._lock:
+            entry = self._entries.get((namespace, key))
+            if entry is not None and entry[0] is not None and entry[0] <= now:
+                del self._entries[(namespace, key)]
+                entry = None
+            if entry is not None:
+                self._entries.move_to_end((namespace, key))
+        self._record(entry is not None)
+        if entry is None:
+            return None, None
+        expires_at, value = entry
+        return value, expires_at - now if expires_at is not None else None
+
+    def set(self, namespace: str, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        expires_at = monotonic() + ttl if ttl is not None else None
+        with self._lock:
+            self._entries[(namespace, key)] = (expires_at, value)
+            self._entries.move_to_end((namespace, key))
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def delete(self, namespace: str, key: str) -> None:
+        with self._lock:
+            self._entries.pop((namespace, key), None)
+
+    def clear(self, namespace: Optional[str] = None) -> None:
+        with self._lock:
+            if namespace is None:
+                self._entries.clear()
+            else:
+                for entry_key in [k for k in self._entries if k[0] == namespace]:
+                    del self._entries[entry_key]
+
+    async def aget(self, namespace: str, key: str) -> Optional[Any]:
+        return self.get(namespace, key)
+
+    async def aget_with_ttl(self, namespace: str, key: str) -> Tuple[Optional[Any], Optional[float]]:
+        return self.get_with_ttl(namespace, key)
+
+    async def aset(self, namespace: str, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        self.set(namespace, key, value, ttl)
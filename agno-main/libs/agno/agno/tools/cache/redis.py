@@ -0,0 +1,160 @@
+import asyncio
+import json
+from typing import Any, Optional, Tuple
+
+from agno.tools.cache.base import ToolCache
+from agno.utils.log import log_debug, log_error
+
+try:
+    from redis import Redis
+    from redis.asyncio import Redis as AsyncRedis
+except ImportError:
+    raise ImportError("`redis` not installed. Please install it using `pip install redis`")
+
+
+class RedisToolCache(ToolCache):
+    def __init__(
+        self,
+        prefix: str = "agno_tool_cache",
+        host: str = "localhost",
+        port: int = 6379,
+        db: int = 0,
+        password: Optional[str] = None,
+        client: Optional[Redis] = None,
+    ):
+        """
+        Cache of tool results stored in Redis (or a Redis-compatible server such as Valkey), shared by every process
+        connected to it. Results are stored as JSON strings and expire using Redis key expiry.
+
+        Args:
+            prefix (str): Prefix for the Redis keys, keys are `{prefix}:{namespace}:{key}`
+            host (str): Redis host address
+            port (int): Redis port number
+            db (int): Redis database number
+            password (Optional[str]): Redis password if authentication is required
+            client (Optional[Redis]): Use this client instead of connecting to host:port.
+                The async methods then run the client in a thread.
+        """
+        super().__init__()
+        self.prefix = prefix
+        self.host = host
+        self.port = port
+        self.db = db
+        self.password = password
+        self._external_client = client is not None
+        self.redis_client: Redis = client or Redis(
+            host=host, port=port, db=db, password=password, decode_responses=True
+        )
+        # Async client, per event loop as async connections can't be shared across loops
+        self._async_redis_client: Optional[AsyncRedis] = None
+        self._async_redis_client_loop: Optional[asyncio.AbstractEventLoop] = None
+        log_debug(f"Created RedisToolCache with prefix: '{self.prefix}'")
+
+    def _get_key(self, namespace: str, key: str) -> str:
+        return f"{self.prefix}:{namespace}:{key}"
+
+    @property
+    def async_redis_client(self) -> AsyncRedis:
+        """The redis.asyncio client for the running event loop."""
+        loop = asyncio.get_running_loop()
+        if self._async_redis_client is None or self._async_redis_client_loop is not loop:
+            self._async_redis_client = AsyncRedis(
+                host=self.host,
+                port=self.port,
+                db=self.db,
+                password=self.password,
+                decode_responses=True,
+            )
+            self._async_redis_client_loop = loop
+        return self._async_redis_client
+
+    def _loads(self, data: Optional[Any]) -> Optional[Any]:
+        if data is None:
+            return None
+        try:
+            return json.loads(data)
+        except Exception as e:
+            log_error(f"Error reading cache: {e}")
+            return None
+
+    def get(self, namespace: str, key: str) -> Optional[Any]:
+        try:
+            result = self._loads(self.redis_client.get(self._get_key(namespace, key)))
+        except Exception as e:
+            log_error(f"Error reading cache: {e}")
+            result = None
+        self._record(result is not None)
+        return result
+
+    @staticmethod
+    def _get_ttl(ttl_ms: Any) -> Optional[float]:
+        # PTTL is -1 for keys without expiry
+        return ttl_ms / 1000 if isinstance(ttl_ms, int) and ttl_ms >= 0 else None
+
+    def get_with_ttl(self, namespace: str, key: str) -> Tuple[Optional[Any], Optional[float]]:
+        try:
+            pipeline = self.redis_client.pipeline(transaction=True)
+            pipeline.get(self._get_key(namespace, key))
+            pipeline.pttl(self._get_key(namespace, key))
+            data, ttl_ms = pipeline.execute()
+            result = self._loads(data)
+        except Exception as e:
+            log_error(f"Error reading cache: {e}")
+            result, ttl_ms = None, None
+        self._record(result is not None)
+        return result, self._get_ttl(ttl_ms) if result is not None else None
+
+    def set(self, namespace: str, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        try:
+            self.redis_client.set(self._get_key(namespace, key), json.dumps(value), px=self._get_ttl_ms(ttl))
+        except Exception as e:
+            log_error(f"Error writing cache: {e}")
+
+    @staticmethod
+    def _get_ttl_ms(ttl: Optional[float]) -> Optional[int]:
+        return max(1, int(ttl * 1000)) if ttl is not None else None
+
+    def delete(self, namespace: str, key: str) -> None:
+        self.redis_client.delete(self._get_key(namespace, key))
+
+    def clear(self, namespace: Optional[str] = None) -> None:
+        match = f"{self.prefix}:*" if namespace is None else f"{self.prefix}:{namespace}:*"
+        keys = list(self.redis_client.scan_iter(match=match))
+        for i in range(0, len(keys), 500):
+            self.redis_client.delete(*keys[i : i + 500])
+
+    async def aget(self, namespace: str, key: str) -> Optional[Any]:
+        if self._external_client:
+            return await super().aget(namespace, key)
+        try:
+            result = self._loads(await self.async_redis_client.get(self._get_key(namespace, key)))
+        except Exception as e:
+            log_error(f"Error reading cache: {e}")
+            result = None
+        self._record(result is not None)
+        return result
+
+    async def aget_with_ttl(self, namespace: str, key: str) -> Tuple[Optional[Any], Optional[float]]:
+        if self._external_client:
+            return await super().aget_with_ttl(namespace, key)
+        try:
+            pipeline = self.async_redis_client.pipeline(transaction=True)
+            pipeline.get(self._get_key(namespace, key))
+            pipeline.pttl(self._get_key(namespace, key))
+            data, ttl_ms = await pipeline.execute()
+            result = self._loads(data)
+        except Exception as e:
+            log_error(f"Error reading cache: {e}")
+            result, ttl_ms = None, None
+        self._record(result is not None)
+        return result, self._get_ttl(ttl_ms) if result is not None else None
+
+    async def aset(self, namespace: str, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        if self._external_client:
+            return await super().aset(namespace, key, value, ttl)
+        try:
+            await self.async_redis_client.set(
+                self._get_key(namespace, key), json.dumps(value), px=self._get_ttl_ms(ttl)
+            )
+        except Exception as e:
+            log_error(f"Error writing cache: {e}")
@@ -0,0 +1,61 @@
+from typing import Any, List, Optional, Tuple
+
+from agno.tools.cache.base import ToolCache
+
+
+class TieredToolCache(ToolCache):
+    def __init__(self, tiers: List[ToolCache]):
+        """
+        Combines caches from fastest to slowest, e.g. an InMemoryToolCache in front of a RedisToolCache.
+        Results are written to every tier, and results found in a slower tier are copied to the faster tiers
+        with the time they have left to live.
+
+        Args:
+            tiers (List[ToolCache]): The caches, from fastest to slowest.
+        """
+        super().__init__()
+        self.tiers = tiers
+
+    def get(self, namespace: str, key: str) -> Optional[Any]:
+        return self.get_with_ttl(namespace, key)[0]
+
+    def get_with_ttl(self, namespace: str, key: str) -> Tuple[Optional[Any], Optional[float]]:
+        for i, tier in enumerate(self.tiers):
+            value, ttl = tier.get_with_ttl(namespace, key)
+            if value is not None:
+                for faster_tier in self.tiers[:i]:
+                    faster_tier.set(namespace, key, value, ttl)
+                self._record(True)
+                return value, ttl
+        self._record(False)
+        return None, None
+
+    def set(self, namespace: str, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        for tier in self.tiers:
+            tier.set(namespace, key, value, ttl)
+
+    def delete(self, namespace: str, key: str) -> None:
+        for tier in self.tiers:
+            tier.delete(namespace, key)
+
+    def clear(self, namespace: Optional[str] = None) -> None:
+        for tier in self.tiers:
+            tier.clear(namespace)
+
+    async def aget(self, namespace: str, key: str) -> Optional[Any]:
+        return (await self.aget_with_ttl(namespace, key))[0]
+
+    async def aget_with_ttl(self, namespace: str, key: str) -> Tuple[Optional[Any], Optional[float]]:
+        for i, tier in enumerate(self.tiers):
+            value, ttl = await tier.aget_with_ttl(namespace, key)
+            if value is not None:
+                for faster_tier in self.tiers[:i]:
+                    await faster_tier.aset(namespace, key, value, ttl)
+                self._record(True)
+                return value, ttl
+        self._record(False)
+        return None, None
+
+    async def aset(self, namespace: str, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        for tier in self.tiers:
+            await tier.aset(namespace, key, value, ttl)
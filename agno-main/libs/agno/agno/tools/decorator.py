@@ -1,6 +1,7 @@
 from functools import update_wrapper, wraps
 from typing import Any, Callable, Dict, List, Optional, TypeVar, Union, overload
 
+from agno.tools.cache.base import ToolCache
 from agno.tools.function import Function
 from agno.utils.log import logger
 
@@ -30,6 +31,11 @@ def tool(
     cache_results: bool = False,
     cache_dir: Optional[str] = None,
     cache_ttl: int = 3600,
+    cache: Optional[ToolCache] = None,
+    parallel_safe: Optional[bool] = None,
+    max_concurrency: Optional[int] = None,
+    timeout: Optional[float] = None,
+    deduplicate: Optional[bool] = None,
 ) -> Callable[[F], Function]: ...
 
 
@@ -55,6 +61,11 @@ def tool(*args, **kwargs) -> Union[Function, Callable[[F], Function]]:
         cache_results: bool - If True, enable caching of function results
         cache_dir: Optional[str] - Directory to store cache files
         cache_ttl: int - Time-to-live for cached results in seconds
+        cache: Optional[ToolCache] - Cache to store results in instead of cache_dir, e.g. an InMemoryToolCache
+        parallel_safe: Optional[bool] - If False, the function never runs at the same time as other tool calls
+        max_concurrency: Optional[int] - Maximum number of calls of the function that run at the same time
+        timeout: Optional[float] - Seconds after which a call of the function run in parallel is reported as failed
+        deduplicate: Optional[bool] - If False, identical calls of the function are never deduplicated within a run
 
     Returns:
         Union[Function, Callable[[F], Function]]: Decorated function or decorator
@@ -89,6 +100,11 @@ def tool(*args, **kwargs) -> Union[Function, Callable[[F], Function]]:
             "cache_results",
             "cache_dir",
             "cache_ttl",
+            "cache",
+            "parallel_safe",
+            "max_concurrency",
+            "timeout",
+            "deduplicate",
         }
     )
 
@@ -1,11 +1,24 @@
+import json
+from collections import OrderedDict
+from copy import deepcopy
+from dataclasses import dataclass
 from functools import partial
-from typing import Any, Callable, Dict, List, Optional, Type, TypeVar, get_type_hints
+from inspect import isasyncgen, isasyncgenfunction, isfunction, isgenerator, ismethod
+from threading import Lock
+from types import MethodType
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type, TypeVar, get_type_hints
+from weakref import WeakKeyDictionary
 
 from docstring_parser import parse
 from pydantic import BaseModel, Field, validate_call
 
 from agno.exceptions import AgentRunException
-from agno.utils.log import log_debug, log_error, log_exception, log_warning
+from agno.tools.cache.base import ToolCache, get_cache_key
+from agno.tools.cache.disk import DiskToolCache
+from agno.tracing.span import Span
+from agno.tracing.tracer import TOOL_CALL, atrace_iterator, start_span, trace_iterator, use_span
+from agno.utils.log import log_debug, log_exception, log_warning
+from agno.utils.phases import TOOL, phase
 
 T = TypeVar("T")
 
@@ -32,6 +45,146 @@ def get_entrypoint_docstring(entrypoint: Callable) -> str:
     return "\n".join(lines)
 
 
+@dataclass
+class FunctionSchema:
+    """The description and JSON schema of a callable, as sent to the model."""
+
+    description: str
+    # The JSON schema of the parameters, None if the parameters could not be parsed
+    parameters: Optional[Dict[str, Any]]
+    # The parameters without a default value
+    required: List[str]
+
+
+# Schemas are compiled once per callable for the whole process, as parsing docstrings and building JSON schemas
+# is expensive for large toolkits. Bound methods share the schema of their function, so copies of a toolkit
+# (e.g. of a deep copied Agent) reuse it too.
+_schema_cache: "WeakKeyDictionary[Any, Dict[Tuple[bool, bool, bool], FunctionSchema]]" = WeakKeyDictionary()
+# Validated entrypoints of module and class level functions, bound methods are rebound to their instance
+_validated_entrypoint_cache: "WeakKeyDictionary[Any, Callable]" = WeakKeyDictionary()
+_cache_lock = Lock()
+# Tool payloads by model provider and function schema, shared by the functions of the whole process, see
+# Function.get_payload. The least recently used payloads are dropped once the cache is full.
+_payload_cache: "OrderedDict[Tuple[str, str], Dict[str, Any]]" = OrderedDict()
+_PAYLOAD_CACHE_SIZE = 4096
+
+
+def _default_parameters() -> Dict[str, Any]:
+    return {"type": "object", "properties": {}, "required": []}
+
+
+def _compile_function_schema(c: Callable, strict: bool, typed_param_descriptions: bool) -> FunctionSchema:
+    from inspect import getdoc, signature
+
+    from agno.utils.json_schema import get_json_schema
+
+    function_name = getattr(c, "__name__", str(c))
+    description = get_entrypoint_docstring(entrypoint=c)
+    try:
+        sig = signature(c)
+        type_hints = get_type_hints(c)
+
+        # If function has an the agent argument, remove the agent parameter from the type hints
+        if "agent" in sig.parameters:
+            del type_hints["agent"]
+        if "team" in sig.parameters:
+            del type_hints["team"]
+
+        # Filter out return type and only process parameters
+        param_type_hints = {
+            name: type_hints.get(name) for name in sig.parameters if name != "return" and name not in ["agent", "team"]
+        }
+
+        # Parse docstring for parameters
+        param_descriptions: Dict[str, Any] = {}
+        if docstring := getdoc(c):
+            parsed_doc = parse(docstring)
+            param_docs = parsed_doc.params
+
+            if param_docs is not None:
+                for param in param_docs:
+                    param_name = param.arg_name
+                    param_type = param.type_name
+                    if param_type is None and not typed_param_descriptions:
+                        param_descriptions[param_name] = param.description
+                    else:
+                        # TODO: We should use type hints first, then map param types in docs to json schema types.
+                        # This is temporary to not lose information
+                        param_descriptions[param_name] = f"({param_type}) {param.description}"
+
+        # Get JSON schema for parameters only
+        parameters = get_json_schema(type_hints=param_type_hints, param_descriptions=param_descriptions, strict=strict)
+
+        # Mark a field as required if it has no default value
+        required = [
+            name
+            for name, param in sig.parameters.items()
+            if param.default == param.empty and name != "self" and name not in ["agent", "team"]
+        ]
+        # If strict=True mark all fields as required
+        # See: https://platform.openai.com/docs/guides/structured-outputs/supported-schemas#all-fields-must-be-required
+        if strict:
+            parameters["required"] = [name for name in parameters["properties"] if name not in ["agent", "team"]]
+        else:
+            parameters["required"] = list(required)
+        return FunctionSchema(description=description, parameters=parameters, required=required)
+    except Exception as e:
+        log_warning(f"Could not parse args for {function_name}: {e}", exc_info=True)
+        return FunctionSchema(description=description, parameters=None, required=[])
+
+
+def get_function_schema(c: Callable, strict: bool = False, typed_param_descriptions: bool = True) -> FunctionSchema:
+    """Returns the schema of a callable, compiled once per process.
+
+    The returned schema is shared, copy its parameters before modifying them.
+    """
+    # The schema of a bound method doesn't include `self`, so it is cached separately from its function
+    key = (ismethod(c), strict, typed_param_descriptions)
+    owner = getattr(c, "__func__", c)
+    # Partials render their arguments in the description, so they are not shared
+    cacheable = not isinstance(c, partial)
+    if cacheable:
+        with _cache_lock:
+            try:
+                schema = _schema_cache.get(owner, {}).get(key)
+            except TypeError:
+                # The callable can't be weakly referenced
+                cacheable = False
+                schema = None
+        if schema is not None:
+            return schema
+
+    schema = _compile_function_schema(c, strict=strict, typed_param_descriptions=typed_param_descriptions)
+    if cacheable:
+        with _cache_lock:
+            _schema_cache.setdefault(owner, {})[key] = schema
+    return schema
+
+
+def get_validated_entrypoint(c: Callable) -> Callable:
+    """Wraps a callable with pydantic's validate_call, reusing the wrapper of module and class level functions."""
+    # Don't wrap async generator with validate_call or wrap an entrypoint twice
+    if isasyncgenfunction(c) or hasattr(c, "raw_function"):
+        return c
+
+    func = getattr(c, "__func__", c)
+    # Nested functions are created on every call, caching them would only keep them alive
+    cacheable = isfunction(func) and "<locals>" not in func.__qualname__
+    validated = _validated_entrypoint_cache.get(func) if cacheable else None
+    try:
+        if validated is None:
+            validated = validate_call(func, config=dict(arbitrary_types_allowed=True))  # type: ignore
+            if cacheable:
+                with _cache_lock:
+                    _validated_entrypoint_cache[func] = validated
+        if ismethod(c):
+            return MethodType(validated, c.__self__)
+        return validated
+    except Exception as e:
+        log_warning(f"Failed to add validate decorator to entrypoint: {e}")
+        return c
+
+
 class Function(BaseModel):
     """Model for storing functions that can be called by an agent."""
 
@@ -74,191 +227,101 @@ class Function(BaseModel):
     # A list of hooks to run around tool calls.
     tool_hooks: Optional[List[Callable]] = None
 
+    # Parallel execution configuration, see Model.run_tools_in_parallel
+    # If False, the function never runs at the same time as other tool calls.
+    parallel_safe: bool = True
+    # Maximum number of calls of this function that run at the same time.
+    max_concurrency: Optional[int] = None
+    # Seconds after which a call of this function is reported as failed.
+    timeout: Optional[float] = None
+    # If False, identical calls of this function are never deduplicated, see Agent.deduplicate_tool_calls.
+    # Set this for functions with side effects.
+    deduplicate: bool = True
+
     # Caching configuration
     cache_results: bool = False
     cache_dir: Optional[str] = None
     cache_ttl: int = 3600
+    # The ToolCache to store results in, e.g. an InMemoryToolCache or RedisToolCache.
+    # Defaults to a DiskToolCache in cache_dir if cache_results is True.
+    cache: Optional[Any] = None
 
     # --*-- FOR INTERNAL USE ONLY --*--
     # The agent that the function is associated with
     _agent: Optional[Any] = None
     # The team that the function is associated with
     _team: Optional[Any] = None
+    # The strict flag the entrypoint was last processed with
+    _processed_strict: Optional[bool] = None
 
     def to_dict(self) -> Dict[str, Any]:
         return self.model_dump(exclude_none=True, include={"name", "description", "parameters", "strict"})
 
+    def get_payload(self, provider: str, build: Callable[["Function"], Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Returns the tool payload of this function for a model provider. Payloads are built once per provider and
+        schema for the whole process, so they are shared by copies of the function and rebuilt when the name,
+        description, parameters or strict flag change.
+        """
+        schema = json.dumps(
+            [self.name, self.description, self.parameters, self.strict], sort_keys=True, ensure_ascii=False, default=str
+        )
+        key = (provider, schema)
+        with _cache_lock:
+            payload = _payload_cache.get(key)
+            if payload is not None:
+                _payload_cache.move_to_end(key)
+                return payload
+
+        payload = build(self)
+        with _cache_lock:
+            _payload_cache[key] = payload
+            if len(_payload_cache) > _PAYLOAD_CACHE_SIZE:
+                _payload_cache.popitem(last=False)
+        return payload
+
     @classmethod
     def from_callable(cls, c: Callable, strict: bool = False) -> "Function":
-        from inspect import getdoc, isasyncgenfunction, signature
-
-        from agno.utils.json_schema import get_json_schema
-
-        function_name = c.__name__
-        parameters = {"type": "object", "properties": {}, "required": []}
-        try:
-            sig = signature(c)
-            type_hints = get_type_hints(c)
-
-            # If function has an the agent argument, remove the agent parameter from the type hints
-            if "agent" in sig.parameters:
-                del type_hints["agent"]
-            if "team" in sig.parameters:
-                del type_hints["team"]
-            # log_info(f"Type hints for {function_name}: {type_hints}")
-
-            # Filter out return type and only process parameters
-            param_type_hints = {
-                name: type_hints.get(name)
-                for name in sig.parameters
-                if name != "return" and name not in ["agent", "team"]
-            }
-
-            # Parse docstring for parameters
-            param_descriptions: Dict[str, Any] = {}
-            if docstring := getdoc(c):
-                parsed_doc = parse(docstring)
-                param_docs = parsed_doc.params
-
-                if param_docs is not None:
-                    for param in param_docs:
-                        param_name = param.arg_name
-                        param_type = param.type_name
-                        if param_type is None:
-                            param_descriptions[param_name] = param.description
-                        else:
-                            param_descriptions[param_name] = f"({param_type}) {param.description}"
-
-            # Get JSON schema for parameters only
-            parameters = get_json_schema(
-                type_hints=param_type_hints, param_descriptions=param_descriptions, strict=strict
-            )
-
-            # If strict=True mark all fields as required
-            # See: https://platform.openai.com/docs/guides/structured-outputs/supported-schemas#all-fields-must-be-required
-            if strict:
-                parameters["required"] = [name for name in parameters["properties"] if name not in ["agent", "team"]]
-            else:
-                # Mark a field as required if it has no default value
-                parameters["required"] = [
-                    name
-                    for name, param in sig.parameters.items()
-                    if param.default == param.empty and name != "self" and name not in ["agent", "team"]
-                ]
-
-            # log_debug(f"JSON schema for {function_name}: {parameters}")
-        except Exception as e:
-            log_warning(f"Could not parse args for {function_name}: {e}", exc_info=True)
-
-        # Don't wrap async generator with validate_call
-        if isasyncgenfunction(c):
-            entrypoint = c
-        else:
-            entrypoint = validate_call(c, config=dict(arbitrary_types_allowed=True))  # type: ignore
+        schema = get_function_schema(c, strict=strict, typed_param_descriptions=False)
         return cls(
-            name=function_name,
-            description=get_entrypoint_docstring(entrypoint=c),
-            parameters=parameters,
-            entrypoint=entrypoint,
+            name=c.__name__,
+            description=schema.description,
+            parameters=deepcopy(schema.parameters) if schema.parameters is not None else _default_parameters(),
+            entrypoint=get_validated_entrypoint(c),
         )
 
     def process_entrypoint(self, strict: bool = False):
         """Process the entrypoint and make it ready for use by an agent."""
-        from inspect import getdoc, isasyncgenfunction, signature
-
-        from agno.utils.json_schema import get_json_schema
-
         if self.skip_entrypoint_processing:
             return
 
         if self.entrypoint is None:
             return
 
-        parameters = {"type": "object", "properties": {}, "required": []}
+        # Functions are processed again when they are added to a model, skip them if nothing changed
+        if self._processed_strict is not None and self._processed_strict == strict:
+            return
 
-        params_set_by_user = False
         # If the user set the parameters (i.e. they are different from the default), we should keep them
-        if self.parameters != parameters:
-            params_set_by_user = True
-
-        try:
-            sig = signature(self.entrypoint)
-            type_hints = get_type_hints(self.entrypoint)
-
-            # If function has an the agent argument, remove the agent parameter from the type hints
-            if "agent" in sig.parameters:
-                del type_hints["agent"]
-            if "team" in sig.parameters:
-                del type_hints["team"]
-            # log_info(f"Type hints for {self.name}: {type_hints}")
-
-            # Filter out return type and only process parameters
-            param_type_hints = {
-                name: type_hints.get(name)
-                for name in sig.parameters
-                if name != "return" and name not in ["agent", "team"]
-            }
-
-            # Parse docstring for parameters
-            param_descriptions = {}
-            if docstring := getdoc(self.entrypoint):
-                parsed_doc = parse(docstring)
-                param_docs = parsed_doc.params
-
-                if param_docs is not None:
-                    for param in param_docs:
-                        param_name = param.arg_name
-                        param_type = param.type_name
-
-                        # TODO: We should use type hints first, then map param types in docs to json schema types.
-                        # This is temporary to not lose information
-                        param_descriptions[param_name] = f"({param_type}) {param.description}"
-
-            # Get JSON schema for parameters only
-            parameters = get_json_schema(
-                type_hints=param_type_hints, param_descriptions=param_descriptions, strict=strict
-            )
+        params_set_by_user = self.parameters != _default_parameters()
 
-            # If strict=True mark all fields as required
-            # See: https://platform.openai.com/docs/guides/structured-outputs/supported-schemas#all-fields-must-be-required
+        schema = get_function_schema(self.entrypoint, strict=strict)
+        if schema.parameters is not None and params_set_by_user:
+            self.parameters["additionalProperties"] = False
             if strict:
-                parameters["required"] = [name for name in parameters["properties"] if name not in ["agent", "team"]]
+                self.parameters["required"] = [
+                    name for name in self.parameters["properties"] if name not in ["agent", "team"]
+                ]
             else:
                 # Mark a field as required if it has no default value
-                parameters["required"] = [
-                    name
-                    for name, param in sig.parameters.items()
-                    if param.default == param.empty and name != "self" and name not in ["agent", "team"]
-                ]
+                self.parameters["required"] = list(schema.required)
 
-            if params_set_by_user:
-                self.parameters["additionalProperties"] = False
-                if strict:
-                    self.parameters["required"] = [
-                        name for name in self.parameters["properties"] if name not in ["agent", "team"]
-                    ]
-                else:
-                    # Mark a field as required if it has no default value
-                    self.parameters["required"] = [
-                        name
-                        for name, param in sig.parameters.items()
-                        if param.default == param.empty and name != "self" and name not in ["agent", "team"]
-                    ]
-
-            # log_debug(f"JSON schema for {self.name}: {parameters}")
-        except Exception as e:
-            log_warning(f"Could not parse args for {self.name}: {e}", exc_info=True)
-
-        self.description = self.description or get_entrypoint_docstring(self.entrypoint)
+        self.description = self.description or schema.description
         if not params_set_by_user:
-            self.parameters = parameters
+            self.parameters = deepcopy(schema.parameters) if schema.parameters is not None else _default_parameters()
 
-        try:
-            # Don't wrap async generator with validate_call
-            if not isasyncgenfunction(self.entrypoint):
-                self.entrypoint = validate_call(self.entrypoint, config=dict(arbitrary_types_allowed=True))  # type: ignore
-        except Exception as e:
-            log_warning(f"Failed to add validate decorator to entrypoint: {e}")
+        self.entrypoint = get_validated_entrypoint(self.entrypoint)
+        self._processed_strict = strict
 
     def get_type_name(self, t: Type[T]):
         name = str(t)
@@ -296,69 +359,24 @@ class Function(BaseModel):
             return json.dumps(function_info, indent=2)
         return None
 
-    def _get_cache_key(self, entrypoint_args: Dict[str, Any], call_args: Optional[Dict[str, Any]] = None) -> str:
-        """Generate a cache key based on function name and arguments."""
-        from hashlib import md5
-
-        copy_entrypoint_args = entrypoint_args.copy()
-        # Remove agent from entrypoint_args
-        if "agent" in copy_entrypoint_args:
-            del copy_entrypoint_args["agent"]
-        if "team" in copy_entrypoint_args:
-            del copy_entrypoint_args["team"]
-        args_str = str(copy_entrypoint_args)
-
-        kwargs_str = str(sorted((call_args or {}).items()))
-        key_str = f"{self.name}:{args_str}:{kwargs_str}"
-        return md5(key_str.encode()).hexdigest()
-
-    def _get_cache_file_path(self, cache_key: str) -> str:
-        """Get the full path for the cache file."""
-        from pathlib import Path
-        from tempfile import gettempdir
-
-        base_cache_dir = self.cache_dir or Path(gettempdir()) / "agno_cache"
-        func_cache_dir = Path(base_cache_dir) / "functions" / self.name
-        func_cache_dir.mkdir(parents=True, exist_ok=True)
-        return str(func_cache_dir / f"{cache_key}.json")
-
-    def _get_cached_result(self, cache_file: str) -> Optional[Any]:
-        """Retrieve cached result if valid."""
-        import json
-        from pathlib import Path
-        from time import time
-
-        cache_path = Path(cache_file)
-        if not cache_path.exists():
-            return None
-
-        try:
-            with cache_path.open("r") as f:
-                cache_data = json.load(f)
-
-            timestamp = cache_data.get("timestamp", 0)
-            result = cache_data.get("result")
-
-            if time() - timestamp <= self.cache_ttl:
-                return result
+    def get_cache(self) -> Optional[ToolCache]:
+        """Returns the ToolCache results of this function are stored in, or None if results are not cached."""
+        if self.cache is not None:
+            return self.cache
+        if self.cache_results:
+            return get_disk_tool_cache(self.cache_dir)
+        return None
 
-            # Remove expired entry
-            cache_path.unlink()
-        except Exception as e:
-            log_error(f"Error reading cache: {e}")
 
-        return None
+_disk_tool_caches: Dict[Optional[str], DiskToolCache] = {}
 
-    def _save_to_cache(self, cache_file: str, result: Any):
-        """Save result to cache."""
-        import json
-        from time import time
 
-        try:
-            with open(cache_file, "w") as f:
-                json.dump({"timestamp": time(), "result": result}, f)
-        except Exception as e:
-            log_error(f"Error writing cache: {e}")
+def get_disk_tool_cache(cache_dir: Optional[str] = None) -> DiskToolCache:
+    """Returns the DiskToolCache shared by all functions caching their results in cache_dir."""
+    with _cache_lock:
+        if cache_dir not in _disk_tool_caches:
+            _disk_tool_caches[cache_dir] = DiskToolCache(cache_dir=cache_dir)
+        return _disk_tool_caches[cache_dir]
 
 
 class FunctionCall(BaseModel):
@@ -514,8 +532,28 @@ class FunctionCall(BaseModel):
         chain = reduce(create_hook_wrapper, hooks, execute_entrypoint)
         return chain
 
+    def _end_trace_span(self, span: Optional[Span], success: bool) -> None:
+        """End the span of the function call, or of its result if the result is a generator run as it is consumed."""
+        if span is None:
+            return
+        if isgenerator(self.result):
+            self.result = trace_iterator(self.result, span)
+        elif isasyncgen(self.result):
+            self.result = atrace_iterator(self.result, span)
+        else:
+            if not success:
+                span.set_status("ERROR", self.error)
+            span.end()
+
     def execute(self) -> bool:
         """Runs the function call."""
+        span = start_span(TOOL_CALL, {"agno.tool.name": self.function.name})
+        with phase(TOOL), use_span(span):
+            success = self._execute()
+        self._end_trace_span(span, success)
+        return success
+
+    def _execute(self) -> bool:
         from inspect import isgenerator
 
         if self.function.entrypoint is None:
@@ -530,10 +568,10 @@ class FunctionCall(BaseModel):
         entrypoint_args = self._build_entrypoint_args()
 
         # Check cache if enabled and not a generator function
-        if self.function.cache_results and not isgenerator(self.function.entrypoint):
-            cache_key = self.function._get_cache_key(entrypoint_args, self.arguments)
-            cache_file = self.function._get_cache_file_path(cache_key)
-            cached_result = self.function._get_cached_result(cache_file)
+        cache = self.function.get_cache()
+        cache_key = get_cache_key(self.arguments)
+        if cache is not None and not isgenerator(self.function.entrypoint):
+            cached_result = cache.get(self.function.name, cache_key)
 
             if cached_result is not None:
                 log_debug(f"Cache hit for: {self.get_call_str()}")
@@ -559,10 +597,8 @@ class FunctionCall(BaseModel):
             else:
                 self.result = result
                 # Only cache non-generator results
-                if self.function.cache_results:
-                    cache_key = self.function._get_cache_key(entrypoint_args, self.arguments)
-                    cache_file = self.function._get_cache_file_path(cache_key)
-                    self.function._save_to_cache(cache_file, self.result)
+                if cache is not None:
+                    cache.set(self.function.name, cache_key, self.result, ttl=self.function.cache_ttl)
 
             function_call_success = True
 
@@ -699,6 +735,13 @@ class FunctionCall(BaseModel):
 
     async def aexecute(self) -> bool:
         """Runs the function call asynchronously."""
+        span = start_span(TOOL_CALL, {"agno.tool.name": self.function.name})
+        with phase(TOOL), use_span(span):
+            success = await self._aexecute()
+        self._end_trace_span(span, success)
+        return success
+
+    async def _aexecute(self) -> bool:
         from inspect import isasyncgen, isasyncgenfunction, iscoroutinefunction, isgenerator
 
         if self.function.entrypoint is None:
@@ -716,12 +759,10 @@ class FunctionCall(BaseModel):
         entrypoint_args = self._build_entrypoint_args()
 
         # Check cache if enabled and not a generator function
-        if self.function.cache_results and not (
-            isasyncgen(self.function.entrypoint) or isgenerator(self.function.entrypoint)
-        ):
-            cache_key = self.function._get_cache_key(entrypoint_args, self.arguments)
-            cache_file = self.function._get_cache_file_path(cache_key)
-            cached_result = self.function._get_cached_result(cache_file)
+        cache = self.function.get_cache()
+        cache_key = get_cache_key(self.arguments)
+        if cache is not None and not (isasyncgen(self.function.entrypoint) or isgenerator(self.function.entrypoint)):
+            cached_result = await cache.aget(self.function.name, cache_key)
             if cached_result is not None:
                 log_debug(f"Cache hit for: {self.get_call_str()}")
                 self.result = cached_result
@@ -746,10 +787,8 @@ class FunctionCall(BaseModel):
                     self.result = await result
 
             # Only cache if not a generator
-            if self.function.cache_results and not (isgenerator(self.result) or isasyncgen(self.result)):
-                cache_key = self.function._get_cache_key(entrypoint_args, self.arguments)
-                cache_file = self.function._get_cache_file_path(cache_key)
-                self.function._save_to_cache(cache_file, self.result)
+            if cache is not None and not (isgenerator(self.result) or isasyncgen(self.result)):
+                await cache.aset(self.function.name, cache_key, self.result, ttl=self.function.cache_ttl)
 
             function_call_success = True
 
@@ -0,0 +1,122 @@
+import asyncio
+from inspect import isasyncgen, isasyncgenfunction, isgenerator, isgeneratorfunction
+from threading import Event, Lock
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple, Union
+
+from agno.tools.cache.base import get_cache_key
+from agno.tools.function import FunctionCall
+from agno.utils.log import log_debug
+
+MemoKey = Tuple[str, str]
+
+
+class ToolCallMemo:
+    """Results of the tool calls of a run (or session), keyed by function name and canonical arguments.
+
+    An identical tool call reuses the result of the first successful call instead of running again, and identical
+    calls running at the same time wait for a single execution (single-flight).
+    Calls of functions with Function.deduplicate=False and of generator functions always run.
+    """
+
+    def __init__(self):
+        self.hits: int = 0
+        self._results: Dict[MemoKey, Any] = {}
+        self._lock = Lock()
+        # Identical calls that are running, in a thread or in an event loop
+        self._running: Dict[MemoKey, Union[Event, asyncio.Event]] = {}
+
+    def __len__(self) -> int:
+        return len(self._results)
+
+    @staticmethod
+    def get_key(function_call: FunctionCall) -> Optional[MemoKey]:
+        """Returns the key of a function call, or None if its result can't be reused."""
+        function = function_call.function
+        if not function.deduplicate:
+            return None
+        if isgeneratorfunction(function.entrypoint) or isasyncgenfunction(function.entrypoint):
+            return None
+        return function.name, get_cache_key(function_call.arguments)
+
+    def _reuse(self, key: MemoKey, function_call: FunctionCall) -> bool:
+        """Set the memoized result on the function call, returns False if there is none. Requires the lock."""
+        if key not in self._results:
+            return False
+        function_call.result = self._results[key]
+        self.hits += 1
+        log_debug(f"Reusing the result of an identical call: {function_call.get_call_str()}")
+        return True
+
+    def _record(self, key: MemoKey, function_call: FunctionCall, success: bool) -> None:
+        result = function_call.result
+        if success and function_call.error is None and not (isgenerator(result) or isasyncgen(result)):
+            self._results[key] = result
+
+    def execute(self, function_call: FunctionCall, execute: Callable[[], Any]) -> Any:
+        """Runs execute() for the function call unless an identical call already ran or is running in a thread."""
+        key = self.get_key(function_call)
+        if key is None:
+            return execute()
+
+        while True:
+            with self._lock:
+                if self._reuse(key, function_call):
+                    return True
+                running = self._running.get(key)
+                if running is None:
+                    done = Event()
+                    self._running[key] = done
+            if running is None:
+                break
+            if not isinstance(running, Event):
+                # The identical call is running in an event loop, which can't be waited for from this thread
+                return execute()
+            # Wait for the identical call, and run this call if it failed
+            running.wait()
+
+        try:
+            success = execute()
+            with self._lock:
+                self._record(key, function_call, success is True)
+            return success
+        finally:
+            with self._lock:
+                self._running.pop(key, None)
+            done.set()
+
+    async def aexecute(self, function_call: FunctionCall, execute: Callable[[], Awaitable[Any]]) -> Any:
+        """Awaits execute() for the function call unless an identical call already ran or is running."""
+        key = self.get_key(function_call)
+        if key is None:
+            return await execute()
+
+        while True:
+            with self._lock:
+                if self._reuse(key, function_call):
+                    return True
+                running = self._running.get(key)
+                if running is None:
+                    done = asyncio.Event()
+                    self._running[key] = done
+            if running is None:
+                break
+            # Wait for the identical call, and run this call if it failed
+            if isinstance(running, asyncio.Event):
+                await running.wait()
+            else:
+                await asyncio.to_thread(running.wait)
+
+        try:
+            success = await execute()
+            with self._lock:
+                self._record(key, function_call, success is True)
+            return success
+        finally:
+            with self._lock:
+                self._running.pop(key, None)
+            done.set()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._results.clear()
+            self.hits = 0
@@ -1,6 +1,7 @@
 from collections import OrderedDict
 from typing import Any, Callable, Dict, List, Optional
 
+from agno.tools.cache.base import ToolCache
 from agno.tools.function import Function
 from agno.utils.log import log_debug, logger
 
@@ -17,6 +18,7 @@ class Toolkit:
         cache_results: bool = False,
         cache_ttl: int = 3600,
         cache_dir: Optional[str] = None,
+        cache: Optional[ToolCache] = None,
         auto_register: bool = True,
     ):
         """Initialize a new Toolkit.
@@ -31,6 +33,7 @@ class Toolkit:
             cache_results (bool): Enable in-memory caching of function results.
             cache_ttl (int): Time-to-live for cached results in seconds.
             cache_dir (Optional[str]): Directory to store cache files. Defaults to system temp dir.
+            cache (Optional[ToolCache]): Cache to store results in instead of cache_dir, e.g. an InMemoryToolCache.
             auto_register (bool): Whether to automatically register all methods in the class.
         """
         self.name: str = name
@@ -58,6 +61,7 @@ class Toolkit:
         self.cache_results: bool = cache_results
         self.cache_ttl: int = cache_ttl
         self.cache_dir: Optional[str] = cache_dir
+        self.cache: Optional[ToolCache] = cache
 
         # Automatically register all methods if auto_register is True
         if auto_register and self.tools:
@@ -93,6 +97,7 @@ class Toolkit:
                 cache_results=self.cache_results,
                 cache_dir=self.cache_dir,
                 cache_ttl=self.cache_ttl,
+                cache=self.cache,
             )
             self.functions[f.name] = f
             log_debug(f"Function: {f.name} registered with {self.name}")
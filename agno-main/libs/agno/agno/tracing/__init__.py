@@ -0,0 +1,29 @@
+from agno.tracing.collector import InMemorySpanCollector
+from agno.tracing.span import Span, SpanEvent, SpanProcessor
+from agno.tracing.tracer import (
+    atrace_iterator,
+    disable_tracing,
+    enable_tracing,
+    get_current_span,
+    is_tracing_enabled,
+    start_span,
+    trace_iterator,
+    trace_span,
+    use_span,
+)
+
+__all__ = [
+    "InMemorySpanCollector",
+    "Span",
+    "SpanEvent",
+    "SpanProcessor",
+    "atrace_iterator",
+    "disable_tracing",
+    "enable_tracing",
+    "get_current_span",
+    "is_tracing_enabled",
+    "start_span",
+    "trace_iterator",
+    "trace_span",
+    "use_span",
+]
@@ -0,0 +1,44 @@
+from collections import deque
+from threading import Lock
+from typing import Deque, Dict, List, Optional
+
+from agno.tracing.span import Span, SpanProcessor
+
+
+class InMemorySpanCollector(SpanProcessor):
+    """Collects the ended spans in memory, to inspect where the time of runs goes without any tracing backend."""
+
+    def __init__(self, max_spans: Optional[int] = 10_000):
+        # The oldest spans are dropped once max_spans spans are collected
+        self._spans: Deque[Span] = deque(maxlen=max_spans)
+        self._lock = Lock()
+
+    def on_end(self, span: Span) -> None:
+        with self._lock:
+            self._spans.append(span)
+
+    def get_spans(self, name: Optional[str] = None, trace_id: Optional[str] = None) -> List[Span]:
+        """Returns the collected spans in the order they ended, optionally filtered by name and trace."""
+        with self._lock:
+            spans = list(self._spans)
+        return [
+            span
+            for span in spans
+            if (name is None or span.name == name) and (trace_id is None or span.trace_id == trace_id)
+        ]
+
+    def get_children(self, span: Span) -> List[Span]:
+        """Returns the collected child spans of a span, in the order they started."""
+        children = [child for child in self.get_spans(trace_id=span.trace_id) if child.parent_span_id == span.span_id]
+        return sorted(children, key=lambda child: child.start_time)
+
+    def get_durations(self, trace_id: Optional[str] = None) -> Dict[str, float]:
+        """Returns the total duration in seconds of the collected spans of each name."""
+        durations: Dict[str, float] = {}
+        for span in self.get_spans(trace_id=trace_id):
+            durations[span.name] = durations.get(span.name, 0.0) + (span.duration or 0.0)
+        return durations
+
+    def clear(self) -> None:
+        with self._lock:
+            self._spans.clear()
@@ -0,0 +1,53 @@
+from threading import Lock
+from typing import Any, Dict, Optional
+
+from agno.tracing.span import Span, SpanProcessor
+
+try:
+    from opentelemetry import trace
+    from opentelemetry.trace import Status, StatusCode
+except ImportError:
+    raise ImportError("`opentelemetry-api` not installed. Please install it using `pip install opentelemetry-api`")
+
+
+class OpenTelemetrySpanProcessor(SpanProcessor):
+    """
+    Sends the spans to an OpenTelemetry tracer, to export them with the exporters of the OpenTelemetry SDK.
+
+    Root spans are children of the OpenTelemetry span current when they start, so runs are traced as part of the
+    request that started them.
+    """
+
+    def __init__(self, tracer: Optional[Any] = None, tracer_provider: Optional[Any] = None):
+        self.tracer = tracer or trace.get_tracer("agno", tracer_provider=tracer_provider)
+        # The OpenTelemetry spans of the spans that have not ended, by span id
+        self._spans: Dict[str, Any] = {}
+        self._lock = Lock()
+
+    def on_start(self, span: Span) -> None:
+        with self._lock:
+            parent = self._spans.get(span.parent_span_id) if span.parent_span_id is not None else None
+        context = trace.set_span_in_context(parent) if parent is not None else None
+        otel_span = self.tracer.start_span(
+            span.name, context=context, attributes=span.attributes, start_time=span.start_time
+        )
+        with self._lock:
+            self._spans[span.span_id] = otel_span
+
+    def on_end(self, span: Span) -> None:
+        with self._lock:
+            otel_span = self._spans.pop(span.span_id, None)
+        if otel_span is None:
+            return
+        otel_span.set_attributes(span.attributes)
+        for event in span.events:
+            otel_span.add_event(event.name, attributes=event.attributes, timestamp=event.timestamp)
+        if span.status == "ERROR":
+            otel_span.set_status(Status(StatusCode.ERROR, span.status_description))
+        elif span.status == "OK":
+            otel_span.set_status(Status(StatusCode.OK))
+        otel_span.end(end_time=span.end_time)
+
+    def shutdown(self) -> None:
+        with self._lock:
+            self._spans.clear()
@@ -0,0 +1,114 @@
+from dataclasses import dataclass, field
+from secrets import token_hex
+from threading import Lock
+from time import time_ns
+from typing import Any, Dict, List, Optional, Sequence
+
+
+@dataclass
+class SpanEvent:
+    name: str
+    # Nanoseconds since the epoch
+    timestamp: int = field(default_factory=time_ns)
+    attributes: Dict[str, Any] = field(default_factory=dict)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"name": self.name, "timestamp": self.timestamp, "attributes": self.attributes}
+
+
+class SpanProcessor:
+    """Receives the spans when they start and end, e.g. to collect or export them."""
+
+    def on_start(self, span: "Span") -> None:
+        pass
+
+    def on_end(self, span: "Span") -> None:
+        pass
+
+    def shutdown(self) -> None:
+        pass
+
+
+@dataclass
+class Span:
+    """
+    A timed operation of a run. The ids, timestamps, status and exception events follow OpenTelemetry, so spans can
+    be exported to any OpenTelemetry backend.
+    """
+
+    name: str
+    # 32 hex characters, shared by the spans of a trace
+    trace_id: str = field(default_factory=lambda: token_hex(16))
+    # 16 hex characters
+    span_id: str = field(default_factory=lambda: token_hex(8))
+    parent_span_id: Optional[str] = None
+    # Nanoseconds since the epoch
+    start_time: int = field(default_factory=time_ns)
+    end_time: Optional[int] = None
+    attributes: Dict[str, Any] = field(default_factory=dict)
+    events: List[SpanEvent] = field(default_factory=list)
+    # One of "UNSET", "OK" or "ERROR"
+    status: str = "UNSET"
+    status_description: Optional[str] = None
+
+    processors: Sequence[SpanProcessor] = field(default=(), repr=False, compare=False)
+    _lock: Lock = field(default_factory=Lock, init=False, repr=False, compare=False)
+
+    @property
+    def is_recording(self) -> bool:
+        return self.end_time is None
+
+    @property
+    def duration(self) -> Optional[float]:
+        """The duration of the span in seconds, None while it is recording."""
+        if self.end_time is None:
+            return None
+        return (self.end_time - self.start_time) / 1e9
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        if self.is_recording and value is not None:
+            self.attributes[key] = value
+
+    def set_attributes(self, attributes: Dict[str, Any]) -> None:
+        for key, value in attributes.items():
+            self.set_attribute(key, value)
+
+    def add_event(self, name: str, attributes: Optional[Dict[str, Any]] = None) -> None:
+        if self.is_recording:
+            self.events.append(SpanEvent(name=name, attributes=attributes or {}))
+
+    def set_status(self, status: str, description: Optional[str] = None) -> None:
+        if self.is_recording:
+            self.status = status
+            self.status_description = description
+
+    def record_exception(self, exception: BaseException) -> None:
+        self.add_event(
+            "exception",
+            {"exception.type": type(exception).__name__, "exception.message": str(exception)},
+        )
+        self.set_status("ERROR", f"{type(exception).__name__}: {exception}")
+
+    def end(self, end_time: Optional[int] = None) -> None:
+        """End the span and send it to the span processors. Ending a span more than once has no effect."""
+        with self._lock:
+            if self.end_time is not None:
+                return
+            self.end_time = end_time or time_ns()
+        for processor in self.processors:
+            processor.on_end(self)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "trace_id": self.trace_id,
+            "span_id": self.span_id,
+            "parent_span_id": self.parent_span_id,
+            "start_time": self.start_time,
+            "end_time": self.end_time,
+            "duration": self.duration,
+            "attributes": self.attributes,
+            "events": [event.to_dict() for event in self.events],
+            "status": self.status,
+            "status_description": self.status_description,
+        }
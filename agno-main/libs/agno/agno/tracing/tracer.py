@@ -0,0 +1,191 @@
+"""
+Tracing of Agent, Team and Workflow runs.
+
+Spans are only created once tracing is enabled with span processors, e.g. an InMemorySpanCollector or an
+OpenTelemetrySpanProcessor. While tracing is disabled, a span costs a single global lookup.
+"""
+
+from contextlib import AbstractContextManager, contextmanager, nullcontext
+from contextvars import ContextVar, Token
+from time import time_ns
+from typing import Any, AsyncIterator, Dict, Iterator, Optional, Tuple, TypeVar
+
+from agno.tracing.span import Span, SpanProcessor
+
+T = TypeVar("T")
+
+# Span names
+AGENT_RUN = "agent.run"
+TEAM_RUN = "team.run"
+SYSTEM_MESSAGE = "system_message"
+HISTORY = "history"
+KNOWLEDGE_SEARCH = "knowledge.search"
+MODEL_RESPONSE = "model.response"
+TOOL_CALL = "tool.call"
+MEMORY_UPDATE = "memory.update"
+STORAGE_READ = "storage.read"
+STORAGE_WRITE = "storage.write"
+
+_processors: Tuple[SpanProcessor, ...] = ()
+# Returned instead of a span context while tracing is disabled
+_no_span: AbstractContextManager = nullcontext()
+# The span started last in the current context, the parent of the spans started in it
+_current_span: ContextVar[Optional[Span]] = ContextVar("agno_current_span", default=None)
+
+
+def enable_tracing(*processors: SpanProcessor) -> None:
+    """Start tracing runs, sending the spans to the given span processors."""
+    global _processors
+    _processors = _processors + tuple(processor for processor in processors if processor not in _processors)
+
+
+def disable_tracing() -> None:
+    """Stop tracing runs and shut down the span processors."""
+    global _processors
+    processors, _processors = _processors, ()
+    for processor in processors:
+        processor.shutdown()
+
+
+def is_tracing_enabled() -> bool:
+    return bool(_processors)
+
+
+def get_current_span() -> Optional[Span]:
+    return _current_span.get()
+
+
+def start_span(name: str, attributes: Optional[Dict[str, Any]] = None) -> Optional[Span]:
+    """
+    Start a span, child of the current span. The span is not made current, see use_span.
+
+    Returns:
+        The span, or None if tracing is disabled.
+    """
+    processors = _processors
+    if not processors:
+        return None
+
+    parent = _current_span.get()
+    span = Span(name=name, processors=processors)
+    if parent is not None:
+        span.trace_id = parent.trace_id
+        span.parent_span_id = parent.span_id
+    if attributes:
+        span.set_attributes(attributes)
+    for processor in processors:
+        processor.on_start(span)
+    return span
+
+
+def _reset_current_span(token: Token) -> None:
+    try:
+        _current_span.reset(token)
+    except ValueError:
+        # The token was created in another context, e.g. for a generator closed by the garbage collector
+        pass
+
+
+def use_span(span: Optional[Span], end_on_exit: bool = False) -> AbstractContextManager:
+    """
+    Make the span the parent of the spans started in this context. An exception raised in it is recorded on the
+    span and ends the span.
+    """
+    if span is None:
+        return _no_span
+    return _use_span(span, end_on_exit)
+
+
+@contextmanager
+def _use_span(span: Span, end_on_exit: bool) -> Iterator[Span]:
+    token = _current_span.set(span)
+    try:
+        yield span
+    except BaseException as e:
+        span.record_exception(e)
+        span.end()
+        raise
+    finally:
+        _reset_current_span(token)
+        if end_on_exit:
+            span.end()
+
+
+def trace_span(name: str, attributes: Optional[Dict[str, Any]] = None) -> AbstractContextManager:
+    """Trace the code run in this context in a new span. The context is None if tracing is disabled."""
+    if not _processors:
+        return _no_span
+    return use_span(start_span(name, attributes), end_on_exit=True)
+
+
+def trace_iterator(
+    iterator: Iterator[T],
+    span: Optional[Span],
+    first_item_attribute: Optional[str] = None,
+    end_on_exit: bool = True,
+) -> Iterator[T]:
+    """
+    Trace an iterator, e.g. a streamed response, in a span. The span is current while the iterator produces an item,
+    not while the consumer handles it, and ends when the iterator is exhausted or closed.
+
+    Args:
+        iterator: The iterator to trace.
+        span: The span started for the iterator. If None, the iterator is returned as is.
+        first_item_attribute: Set this attribute of the span to the time in seconds until the first item.
+        end_on_exit: End the span when the iterator is exhausted or closed.
+    """
+    if span is None:
+        return iterator
+    return _traced_iterator(iter(iterator), span, first_item_attribute, end_on_exit)
+
+
+def _traced_iterator(
+    iterator: Iterator[T], span: Span, first_item_attribute: Optional[str], end_on_exit: bool
+) -> Iterator[T]:
+    first_item = True
+    try:
+        while True:
+            with use_span(span):
+                try:
+                    item = next(iterator)
+                except StopIteration:
+                    return
+            if first_item and first_item_attribute is not None:
+                span.set_attribute(first_item_attribute, (time_ns() - span.start_time) / 1e9)
+            first_item = False
+            yield item
+    finally:
+        if end_on_exit:
+            span.end()
+
+
+def atrace_iterator(
+    iterator: AsyncIterator[T],
+    span: Optional[Span],
+    first_item_attribute: Optional[str] = None,
+    end_on_exit: bool = True,
+) -> AsyncIterator[T]:
+    """Trace an async iterator in a span, see trace_iterator."""
+    if span is None:
+        return iterator
+    return _atraced_iterator(iterator.__aiter__(), span, first_item_attribute, end_on_exit)
+
+
+async def _atraced_iterator(
+    iterator: AsyncIterator[T], span: Span, first_item_attribute: Optional[str], end_on_exit: bool
+) -> AsyncIterator[T]:
+    first_item = True
+    try:
+        while True:
+            with use_span(span):
+                try:
+                    item = await iterator.__anext__()
+                except StopAsyncIteration:
+                    return
+            if first_item and first_item_attribute is not None:
+                span.set_attribute(first_item_attribute, (time_ns() - span.start_time) / 1e9)
+            first_item = False
+            yield item
+    finally:
+        if end_on_exit:
+            span.end()
@@ -0,0 +1,141 @@
+import asyncio
+import contextvars
+from concurrent.futures import ThreadPoolExecutor
+from queue import Queue
+from threading import Event
+from typing import Any, AsyncIterator, Callable, Dict, Iterator, List, Optional, Set, Tuple
+
+# A merged stream yields (index of the source, item, whether the source finished)
+MergedItem = Tuple[int, Any, bool]
+
+
+def merge_iterators(
+    sources: List[Callable[[], Iterator[Any]]], max_workers: Optional[int] = None
+) -> Iterator[MergedItem]:
+    """
+    Run each source iterator in a thread pool and yield their items as they arrive.
+
+    Yields (index, item, False) for every item of the source at index, and (index, None, True) once the source is
+    exhausted. An exception raised by a source is raised by this iterator. If the consumer stops early, e.g. by
+    closing this iterator, the sources are stopped after their current item and their threads are joined.
+
+    Args:
+        sources (List[Callable[[], Iterator[Any]]]): Functions returning the iterators to run, called in the threads.
+        max_workers (Optional[int]): Maximum number of sources run concurrently. Defaults to the number of sources.
+    """
+    if not sources:
+        return
+    queue: "Queue[Tuple[int, Any, bool, Optional[BaseException]]]" = Queue()
+    # Set when the consumer stopped, to stop the sources that are still running
+    stop = Event()
+
+    def drain(index: int, source: Callable[[], Iterator[Any]]) -> None:
+        if stop.is_set():
+            return
+        iterator = source()
+        try:
+            for item in iterator:
+                if stop.is_set():
+                    return
+                queue.put((index, item, False, None))
+        except BaseException as e:
+            queue.put((index, None, True, e))
+            return
+        finally:
+            # Let generators clean up in their own thread, e.g. when they are stopped early
+            close = getattr(iterator, "close", None)
+            if close is not None:
+                close()
+        queue.put((index, None, True, None))
+
+    executor = ThreadPoolExecutor(max_workers=max_workers or len(sources), thread_name_prefix="agno-merge")
+    try:
+        for index, source in enumerate(sources):
+            # Each thread runs in a copy of the caller's context, e.g. to keep the active logger
+            executor.submit(contextvars.copy_context().run, drain, index, source)
+        remaining = len(sources)
+        while remaining > 0:
+            index, item, finished, error = queue.get()
+            if error is not None:
+                raise error
+            if finished:
+                remaining -= 1
+            yield index, item, finished
+    finally:
+        # Stop the other sources if the consumer stopped or a source failed, and wait for their threads
+        stop.set()
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+async def amerge_iterators(sources: List[AsyncIterator[Any]]) -> AsyncIterator[MergedItem]:
+    """
+    Consume each async iterator in a task and yield their items as they arrive, see merge_iterators.
+    """
+    if not sources:
+        return
+    queue: "asyncio.Queue[Tuple[int, Any, bool, Optional[BaseException]]]" = asyncio.Queue()
+
+    async def drain(index: int, source: AsyncIterator[Any]) -> None:
+        try:
+            async for item in source:
+                await queue.put((index, item, False, None))
+        except asyncio.CancelledError:
+            raise
+        except BaseException as e:
+            await queue.put((index, None, True, e))
+            return
+        await queue.put((index, None, True, None))
+
+    tasks = [asyncio.create_task(drain(index, source)) for index, source in enumerate(sources)]
+    try:
+        remaining = len(sources)
+        while remaining > 0:
+            index, item, finished, error = await queue.get()
+            if error is not None:
+                raise error
+            if finished:
+                remaining -= 1
+            yield index, item, finished
+    finally:
+        for task in tasks:
+            if not task.done():
+                task.cancel()
+
+
+class StreamSerializer:
+    """
+    Turns a merged stream into a stream where the items of each source are contiguous, without waiting for
+    all sources to finish: the first source to produce an item is streamed live while the items of the other
+    sources are buffered. When the live source finishes, the buffers of the finished sources are flushed and
+    the next source that is still running becomes live.
+    """
+
+    def __init__(self):
+        self.live: Optional[int] = None
+        self.buffers: Dict[int, List[Any]] = {}
+        self.finished: Set[int] = set()
+
+    def push(self, index: int, item: Any, finished: bool) -> List[Tuple[int, Any]]:
+        """Add an item of a merged stream and return the (index, item) pairs that can be emitted now."""
+        if self.live is None:
+            self.live = index
+        if index != self.live:
+            if finished:
+                self.finished.add(index)
+            else:
+                self.buffers.setdefault(index, []).append(item)
+            return []
+        if not finished:
+            return [(index, item)]
+
+        # The live source finished, flush the buffers of the finished sources
+        self.live = None
+        ready: List[Tuple[int, Any]] = []
+        for buffered_index in sorted(self.finished):
+            ready.extend((buffered_index, buffered_item) for buffered_item in self.buffers.pop(buffered_index, []))
+        self.finished.clear()
+        # Then stream the next running source that produced items
+        if self.buffers:
+            self.live = min(self.buffers)
+            ready.extend((self.live, buffered_item) for buffered_item in self.buffers.pop(self.live))
+        return ready
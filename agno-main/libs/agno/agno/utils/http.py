@@ -1,7 +1,10 @@
 import asyncio
+import atexit
 import logging
+from threading import Lock
 from time import sleep
-from typing import Optional
+from typing import Any, Dict, List, Optional, Set, Tuple, Union
+from weakref import WeakKeyDictionary
 
 import httpx
 
@@ -10,6 +13,9 @@ logger = logging.getLogger(__name__)
 DEFAULT_MAX_RETRIES = 3
 DEFAULT_BACKOFF_FACTOR = 2  # Exponential backoff: 1, 2, 4, 8...
 
+# Connection pool limits of the shared HTTP clients
+DEFAULT_HTTP_LIMITS = httpx.Limits(max_connections=1000, max_keepalive_connections=100, keepalive_expiry=30)
+
 
 def fetch_with_retry(
     url: str,
@@ -72,3 +78,241 @@ async def async_fetch_with_retry(
             raise
 
     raise httpx.RequestError(f"Failed to fetch {url} after {max_retries} attempts")
+
+
+class SharedHttpClient(httpx.Client):
+    """
+    An httpx.Client shared by the whole process, see get_http_client. Closing it, or leaving it as a context
+    manager, has no effect as other holders keep using it, the shared clients are closed by close_http_clients().
+    """
+
+    def __enter__(self) -> "SharedHttpClient":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        pass
+
+    def close(self) -> None:
+        pass
+
+    def close_shared(self) -> None:
+        super().close()
+
+
+class SharedAsyncHttpClient(httpx.AsyncClient):
+    """An httpx.AsyncClient shared by an event loop, see get_async_http_client and SharedHttpClient."""
+
+    # The event loop the client belongs to, None if it was created outside of a running loop
+    loop: Optional[asyncio.AbstractEventLoop] = None
+
+    async def __aenter__(self) -> "SharedAsyncHttpClient":
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        pass
+
+    async def aclose(self) -> None:
+        pass
+
+    async def aclose_shared(self) -> None:
+        await super().aclose()
+
+
+# Tasks closing async clients on a running event loop, referenced until they are done
+_closing_tasks: Set["asyncio.Task[None]"] = set()
+
+
+def close_async_client(client: httpx.AsyncClient, loop: Optional[asyncio.AbstractEventLoop] = None) -> None:
+    """
+    Close an async client from sync code, on the event loop its connections belong to.
+
+    Args:
+        client: The client to close.
+        loop: The event loop the client was used on, None if unknown.
+    """
+    aclose = client.aclose_shared if isinstance(client, SharedAsyncHttpClient) else client.aclose
+    try:
+        running_loop: Optional[asyncio.AbstractEventLoop] = asyncio.get_running_loop()
+    except RuntimeError:
+        running_loop = None
+    loop = loop or running_loop
+    try:
+        if loop is None:
+            asyncio.run(aclose())
+        elif loop.is_closed():
+            # The connections can only be closed on their loop, they are released with it
+            return
+        elif loop is running_loop:
+            task = loop.create_task(aclose())
+            _closing_tasks.add(task)
+            task.add_done_callback(_closing_tasks.discard)
+        elif loop.is_running():
+            asyncio.run_coroutine_threadsafe(aclose(), loop)
+        else:
+            loop.run_until_complete(aclose())
+    except Exception as e:
+        logger.debug(f"Failed to close async HTTP client: {e}")
+
+
+# Shared HTTP clients, keyed by base_url, proxy, TLS settings, HTTP/2 and pool limits.
+# Async clients are kept per event loop, as their connections can't be shared across loops.
+_http_clients: Dict[Tuple[Any, ...], SharedHttpClient] = {}
+_async_http_clients: "WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[Tuple[Any, ...], SharedAsyncHttpClient]]" = (
+    WeakKeyDictionary()
+)
+_async_http_clients_without_loop: Dict[Tuple[Any, ...], SharedAsyncHttpClient] = {}
+_http_clients_lock = Lock()
+_close_registered = False
+
+
+def is_http2_available() -> bool:
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def _get_client_key(
+    base_url: Optional[Union[str, httpx.URL]],
+    proxy: Optional[str],
+    verify: Any,
+    cert: Any,
+    http2: Optional[bool],
+    limits: Optional[httpx.Limits],
+) -> Tuple[Tuple[Any, ...], Dict[str, Any]]:
+    """Returns the registry key and the arguments of an httpx client."""
+    if http2 is None:
+        http2 = is_http2_available()
+    elif http2 and not is_http2_available():
+        raise ImportError("`h2` not installed. Please install it using `pip install 'httpx[http2]'`")
+    limits = limits or DEFAULT_HTTP_LIMITS
+
+    client_args: Dict[str, Any] = {"http2": http2, "limits": limits, "verify": verify}
+    if base_url is not None:
+        client_args["base_url"] = base_url
+    if proxy is not None:
+        client_args["proxy"] = proxy
+    if cert is not None:
+        client_args["cert"] = cert
+    key = (
+        str(base_url) if base_url is not None else None,
+        proxy,
+        verify,
+        cert,
+        http2,
+        (limits.max_connections, limits.max_keepalive_connections, limits.keepalive_expiry),
+    )
+    return key, client_args
+
+
+def _register_close() -> None:
+    global _close_registered
+    if not _close_registered:
+        atexit.register(close_http_clients)
+        _close_registered = True
+
+
+def get_http_client(
+    base_url: Optional[Union[str, httpx.URL]] = None,
+    proxy: Optional[str] = None,
+    verify: Any = True,
+    cert: Any = None,
+    http2: Optional[bool] = None,
+    limits: Optional[httpx.Limits] = None,
+) -> httpx.Client:
+    """Returns the httpx.Client shared by the whole process for these settings.
+
+    Sharing clients keeps their connections (and TLS sessions) alive across model instances and requests.
+    Closing a shared client has no effect, so no holder can break it for the others. The clients are closed when
+    the interpreter exits, or by close_http_clients().
+
+    Args:
+        base_url: Base URL of the requests, also used to keep separate connection pools per API.
+        proxy: URL of the proxy to route requests through.
+        verify: TLS verification, True, False, a CA bundle path or an ssl.SSLContext.
+        cert: Client certificate, a path or a (cert, key) tuple.
+        http2: Use HTTP/2 where the server supports it. Defaults to True if `h2` is installed.
+        limits: Connection pool limits. Defaults to DEFAULT_HTTP_LIMITS.
+    """
+    key, client_args = _get_client_key(base_url, proxy, verify, cert, http2, limits)
+    with _http_clients_lock:
+        client = _http_clients.get(key)
+        if client is None or client.is_closed:
+            client = SharedHttpClient(**client_args)
+            _http_clients[key] = client
+            _register_close()
+        return client
+
+
+def get_async_http_client(
+    base_url: Optional[Union[str, httpx.URL]] = None,
+    proxy: Optional[str] = None,
+    verify: Any = True,
+    cert: Any = None,
+    http2: Optional[bool] = None,
+    limits: Optional[httpx.Limits] = None,
+) -> httpx.AsyncClient:
+    """Returns the httpx.AsyncClient shared by the running event loop for these settings, see get_http_client.
+
+    Clients are closed by aclose_http_clients(), e.g. when an application shuts down, or close_http_clients().
+    """
+    key, client_args = _get_client_key(base_url, proxy, verify, cert, http2, limits)
+    try:
+        loop: Optional[asyncio.AbstractEventLoop] = asyncio.get_running_loop()
+    except RuntimeError:
+        loop = None
+    with _http_clients_lock:
+        if loop is None:
+            clients = _async_http_clients_without_loop
+        else:
+            clients = _async_http_clients.setdefault(loop, {})
+        client = clients.get(key)
+        if client is None or client.is_closed:
+            client = SharedAsyncHttpClient(**client_args)
+            client.loop = loop
+            clients[key] = client
+        return client
+
+
+def is_async_http_client_current(client: Any) -> bool:
+    """
+    Returns False if the client is a shared async client of another event loop than the running one, e.g. of a loop
+    closed by a previous asyncio.run(). Its connections can't be used on this loop, so the clients holding it, e.g.
+    the SDK clients of models, have to be built again around get_async_http_client().
+    """
+    if not isinstance(client, SharedAsyncHttpClient):
+        return True
+    try:
+        running_loop: Optional[asyncio.AbstractEventLoop] = asyncio.get_running_loop()
+    except RuntimeError:
+        running_loop = None
+    return client.loop is running_loop and not client.is_closed
+
+
+def close_http_clients() -> None:
+    """Close the shared HTTP clients, the async clients on the event loops they belong to."""
+    with _http_clients_lock:
+        clients = list(_http_clients.values())
+        _http_clients.clear()
+        async_clients: List[Tuple[Optional[asyncio.AbstractEventLoop], SharedAsyncHttpClient]] = [
+            (loop, client) for loop, loop_clients in _async_http_clients.items() for client in loop_clients.values()
+        ]
+        async_clients.extend((None, client) for client in _async_http_clients_without_loop.values())
+        _async_http_clients.clear()
+        _async_http_clients_without_loop.clear()
+    for client in clients:
+        client.close_shared()
+    for loop, async_client in async_clients:
+        close_async_client(async_client, loop)
+
+
+async def aclose_http_clients() -> None:
+    """Close the shared HTTP clients, including the async clients of the running event loop."""
+    with _http_clients_lock:
+        clients = list(_async_http_clients.pop(asyncio.get_running_loop(), {}).values())
+        clients.extend(_async_http_clients_without_loop.values())
+        _async_http_clients_without_loop.clear()
+    for client in clients:
+        await client.aclose_shared()
+    close_http_clients()
@@ -41,3 +41,12 @@ def get_text_from_message(message: Union[List, Dict, str, Message]) -> str:
     if isinstance(message, Message) and message.content is not None:
         return get_text_from_message(message.content)
     return ""
+
+
+def get_history_messages(messages: List[Message]) -> List[Message]:
+    """Returns the messages tagged as coming from history, without modifying the original messages.
+
+    The returned messages are shallow copies: content, media and tool payloads are shared with the originals
+    instead of being copied on every run.
+    """
+    return [message.model_copy(update={"from_history": True}) for message in messages]
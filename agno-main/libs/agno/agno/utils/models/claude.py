@@ -249,3 +249,28 @@ def format_messages(messages: List[Message]) -> Tuple[List[Dict[str, str]], str]
 
         chat_messages.append({"role": ROLE_MAP[message.role], "content": content})  # type: ignore
     return chat_messages, " ".join(system_messages)
+
+
+def format_system_blocks(messages: List[Message]) -> List[Dict[str, Any]]:
+    """
+    Format the system messages as text blocks, marking the static prefix of each message as a cache breakpoint.
+
+    Args:
+        messages (List[Message]): The list of messages to process.
+
+    Returns:
+        List[Dict[str, Any]]: The system text blocks, see https://docs.anthropic.com/en/docs/build-with-claude/prompt-caching
+    """
+    system_blocks: List[Dict[str, Any]] = []
+    for message in messages:
+        if message.role != "system" or not isinstance(message.content, str) or not message.content:
+            continue
+
+        cache_breakpoint = message.cache_breakpoint if message.cache_breakpoint is not None else len(message.content)
+        static_content = message.content[:cache_breakpoint].strip()
+        volatile_content = message.content[cache_breakpoint:].strip()
+        if static_content:
+            system_blocks.append({"type": "text", "text": static_content, "cache_control": {"type": "ephemeral"}})
+        if volatile_content:
+            system_blocks.append({"type": "text", "text": volatile_content})
+    return system_blocks
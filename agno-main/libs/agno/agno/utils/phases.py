@@ -0,0 +1,120 @@
+"""
+Hooks timing the phases of a run: model requests, tool calls and storage reads and writes.
+
+The time of each phase is recorded for the code running in `record_phases()`, e.g. by PerfEval to break down the
+run time of the function it measures. Outside of it, a phase costs a single context variable lookup.
+"""
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from threading import Lock
+from time import perf_counter
+from typing import AsyncIterator, Dict, Iterator, List, Optional, TypeVar
+
+T = TypeVar("T")
+
+MODEL = "model"
+TOOL = "tool"
+STORAGE = "storage"
+
+
+class PhaseRecorder:
+    """
+    The total time and number of calls of each phase. The time of a phase excludes the time of the phases nested in
+    it, e.g. the tool time of a team excludes the model time of the member agents it runs.
+    """
+
+    def __init__(self):
+        self.times: Dict[str, float] = {}
+        self.counts: Dict[str, int] = {}
+        self._lock = Lock()
+
+    def add(self, name: str, seconds: float) -> None:
+        with self._lock:
+            self.times[name] = self.times.get(name, 0.0) + seconds
+            self.counts[name] = self.counts.get(name, 0) + 1
+
+
+class _Frame:
+    __slots__ = ("nested_time",)
+
+    def __init__(self):
+        self.nested_time = 0.0
+
+
+_recorder: ContextVar[Optional[PhaseRecorder]] = ContextVar("agno_phase_recorder", default=None)
+# The phases open in the current context, innermost last
+_frames: ContextVar[List[_Frame]] = ContextVar("agno_phase_frames", default=[])
+
+
+@contextmanager
+def record_phases() -> Iterator[PhaseRecorder]:
+    """Record the time of the phases run in this context, including threads and tasks started from it."""
+    recorder = PhaseRecorder()
+    recorder_token = _recorder.set(recorder)
+    frames_token = _frames.set([])
+    try:
+        yield recorder
+    finally:
+        _frames.reset(frames_token)
+        _recorder.reset(recorder_token)
+
+
+@contextmanager
+def phase(name: str) -> Iterator[None]:
+    """Time a phase of a run."""
+    recorder = _recorder.get()
+    if recorder is None:
+        yield
+        return
+
+    parent_frames = _frames.get()
+    frame = _Frame()
+    # Threads started in a phase share its list of frames, so each phase gets a new list
+    token = _frames.set(parent_frames + [frame])
+    start = perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = perf_counter() - start
+        _frames.reset(token)
+        # Phases nested in concurrent threads can add up to more than their parent
+        recorder.add(name, max(0.0, elapsed - frame.nested_time))
+        if parent_frames:
+            parent_frames[-1].nested_time += elapsed
+
+
+def phase_iterator(iterator: Iterator[T], name: str) -> Iterator[T]:
+    """Time a phase that produces an iterator, e.g. a streamed model response, excluding the time of the consumer."""
+    if _recorder.get() is None:
+        return iterator
+    return _timed_iterator(iterator, name)
+
+
+def _timed_iterator(iterator: Iterator[T], name: str) -> Iterator[T]:
+    iterator = iter(iterator)
+    while True:
+        with phase(name):
+            try:
+                item = next(iterator)
+            except StopIteration:
+                return
+        yield item
+
+
+def aphase_iterator(iterator: AsyncIterator[T], name: str) -> AsyncIterator[T]:
+    """Time a phase that produces an async iterator, see phase_iterator."""
+    if _recorder.get() is None:
+        return iterator
+    return _atimed_iterator(iterator, name)
+
+
+async def _atimed_iterator(iterator: AsyncIterator[T], name: str) -> AsyncIterator[T]:
+    iterator = iterator.__aiter__()
+    while True:
+        with phase(name):
+            try:
+                item = await iterator.__anext__()
+            except StopAsyncIteration:
+                return
+        yield item
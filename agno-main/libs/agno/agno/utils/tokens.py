@@ -0,0 +1,157 @@
+import json
+from functools import lru_cache
+from typing import Any, Iterable, List, Optional
+
+from agno.models.message import Message
+from agno.utils.log import log_debug
+
+# Approximate number of characters per token of English text
+CHARS_PER_TOKEN = 4
+# Approximate number of tokens of an image, audio, video or file attached to a message
+MEDIA_TOKENS = 85
+# Approximate number of tokens used by the role and formatting of a message
+MESSAGE_OVERHEAD_TOKENS = 4
+# Appended to text that is truncated to fit a token budget
+TRUNCATION_MARKER = "\n... [truncated]"
+
+# Model providers whose models use tiktoken encodings
+TIKTOKEN_PROVIDERS = ("OpenAI", "Azure")
+# Encoding used for models unknown to tiktoken
+DEFAULT_TIKTOKEN_ENCODING = "o200k_base"
+
+
+def estimate_text_tokens(text: str) -> int:
+    """Estimate the number of tokens of a text without a tokenizer"""
+    return (len(text) + CHARS_PER_TOKEN - 1) // CHARS_PER_TOKEN
+
+
+class Tokenizer:
+    """Counts tokens by estimating them from the number of characters, used when no tokenizer is available."""
+
+    name: str = "heuristic"
+
+    def count(self, text: str) -> int:
+        """Returns the number of tokens of a text."""
+        return estimate_text_tokens(text)
+
+    def truncate(self, text: str, max_tokens: int) -> str:
+        """Truncate a text to at most max_tokens tokens, marking that it was truncated."""
+        if self.count(text) <= max_tokens:
+            return text
+        return text[: max(max_tokens, 0) * CHARS_PER_TOKEN] + TRUNCATION_MARKER
+
+
+class TiktokenTokenizer(Tokenizer):
+    def __init__(self, model_id: Optional[str] = None, encoding_name: Optional[str] = None):
+        """
+        Counts tokens with the tiktoken encoding of an OpenAI model.
+
+        Args:
+            model_id (Optional[str]): The model to count tokens for, e.g. "gpt-4o".
+            encoding_name (Optional[str]): The encoding to use. Defaults to the encoding of the model, or o200k_base
+                for models unknown to tiktoken.
+        """
+        try:
+            import tiktoken
+        except ImportError:
+            raise ImportError("`tiktoken` not installed. Please install it using `pip install tiktoken`")
+
+        if encoding_name is None and model_id is not None:
+            try:
+                self.encoding = tiktoken.encoding_for_model(model_id)
+            except KeyError:
+                self.encoding = tiktoken.get_encoding(DEFAULT_TIKTOKEN_ENCODING)
+        else:
+            self.encoding = tiktoken.get_encoding(encoding_name or DEFAULT_TIKTOKEN_ENCODING)
+        self.name = f"tiktoken:{self.encoding.name}"
+
+    def count(self, text: str) -> int:
+        return len(self.encoding.encode(text, disallowed_special=()))
+
+    def truncate(self, text: str, max_tokens: int) -> str:
+        tokens = self.encoding.encode(text, disallowed_special=())
+        if len(tokens) <= max_tokens:
+            return text
+        return self.encoding.decode(tokens[: max(max_tokens, 0)]) + TRUNCATION_MARKER
+
+
+HEURISTIC_TOKENIZER = Tokenizer()
+
+
+@lru_cache(maxsize=64)
+def get_tokenizer(provider: Optional[str] = None, model_id: Optional[str] = None) -> Tokenizer:
+    """Returns the tokenizer for a model: tiktoken for OpenAI and Azure models if installed, a heuristic otherwise."""
+    if provider in TIKTOKEN_PROVIDERS:
+        try:
+            return TiktokenTokenizer(model_id=model_id)
+        except ImportError:
+            log_debug("tiktoken not installed, estimating the number of tokens")
+    return HEURISTIC_TOKENIZER
+
+
+def count_text_tokens(value: Any, tokenizer: Optional[Tokenizer] = None) -> int:
+    """Returns the number of tokens of a text, or of the JSON of any other value."""
+    tokenizer = tokenizer or HEURISTIC_TOKENIZER
+    if not isinstance(value, str):
+        value = json.dumps(value, default=str)
+    return tokenizer.count(value)
+
+
+def estimate_message_tokens(message: Message, tokenizer: Optional[Tokenizer] = None) -> int:
+    """Estimate the number of tokens a message consumes in the context window"""
+    tokens = MESSAGE_OVERHEAD_TOKENS
+    if message.content is not None:
+        tokens += count_text_tokens(message.content, tokenizer)
+    if message.tool_calls:
+        tokens += count_text_tokens(message.tool_calls, tokenizer)
+    for media in (message.images, message.audio, message.videos, message.files):
+        if media:
+            tokens += MEDIA_TOKENS * len(media)
+    return tokens
+
+
+def count_message_tokens(message: Message, tokenizer: Optional[Tokenizer] = None) -> int:
+    """Returns the number of tokens of a message, computed once per tokenizer and cached on the message.
+
+    Only use this for messages that are no longer modified, e.g. messages from history or sent to the model.
+    """
+    tokenizer = tokenizer or HEURISTIC_TOKENIZER
+    token_count = message._token_counts.get(tokenizer.name)
+    if token_count is None:
+        token_count = estimate_message_tokens(message, tokenizer)
+        message._token_counts[tokenizer.name] = token_count
+    return token_count
+
+
+def get_num_runs_within_token_budget(run_messages: Iterable[List[Message]], max_tokens: int) -> int:
+    """Returns how many runs fit in max_tokens, given the messages of each run from the newest run to the oldest.
+
+    Runs are consumed lazily and only until the budget is exhausted, so the cost does not grow with the
+    number of runs in the session.
+    """
+    num_runs = 0
+    used_tokens = 0
+    for messages in run_messages:
+        used_tokens += sum(count_message_tokens(message) for message in messages)
+        if used_tokens > max_tokens:
+            break
+        num_runs += 1
+    return num_runs
+
+
+def get_messages_within_token_budget(messages: List[Message], max_tokens: int) -> List[Message]:
+    """Returns the most recent messages that fit in max_tokens, used when a single run doesn't fit the budget.
+
+    Tool results are not returned without the assistant message that called the tool.
+    """
+    num_messages = 0
+    used_tokens = 0
+    for message in reversed(messages):
+        used_tokens += count_message_tokens(message)
+        if used_tokens > max_tokens:
+            break
+        num_messages += 1
+    recent_messages = messages[len(messages) - num_messages :]
+    while recent_messages and recent_messages[0].role == "tool":
+        recent_messages = recent_messages[1:]
+    return recent_messages
@@ -33,7 +33,7 @@ class LanceDb(VectorDb):
         search_type: The search type to use when searching for documents.
         distance: The distance metric to use when searching for documents.
         nprobes: The number of probes to use when searching for documents.
-        reranker: The reranker to use when reranking documents.
+        reranker: The reranker to use when reranking documents. Fuses vector and keyword results in hybrid search.
         use_tantivy: Whether to use Tantivy for full text search.
         on_bad_vectors: What to do if the vector is bad. One of "error", "drop", "fill", "null".
         fill_value: The value to fill the vector with if on_bad_vectors is "fill".
@@ -363,6 +363,12 @@ class LanceDb(VectorDb):
             return []
 
     def vector_search(self, query: str, limit: int = 5) -> List[Document]:
+        search_results = self._vector_search(query=query, limit=limit)
+        if self.reranker:
+            search_results = self.reranker.rerank(query=query, documents=search_results)
+        return search_results
+
+    def _vector_search(self, query: str, limit: int = 5) -> List[Document]:
         query_embedding = self.embedder.get_embedding(query)
         if query_embedding is None:
             logger.error(f"Error getting embedding for Query: {query}")
@@ -382,14 +388,17 @@ class LanceDb(VectorDb):
 
         results = results.to_pandas()
 
-        search_results = self._build_search_results(results)
+        return self._build_search_results(results)
 
+    def hybrid_search(self, query: str, limit: int = 5) -> List[Document]:
         if self.reranker:
-            search_results = self.reranker.rerank(query=query, documents=search_results)
-
-        return search_results
+            # Retrieve the vector and keyword results separately and let the reranker fuse them
+            ranked_lists = [
+                self._vector_search(query=query, limit=limit),
+                self._keyword_search(query=query, limit=limit),
+            ]
+            return self.reranker.fuse(query=query, ranked_lists=ranked_lists)[:limit]
 
-    def hybrid_search(self, query: str, limit: int = 5) -> List[Document]:
         query_embedding = self.embedder.get_embedding(query)
         if query_embedding is None:
             logger.error(f"Error getting embedding for Query: {query}")
@@ -416,14 +425,15 @@ class LanceDb(VectorDb):
 
         results = results.to_pandas()
 
-        search_results = self._build_search_results(results)
+        return self._build_search_results(results)
 
+    def keyword_search(self, query: str, limit: int = 5) -> List[Document]:
+        search_results = self._keyword_search(query=query, limit=limit)
         if self.reranker:
             search_results = self.reranker.rerank(query=query, documents=search_results)
-
         return search_results
 
-    def keyword_search(self, query: str, limit: int = 5) -> List[Document]:
+    def _keyword_search(self, query: str, limit: int = 5) -> List[Document]:
         if self.table is None:
             logger.error("Table not initialized. Please create the table first")
             return []
@@ -439,11 +449,7 @@ class LanceDb(VectorDb):
             .limit(limit)
             .to_pandas()
         )
-        search_results = self._build_search_results(results)
-
-        if self.reranker:
-            search_results = self.reranker.rerank(query=query, documents=search_results)
-        return search_results
+        return self._build_search_results(results)
 
     def _build_search_results(self, results) -> List[Document]:  # TODO: typehint pandas?
         search_results: List[Document] = []
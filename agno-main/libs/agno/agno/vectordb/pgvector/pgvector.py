@@ -71,6 +71,7 @@ class PgVector(VectorDb):
             content_language (str): Language for full-text search.
             schema_version (int): Version of the database schema.
             auto_upgrade_schema (bool): Automatically upgrade schema if True.
+            reranker (Optional[Reranker]): Reranker used to rerank (and, in hybrid search, fuse) results.
         """
         if not table_name:
             raise ValueError("Table name must be provided.")
@@ -466,6 +467,13 @@ class PgVector(VectorDb):
         Returns:
             List[Document]: List of matching documents.
         """
+        search_results = self._vector_search(query=query, limit=limit, filters=filters)
+        if self.reranker:
+            search_results = self.reranker.rerank(query=query, documents=search_results)
+        return search_results
+
+    def _vector_search(self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None) -> List[Document]:
+        """Perform a vector similarity search without reranking the results."""
         try:
             # Get the embedding for the query string
             query_embedding = self.embedder.get_embedding(query)
@@ -537,9 +545,6 @@ class PgVector(VectorDb):
                     )
                 )
 
-            if self.reranker:
-                search_results = self.reranker.rerank(query=query, documents=search_results)
-
             return search_results
         except Exception as e:
             logger.error(f"Error during vector search: {e}")
@@ -572,6 +577,13 @@ class PgVector(VectorDb):
         Returns:
             List[Document]: List of matching documents.
         """
+        search_results = self._keyword_search(query=query, limit=limit, filters=filters)
+        if self.reranker:
+            search_results = self.reranker.rerank(query=query, documents=search_results)
+        return search_results
+
+    def _keyword_search(self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None) -> List[Document]:
+        """Perform a keyword search on the 'content' column without reranking the results."""
         try:
             # Define the columns to select
             columns = [
@@ -647,6 +659,9 @@ class PgVector(VectorDb):
         """
         Perform a hybrid search combining vector similarity and full-text search.
 
+        If a reranker is set, the vector and keyword results are retrieved separately and fused by the
+        reranker instead of being combined with the weighted hybrid score.
+
         Args:
             query (str): The search query.
             limit (int): Maximum number of results to return.
@@ -655,6 +670,13 @@ class PgVector(VectorDb):
         Returns:
             List[Document]: List of matching documents.
         """
+        if self.reranker:
+            ranked_lists = [
+                self._vector_search(query=query, limit=limit, filters=filters),
+                self._keyword_search(query=query, limit=limit, filters=filters),
+            ]
+            return self.reranker.fuse(query=query, ranked_lists=ranked_lists)[:limit]
+
         try:
             # Get the embedding for the query string
             query_embedding = self.embedder.get_embedding(query)
@@ -1,8 +1,10 @@
+from agno.workflow.steps import Step
 from agno.workflow.workflow import RunEvent, RunResponse, Workflow, WorkflowSession
 
 __all__ = [
     "RunEvent",
     "RunResponse",
+    "Step",
     "Workflow",
     "WorkflowSession",
 ]
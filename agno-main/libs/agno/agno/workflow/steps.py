@@ -0,0 +1,337 @@
+import asyncio
+import contextvars
+import importlib
+import inspect
+import json
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from hashlib import sha256
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple, Type
+
+from pydantic import BaseModel
+
+from agno.run.response import RunResponse
+from agno.utils.common import nested_model_dump
+from agno.utils.log import log_debug
+
+
+@dataclass
+class Step:
+    """
+    A step of a Workflow. Steps run as soon as the steps they depend on are complete, so independent steps run
+    concurrently.
+
+    The function of a step is called with keyword arguments: the output of each step it depends on, by step name,
+    and the inputs of the workflow run that match its parameters. It can be sync or async.
+    """
+
+    # Name of the step, unique in the workflow. Steps that depend on this step receive its output as `name`
+    name: str
+    # The function run by the step
+    function: Callable[..., Any]
+    # Names of the steps whose outputs this step uses
+    depends_on: List[str] = field(default_factory=list)
+    # If True, the output of the step is reused while its inputs are unchanged.
+    # Only enable it for steps whose output depends on nothing but their inputs.
+    cache: bool = False
+
+    def get_inputs(self, run_input: Dict[str, Any], outputs: Dict[str, Any]) -> Dict[str, Any]:
+        """Returns the keyword arguments to call the function with."""
+        inputs = {name: outputs[name] for name in self.depends_on}
+        parameters = inspect.signature(self.function).parameters
+        accepts_kwargs = any(p.kind == inspect.Parameter.VAR_KEYWORD for p in parameters.values())
+        for name, value in run_input.items():
+            if name not in inputs and (accepts_kwargs or name in parameters):
+                inputs[name] = value
+        return inputs
+
+    def __deepcopy__(self, memo):
+        """Steps are shared by copies of the workflow."""
+        memo[id(self)] = self
+        return self
+
+
+# Called with the step, the hash of its inputs and its output when a step completes
+StepCompleteCallback = Callable[[Step, str, Any], None]
+
+
+def get_step_input_hash(step_name: str, inputs: Dict[str, Any]) -> str:
+    """Returns a hash of the inputs of a step, used to reuse its output."""
+    canonical = json.dumps(
+        {"step": step_name, "inputs": nested_model_dump(inputs)}, sort_keys=True, default=str, ensure_ascii=False
+    )
+    return sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def _call_step(step: Step, inputs: Dict[str, Any]) -> Any:
+    """Call the function of a step from a worker thread, async functions in a new event loop."""
+    if inspect.iscoroutinefunction(step.function):
+        return asyncio.run(step.function(**inputs))
+    return step.function(**inputs)
+
+
+def _get_model_class(path: str) -> Optional[Type[BaseModel]]:
+    """Returns the pydantic model class at `module:qualname`, or None if it can't be imported."""
+    module_name, _, qualname = path.partition(":")
+    try:
+        value: Any = importlib.import_module(module_name)
+        for attribute in qualname.split("."):
+            value = getattr(value, attribute)
+    except (ImportError, AttributeError):
+        return None
+    return value if isinstance(value, type) and issubclass(value, BaseModel) else None
+
+
+def is_json_serializable(value: Any) -> bool:
+    try:
+        json.dumps(value)
+        return True
+    except (TypeError, ValueError):
+        return False
+
+
+def serialize_step_output(step_output: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """
+    Returns a step output as JSON to store it, or None if the output can't be stored.
+    RunResponses and pydantic models are restored as such, pydantic models nested in other outputs as dicts.
+    """
+    output = step_output.get("output")
+    serialized: Dict[str, Any] = {"input_hash": step_output.get("input_hash")}
+    if isinstance(output, RunResponse):
+        serialized["output"] = output.to_dict()
+        serialized["output_type"] = "run_response"
+    elif isinstance(output, BaseModel):
+        serialized["output"] = output.model_dump(mode="json")
+        serialized["output_type"] = "pydantic"
+        serialized["output_model"] = f"{type(output).__module__}:{type(output).__qualname__}"
+    else:
+        serialized["output"] = nested_model_dump(output)
+    if not is_json_serializable(serialized):
+        log_debug("Step output is not JSON serializable and is not stored")
+        return None
+    return serialized
+
+
+def deserialize_step_output(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Returns a step output stored with serialize_step_output."""
+    output = data.get("output")
+    if data.get("output_type") == "run_response" and isinstance(output, dict):
+        output = RunResponse.from_dict(output)
+    elif data.get("output_type") == "pydantic" and isinstance(output, dict):
+        model_class = _get_model_class(data.get("output_model") or "")
+        if model_class is not None:
+            output = model_class.model_validate(output)
+        else:
+            log_debug(f"Could not import {data.get('output_model')}, the step output is restored as a dict")
+    return {"input_hash": data.get("input_hash"), "output": output}
+
+
+class StepGraph:
+    def __init__(self, steps: List[Step]):
+        """
+        The dependency graph of the steps of a workflow.
+
+        Raises:
+            ValueError: If step names are not unique, a step depends on an unknown step, or the steps have a cycle.
+        """
+        self.steps: Dict[str, Step] = {}
+        for step in steps:
+            if step.name in self.steps:
+                raise ValueError(f"Duplicate step name: {step.name}")
+            self.steps[step.name] = step
+        for step in steps:
+            for dependency in step.depends_on:
+                if dependency not in self.steps:
+                    raise ValueError(f"Step {step.name} depends on unknown step: {dependency}")
+        self.order: List[str] = self._get_order()
+
+    def _get_order(self) -> List[str]:
+        """Returns the step names in topological order, keeping the declared order of independent steps."""
+        order: List[str] = []
+        visiting: Set[str] = set()
+        visited: Set[str] = set()
+
+        def visit(name: str) -> None:
+            if name in visited:
+                return
+            if name in visiting:
+                raise ValueError(f"Steps have a dependency cycle through: {name}")
+            visiting.add(name)
+            for dependency in self.steps[name].depends_on:
+                visit(dependency)
+            visiting.discard(name)
+            visited.add(name)
+            order.append(name)
+
+        for name in self.steps:
+            visit(name)
+        return order
+
+    @property
+    def final_steps(self) -> List[str]:
+        """Names of the steps no other step depends on."""
+        dependencies = {dependency for step in self.steps.values() for dependency in step.depends_on}
+        return [name for name in self.order if name not in dependencies]
+
+    def _get_ready_steps(
+        self,
+        run_input: Dict[str, Any],
+        outputs: Dict[str, Any],
+        started: Set[str],
+        step_outputs: Dict[str, Dict[str, Any]],
+        checkpoints: Dict[str, Dict[str, Any]],
+    ) -> List[Tuple[Step, Dict[str, Any], str]]:
+        """
+        Returns the steps whose dependencies are complete, with their inputs and input hash. Steps with a checkpoint
+        or a cached output for the same inputs are completed from it instead.
+        """
+        ready: List[Tuple[Step, Dict[str, Any], str]] = []
+        found = True
+        while found:
+            found = False
+            for name in self.order:
+                step = self.steps[name]
+                if name in started or any(dependency not in outputs for dependency in step.depends_on):
+                    continue
+                started.add(name)
+                inputs = step.get_inputs(run_input, outputs)
+                input_hash = get_step_input_hash(step.name, inputs)
+                checkpoint = checkpoints.get(name)
+                cached = step_outputs.get(name) if step.cache else None
+                if checkpoint is not None and checkpoint.get("input_hash") == input_hash:
+                    log_debug(f"Using the checkpoint of step: {name}")
+                    outputs[name] = checkpoint.get("output")
+                    # Steps that depend on this step may be ready now
+                    found = True
+                elif cached is not None and cached.get("input_hash") == input_hash:
+                    log_debug(f"Using the cached output of step: {name}")
+                    outputs[name] = cached.get("output")
+                    found = True
+                else:
+                    ready.append((step, inputs, input_hash))
+        return ready
+
+    @staticmethod
+    def _complete_step(
+        step: Step,
+        input_hash: str,
+        output: Any,
+        outputs: Dict[str, Any],
+        step_outputs: Dict[str, Dict[str, Any]],
+        on_step_complete: Optional[StepCompleteCallback],
+    ) -> None:
+        outputs[step.name] = output
+        step_outputs[step.name] = {"input_hash": input_hash, "output": output}
+        if on_step_complete is not None:
+            on_step_complete(step, input_hash, output)
+
+    def run(
+        self,
+        run_input: Dict[str, Any],
+        step_outputs: Optional[Dict[str, Dict[str, Any]]] = None,
+        max_workers: Optional[int] = None,
+        checkpoints: Optional[Dict[str, Dict[str, Any]]] = None,
+        on_step_complete: Optional[StepCompleteCallback] = None,
+    ) -> Dict[str, Any]:
+        """
+        Run the steps in a thread pool, each step as soon as its dependencies are complete.
+
+        Args:
+            run_input (Dict[str, Any]): The inputs of the workflow run.
+            step_outputs (Optional[Dict[str, Dict[str, Any]]]): The outputs of previous runs by step name, with the
+                hash of the inputs they were created from. Updated with the outputs of the steps that run.
+            max_workers (Optional[int]): Maximum number of steps run concurrently.
+            checkpoints (Optional[Dict[str, Dict[str, Any]]]): The outputs of the steps completed by a previous
+                attempt of this run, in the format of step_outputs. Reused even for steps with cache=False.
+            on_step_complete (Optional[StepCompleteCallback]): Called when a step completes, e.g. to save it.
+
+        Returns:
+            Dict[str, Any]: The output of each step, by step name.
+        """
+        step_outputs = step_outputs if step_outputs is not None else {}
+        outputs: Dict[str, Any] = {}
+        started: Set[str] = set()
+        running: Dict[Future, Tuple[Step, str]] = {}
+
+        # The first error of a step. No step is started after it, and the running steps complete so that their
+        # outputs are saved for resume, before the error is raised
+        error: Optional[BaseException] = None
+
+        executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="agno-step")
+        try:
+            while True:
+                if error is None:
+                    for step, inputs, input_hash in self._get_ready_steps(
+                        run_input, outputs, started, step_outputs, checkpoints or {}
+                    ):
+                        log_debug(f"Running step: {step.name}")
+                        # Run each step in a copy of the current context, like asyncio.to_thread
+                        future = executor.submit(contextvars.copy_context().run, _call_step, step, inputs)
+                        running[future] = (step, input_hash)
+                if not running:
+                    break
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    step, input_hash = running.pop(future)
+                    try:
+                        output = future.result()
+                    except Exception as e:
+                        log_debug(f"Step failed: {step.name}")
+                        error = error or e
+                        continue
+                    self._complete_step(step, input_hash, output, outputs, step_outputs, on_step_complete)
+            if error is not None:
+                raise error
+        finally:
+            # Steps still running when a callback raised are waited for, they are not left running after the run
+            executor.shutdown(wait=True, cancel_futures=True)
+        return outputs
+
+    async def arun(
+        self,
+        run_input: Dict[str, Any],
+        step_outputs: Optional[Dict[str, Dict[str, Any]]] = None,
+        checkpoints: Optional[Dict[str, Dict[str, Any]]] = None,
+        on_step_complete: Optional[StepCompleteCallback] = None,
+    ) -> Dict[str, Any]:
+        """
+        Run the steps as asyncio tasks, each step as soon as its dependencies are complete, see run.
+        Sync step functions run in a thread.
+        """
+        step_outputs = step_outputs if step_outputs is not None else {}
+        outputs: Dict[str, Any] = {}
+        started: Set[str] = set()
+        running: Dict[asyncio.Task, Tuple[Step, str]] = {}
+
+        error: Optional[BaseException] = None
+
+        try:
+            while True:
+                if error is None:
+                    for step, inputs, input_hash in self._get_ready_steps(
+                        run_input, outputs, started, step_outputs, checkpoints or {}
+                    ):
+                        log_debug(f"Running step: {step.name}")
+                        if inspect.iscoroutinefunction(step.function):
+                            task = asyncio.create_task(step.function(**inputs))
+                        else:
+                            task = asyncio.create_task(asyncio.to_thread(step.function, **inputs))
+                        running[task] = (step, input_hash)
+                if not running:
+                    break
+                done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    step, input_hash = running.pop(task)
+                    try:
+                        output = task.result()
+                    except Exception as e:
+                        log_debug(f"Step failed: {step.name}")
+                        error = error or e
+                        continue
+                    self._complete_step(step, input_hash, output, outputs, step_outputs, on_step_complete)
+            if error is not None:
+                raise error
+        finally:
+            for task in running:
+                task.cancel()
+        return outputs
@@ -1,11 +1,13 @@
 from __future__ import annotations
 
+import asyncio
 import collections.abc
 import inspect
 from dataclasses import dataclass, field, fields
 from os import getenv
+from threading import Lock
 from types import GeneratorType
-from typing import Any, Callable, Dict, List, Optional, Union, cast
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union, cast
 from uuid import uuid4
 
 from pydantic import BaseModel
@@ -17,9 +19,19 @@ from agno.memory.workflow import WorkflowMemory, WorkflowRun
 from agno.run.response import RunEvent, RunResponse  # noqa: F401
 from agno.storage.base import Storage
 from agno.storage.session.workflow import WorkflowSession
+from agno.tracing.tracer import STORAGE_READ, STORAGE_WRITE, trace_span
 from agno.utils.common import nested_model_dump
 from agno.utils.log import log_debug, logger, set_log_level_to_debug, set_log_level_to_info
 from agno.utils.merge_dict import merge_dictionaries
+from agno.utils.phases import STORAGE, phase
+from agno.workflow.steps import (
+    Step,
+    StepGraph,
+    deserialize_step_output,
+    get_step_input_hash,
+    is_json_serializable,
+    serialize_step_output,
+)
 
 
 @dataclass(init=False)
@@ -47,6 +59,17 @@ class Workflow:
     # --- Workflow Memory ---
     memory: Optional[Union[WorkflowMemory, Memory]] = None
 
+    # --- Workflow Steps ---
+    # Steps run by the workflow if it does not override run(), see agno.workflow.steps.Step
+    steps: Optional[List[Step]] = None
+    # Maximum number of steps run concurrently
+    max_step_workers: Optional[int] = None
+    # If True, save the session to storage each time a step completes, so even a run whose process crashed can be
+    # resumed. Otherwise the checkpoint of a run is saved once, when the run fails.
+    checkpoint_steps: bool = False
+    # Maximum number of runs that did not complete to keep checkpoints of, the oldest are dropped first
+    max_run_checkpoints: int = 10
+
     # --- Workflow Storage ---
     storage: Optional[Storage] = None
     # Extra data stored with this workflow
@@ -71,6 +94,10 @@ class Workflow:
     videos: Optional[List[VideoArtifact]] = None
     # Audio generated during this session
     audio: Optional[List[AudioArtifact]] = None
+    # Output of each step by step name, with the hash of its inputs. Stored in the session to reuse step outputs.
+    step_outputs: Optional[Dict[str, Dict[str, Any]]] = None
+    # Checkpoints of the runs that did not complete, by run id: the input of the run and the outputs of its steps
+    run_checkpoints: Optional[Dict[str, Dict[str, Any]]] = None
 
     def __init__(
         self,
@@ -83,6 +110,10 @@ class Workflow:
         session_name: Optional[str] = None,
         session_state: Optional[Dict[str, Any]] = None,
         memory: Optional[Union[WorkflowMemory, Memory]] = None,
+        steps: Optional[List[Step]] = None,
+        max_step_workers: Optional[int] = None,
+        checkpoint_steps: bool = False,
+        max_run_checkpoints: int = 10,
         storage: Optional[Storage] = None,
         extra_data: Optional[Dict[str, Any]] = None,
         debug_mode: bool = False,
@@ -100,6 +131,10 @@ class Workflow:
         self.session_state: Dict[str, Any] = session_state or {}
 
         self.memory = memory
+        self.steps = steps or self.__class__.steps
+        self.max_step_workers = max_step_workers or self.__class__.max_step_workers
+        self.checkpoint_steps = checkpoint_steps
+        self.max_run_checkpoints = max_run_checkpoints
         self.storage = storage
         self.extra_data = extra_data
 
@@ -113,6 +148,8 @@ class Workflow:
         self.images = None
         self.videos = None
         self.audio = None
+        self.step_outputs = None
+        self.run_checkpoints = None
 
         self.workflow_session: Optional[WorkflowSession] = None
 
@@ -123,6 +160,10 @@ class Workflow:
         self._run_parameters: Optional[Dict[str, Any]] = None
         # Return type of the run function
         self._run_return_type: Optional[str] = None
+        # Id of the run to resume, set by resume()
+        self._resume_run_id: Optional[str] = None
+        # Lock for saving checkpoints of steps completed concurrently
+        self._checkpoint_lock = Lock()
 
         self.update_run_method()
 
@@ -137,8 +178,12 @@ class Workflow:
         logger.error(f"{self.__class__.__name__}.run() method not implemented.")
         return
 
-    def run_workflow(self, **kwargs: Any):
-        """Run the Workflow"""
+    async def arun(self, **kwargs: Any):
+        """Run the Workflow asynchronously"""
+        return await self.arun_workflow(**kwargs)
+
+    def start_run(self, **kwargs: Any) -> None:
+        """Prepare the workflow for a new run"""
 
         # Set mode, debug, workflow_id, session_id, initialize memory
         self.set_storage_mode()
@@ -147,8 +192,8 @@ class Workflow:
         self.set_session_id()
         self.initialize_memory()
 
-        # Create a run_id
-        self.run_id = str(uuid4())
+        # Create a run_id, or reuse the run_id of the run to resume
+        self.run_id = self._resume_run_id or str(uuid4())
 
         # Set run_input, run_response
         self.run_input = kwargs
@@ -161,17 +206,48 @@ class Workflow:
         self.update_agent_session_ids()
 
         log_debug(f"Workflow Run Start: {self.run_id}", center=True)
+
+    def end_run(self) -> None:
+        """Add the run to the memory and save the session"""
+        # The run completed, its checkpoints are no longer needed
+        if self.run_checkpoints is not None and self.run_id is not None:
+            self.run_checkpoints.pop(self.run_id, None)
+        if isinstance(self.memory, WorkflowMemory):
+            self.memory.add_run(WorkflowRun(input=self.run_input, response=self.run_response))
+        elif isinstance(self.memory, Memory):
+            self.memory.add_run(session_id=self.session_id, run=self.run_response)  # type: ignore
+        # Write this run to the database
+        self.write_to_storage()
+        log_debug(f"Workflow Run End: {self.run_id}", center=True)
+
+    def update_run_response(self, result: RunResponse) -> RunResponse:
+        """Update the result of run() with the ids of the workflow run"""
+        self.run_response = cast(RunResponse, self.run_response)
+        result.run_id = self.run_id
+        result.session_id = self.session_id
+        result.workflow_id = self.workflow_id
+
+        # Update the run_response with the content from the result
+        if result.content is not None and isinstance(result.content, str):
+            self.run_response.content = result.content
+        return result
+
+    def run_workflow(self, **kwargs: Any):
+        """Run the Workflow"""
+        self.start_run(**kwargs)
         try:
             self._subclass_run = cast(Callable, self._subclass_run)
             result = self._subclass_run(**kwargs)
         except Exception as e:
             logger.error(f"Workflow.run() failed: {e}")
+            self.save_failed_run()
             raise e
 
         # The run_workflow() method handles both Iterator[RunResponse] and RunResponse
         # Case 1: The run method returns an Iterator[RunResponse]
         if isinstance(result, (GeneratorType, collections.abc.Iterator)):
             # Initialize the run_response content
+            self.run_response = cast(RunResponse, self.run_response)
             self.run_response.content = ""
 
             def result_generator():
@@ -181,54 +257,210 @@ class Workflow:
                 elif isinstance(self.memory, Memory):
                     self.memory = cast(Memory, self.memory)
 
-                for item in result:
-                    if isinstance(item, RunResponse):
-                        # Update the run_id, session_id and workflow_id of the RunResponse
-                        item.run_id = self.run_id
-                        item.session_id = self.session_id
-                        item.workflow_id = self.workflow_id
-
-                        # Update the run_response with the content from the result
-                        if item.content is not None and isinstance(item.content, str):
-                            self.run_response.content += item.content
-                    else:
-                        logger.warning(f"Workflow.run() should only yield RunResponse objects, got: {type(item)}")
-                    yield item
-
-                # Add the run to the memory
-                if isinstance(self.memory, WorkflowMemory):
-                    self.memory.add_run(WorkflowRun(input=self.run_input, response=self.run_response))
-                elif isinstance(self.memory, Memory):
-                    self.memory.add_run(session_id=self.session_id, run=self.run_response)  # type: ignore
-                # Write this run to the database
-                self.write_to_storage()
-                log_debug(f"Workflow Run End: {self.run_id}", center=True)
+                try:
+                    for item in result:
+                        if isinstance(item, RunResponse):
+                            # Update the run_id, session_id and workflow_id of the RunResponse
+                            item.run_id = self.run_id
+                            item.session_id = self.session_id
+                            item.workflow_id = self.workflow_id
+
+                            # Update the run_response with the content from the result
+                            if item.content is not None and isinstance(item.content, str):
+                                self.run_response.content += item.content
+                        else:
+                            logger.warning(f"Workflow.run() should only yield RunResponse objects, got: {type(item)}")
+                        yield item
+                except Exception as e:
+                    # The steps of a generator run() fail while it is iterated
+                    logger.error(f"Workflow.run() failed: {e}")
+                    self.save_failed_run()
+                    raise e
+
+                # Add the run to the memory and write it to the database
+                self.end_run()
 
             return result_generator()
         # Case 2: The run method returns a RunResponse
         elif isinstance(result, RunResponse):
             # Update the result with the run_id, session_id and workflow_id of the workflow run
-            result.run_id = self.run_id
-            result.session_id = self.session_id
-            result.workflow_id = self.workflow_id
-
-            # Update the run_response with the content from the result
-            if result.content is not None and isinstance(result.content, str):
-                self.run_response.content = result.content
-
-            # Add the run to the memory
-            if isinstance(self.memory, WorkflowMemory):
-                self.memory.add_run(WorkflowRun(input=self.run_input, response=self.run_response))
-            elif isinstance(self.memory, Memory):
-                self.memory.add_run(session_id=self.session_id, run=self.run_response)  # type: ignore
-            # Write this run to the database
-            self.write_to_storage()
-            log_debug(f"Workflow Run End: {self.run_id}", center=True)
+            self.update_run_response(result)
+            # Add the run to the memory and write it to the database
+            self.end_run()
             return result
         else:
             logger.warning(f"Workflow.run() should only return RunResponse objects, got: {type(result)}")
             return None
 
+    async def arun_workflow(self, **kwargs: Any):
+        """Run the Workflow asynchronously. Workflows that override run() run it in a thread."""
+        if self.__class__.run is not Workflow.run or not self.steps:
+            return await asyncio.to_thread(self.run_workflow, **kwargs)
+
+        self.start_run(**kwargs)
+        try:
+            result = await self._arun_steps(**kwargs)
+        except Exception as e:
+            logger.error(f"Workflow.arun() failed: {e}")
+            self.save_failed_run()
+            raise e
+        self.update_run_response(result)
+        self.end_run()
+        return result
+
+    def _get_steps_response(self, outputs: Dict[str, Any], graph: StepGraph) -> RunResponse:
+        """The content of the response is the output of the final step, or the outputs of the final steps by name"""
+        final_steps = graph.final_steps
+        if len(final_steps) == 1:
+            content = outputs[final_steps[0]]
+        else:
+            content = {name: outputs[name] for name in final_steps}
+        if isinstance(content, RunResponse):
+            return content
+        return RunResponse(content=content)
+
+    def _run_steps(self, **kwargs: Any) -> RunResponse:
+        """Run the steps of the workflow, independent steps run concurrently in a thread pool"""
+        graph = StepGraph(self.steps or [])
+        if self.step_outputs is None:
+            self.step_outputs = {}
+        outputs = graph.run(
+            kwargs,
+            step_outputs=self.step_outputs,
+            max_workers=self.max_step_workers,
+            checkpoints=self.get_run_checkpoint()["steps"],
+            on_step_complete=lambda step, input_hash, output: self.save_checkpoint(step.name, input_hash, output),
+        )
+        return self._get_steps_response(outputs, graph)
+
+    async def _arun_steps(self, **kwargs: Any) -> RunResponse:
+        """Run the steps of the workflow, independent steps run concurrently as asyncio tasks"""
+        graph = StepGraph(self.steps or [])
+        if self.step_outputs is None:
+            self.step_outputs = {}
+        outputs = await graph.arun(
+            kwargs,
+            step_outputs=self.step_outputs,
+            checkpoints=self.get_run_checkpoint()["steps"],
+            on_step_complete=lambda step, input_hash, output: self.save_checkpoint(step.name, input_hash, output),
+        )
+        return self._get_steps_response(outputs, graph)
+
+    def get_run_checkpoint(self) -> Dict[str, Any]:
+        """Returns the checkpoint of the current run, with its input and the outputs of its completed steps"""
+        if self.run_checkpoints is None:
+            self.run_checkpoints = {}
+        run_id = cast(str, self.run_id)
+        if run_id not in self.run_checkpoints:
+            self.run_checkpoints[run_id] = {"input": self.run_input, "steps": {}}
+            # Drop the checkpoints of the oldest runs that did not complete
+            stale_run_ids = [other_run_id for other_run_id in self.run_checkpoints if other_run_id != run_id]
+            for stale_run_id in stale_run_ids[: max(0, len(stale_run_ids) - max(0, self.max_run_checkpoints - 1))]:
+                log_debug(f"Dropping the checkpoint of run: {stale_run_id}")
+                self.run_checkpoints.pop(stale_run_id)
+        return self.run_checkpoints[run_id]
+
+    def save_checkpoint(self, step_name: str, input_hash: str, output: Any) -> None:
+        """Add the output of a step to the checkpoint of the current run and save it to storage"""
+        with self._checkpoint_lock:
+            self.get_run_checkpoint()["steps"][step_name] = {"input_hash": input_hash, "output": output}
+            if self.checkpoint_steps and self.storage is not None:
+                log_debug(f"Saving checkpoint of step: {step_name}")
+                self.write_to_storage()
+
+    def save_failed_run(self) -> None:
+        """Save the checkpoint of a run that failed, so it can be resumed. Not needed with checkpoint_steps."""
+        if self.checkpoint_steps or self.storage is None or not self.run_checkpoints:
+            return
+        if self.run_id not in self.run_checkpoints:
+            return
+        try:
+            self.write_to_storage()
+        except Exception as e:
+            logger.warning(f"Failed to save the checkpoint of run {self.run_id}: {e}")
+
+    def run_step(self, name: str, function: Callable[..., Any], **inputs: Any) -> Any:
+        """
+        Run a step of a workflow that overrides run(), e.g. `self.run_step("research", self.researcher.run, message=topic)`.
+        The output of the step is saved to the checkpoint of the run. When the run is resumed, the output is reused
+        if the inputs are unchanged, instead of running the step again.
+
+        Args:
+            name (str): The name of the step, unique in the run.
+            function (Callable[..., Any]): The function to run, called with the inputs. It should return a value
+                (e.g. a RunResponse), not an iterator.
+            **inputs: The keyword arguments to call the function with.
+
+        Returns:
+            Any: The output of the function.
+        """
+        input_hash = get_step_input_hash(name, inputs)
+        checkpoint = self.get_run_checkpoint()["steps"].get(name)
+        if checkpoint is not None and checkpoint.get("input_hash") == input_hash:
+            log_debug(f"Using the checkpoint of step: {name}")
+            return checkpoint.get("output")
+        output = function(**inputs)
+        self.save_checkpoint(name, input_hash, output)
+        return output
+
+    async def arun_step(self, name: str, function: Callable[..., Any], **inputs: Any) -> Any:
+        """Run a step of a workflow asynchronously, see run_step. Sync functions run in a thread."""
+        input_hash = get_step_input_hash(name, inputs)
+        checkpoint = self.get_run_checkpoint()["steps"].get(name)
+        if checkpoint is not None and checkpoint.get("input_hash") == input_hash:
+            log_debug(f"Using the checkpoint of step: {name}")
+            return checkpoint.get("output")
+        if inspect.iscoroutinefunction(function):
+            output = await function(**inputs)
+        else:
+            output = await asyncio.to_thread(function, **inputs)
+        self.save_checkpoint(name, input_hash, output)
+        return output
+
+    def _get_run_to_resume(self, run_id: Optional[str], run_input: Dict[str, Any]) -> Tuple[str, Dict[str, Any]]:
+        self.set_storage_mode()
+        self.read_from_storage()
+        if not self.run_checkpoints:
+            raise ValueError("There is no run to resume")
+        if run_id is None:
+            # Resume the last run that did not complete
+            run_id = list(self.run_checkpoints)[-1]
+        elif run_id not in self.run_checkpoints:
+            raise ValueError(f"There is no checkpoint for run: {run_id}")
+        if not run_input:
+            run_input = self.run_checkpoints[run_id].get("input") or {}
+        return run_id, run_input
+
+    def resume(self, run_id: Optional[str] = None, **kwargs: Any):
+        """
+        Resume a run that did not complete. Steps completed by the run are reused if their inputs are unchanged,
+        so only the failed and remaining steps run again.
+
+        Args:
+            run_id (Optional[str]): The id of the run to resume. Defaults to the last run that did not complete.
+            **kwargs: The inputs of the run. Defaults to the inputs of the run to resume.
+
+        Raises:
+            ValueError: If there is no checkpoint of the run to resume.
+        """
+        run_id, run_input = self._get_run_to_resume(run_id, kwargs)
+        log_debug(f"Resuming run: {run_id}")
+        self._resume_run_id = run_id
+        try:
+            return self.run(**run_input)
+        finally:
+            self._resume_run_id = None
+
+    async def aresume(self, run_id: Optional[str] = None, **kwargs: Any):
+        """Resume a run that did not complete asynchronously, see resume."""
+        run_id, run_input = self._get_run_to_resume(run_id, kwargs)
+        log_debug(f"Resuming run: {run_id}")
+        self._resume_run_id = run_id
+        try:
+            return await self.arun(**run_input)
+        finally:
+            self._resume_run_id = None
+
     def set_storage_mode(self):
         if self.storage is not None:
             self.storage.mode = "workflow"
@@ -313,6 +545,29 @@ class Workflow:
             # Important: Replace the instance's run method with run_workflow
             # This is so we call run_workflow() instead of the subclass's run()
             object.__setattr__(self, "run", self.run_workflow.__get__(self))
+        elif self.steps:
+            # Run the steps of the workflow, validating them first
+            graph = StepGraph(self.steps)
+            self._subclass_run = self._run_steps
+            # The parameters of the workflow are the parameters of the steps that are not step outputs
+            self._run_parameters = {}
+            for step in self.steps:
+                for param_name, param in inspect.signature(step.function).parameters.items():
+                    if param_name in graph.steps or param.kind in (param.VAR_POSITIONAL, param.VAR_KEYWORD):
+                        continue
+                    self._run_parameters.setdefault(
+                        param_name,
+                        {
+                            "name": param_name,
+                            "default": param.default if param.default is not inspect.Parameter.empty else None,
+                            "annotation": getattr(param.annotation, "__name__", str(param.annotation))
+                            if param.annotation is not inspect.Parameter.empty
+                            else None,
+                            "required": param.default is inspect.Parameter.empty,
+                        },
+                    )
+            self._run_return_type = "RunResponse"
+            object.__setattr__(self, "run", self.run_workflow.__get__(self))
         else:
             # If the subclass does not override the run method,
             # the Workflow.run() method will be called and will log an error
@@ -351,8 +606,27 @@ class Workflow:
             session_data["videos"] = [vid.model_dump() for vid in self.videos]
         if self.audio is not None:
             session_data["audio"] = [aud.model_dump() for aud in self.audio]
+        if self.step_outputs:
+            # Only outputs that can be stored as JSON are reused across runs
+            session_data["step_outputs"] = self._serialize_step_outputs(self.step_outputs)
+        if self.run_checkpoints:
+            session_data["run_checkpoints"] = {
+                run_id: {
+                    "input": checkpoint["input"] if is_json_serializable(checkpoint["input"]) else None,
+                    "steps": self._serialize_step_outputs(checkpoint["steps"]),
+                }
+                for run_id, checkpoint in self.run_checkpoints.items()
+            }
         return session_data
 
+    def _serialize_step_outputs(self, step_outputs: Dict[str, Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+        serialized_outputs: Dict[str, Dict[str, Any]] = {}
+        for name, step_output in step_outputs.items():
+            serialized = serialize_step_output(step_output)
+            if serialized is not None:
+                serialized_outputs[name] = serialized
+        return serialized_outputs
+
     def get_workflow_session(self) -> WorkflowSession:
         """Get a WorkflowSession object, which can be saved to the database"""
         self.memory = cast(WorkflowMemory, self.memory)
@@ -426,6 +700,30 @@ class Workflow:
                         self.audio = []
                     self.audio.extend([AudioArtifact.model_validate(aud) for aud in audio_from_db])
 
+            # Get the step outputs from the database, outputs of the current session take precedence
+            step_outputs_from_db = session.session_data.get("step_outputs")
+            if step_outputs_from_db is not None and isinstance(step_outputs_from_db, dict):
+                step_outputs_from_db = {
+                    name: deserialize_step_output(step_output) for name, step_output in step_outputs_from_db.items()
+                }
+                self.step_outputs = {**step_outputs_from_db, **(self.step_outputs or {})}
+
+            # Get the checkpoints of the runs that did not complete from the database
+            run_checkpoints_from_db = session.session_data.get("run_checkpoints")
+            if run_checkpoints_from_db is not None and isinstance(run_checkpoints_from_db, dict):
+                for run_id, checkpoint in run_checkpoints_from_db.items():
+                    run_checkpoint = (self.run_checkpoints or {}).get(
+                        run_id, {"input": checkpoint.get("input"), "steps": {}}
+                    )
+                    steps_from_db = {
+                        name: deserialize_step_output(step_output)
+                        for name, step_output in (checkpoint.get("steps") or {}).items()
+                    }
+                    run_checkpoint["steps"] = {**steps_from_db, **run_checkpoint["steps"]}
+                    if self.run_checkpoints is None:
+                        self.run_checkpoints = {}
+                    self.run_checkpoints[run_id] = run_checkpoint
+
         # Read extra_data from the database
         if session.extra_data is not None:
             # If extra_data is set in the workflow, update the database extra_data with the workflow's extra_data
@@ -456,7 +754,8 @@ class Workflow:
             Optional[WorkflowSession]: The loaded WorkflowSession or None if not found.
         """
         if self.storage is not None and self.session_id is not None:
-            self.workflow_session = cast(WorkflowSession, self.storage.read(session_id=self.session_id))
+            with phase(STORAGE), trace_span(STORAGE_READ, {"agno.session_id": self.session_id}):
+                self.workflow_session = cast(WorkflowSession, self.storage.read(session_id=self.session_id))
             if self.workflow_session is not None:
                 self.load_workflow_session(session=self.workflow_session)
         return self.workflow_session
@@ -468,7 +767,8 @@ class Workflow:
             Optional[WorkflowSession]: The saved WorkflowSession or None if not saved.
         """
         if self.storage is not None:
-            self.workflow_session = cast(WorkflowSession, self.storage.upsert(session=self.get_workflow_session()))
+            with phase(STORAGE), trace_span(STORAGE_WRITE, {"agno.session_id": self.session_id}):
+                self.workflow_session = cast(WorkflowSession, self.storage.upsert(session=self.get_workflow_session()))
         return self.workflow_session
 
     def load_session(self, force: bool = False) -> Optional[str]:
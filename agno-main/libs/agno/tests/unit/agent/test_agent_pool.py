@@ -0,0 +1,115 @@
+import asyncio
+from dataclasses import dataclass
+from typing import Any
+
+from agno.agent import Agent
+from agno.agent.pool import AgentPool
+from agno.memory.agent import AgentMemory
+from agno.models.base import Model
+from agno.models.response import ModelResponse
+from agno.tools.toolkit import Toolkit
+
+
+@dataclass
+class EchoModel(Model):
+    """Responds with the last user message after a delay, so concurrent runs overlap."""
+
+    id: str = "echo"
+    delay: float = 0.05
+
+    def invoke(self, messages: Any, **kwargs) -> Any:
+        return messages[-1].content
+
+    async def ainvoke(self, messages: Any, **kwargs) -> Any:
+        await asyncio.sleep(self.delay)
+        return messages[-1].content
+
+    def invoke_stream(self, *args, **kwargs):
+        yield from []
+
+    async def ainvoke_stream(self, *args, **kwargs):
+        yield None
+
+    def parse_provider_response(self, response: Any) -> ModelResponse:
+        return ModelResponse(role="assistant", content=f"echo: {response}")
+
+    def parse_provider_response_delta(self, response: Any) -> ModelResponse:
+        return ModelResponse()
+
+
+class SearchTools(Toolkit):
+    def __init__(self):
+        super().__init__(name="search_tools", tools=[self.search])
+
+    def search(self, query: str) -> str:
+        """Search for a query."""
+        return query
+
+
+def _make_agent() -> Agent:
+    return Agent(
+        agent_id="pooled-agent",
+        model=EchoModel(),
+        tools=[SearchTools()],
+        session_state={"count": 0},
+        memory=AgentMemory(),
+        telemetry=False,
+    )
+
+
+def test_pooled_agents_share_config_but_not_run_state():
+    agent = _make_agent()
+    pool = AgentPool(agent)
+
+    first, second = pool.acquire(), pool.acquire()
+
+    assert first is not second and first is not agent
+    assert first.model is not agent.model
+    assert first.model.id == agent.model.id  # type: ignore
+    first_search = first.tools[0].functions["search"]  # type: ignore
+    assert first_search is not agent.tools[0].functions["search"]  # type: ignore
+    assert first_search is not second.tools[0].functions["search"]  # type: ignore
+    assert first_search.entrypoint == agent.tools[0].functions["search"].entrypoint  # type: ignore
+    assert first.session_state is not agent.session_state
+    assert first.memory is not agent.memory
+
+
+def test_released_agents_are_reset_and_reused():
+    agent = _make_agent()
+    pool = AgentPool(agent, max_idle=1)
+
+    with pool.lease() as pooled:
+        pooled.session_state["count"] = 1  # type: ignore
+        pooled.monitoring = True
+        pooled.run_id = "run-1"
+        pooled.session_id = "session-1"
+
+    assert pool.num_idle == 1
+    assert pooled.session_state == {"count": 0}
+    assert pooled.monitoring is False
+    assert pooled.run_id is None
+    assert pooled.session_id == agent.session_id
+    assert agent.session_state == {"count": 0}
+    assert pool.acquire() is pooled
+
+    # Only max_idle agents are kept
+    first, second = pool.acquire(), pool.acquire()
+    pool.release(first)
+    pool.release(second)
+    assert pool.num_idle == 1
+
+
+async def test_concurrent_runs_do_not_share_state():
+    agent = _make_agent()
+    pool = AgentPool(agent)
+
+    async def run(message: str, session_id: str):
+        async with pool.alease() as pooled:
+            response = await pooled.arun(message, session_id=session_id)
+            return response.content, response.session_id, pooled.run_id == response.run_id
+
+    results = await asyncio.gather(*(run(f"message {i}", f"session-{i}") for i in range(3)))
+
+    assert results == [(f"echo: message {i}", f"session-{i}", True) for i in range(3)]
+    assert agent.run_response is None
+    assert pool.num_idle == 3
@@ -0,0 +1,113 @@
+from unittest.mock import patch
+
+import pytest
+
+from agno.agent import Agent
+from agno.memory.agent import AgentMemory
+from agno.models.message import Message, MessageMetrics
+from agno.models.openai import OpenAIChat
+
+
+def _make_agent(**kwargs) -> Agent:
+    return Agent(
+        model=OpenAIChat(id="gpt-4o", api_key="test"),
+        description="You are a helpful assistant.",
+        instructions=["Be concise.", "Cite your sources."],
+        telemetry=False,
+        **kwargs,
+    )
+
+
+def test_static_prefix_is_built_once():
+    agent = _make_agent()
+
+    with patch.object(Agent, "_build_system_message_prefix", wraps=agent._build_system_message_prefix) as build:
+        first = agent.get_system_message(session_id="session-1")
+        second = agent.get_system_message(session_id="session-1")
+        assert build.call_count == 1
+
+        agent.instructions = ["Be verbose."]
+        third = agent.get_system_message(session_id="session-1")
+        assert build.call_count == 2
+
+    assert first is not None and second is not None and third is not None
+    assert first.content == second.content
+    assert "Be verbose." in third.content  # type: ignore
+    assert "Be concise." not in third.content  # type: ignore
+
+
+def test_prefix_is_rebuilt_when_a_team_member_changes():
+    researcher = Agent(name="Researcher", role="Find sources", telemetry=False)
+    agent = _make_agent(team=[researcher])
+
+    first = agent.get_system_message(session_id="session-1")
+    researcher.role = "Write summaries"
+    second = agent.get_system_message(session_id="session-1")
+
+    assert "Role: Find sources" in first.content  # type: ignore
+    assert "Role: Write summaries" in second.content  # type: ignore
+
+
+def test_volatile_content_comes_last():
+    memory = AgentMemory(create_session_summary=True)
+    agent = _make_agent(add_datetime_to_instructions=True, markdown=True, memory=memory)
+    memory.summary = "The user asked about the weather."  # type: ignore
+
+    system_message = agent.get_system_message(session_id="session-1")
+
+    assert system_message is not None and system_message.cache_breakpoint is not None
+    content: str = system_message.content  # type: ignore
+    static_content, volatile_content = (
+        content[: system_message.cache_breakpoint],
+        content[system_message.cache_breakpoint :],
+    )
+    assert static_content.startswith("You are a helpful assistant.")
+    assert "Use markdown to format your answers." in static_content
+    assert "The current time is" not in static_content
+    assert "The current time is" in volatile_content
+    assert "The user asked about the weather." in volatile_content
+
+
+def test_state_variables_are_formatted_in_the_cached_prefix():
+    agent = _make_agent(session_state={"city": "Paris"}, add_state_in_messages=True)
+    agent.instructions = ["The user lives in {city}."]
+    agent.initialize_agent()
+
+    assert "The user lives in Paris." in agent.get_system_message(session_id="session-1").content  # type: ignore
+    agent.session_state = {"city": "Berlin"}
+    assert "The user lives in Berlin." in agent.get_system_message(session_id="session-1").content  # type: ignore
+
+
+def test_claude_marks_the_static_prefix_as_cache_breakpoint():
+    pytest.importorskip("anthropic")
+    from agno.models.anthropic import Claude
+
+    content = "You are a helpful assistant.\n\nThe current time is now."
+    messages = [
+        Message(role="system", content=content, cache_breakpoint=len("You are a helpful assistant.")),
+        Message(role="user", content="Hi"),
+    ]
+
+    request_kwargs = Claude(cache_system_prompt=True)._prepare_request_kwargs(content, messages)
+
+    assert request_kwargs["system"] == [
+        {"type": "text", "text": "You are a helpful assistant.", "cache_control": {"type": "ephemeral"}},
+        {"type": "text", "text": "The current time is now."},
+    ]
+    # Caching is opt-in
+    assert Claude()._prepare_request_kwargs(content, messages)["system"] == content
+
+
+def test_cache_usage_metrics():
+    anthropic_types = pytest.importorskip("anthropic.types")
+    usage = anthropic_types.Usage(
+        input_tokens=10, output_tokens=5, cache_read_input_tokens=900, cache_creation_input_tokens=100
+    )
+    assistant_message = Message(role="assistant")
+
+    OpenAIChat(id="gpt-4o", api_key="test")._add_usage_metrics_to_assistant_message(assistant_message, usage)
+
+    assert assistant_message.metrics.cached_tokens == 900
+    assert assistant_message.metrics.cache_write_tokens == 100
+    total = assistant_message.metrics + MessageMetrics(cached_tokens=100, cache_write_tokens=0)
+    assert (total.cached_tokens, total.cache_write_tokens) == (1000, 100)
@@ -0,0 +1,130 @@
+import asyncio
+import json
+import time
+
+import pytest
+
+from agno.eval.perf import PerfEval, PerfResult
+from agno.utils.phases import MODEL, STORAGE, TOOL, phase, record_phases
+
+
+def test_percentiles_and_throughput():
+    result = PerfResult(run_times=[i / 100 for i in range(1, 101)], memory_usages=[])
+    assert result.median_run_time == pytest.approx(0.505)
+    assert result.p90_run_time > result.median_run_time
+    assert result.p99_run_time > result.p95_run_time
+    # Sequential runs: the throughput is based on the sum of the run times
+    assert result.throughput == pytest.approx(100 / sum(result.run_times))
+
+
+def test_phases_exclude_nested_phases():
+    with record_phases() as recorder:
+        with phase(TOOL):
+            time.sleep(0.01)
+            with phase(MODEL):
+                time.sleep(0.02)
+    assert recorder.counts == {MODEL: 1, TOOL: 1}
+    assert recorder.times[MODEL] >= 0.02
+    assert 0.01 <= recorder.times[TOOL] < 0.02
+
+
+def test_phases_are_recorded_per_run():
+    def func():
+        with phase(STORAGE):
+            time.sleep(0.001)
+
+    result = PerfEval(func=func, warmup_runs=0, num_iterations=3, measure_memory=False).run()
+    assert len(result.phase_times[STORAGE]) == 3
+    assert result.avg_phase_times[STORAGE] >= 0.001
+
+
+def test_async_func():
+    calls = []
+
+    async def func():
+        calls.append(1)
+        await asyncio.sleep(0)
+
+    result = PerfEval(func=func, warmup_runs=1, num_iterations=3).run()
+    assert len(result.run_times) == 3
+    assert len(result.memory_usages) == 3
+    assert len(calls) == 7
+
+
+@pytest.mark.parametrize("is_async", [False, True])
+def test_concurrent_runs(is_async):
+    if is_async:
+
+        async def func():
+            await asyncio.sleep(0.05)
+    else:
+
+        def func():
+            time.sleep(0.05)
+
+    result = PerfEval(func=func, warmup_runs=0, num_iterations=8, concurrency=4).run()
+    assert len(result.run_times) == 8
+    # Memory is not measured under load
+    assert result.memory_usages == []
+    assert result.concurrency == 4
+    assert result.total_time < 0.05 * 8
+    assert result.throughput > 1 / 0.05
+
+
+def test_failed_runs_are_counted():
+    calls = []
+
+    def func():
+        calls.append(1)
+        if len(calls) % 2 == 0:
+            raise RuntimeError("Failed")
+
+    result = PerfEval(func=func, warmup_runs=0, num_iterations=4, concurrency=2, measure_memory=False).run()
+    assert result.num_errors == 2
+    assert len(result.run_times) == 2
+
+
+def test_target_rps_paces_runs():
+    result = PerfEval(func=lambda: None, warmup_runs=0, num_iterations=5, target_rps=50).run()
+    # The last run starts 4 / 50 seconds after the first
+    assert result.total_time >= 0.08
+
+
+def test_target_rps_measures_from_the_scheduled_start():
+    # One worker can't keep up with the target rate, so the runs queue behind each other
+    result = PerfEval(
+        func=lambda: time.sleep(0.05),
+        warmup_runs=0,
+        num_iterations=4,
+        target_rps=100,
+        measure_memory=False,
+        measure_phases=False,
+    ).run()
+    # The last run is scheduled 0.03 seconds after the first, and finishes after the 4 runs of 0.05 seconds
+    assert max(result.run_times) >= 4 * 0.05 - 0.03
+
+
+def test_cprofile():
+    def func():
+        return sum(range(1000))
+
+    result = PerfEval(func=func, warmup_runs=0, num_iterations=1, measure_memory=False, profiler="cprofile").run()
+    assert "function calls" in result.profile
+
+
+def test_save_results(tmp_path):
+    def func():
+        with phase(MODEL):
+            pass
+
+    json_file = tmp_path / "result.json"
+    PerfEval(func=func, warmup_runs=0, num_iterations=2, save_result_to_file=str(json_file)).run()
+    data = json.loads(json_file.read_text())
+    assert len(data["run_times"]) == 2
+    assert "p99_run_time" in data
+
+    csv_file = tmp_path / "result.csv"
+    PerfEval(func=func, warmup_runs=0, num_iterations=2, save_result_to_file=str(csv_file)).run()
+    lines = csv_file.read_text().splitlines()
+    assert len(lines) == 3
+    assert MODEL in lines[0]
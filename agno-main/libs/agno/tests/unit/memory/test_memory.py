@@ -597,6 +597,55 @@ def test_get_messages_from_last_n_runs(memory_with_model):
     assert messages[1].content == "It's expected to rain."
 
 
+def test_get_messages_from_last_n_runs_with_max_tokens(memory_with_model):
+    """Test retrieving the messages of the most recent runs that fit in a token budget."""
+    session_id = "test_session"
+    for i in range(5):
+        memory_with_model.add_run(
+            session_id,
+            RunResponse(
+                content=f"Response {i}",
+                messages=[
+                    Message(role="user", content=f"Question {i} " + "x" * 36),
+                    Message(role="assistant", content=f"Answer {i} " + "x" * 36),
+                ],
+            ),
+        )
+
+    # Each message is estimated at 16 tokens, so a run uses 32 tokens
+    messages = memory_with_model.get_messages_from_last_n_runs(session_id, max_tokens=70)
+    assert [m.content.split(" ")[1] for m in messages] == ["3", "3", "4", "4"]
+
+    # Runs are not split, except the most recent run when it doesn't fit on its own
+    messages = memory_with_model.get_messages_from_last_n_runs(session_id, max_tokens=20)
+    assert [m.content for m in messages] == ["Answer 4 " + "x" * 36]
+
+    # last_n still caps the number of runs
+    messages = memory_with_model.get_messages_from_last_n_runs(session_id, last_n=1, max_tokens=1000)
+    assert len(messages) == 2
+
+
+def test_get_messages_from_last_n_runs_with_max_tokens_keeps_tool_calls(memory_with_model):
+    """Test that the truncated most recent run doesn't start with a tool result."""
+    session_id = "test_session"
+    memory_with_model.add_run(
+        session_id,
+        RunResponse(
+            content="Done",
+            messages=[
+                Message(role="user", content="x" * 48),
+                Message(role="assistant", content="x" * 48),
+                Message(role="tool", content="x" * 48, tool_call_id="call_1"),
+                Message(role="assistant", content="Done"),
+            ],
+        ),
+    )
+
+    messages = memory_with_model.get_messages_from_last_n_runs(session_id, max_tokens=30)
+    assert [m.role for m in messages] == ["assistant"]
+    assert messages[0].content == "Done"
+
+
 # Team Context Tests
 def test_add_interaction_to_team_context(memory_with_model):
     """Test adding an interaction to team context."""
@@ -0,0 +1,119 @@
+from unittest.mock import Mock, patch
+
+import pytest
+from sqlalchemy import text
+
+from agno.memory.v2.db.sqlite import SqliteMemoryDb
+from agno.memory.v2.memory import Memory
+from agno.memory.v2.schema import UserMemory
+
+
+@pytest.fixture
+def db(tmp_path):
+    db = SqliteMemoryDb(table_name="memories", db_file=str(tmp_path / "memory.db"), page_size=2)
+    db.create()
+    return db
+
+
+def _memory_ids(memory: Memory, user_id: str = "user"):
+    return sorted(memory.memories.get(user_id, {}))  # type: ignore
+
+
+def test_memories_are_stored_as_json_and_legacy_rows_are_read(db):
+    memory = Memory(db=db)
+    memory.add_user_memory(UserMemory(memory="likes pizza", memory_id="m1"), user_id="user")
+    with db.Session() as session:
+        assert session.execute(text("SELECT memory FROM memories")).scalar().startswith('{"memory_id": "m1"')
+        # Rows written by earlier versions, and a row that is not a dict
+        session.execute(
+            text("INSERT INTO memories (id, user_id, memory) VALUES ('m2', 'user', :memory)"),
+            {"memory": str({"memory_id": "m2", "memory": "has a cat", "topics": ["pet"]})},
+        )
+        session.execute(text("INSERT INTO memories (id, user_id, memory) VALUES ('m3', 'user', '__import__(\"os\")')"))
+        session.commit()
+
+    memories = {row.id: row.memory for row in db.read_memories(user_id="user")}
+    assert memories == {
+        "m1": {"memory_id": "m1", "memory": "likes pizza", "last_updated": memories["m1"]["last_updated"]},
+        "m2": {"memory_id": "m2", "memory": "has a cat", "topics": ["pet"]},
+    }
+
+
+def test_refresh_only_reads_changed_memories(db):
+    writer = Memory(db=db)
+    for i in range(5):
+        writer.add_user_memory(UserMemory(memory=f"memory {i}", memory_id=f"m{i}"), user_id="user")
+    writer.add_user_memory(UserMemory(memory="other user", memory_id="o1"), user_id="other")
+
+    reader = Memory(db=db)
+    assert len(reader.get_user_memories(user_id="user")) == 5
+    assert reader.get_user_memories(user_id="other")[0].memory == "other user"
+
+    # Changes made by another Memory, e.g. in another process
+    writer.replace_user_memory("m1", UserMemory(memory="memory 1 updated", memory_id="m1"), user_id="user")
+    writer.add_user_memory(UserMemory(memory="memory 5", memory_id="m5"), user_id="user")
+    writer.delete_user_memory("m2", user_id="user")
+
+    # SqliteMemoryDb overrides __dict__, so its methods are patched on the class
+    with patch.object(
+        SqliteMemoryDb, "read_memories", autospec=True, side_effect=SqliteMemoryDb.read_memories
+    ) as read_memories:
+        memories = {memory.memory_id: memory.memory for memory in reader.get_user_memories(user_id="user")}
+        read_memories.assert_not_called()
+
+    assert sorted(memories) == ["m0", "m1", "m3", "m4", "m5"]
+    assert memories["m1"] == "memory 1 updated"
+    # The memories of other users are kept
+    assert _memory_ids(reader, "other") == ["o1"]
+
+
+def test_refresh_interval_uses_cached_memories(db):
+    writer = Memory(db=db)
+    writer.add_user_memory(UserMemory(memory="memory 0", memory_id="m0"), user_id="user")
+
+    reader = Memory(db=db, refresh_interval=60)
+    assert _memory_ids(reader) == []
+    reader.refresh_from_db(user_id="user")
+    assert _memory_ids(reader) == ["m0"]
+
+    writer.add_user_memory(UserMemory(memory="memory 1", memory_id="m1"), user_id="user")
+    with patch.object(SqliteMemoryDb, "read_memories_updated_since") as read_memories_updated_since:
+        assert len(reader.get_user_memories(user_id="user")) == 1
+        read_memories_updated_since.assert_not_called()
+
+
+def test_memories_written_by_the_memory_manager_are_read_within_the_refresh_interval(db):
+    memory = Memory(db=db, refresh_interval=60)
+    memory.add_user_memory(UserMemory(memory="memory 0", memory_id="m0"), user_id="user")
+    memory.refresh_from_db(user_id="user")
+
+    writer = Memory(db=db)
+
+    def create_or_update_memories(**kwargs):
+        # The memory manager writes to the db directly
+        writer.add_user_memory(UserMemory(memory="memory 1", memory_id="m1"), user_id="user")
+        return "Memories updated"
+
+    memory.memory_manager = Mock(create_or_update_memories=Mock(side_effect=create_or_update_memories))
+    memory.create_user_memories(message="remember this", user_id="user")
+    assert _memory_ids(memory) == ["m0", "m1"]
+
+
+def test_refresh_replaces_the_memories_of_a_user(db):
+    writer = Memory(db=db)
+    writer.add_user_memory(UserMemory(memory="memory 0", memory_id="m0"), user_id="user")
+    writer.add_user_memory(UserMemory(memory="memory 1", memory_id="m1"), user_id="user")
+
+    reader = Memory(db=db)
+    reader.refresh_from_db(user_id="user")
+    user_memories = reader.memories["user"]  # type: ignore
+
+    writer.delete_user_memory("m0", user_id="user")
+    reader.refresh_from_db(user_id="user")
+    # The dict read before the refresh is not changed while it can be read from another thread
+    assert sorted(user_memories) == ["m0", "m1"]
+    assert _memory_ids(reader) == ["m1"]
+
+    reader.refresh_from_db()
+    assert _memory_ids(reader) == ["m1"]
+    assert reader.deep_copy()._lock is not reader._lock
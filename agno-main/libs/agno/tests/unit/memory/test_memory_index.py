@@ -0,0 +1,184 @@
+from dataclasses import dataclass, field
+from typing import List
+from unittest.mock import Mock, patch
+
+import pytest
+
+from agno.embedder.base import Embedder
+from agno.memory.v2.index import InMemoryMemoryIndex, VectorDbMemoryIndex
+from agno.memory.v2.memory import Memory
+from agno.memory.v2.schema import UserMemory
+
+VOCABULARY = ["pizza", "food", "hiking", "mountains", "python", "code", "cat", "pet"]
+
+
+@dataclass
+class KeywordEmbedder(Embedder):
+    """Embeds a text as the counts of the vocabulary words in it, and records the batches it embeds."""
+
+    dimensions: int = len(VOCABULARY)
+    batches: List[List[str]] = field(default_factory=list)
+
+    def get_embedding(self, text: str) -> List[float]:
+        words = text.lower().replace(",", " ").split()
+        return [float(words.count(word)) for word in VOCABULARY]
+
+    def get_embeddings(self, texts: List[str]) -> List[List[float]]:
+        self.batches.append(texts)
+        return [self.get_embedding(text) for text in texts]
+
+
+@pytest.fixture
+def embedder():
+    return KeywordEmbedder()
+
+
+@pytest.fixture
+def memory(embedder):
+    memory = Memory(memory_index=InMemoryMemoryIndex(embedder=embedder, batch_size=2))
+    memory.memories = {
+        "user": {
+            "m1": UserMemory(memory="likes pizza", topics=["food"], memory_id="m1"),
+            "m2": UserMemory(memory="goes hiking in the mountains", memory_id="m2"),
+            "m3": UserMemory(memory="writes python code", memory_id="m3"),
+            "m4": UserMemory(memory="has a cat", topics=["pet"], memory_id="m4"),
+        }
+    }
+    return memory
+
+
+def _search(memory: Memory, query: str, limit=None, **kwargs) -> List[str]:
+    results = memory.search_user_memories(
+        query=query, limit=limit, retrieval_method="semantic", user_id="user", refresh_from_db=False, **kwargs
+    )
+    return [result.memory_id for result in results]  # type: ignore
+
+
+def test_semantic_search_returns_most_similar_memories(memory):
+    assert _search(memory, "favourite food", limit=1) == ["m1"]
+    assert _search(memory, "mountains hiking trip", limit=1) == ["m2"]
+    assert _search(memory, "pet cat", limit=2)[0] == "m4"
+    assert len(_search(memory, "anything")) == 4
+
+
+def test_memories_are_embedded_in_batches_once(memory, embedder):
+    _search(memory, "food")
+    assert [len(batch) for batch in embedder.batches] == [2, 2]
+
+    _search(memory, "code")
+    assert len(embedder.batches) == 2
+
+    # Only new and changed memories are embedded again
+    memory.memories["user"]["m5"] = UserMemory(memory="plays chess", memory_id="m5")
+    memory.memories["user"]["m1"] = UserMemory(memory="likes pizza and python", memory_id="m1")
+    del memory.memories["user"]["m3"]
+    assert _search(memory, "python", limit=1) == ["m1"]
+    assert embedder.batches[2:] == [["likes pizza and python", "plays chess"]]
+
+
+def test_semantic_search_requires_an_index():
+    memory = Memory()
+    memory.memories = {"user": {"m1": UserMemory(memory="likes pizza", memory_id="m1")}}
+    with pytest.raises(ValueError, match="memory_index"):
+        _search(memory, "food")
+
+
+def test_rerank_only_sends_the_candidates(memory):
+    with patch.object(memory, "_search_user_memories_agentic") as mock_search:
+        mock_search.return_value = []
+        _search(memory, "pizza food", limit=1, rerank=True)
+
+    candidates = mock_search.call_args.kwargs["candidates"]
+    assert list(candidates)[0] == "m1"
+    assert len(candidates) == 3
+
+
+def test_vector_db_index_filters_other_users_and_deleted_memories(memory, embedder):
+    vector_db = Mock()
+    vector_db.upsert_available.return_value = True
+    vector_db.name_exists.return_value = False
+    vector_db.search.return_value = [
+        Mock(id="m9", meta_data={"user_id": "user", "memory_id": "m9"}),
+        Mock(id="x1", meta_data={"user_id": "other", "memory_id": "x1"}),
+        Mock(id="m2", meta_data={"user_id": "user", "memory_id": "m2"}),
+    ]
+    vector_db.embedder = embedder
+    memory.memory_index = VectorDbMemoryIndex(vector_db=vector_db, batch_size=3)
+
+    assert _search(memory, "hiking") == ["m2"]
+    assert vector_db.upsert.call_count == 2
+    documents = vector_db.upsert.call_args_list[0].args[0]
+    assert documents[0].meta_data["user_id"] == "user"
+    assert documents[0].meta_data["memory_id"] == "m1"
+    assert documents[0].id == VectorDbMemoryIndex.get_document_id("user", "m1")
+
+    _search(memory, "hiking")
+    assert vector_db.upsert.call_count == 2
+
+
+def test_vector_db_index_replaces_documents_of_changed_memories(memory, embedder):
+    vector_db = Mock()
+    vector_db.upsert_available.return_value = True
+    vector_db.name_exists.return_value = False
+    vector_db.embedder = embedder
+    memory.memory_index = VectorDbMemoryIndex(vector_db=vector_db)
+    memory.index_user_memories(user_id="user")
+
+    memory.memories["user"]["m1"] = UserMemory(memory="likes pizza and python", memory_id="m1")
+    memory.index_user_memories(user_id="user")
+    first, second = [call.args[0] for call in vector_db.upsert.call_args_list]
+    assert [document.id for document in second] == [first[0].id]
+    assert second[0].name != first[0].name
+
+
+def test_vector_db_index_skips_memories_indexed_by_another_process(memory, embedder):
+    vector_db = Mock()
+    vector_db.upsert_available.return_value = True
+    vector_db.name_exists.return_value = False
+    vector_db.embedder = embedder
+    indexed = VectorDbMemoryIndex(vector_db=vector_db)
+    indexed.sync("user", memory.memories["user"])
+    names = {document.name for document in vector_db.upsert.call_args.args[0]}
+    vector_db.name_exists.side_effect = lambda name: name in names
+
+    # A new index, e.g. in another process, only sends the changed memories
+    memory.memories["user"]["m1"] = UserMemory(memory="likes pizza and python", memory_id="m1")
+    VectorDbMemoryIndex(vector_db=vector_db).sync("user", memory.memories["user"])
+    assert [document.content for document in vector_db.upsert.call_args.args[0]] == ["likes pizza and python"]
+
+
+def test_vector_db_index_without_upsert_does_not_duplicate_documents(memory, embedder):
+    vector_db = Mock()
+    vector_db.upsert_available.return_value = False
+    vector_db.name_exists.return_value = False
+    vector_db.id_exists.side_effect = lambda id: id == VectorDbMemoryIndex.get_document_id("user", "m1")
+    vector_db.embedder = embedder
+    memory.memory_index = VectorDbMemoryIndex(vector_db=vector_db)
+
+    memory.index_user_memories(user_id="user")
+    inserted = [document.meta_data["memory_id"] for document in vector_db.insert.call_args.args[0]]
+    assert inserted == ["m2", "m3", "m4"]
+    vector_db.upsert.assert_not_called()
+
+
+def test_memories_that_fail_to_embed_are_embedded_again(memory, embedder):
+    failing = {"has a cat\nTopics: pet"}
+
+    def get_embeddings(texts):
+        embedder.batches.append(texts)
+        return [[] if text in failing else embedder.get_embedding(text) for text in texts]
+
+    with patch.object(embedder, "get_embeddings", side_effect=get_embeddings):
+        assert "m4" not in _search(memory, "pet cat")
+        failing.clear()
+        assert _search(memory, "pet cat", limit=1) == ["m4"]
+    assert embedder.batches[-1] == ["has a cat\nTopics: pet"]
+
+
+def test_async_index_embeds_the_memories(memory, embedder):
+    import asyncio
+
+    asyncio.run(memory.aindex_user_memories(user_id="user"))
+    assert [len(batch) for batch in embedder.batches] == [2, 2]
+    assert _search(memory, "favourite food", limit=1) == ["m1"]
+    assert len(embedder.batches) == 2
@@ -0,0 +1,122 @@
+from unittest.mock import Mock
+
+import pytest
+
+from agno.agent import Agent
+from agno.memory.v2.memory import Memory
+from agno.memory.v2.schema import UserMemory, get_input_hash
+from agno.memory.v2.worker import MemoryTask, MemoryWorker
+from agno.models.message import Message
+from agno.run.messages import RunMessages
+
+
+@pytest.fixture
+def memory():
+    memory = Mock(spec=Memory)
+    memory.memories = {"user": {"m1": UserMemory(memory="likes pizza", input="I like pizza")}}
+    return memory
+
+
+@pytest.fixture
+def worker():
+    worker = MemoryWorker(max_batch_size=10, flush_interval=60)
+    yield worker
+    worker.close()
+
+
+def _task(memory, content, session_id="s1", user_id="user", summary=True):
+    return MemoryTask(
+        memory=memory,
+        user_id=user_id,
+        session_id=session_id,
+        messages=[Message(role="user", content=content)],
+        create_session_summary=summary,
+    )
+
+
+def test_flush_batches_queued_runs(memory, worker):
+    worker.submit(_task(memory, "I have a cat"))
+    worker.submit(_task(memory, "I live in Paris"))
+    worker.submit(_task(memory, "I work remotely", session_id="s2", user_id="other", summary=False))
+    # Nothing is processed before the flush policy is met
+    assert memory.create_user_memories.call_count == 0
+    assert worker.num_queued == 3
+
+    assert worker.flush(timeout=5)
+
+    # One extraction call per user, one summary per session
+    assert memory.create_user_memories.call_count == 2
+    user_call = memory.create_user_memories.call_args_list[0].kwargs
+    assert user_call["user_id"] == "user"
+    assert [m.content for m in user_call["messages"]] == ["I have a cat", "I live in Paris"]
+    memory.create_session_summary.assert_called_once_with(session_id="s1", user_id="user")
+    assert worker.num_queued == 0
+
+
+def test_duplicate_messages_are_skipped(memory, worker):
+    worker.submit(_task(memory, "I like pizza"))
+    worker.submit(_task(memory, "I have a cat"))
+    worker.submit(_task(memory, "I have a cat"))
+    worker.flush(timeout=5)
+
+    memory.refresh_from_db.assert_called_with(user_id="user")
+    messages = memory.create_user_memories.call_args.kwargs["messages"]
+    assert [m.content for m in messages] == ["I have a cat"]
+
+
+def test_messages_of_batched_memories_are_skipped(memory, worker):
+    # A memory created from a batch of messages stores the hash of each message
+    memory.memories["user"]["m2"] = UserMemory(
+        memory="has a cat and lives in Paris",
+        input="I have a cat, I live in Paris",
+        input_hashes=[get_input_hash("I have a cat"), get_input_hash("I live in Paris")],
+    )
+    worker.submit(_task(memory, "I live in Paris"))
+    worker.submit(_task(memory, "I work remotely"))
+    worker.flush(timeout=5)
+
+    messages = memory.create_user_memories.call_args.kwargs["messages"]
+    assert [m.content for m in messages] == ["I work remotely"]
+
+
+def test_queue_is_processed_at_max_batch_size(memory):
+    worker = MemoryWorker(max_batch_size=2, flush_interval=60)
+    try:
+        worker.submit(_task(memory, "I have a cat"))
+        worker.submit(_task(memory, "I live in Paris"))
+        # Wait for the worker without requesting a flush
+        with worker._condition:
+            assert worker._condition.wait_for(
+                lambda: not worker._queue and not worker._processing and memory.create_user_memories.called,
+                timeout=5,
+            )
+        memory.create_user_memories.assert_called_once()
+    finally:
+        worker.close()
+
+
+def test_failures_do_not_stop_the_worker(memory, worker):
+    memory.create_user_memories.side_effect = [RuntimeError("model error"), "ok"]
+    worker.submit(_task(memory, "I have a cat"))
+    assert worker.flush(timeout=5)
+    worker.submit(_task(memory, "I live in Paris"))
+    assert worker.flush(timeout=5)
+    assert memory.create_user_memories.call_count == 2
+    assert memory.create_session_summary.call_count == 2
+
+
+def test_agent_queues_memories_on_the_worker():
+    worker = Mock(spec=MemoryWorker)
+    memory = Memory(memory_worker=worker)
+    memory.create_user_memories = Mock()  # type: ignore
+    agent = Agent(memory=memory, enable_user_memories=True, enable_session_summaries=True)
+    user_message = Message(role="user", content="I have a cat")
+
+    agent._make_memories_and_summaries(RunMessages(user_message=user_message), session_id="s1", user_id="user")
+
+    memory.create_user_memories.assert_not_called()
+    task = worker.submit.call_args.args[0]
+    assert task.memory is memory
+    assert task.user_id == "user"
+    assert task.messages == [user_message]
+    assert task.create_session_summary
@@ -0,0 +1,123 @@
+import asyncio
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+from agno.memory.v2.memory import Memory
+from agno.memory.v2.schema import SessionSummary
+from agno.memory.v2.summarizer import SessionSummarizer, SessionSummaryResponse
+from agno.models.message import Message
+from agno.run.response import RunResponse
+
+
+def _add_run(memory: Memory, question: str, answer: str, session_id: str = "s1"):
+    memory.add_run(
+        session_id,
+        RunResponse(messages=[Message(role="user", content=question), Message(role="assistant", content=answer)]),
+    )
+
+
+def _summarize(conversation, previous_summaries=None):
+    summaries = [summary.summary for summary in previous_summaries or []]
+    return SessionSummaryResponse(summary=" | ".join(summaries + [m.content for m in conversation]))
+
+
+@pytest.fixture
+def summarize():
+    with patch.object(SessionSummarizer, "_summarize", side_effect=_summarize) as summarize:
+        yield summarize
+
+
+def _memory(**kwargs) -> Memory:
+    return Memory(summarizer=SessionSummarizer(model=Mock(), **kwargs))
+
+
+def test_summary_is_updated_with_new_messages_only(summarize):
+    memory = _memory()
+    _add_run(memory, "Hi", "Hello")
+    summary = memory.create_session_summary("s1", "user")
+    assert summary.summary == "Hi | Hello"
+    assert summary.num_messages == 2
+
+    _add_run(memory, "Bye", "Goodbye")
+    summary = memory.create_session_summary("s1", "user")
+    conversation, previous_summaries = summarize.call_args.args
+    assert [m.content for m in conversation] == ["Bye", "Goodbye"]
+    assert [s.summary for s in previous_summaries] == ["Hi | Hello"]
+    assert summary.summary == "Hi | Hello | Bye | Goodbye"
+    assert summary.num_messages == 4
+
+    # No new messages, the summary is unchanged
+    assert memory.create_session_summary("s1", "user") is summary
+    assert summarize.call_count == 2
+
+
+def test_summary_is_recreated_when_not_incremental(summarize):
+    memory = _memory(incremental=False)
+    _add_run(memory, "Hi", "Hello")
+    memory.create_session_summary("s1", "user")
+    _add_run(memory, "Bye", "Goodbye")
+    memory.create_session_summary("s1", "user")
+    conversation, previous_summaries = summarize.call_args.args
+    assert len(conversation) == 4
+    assert previous_summaries is None
+
+
+def test_summary_without_watermark_is_recreated(summarize):
+    memory = _memory()
+    memory.summaries = {"user": {"s1": SessionSummary(summary="Stored by an earlier version")}}
+    _add_run(memory, "Hi", "Hello")
+    summary = memory.create_session_summary("s1", "user")
+    assert summary.summary == "Hi | Hello"
+    assert summary.num_messages == 2
+
+
+def test_long_conversations_are_summarized_in_segments(summarize):
+    summarizer = SessionSummarizer(model=Mock(), max_messages=2)
+    conversation = [Message(role="user", content=str(i)) for i in range(6)]
+
+    summary = summarizer.run(conversation, previous_summary=SessionSummaryResponse(summary="before"))
+
+    # 3 segments, then the 4 summaries are merged two by two: 2 merges, then 1
+    assert summarize.call_count == 6
+    for call in summarize.call_args_list:
+        conversation_arg = call.args[0]
+        previous_summaries = call.args[1] if len(call.args) > 1 else None
+        assert len(conversation_arg) + len(previous_summaries or []) <= 2
+    assert summary.summary == "before | 0 | 1 | 2 | 3 | 4 | 5"
+
+
+def test_long_conversations_are_summarized_in_segments_async():
+    summarizer = SessionSummarizer(model=Mock(), max_messages=2)
+    conversation = [Message(role="user", content=str(i)) for i in range(5)]
+
+    async def asummarize(conversation, previous_summaries=None):
+        return _summarize(conversation, previous_summaries)
+
+    with patch.object(SessionSummarizer, "_asummarize", new=AsyncMock(side_effect=asummarize)) as summarize:
+        summary = asyncio.run(summarizer.arun(conversation))
+
+    assert summarize.call_count == 5
+    assert summary.summary == "0 | 1 | 2 | 3 | 4"
+
+
+def test_system_message_includes_previous_summary():
+    summarizer = SessionSummarizer(model=Mock())
+    model = Mock(response_format=None)
+    system_message = summarizer.get_system_message(
+        [Message(role="user", content="Bye")],
+        model=model,
+        previous_summaries=[SessionSummaryResponse(summary="The user said hi", topics=["greetings"])],
+    )
+    assert "Summary: The user said hi\nTopics: greetings" in system_message.content
+    assert "<new_messages>\nUser: Bye</new_messages>" in system_message.content
+
+
+def test_max_messages_must_allow_merging():
+    with pytest.raises(ValueError):
+        SessionSummarizer(max_messages=1)
+
+
+def test_summary_watermark_is_serialized():
+    summary = SessionSummary(summary="Hi", num_messages=4)
+    assert SessionSummary.from_dict(summary.to_dict()).num_messages == 4
@@ -0,0 +1,157 @@
+from dataclasses import dataclass, field
+from typing import Any, List
+
+import pytest
+
+from agno.models.base import Model
+from agno.models.budget import ContextBudget
+from agno.models.message import Message
+from agno.models.response import ModelResponse
+from agno.utils.tokens import (
+    HEURISTIC_TOKENIZER,
+    TRUNCATION_MARKER,
+    count_message_tokens,
+    get_tokenizer,
+)
+
+
+@dataclass
+class RecordingModel(Model):
+    """Records the messages of each request."""
+
+    id: str = "recording"
+    requests: List[List[Message]] = field(default_factory=list)
+
+    def invoke(self, messages: List[Message]) -> Any:
+        self.requests.append(list(messages))
+        return "done"
+
+    async def ainvoke(self, messages: List[Message]) -> Any:
+        return self.invoke(messages)
+
+    def invoke_stream(self, messages: List[Message]):
+        yield self.invoke(messages)
+
+    async def ainvoke_stream(self, messages: List[Message]):
+        yield self.invoke(messages)
+
+    def parse_provider_response(self, response: Any) -> ModelResponse:
+        return ModelResponse(role="assistant", content=response)
+
+    def parse_provider_response_delta(self, response: Any) -> ModelResponse:
+        return ModelResponse(role="assistant", content=response)
+
+
+def _history_run(i: int) -> List[Message]:
+    return [
+        Message(role="user", content=f"question {i} " + "x" * 400, from_history=True),
+        Message(role="assistant", content=f"answer {i} " + "y" * 400, from_history=True),
+    ]
+
+
+def _messages() -> List[Message]:
+    return [
+        Message(role="system", content="You answer questions."),
+        *_history_run(1),
+        *_history_run(2),
+        Message(role="user", content="What is the answer?"),
+    ]
+
+
+def test_heuristic_tokenizer():
+    assert HEURISTIC_TOKENIZER.count("x" * 400) == 100
+    assert HEURISTIC_TOKENIZER.truncate("short", 10) == "short"
+    assert HEURISTIC_TOKENIZER.truncate("x" * 400, 10) == "x" * 40 + TRUNCATION_MARKER
+    # Models without a tokenizer use the heuristic
+    assert get_tokenizer(provider="Anthropic", model_id="claude-3-5-sonnet-20241022") is HEURISTIC_TOKENIZER
+
+
+def test_tiktoken_tokenizer():
+    pytest.importorskip("tiktoken")
+    tokenizer = get_tokenizer(provider="OpenAI", model_id="gpt-4o")
+
+    assert tokenizer.name == "tiktoken:o200k_base"
+    assert tokenizer.count("hello world") == 2
+    assert tokenizer.truncate("hello world, how are you?", 2) == "hello world" + TRUNCATION_MARKER
+    # Unknown (e.g. Azure deployment) names use the default encoding
+    assert get_tokenizer(provider="Azure", model_id="my-deployment").name == "tiktoken:o200k_base"
+
+
+def test_token_counts_are_cached_per_tokenizer():
+    class DoubleTokenizer(type(HEURISTIC_TOKENIZER)):  # type: ignore
+        name = "double"
+
+        def count(self, text: str) -> int:
+            return 2 * super().count(text)
+
+    message = Message(role="user", content="x" * 400)
+
+    assert count_message_tokens(message) == 104
+    assert count_message_tokens(message, DoubleTokenizer()) == 204
+    assert message._token_counts == {"heuristic": 104, "double": 204}
+
+
+def test_budget_keeps_messages_that_fit():
+    messages = _messages()
+    assert ContextBudget(context_window=10_000).fit(messages) == messages
+
+
+def test_budget_drops_the_oldest_history_runs():
+    messages = _messages()
+
+    fitted = ContextBudget(context_window=400, reserve_output_tokens=100).fit(messages)
+
+    assert [m.content[:10] for m in fitted] == [
+        "You answer",
+        "question 2",
+        "answer 2 y",
+        "What is th",
+    ]
+    assert len(messages) == 6
+
+
+def test_budget_truncates_tool_results_and_references():
+    tool_result = Message(role="tool", tool_call_id="call_1", content="z" * 4000)
+    user_message = Message(
+        role="user",
+        content="Question\n\n<references>\n" + "r" * 4000 + "\n</references>",
+        references={"query": "Question"},  # type: ignore
+    )
+    messages = [user_message, tool_result]
+    budget = ContextBudget(context_window=100_000, max_tool_result_tokens=50, max_reference_tokens=25)
+
+    fitted = budget.fit(messages)
+
+    assert fitted[0].content == "Question\n\n<references>\n" + "r" * 100 + TRUNCATION_MARKER + "\n</references>"
+    assert fitted[1].content == "z" * 200 + TRUNCATION_MARKER
+    assert fitted[1].tool_call_id == "call_1"
+    # The messages of the run are not modified
+    assert tool_result.content == "z" * 4000
+    assert count_message_tokens(tool_result) == 1004
+
+
+def test_budget_truncates_the_longest_tool_results_to_fit():
+    messages = [
+        Message(role="user", content="Question"),
+        Message(role="tool", tool_call_id="call_1", content="a" * 4000),
+        Message(role="tool", tool_call_id="call_2", content="b" * 400),
+    ]
+
+    fitted = ContextBudget(context_window=700).fit(messages)
+
+    assert sum(count_message_tokens(m) for m in fitted) <= 700
+    assert fitted[1].content.startswith("a" * 100)  # type: ignore
+    assert fitted[1].content.endswith(TRUNCATION_MARKER)  # type: ignore
+    assert fitted[2].content == "b" * 400
+
+
+def test_model_sends_fitted_messages():
+    model = RecordingModel(context_budget=ContextBudget(context_window=300))
+    messages = _messages()
+
+    model.response(messages)
+
+    assert [m.content[:10] for m in model.requests[0]] == ["You answer", "question 2", "answer 2 y", "What is th"]
+    # The run keeps all messages
+    assert len(messages) == 7
+    assert messages[-1].content == "done"
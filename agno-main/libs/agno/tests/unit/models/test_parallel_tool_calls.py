@@ -0,0 +1,242 @@
+import threading
+import time
+from typing import Any, List
+
+import pytest
+
+from agno.exceptions import StopAgentRun
+from agno.models.base import Model
+from agno.models.message import Message
+from agno.models.response import ModelResponse, ModelResponseEvent
+from agno.tools.function import Function, FunctionCall
+
+
+class MockModel(Model):
+    def invoke(self, *args, **kwargs) -> Any:
+        pass
+
+    async def ainvoke(self, *args, **kwargs) -> Any:
+        pass
+
+    def invoke_stream(self, *args, **kwargs):
+        yield from []
+
+    async def ainvoke_stream(self, *args, **kwargs):
+        yield None
+
+    def parse_provider_response(self, response: Any) -> ModelResponse:
+        return ModelResponse()
+
+    def parse_provider_response_delta(self, response: Any) -> ModelResponse:
+        return ModelResponse()
+
+
+def _make_call(function: Function, call_id: str, **arguments) -> FunctionCall:
+    return FunctionCall(function=function, arguments=arguments, call_id=call_id)
+
+
+def _run(model: Model, function_calls: List[FunctionCall]):
+    results: List[Message] = []
+    events = list(model.run_function_calls(function_calls, results))
+    return events, results
+
+
+def sleep_and_echo(value: str, delay: float = 0.2) -> str:
+    time.sleep(delay)
+    return value
+
+
+def test_parallel_tool_calls_run_concurrently_and_keep_order():
+    model = MockModel(id="test", run_tools_in_parallel=True)
+    function = Function.from_callable(sleep_and_echo)
+    function_calls = [_make_call(function, f"call_{i}", value=str(i), delay=0.3 - i * 0.1) for i in range(3)]
+
+    start = time.perf_counter()
+    events, results = _run(model, function_calls)
+    elapsed = time.perf_counter() - start
+
+    assert elapsed < 0.5
+    assert [r.content for r in results] == ["0", "1", "2"]
+    assert [r.tool_call_id for r in results] == ["call_0", "call_1", "call_2"]
+    started = [e for e in events if e.event == ModelResponseEvent.tool_call_started.value]
+    completed = [e for e in events if e.event == ModelResponseEvent.tool_call_completed.value]
+    assert len(started) == 3
+    assert [e.tool_calls[0]["tool_call_id"] for e in completed] == ["call_0", "call_1", "call_2"]
+
+
+def test_sequential_by_default():
+    model = MockModel(id="test")
+    function = Function.from_callable(sleep_and_echo)
+    function_calls = [_make_call(function, f"call_{i}", value=str(i), delay=0.1) for i in range(3)]
+
+    start = time.perf_counter()
+    _, results = _run(model, function_calls)
+
+    assert time.perf_counter() - start >= 0.3
+    assert [r.content for r in results] == ["0", "1", "2"]
+
+
+def test_max_concurrency_and_parallel_safe():
+    lock = threading.Lock()
+    state = {"running": 0, "max_running": 0, "exclusive_overlap": False}
+
+    def track(value: str) -> str:
+        with lock:
+            state["running"] += 1
+            state["max_running"] = max(state["max_running"], state["running"])
+        time.sleep(0.05)
+        with lock:
+            state["running"] -= 1
+        return value
+
+    def exclusive(value: str) -> str:
+        if state["running"] > 0:
+            state["exclusive_overlap"] = True
+        return value
+
+    model = MockModel(id="test", run_tools_in_parallel=True)
+    limited = Function.from_callable(track)
+    limited.max_concurrency = 2
+    not_parallel_safe = Function.from_callable(exclusive)
+    not_parallel_safe.parallel_safe = False
+    function_calls = [_make_call(limited, f"call_{i}", value=str(i)) for i in range(4)]
+    function_calls.insert(1, _make_call(not_parallel_safe, "exclusive", value="x"))
+
+    _, results = _run(model, function_calls)
+
+    assert [r.content for r in results] == ["0", "x", "1", "2", "3"]
+    assert state["max_running"] == 2
+    assert state["exclusive_overlap"] is False
+
+
+def test_timeout_reports_failed_call():
+    model = MockModel(id="test", run_tools_in_parallel=True, tool_call_timeout=0.1)
+    function = Function.from_callable(sleep_and_echo)
+    function_calls = [
+        _make_call(function, "fast", value="fast", delay=0.0),
+        _make_call(function, "slow", value="slow", delay=1.0),
+    ]
+
+    start = time.perf_counter()
+    _, results = _run(model, function_calls)
+
+    assert time.perf_counter() - start < 0.5
+    assert results[0].content == "fast"
+    assert results[1].tool_call_error is True
+    assert "timed out" in results[1].content
+
+
+def test_timed_out_calls_keep_their_error():
+    model = MockModel(id="test", run_tools_in_parallel=True, tool_call_timeout=0.1)
+    function = Function.from_callable(sleep_and_echo)
+    function_calls = [
+        _make_call(function, "fast", value="fast", delay=0.0),
+        _make_call(function, "slow", value="slow", delay=0.3),
+    ]
+
+    _run(model, function_calls)
+    # Let the abandoned call finish
+    time.sleep(0.4)
+
+    assert function_calls[0].result == "fast"
+    assert function_calls[1].result is None
+    assert "timed out" in function_calls[1].error  # type: ignore
+
+
+def test_agent_sets_parallel_tool_execution_on_the_model():
+    from agno.agent import Agent
+
+    model = MockModel(id="test", run_tools_in_parallel=True, max_tool_workers=2, tool_call_timeout=1.0)
+    agent = Agent(model=model, telemetry=False)
+
+    agent.update_model(session_id="session")
+
+    assert model.run_tools_in_parallel is False
+    assert model.max_tool_workers is None
+    assert model.tool_call_timeout is None
+
+
+def test_timed_out_calls_do_not_block_calls_that_are_not_parallel_safe():
+    model = MockModel(id="test", run_tools_in_parallel=True, tool_call_timeout=0.1)
+    function = Function.from_callable(sleep_and_echo)
+    not_parallel_safe = Function.from_callable(sleep_and_echo)
+    not_parallel_safe.parallel_safe = False
+    function_calls = [
+        _make_call(function, "slow", value="slow", delay=1.0),
+        _make_call(not_parallel_safe, "exclusive", value="x", delay=0.0),
+    ]
+
+    start = time.perf_counter()
+    _, results = _run(model, function_calls)
+
+    assert time.perf_counter() - start < 0.5
+    assert results[0].tool_call_error is True
+    assert results[1].content == "x"
+
+
+def test_max_concurrency_is_shared_by_batches():
+    lock = threading.Lock()
+    state = {"running": 0, "max_running": 0}
+
+    def track(value: str) -> str:
+        with lock:
+            state["running"] += 1
+            state["max_running"] = max(state["max_running"], state["running"])
+        time.sleep(0.05)
+        with lock:
+            state["running"] -= 1
+        return value
+
+    model = MockModel(id="test", run_tools_in_parallel=True)
+    limited = Function.from_callable(track)
+    limited.max_concurrency = 1
+
+    batches = [[_make_call(limited, f"call_{b}_{i}", value=str(i)) for i in range(2)] for b in range(2)]
+    threads = [threading.Thread(target=_run, args=(model, batch)) for batch in batches]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert state["max_running"] == 1
+
+
+def test_tool_call_limit_and_agent_exceptions():
+    def stop(value: str) -> str:
+        raise StopAgentRun("Stopping", agent_message="Stopped by tool")
+
+    model = MockModel(id="test", run_tools_in_parallel=True, tool_call_limit=2)
+    function = Function.from_callable(sleep_and_echo)
+    stop_function = Function.from_callable(stop)
+    function_calls = [
+        _make_call(stop_function, "stop", value="a"),
+        _make_call(function, "call_1", value="b", delay=0.0),
+        _make_call(function, "call_2", value="c", delay=0.0),
+    ]
+
+    _, results = _run(model, function_calls)
+
+    # Only the calls within the limit are run, followed by the messages of the agent exception
+    assert [r.tool_call_id for r in results[:2]] == ["stop", "call_1"]
+    assert results[2].content == "Stopped by tool"
+    assert model.tool_choice == "none"
+
+
+@pytest.mark.parametrize("parallel", [False, True])
+def test_show_result_streams_generator_output(parallel):
+    def stream(value: str):
+        yield from value
+
+    model = MockModel(id="test", run_tools_in_parallel=parallel)
+    function = Function.from_callable(stream)
+    function.show_result = True
+
+    events, results = _run(model, [_make_call(function, "a", value="ab"), _make_call(function, "b", value="cd")])
+
+    assert [e.content for e in events if e.event == ModelResponseEvent.assistant_response.value] == [
+        "a",
+        "b",
+        "c",
+        "d",
+    ]
+    assert [r.content for r in results] == ["ab", "cd"]
@@ -0,0 +1,151 @@
+from dataclasses import dataclass
+from typing import Any, List, Optional
+
+from pydantic import BaseModel
+
+from agno.models.base import Model
+from agno.models.cache import ModelResponseCache
+from agno.models.message import Message
+from agno.models.response import ModelResponse
+from agno.tools.cache import DiskToolCache
+
+
+@dataclass
+class CountingModel(Model):
+    """Answers with the number of requests it received, streamed word by word."""
+
+    id: str = "counting"
+    temperature: Optional[float] = 0
+    num_requests: int = 0
+
+    def _answer(self) -> str:
+        self.num_requests += 1
+        return f"answer number {self.num_requests}"
+
+    def invoke(self, messages: List[Message]) -> Any:
+        return self._answer()
+
+    async def ainvoke(self, messages: List[Message]) -> Any:
+        return self._answer()
+
+    def invoke_stream(self, messages: List[Message]):
+        answer = self._answer()
+        for i, word in enumerate(answer.split(" ")):
+            yield word if i == 0 else f" {word}"
+
+    async def ainvoke_stream(self, messages: List[Message]):
+        for chunk in self.invoke_stream(messages):
+            yield chunk
+
+    def parse_provider_response(self, response: Any) -> ModelResponse:
+        if self.response_format is not None:
+            return ModelResponse(role="assistant", content=response, parsed=self.response_format(answer=response))
+        return ModelResponse(role="assistant", content=response)
+
+    def parse_provider_response_delta(self, response: Any) -> ModelResponse:
+        return ModelResponse(role="assistant", content=response)
+
+
+def _messages(content: str = "What is the answer?") -> List[Message]:
+    return [Message(role="system", content="You answer questions."), Message(role="user", content=content)]
+
+
+def test_response_is_cached():
+    model = CountingModel(response_cache=ModelResponseCache())
+
+    first = model.response(_messages())
+    second_messages = _messages()
+    second = model.response(second_messages)
+
+    assert model.num_requests == 1
+    assert first.content == second.content == "answer number 1"
+    assert second_messages[-1].metrics.additional_metrics == {"response_cache_hit": True}
+    assert model.response_cache.cache.stats.to_dict() == {"hits": 1, "misses": 1, "hit_rate": 0.5}
+
+    # Different messages are a miss
+    assert model.response(_messages("What is the question?")).content == "answer number 2"
+
+
+def test_temperature_above_zero_bypasses_the_cache():
+    model = CountingModel(temperature=0.7, response_cache=ModelResponseCache())
+    model.response(_messages())
+    model.response(_messages())
+    assert model.num_requests == 2
+
+    forced_model = CountingModel(temperature=0.7, response_cache=ModelResponseCache(force=True))
+    forced_model.response(_messages())
+    forced_model.response(_messages())
+    assert forced_model.num_requests == 1
+
+
+def test_default_temperature_bypasses_the_cache():
+    model = CountingModel(temperature=None, response_cache=ModelResponseCache())
+    model.response(_messages())
+    model.response(_messages())
+    assert model.num_requests == 2
+
+    forced_model = CountingModel(temperature=None, response_cache=ModelResponseCache(force=True))
+    forced_model.response(_messages())
+    forced_model.response(_messages())
+    assert forced_model.num_requests == 1
+
+
+def test_cached_response_is_replayed_as_stream():
+    model = CountingModel(response_cache=ModelResponseCache())
+
+    streamed = [response.content for response in model.response_stream(_messages())]
+    replayed = [response.content for response in model.response_stream(_messages())]
+
+    assert model.num_requests == 1
+    assert streamed == replayed == ["answer", " number", " 1"]
+    # Replaying a cached stream does not rewrite the cached response
+    assert [response.content for response in model.response_stream(_messages())] == streamed
+    # Responses cached from a stream are also used by response()
+    assert model.response(_messages()).content == "answer number 1"
+
+
+async def test_async_response_and_stream_are_cached():
+    model = CountingModel(response_cache=ModelResponseCache())
+
+    first = await model.aresponse(_messages())
+    second = await model.aresponse(_messages())
+    replayed = [response.content async for response in model.aresponse_stream(_messages())]
+
+    assert model.num_requests == 1
+    assert first.content == second.content == "answer number 1"
+    assert replayed == ["answer number 1"]
+
+
+def test_disk_cache_is_shared_across_models(tmp_path):
+    first_model = CountingModel(response_cache=ModelResponseCache(cache=DiskToolCache(cache_dir=tmp_path)))
+    second_model = CountingModel(response_cache=ModelResponseCache(cache=DiskToolCache(cache_dir=tmp_path)))
+
+    first_model.response(_messages())
+
+    assert second_model.response(_messages()).content == "answer number 1"
+    assert second_model.num_requests == 0
+    # A different model id is a different request
+    second_model.id = "other"
+    assert second_model.response(_messages()).content == "answer number 1"
+    assert second_model.num_requests == 1
+
+
+def test_parsed_response_is_restored():
+    class Answer(BaseModel):
+        answer: str
+
+    model = CountingModel(response_format=Answer, response_cache=ModelResponseCache())
+
+    first = model.response(_messages())
+    second = model.response(_messages())
+
+    assert model.num_requests == 1
+    assert isinstance(second.parsed, Answer)
+    assert second.parsed == first.parsed == Answer(answer="answer number 1")
+
+
+def test_expired_responses_are_not_used():
+    model = CountingModel(response_cache=ModelResponseCache(ttl=0))
+    model.response(_messages())
+    model.response(_messages())
+    assert model.num_requests == 2
@@ -0,0 +1,142 @@
+import asyncio
+import time
+from typing import Any, List
+
+from agno.agent import Agent
+from agno.models.base import Model
+from agno.models.message import Message
+from agno.models.response import ModelResponse
+from agno.tools.function import Function, FunctionCall
+from agno.tools.memo import ToolCallMemo
+
+
+class MockModel(Model):
+    def invoke(self, *args, **kwargs) -> Any:
+        pass
+
+    async def ainvoke(self, *args, **kwargs) -> Any:
+        pass
+
+    def invoke_stream(self, *args, **kwargs):
+        yield from []
+
+    async def ainvoke_stream(self, *args, **kwargs):
+        yield None
+
+    def parse_provider_response(self, response: Any) -> ModelResponse:
+        return ModelResponse()
+
+    def parse_provider_response_delta(self, response: Any) -> ModelResponse:
+        return ModelResponse()
+
+
+def _make_search(calls: List[str], delay: float = 0.0) -> Function:
+    def search(query: str, limit: int = 5) -> str:
+        calls.append(query)
+        time.sleep(delay)
+        return f"results for {query}"
+
+    return Function.from_callable(search)
+
+
+def _make_calls(function: Function, *arguments) -> List[FunctionCall]:
+    return [FunctionCall(function=function, arguments=args, call_id=f"call_{i}") for i, args in enumerate(arguments)]
+
+
+def test_identical_calls_reuse_the_result():
+    calls: List[str] = []
+    function = _make_search(calls)
+    model = MockModel(id="test")
+    model.set_tool_call_memo(ToolCallMemo())
+
+    for arguments in [{"query": "cats", "limit": 3}, {"limit": 3, "query": "cats"}, {"query": "dogs"}]:
+        results: List[Message] = []
+        list(model.run_function_calls(_make_calls(function, arguments), results))
+        assert results[0].content == f"results for {arguments['query']}"
+
+    assert calls == ["cats", "dogs"]
+    assert model._tool_call_memo.hits == 1  # type: ignore
+
+
+def test_calls_are_not_deduplicated_without_memo_or_when_opted_out():
+    calls: List[str] = []
+    function = _make_search(calls)
+    model = MockModel(id="test")
+    list(model.run_function_calls(_make_calls(function, {"query": "cats"}, {"query": "cats"}), []))
+    assert calls == ["cats", "cats"]
+
+    calls.clear()
+    function.deduplicate = False
+    model.set_tool_call_memo(ToolCallMemo())
+    list(model.run_function_calls(_make_calls(function, {"query": "cats"}, {"query": "cats"}), []))
+    assert calls == ["cats", "cats"]
+
+
+def test_failed_calls_are_not_memoized():
+    attempts: List[int] = []
+
+    def flaky(query: str) -> str:
+        attempts.append(1)
+        if len(attempts) == 1:
+            raise ValueError("temporary error")
+        return "ok"
+
+    function = Function.from_callable(flaky)
+    model = MockModel(id="test")
+    model.set_tool_call_memo(ToolCallMemo())
+    results: List[Message] = []
+    list(model.run_function_calls(_make_calls(function, {"query": "a"}, {"query": "a"}, {"query": "a"}), results))
+
+    assert [r.tool_call_error for r in results] == [True, False, False]
+    assert len(attempts) == 2
+
+
+def test_parallel_identical_calls_single_flight():
+    calls: List[str] = []
+    function = _make_search(calls, delay=0.2)
+    model = MockModel(id="test", run_tools_in_parallel=True)
+    model.set_tool_call_memo(ToolCallMemo())
+    results: List[Message] = []
+
+    list(
+        model.run_function_calls(
+            _make_calls(function, {"query": "cats"}, {"query": "cats"}, {"query": "dogs"}), results
+        )
+    )
+
+    assert sorted(calls) == ["cats", "dogs"]
+    assert [r.content for r in results] == ["results for cats", "results for cats", "results for dogs"]
+    assert [r.tool_call_id for r in results] == ["call_0", "call_1", "call_2"]
+
+
+async def test_async_identical_calls_single_flight():
+    calls: List[str] = []
+
+    async def search(query: str) -> str:
+        calls.append(query)
+        await asyncio.sleep(0.1)
+        return f"results for {query}"
+
+    function = Function.from_callable(search)
+    model = MockModel(id="test")
+    model.set_tool_call_memo(ToolCallMemo())
+    results: List[Message] = []
+
+    async for _ in model.arun_function_calls(
+        _make_calls(function, {"query": "cats"}, {"query": "cats"}, {"query": "dogs"}), results
+    ):
+        pass
+
+    assert calls == ["cats", "dogs"]
+    assert [r.content for r in results] == ["results for cats", "results for cats", "results for dogs"]
+
+
+def test_agent_memo_scope():
+    agent = Agent(model=MockModel(id="test"), deduplicate_tool_calls=True)
+    run_memo = agent._get_tool_call_memo(session_id="session-1")
+    assert agent._get_tool_call_memo(session_id="session-1") is not run_memo
+
+    agent.tool_call_memo_scope = "session"
+    session_memo = agent._get_tool_call_memo(session_id="session-1")
+    assert agent._get_tool_call_memo(session_id="session-1") is session_memo
+    assert agent._get_tool_call_memo(session_id="session-2") is not session_memo
@@ -0,0 +1,72 @@
+import sys
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from agno.document import Document
+
+# sentence-transformers is an optional dependency, so the CrossEncoder class is mocked
+mock_sentence_transformers = MagicMock()
+with patch.dict(sys.modules, {"sentence_transformers": mock_sentence_transformers}):
+    from agno.reranker import cross_encoder
+    from agno.reranker.cross_encoder import CrossEncoderReranker
+
+
+class FakeCrossEncoder:
+    """Scores a document by the number stored in its content"""
+
+    def __init__(self):
+        self.calls = 0
+
+    def predict(self, pairs, batch_size=32, show_progress_bar=False):
+        self.calls += 1
+        return [float(document) for _, document in pairs]
+
+
+@pytest.fixture
+def documents():
+    return [Document(content=str(score)) for score in [0.1, 0.9, 0.5, 0.7, 0.2, 0.3]]
+
+
+def test_rerank_orders_by_score(documents):
+    reranker = CrossEncoderReranker(cross_encoder_client=FakeCrossEncoder(), batch_size=2, max_workers=3)
+    reranked = reranker.rerank(query="q", documents=documents)
+
+    assert [doc.content for doc in reranked] == ["0.9", "0.7", "0.5", "0.3", "0.2", "0.1"]
+    assert reranked[0].reranking_score == pytest.approx(0.9)
+
+
+def test_rerank_score_threshold(documents):
+    reranker = CrossEncoderReranker(cross_encoder_client=FakeCrossEncoder(), score_threshold=0.4)
+    reranked = reranker.rerank(query="q", documents=documents)
+
+    assert [doc.content for doc in reranked] == ["0.9", "0.7", "0.5"]
+
+
+def test_rerank_stops_early_once_top_n_pass_threshold(documents):
+    client = FakeCrossEncoder()
+    reranker = CrossEncoderReranker(cross_encoder_client=client, batch_size=2, top_n=1, score_threshold=0.8)
+    reranked = reranker.rerank(query="q", documents=documents)
+
+    assert [doc.content for doc in reranked] == ["0.9"]
+    # The first batch already contains a document above the threshold
+    assert client.calls == 1
+
+
+def test_rerank_returns_original_documents_on_error(documents):
+    client = MagicMock()
+    client.predict.side_effect = RuntimeError("boom")
+    reranker = CrossEncoderReranker(cross_encoder_client=client)
+
+    assert reranker.rerank(query="q", documents=documents) == documents
+
+
+def test_cross_encoder_model_is_cached():
+    cross_encoder._cross_encoder_cache.clear()
+    mock_sentence_transformers.CrossEncoder.reset_mock()
+    with patch.object(cross_encoder, "CrossEncoder") as mock_cross_encoder_cls:
+        first = CrossEncoderReranker(model="m").client
+        second = CrossEncoderReranker(model="m").client
+
+    assert first is second
+    mock_cross_encoder_cls.assert_called_once_with("m", device=None, max_length=None)
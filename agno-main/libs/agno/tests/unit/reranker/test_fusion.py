@@ -0,0 +1,49 @@
+import pytest
+
+from agno.document import Document
+from agno.reranker.base import merge_ranked_lists
+from agno.reranker.fusion import ReciprocalRankFusionReranker
+
+
+@pytest.fixture
+def ranked_lists():
+    vector_hits = [Document(id="a", content="a"), Document(id="b", content="b"), Document(id="c", content="c")]
+    keyword_hits = [Document(id="c", content="c"), Document(id="b", content="b"), Document(id="d", content="d")]
+    return [vector_hits, keyword_hits]
+
+
+def test_fuse_orders_by_reciprocal_rank(ranked_lists):
+    reranker = ReciprocalRankFusionReranker(k=60)
+    fused = reranker.fuse(query="q", ranked_lists=ranked_lists)
+
+    # Ranks 1 and 3 beat ranks 2 and 2
+    assert [doc.id for doc in fused] == ["c", "b", "a", "d"]
+    assert fused[0].reranking_score == pytest.approx(1 / 61 + 1 / 63)
+    assert fused[-1].reranking_score == pytest.approx(1 / 63)
+
+
+def test_fuse_with_weights(ranked_lists):
+    reranker = ReciprocalRankFusionReranker(k=60, weights=[0.0, 1.0])
+    fused = reranker.fuse(query="q", ranked_lists=ranked_lists)
+
+    assert [doc.id for doc in fused][:3] == ["c", "b", "d"]
+
+
+def test_fuse_top_n_and_score_threshold(ranked_lists):
+    assert len(ReciprocalRankFusionReranker(top_n=2).fuse(query="q", ranked_lists=ranked_lists)) == 2
+
+    reranker = ReciprocalRankFusionReranker(k=60, score_threshold=2 / 62)
+    fused = reranker.fuse(query="q", ranked_lists=ranked_lists)
+    assert [doc.id for doc in fused] == ["c", "b"]
+
+
+def test_rerank_keeps_single_list_order():
+    documents = [Document(content="x"), Document(content="y"), Document(content="z")]
+    reranked = ReciprocalRankFusionReranker(top_n=2).rerank(query="q", documents=documents)
+
+    assert [doc.content for doc in reranked] == ["x", "y"]
+
+
+def test_merge_ranked_lists_deduplicates(ranked_lists):
+    merged = merge_ranked_lists(ranked_lists)
+    assert [doc.id for doc in merged] == ["a", "b", "c", "d"]
@@ -1,3 +1,4 @@
+import os
 import tempfile
 from pathlib import Path
 from typing import Generator
@@ -174,3 +175,92 @@ def test_workflow_storage_filtering(workflow_storage: JsonStorage):
 
     empty_sessions = workflow_storage.get_all_sessions(entity_id="non-existent")
     assert len(empty_sessions) == 0
+
+
+def _make_listing_sessions():
+    return [
+        AgentSession(
+            session_id=f"session-{i}",
+            agent_id="agent-1" if i < 2 else "agent-2",
+            user_id="user-1" if i % 2 == 0 else "user-2",
+            memory={"runs": [{"message": {"role": "user", "content": f"Question {i}"}}]},
+            session_data={"session_name": "Named"} if i == 3 else {},
+            created_at=1000 + i,
+        )
+        for i in range(4)
+    ]
+
+
+@pytest.fixture
+def indexed_storage(temp_dir: Path) -> JsonStorage:
+    return JsonStorage(dir_path=temp_dir, use_index=True)
+
+
+def test_list_sessions_uses_index(indexed_storage: JsonStorage, temp_dir: Path):
+    agent_storage = indexed_storage
+    for session in _make_listing_sessions():
+        agent_storage.upsert(session)
+
+    listings = agent_storage.list_sessions()
+    assert [listing.session_id for listing in listings] == ["session-3", "session-2", "session-1", "session-0"]
+    assert listings[0].title == "Named"
+    assert listings[1].title == "Question 2"
+
+    # Listing reads the index, not the session files that did not change since they were indexed
+    for file in temp_dir.glob("*.json"):
+        stat = file.stat()
+        file.write_text("not json")
+        os.utime(file, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    assert [listing.session_id for listing in agent_storage.list_sessions(user_id="user-1")] == [
+        "session-2",
+        "session-0",
+    ]
+    assert agent_storage.get_all_session_ids(user_id="user-2", entity_id="agent-2") == ["session-3"]
+
+
+def test_list_sessions_pagination(indexed_storage: JsonStorage):
+    agent_storage = indexed_storage
+    for session in _make_listing_sessions():
+        agent_storage.upsert(session)
+
+    page = agent_storage.list_sessions(limit=2, offset=1)
+    assert [listing.session_id for listing in page] == ["session-2", "session-1"]
+
+
+def test_index_is_built_for_existing_sessions(temp_dir: Path):
+    JsonStorage(dir_path=temp_dir, use_index=False).upsert(_make_listing_sessions()[0])
+
+    storage = JsonStorage(dir_path=temp_dir, use_index=True)
+    assert storage.get_all_session_ids(entity_id="agent-1") == ["session-0"]
+    assert (temp_dir / ".index").exists()
+
+    # Sessions written without the index, e.g. by another process, are indexed when listing
+    sessions = _make_listing_sessions()
+    JsonStorage(dir_path=temp_dir, use_index=False).upsert(sessions[1])
+    assert storage.get_all_session_ids(entity_id="agent-1") == ["session-1", "session-0"]
+    (temp_dir / "session-0.json").unlink()
+    assert storage.get_all_session_ids(entity_id="agent-1") == ["session-1"]
+
+
+def test_index_drops_entries_when_user_changes(indexed_storage: JsonStorage):
+    session = _make_listing_sessions()[0]
+    indexed_storage.upsert(session)
+    assert indexed_storage.get_all_session_ids(user_id="user-1") == ["session-0"]
+
+    session.user_id = "user-3"
+    indexed_storage.upsert(session)
+    assert indexed_storage.get_all_session_ids(user_id="user-1") == []
+    assert indexed_storage.get_all_session_ids(user_id="user-3") == ["session-0"]
+
+
+def test_delete_session_updates_index(indexed_storage: JsonStorage):
+    agent_storage = indexed_storage
+    for session in _make_listing_sessions():
+        agent_storage.upsert(session)
+
+    agent_storage.delete_session("session-0")
+    assert agent_storage.get_all_session_ids(user_id="user-1") == ["session-2"]
+    assert len(agent_storage.get_all_sessions(entity_id="agent-1")) == 1
+
+    agent_storage.drop()
+    assert agent_storage.list_sessions() == []
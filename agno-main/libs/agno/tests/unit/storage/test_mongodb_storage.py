@@ -1,4 +1,4 @@
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
@@ -316,3 +316,68 @@ def test_deepcopy(agent_storage):
     assert copied_storage._client is storage._client
     assert copied_storage.db is storage.db
     assert copied_storage.collection is storage.collection
+
+
+class AsyncCursor:
+    """Minimal async cursor returned by the mocked async collection."""
+
+    def __init__(self, docs):
+        self.docs = docs
+
+    def sort(self, *args, **kwargs):
+        return self
+
+    def __aiter__(self):
+        return self._iterate()
+
+    async def _iterate(self):
+        for doc in self.docs:
+            yield doc
+
+
+@pytest.fixture
+def async_agent_storage(mock_mongo_client):
+    """Create a MongoDbStorage instance with a mocked async client."""
+    async_collection = MagicMock()
+    async_collection.find_one = AsyncMock()
+    async_collection.update_one = AsyncMock()
+    async_client = MagicMock()
+    async_client.__getitem__.return_value.__getitem__.return_value = async_collection
+
+    storage = MongoDbStorage(
+        collection_name="agent_sessions", db_name="test_db", mode="agent", async_client=async_client
+    )
+    return storage, mock_mongo_client[1], async_collection
+
+
+async def test_async_agent_storage(async_agent_storage):
+    """Test that the async methods use the async client instead of the sync collection."""
+    storage, sync_collection, async_collection = async_agent_storage
+
+    session_doc = {"_id": "mongo-id", "session_id": "test-session", "agent_id": "test-agent", "user_id": "test-user"}
+    async_collection.find_one.side_effect = [None, dict(session_doc)]
+    async_collection.update_one.return_value = MagicMock(acknowledged=True)
+
+    session = AgentSession(session_id="test-session", agent_id="test-agent", user_id="test-user")
+    result = await storage.aupsert(session)
+    assert result is not None
+    assert result.session_id == "test-session"
+    update = async_collection.update_one.call_args[0][1]["$set"]
+    assert update["created_at"] == update["updated_at"]
+
+    async_collection.find_one.side_effect = None
+    async_collection.find_one.return_value = dict(session_doc)
+    result = await storage.aread("test-session", user_id="test-user")
+    assert result is not None
+    async_collection.find_one.assert_called_with({"session_id": "test-session", "user_id": "test-user"})
+
+    async_collection.find.return_value = AsyncCursor([dict(session_doc)])
+    sessions = await storage.aget_all_sessions(user_id="test-user", entity_id="test-agent")
+    assert [s.session_id for s in sessions] == ["test-session"]
+    async_collection.find.assert_called_with({"user_id": "test-user", "agent_id": "test-agent"})
+
+    async_collection.find.return_value = AsyncCursor([{"session_id": "test-session"}])
+    assert await storage.aget_all_session_ids(user_id="test-user") == ["test-session"]
+
+    sync_collection.find_one.assert_not_called()
+    sync_collection.update_one.assert_not_called()
@@ -345,3 +345,96 @@ def test_get_all_session_ids(agent_storage, mock_redis_client):
     # Test combined filtering
     filtered_session_ids = agent_storage.get_all_session_ids(user_id="user-1", entity_id="agent-1")
     assert len(filtered_session_ids) == 1
+
+
+@pytest.fixture
+def indexed_storage():
+    """Create agent storage with a session index on an in-memory Redis server."""
+    fakeredis = pytest.importorskip("fakeredis")
+    with patch("agno.storage.redis.Redis", side_effect=lambda **kwargs: fakeredis.FakeRedis(decode_responses=True)):
+        yield RedisStorage(prefix="test_agent", mode="agent", use_index=True)
+
+
+def _make_listing_sessions():
+    return [
+        AgentSession(
+            session_id=f"session-{i}",
+            agent_id="agent-1" if i < 2 else "agent-2",
+            user_id="user-1" if i % 2 == 0 else "user-2",
+            memory={"runs": [{"message": {"role": "user", "content": f"Question {i}"}}]},
+            created_at=1000 + i,
+        )
+        for i in range(4)
+    ]
+
+
+def test_indexed_list_sessions(indexed_storage):
+    for session in _make_listing_sessions():
+        indexed_storage.upsert(session)
+
+    listings = indexed_storage.list_sessions()
+    assert [listing.session_id for listing in listings] == ["session-3", "session-2", "session-1", "session-0"]
+    assert listings[0].title == "Question 3"
+
+    assert [listing.session_id for listing in indexed_storage.list_sessions(limit=2, offset=1)] == [
+        "session-2",
+        "session-1",
+    ]
+    assert indexed_storage.get_all_session_ids(user_id="user-1") == ["session-2", "session-0"]
+    assert indexed_storage.get_all_session_ids(user_id="user-1", entity_id="agent-2") == ["session-2"]
+    assert [s.session_id for s in indexed_storage.get_all_sessions(entity_id="agent-1")] == ["session-1", "session-0"]
+
+
+def test_index_is_built_for_existing_sessions(indexed_storage):
+    indexed_storage.use_index = False
+    indexed_storage.upsert(_make_listing_sessions()[0])
+    indexed_storage.use_index = True
+
+    assert indexed_storage.get_all_session_ids(user_id="user-1") == ["session-0"]
+
+
+def test_indexed_delete_and_drop(indexed_storage):
+    for session in _make_listing_sessions():
+        indexed_storage.upsert(session)
+
+    indexed_storage.delete_session("session-0")
+    assert indexed_storage.get_all_session_ids(user_id="user-1") == ["session-2"]
+    assert len(indexed_storage.list_sessions()) == 3
+
+    indexed_storage.drop()
+    assert list(indexed_storage.redis_client.scan_iter(match="test_agent*")) == []
+    assert indexed_storage.list_sessions() == []
+
+
+@pytest.fixture(params=[False, True], ids=["scan", "indexed"])
+def async_storage(request):
+    """Create agent storage whose sync and async clients share an in-memory Redis server."""
+    fakeredis = pytest.importorskip("fakeredis")
+    server = fakeredis.FakeServer()
+    with patch("agno.storage.redis.Redis", side_effect=lambda **kwargs: fakeredis.FakeRedis(server=server, **kwargs)):
+        with patch(
+            "agno.storage.redis.AsyncRedis",
+            side_effect=lambda **kwargs: fakeredis.FakeAsyncRedis(server=server, **kwargs),
+        ):
+            yield RedisStorage(prefix="test_agent", mode="agent", use_index=request.param)
+
+
+async def test_async_storage_operations(async_storage):
+    for session in _make_listing_sessions():
+        assert await async_storage.aupsert(session) is not None
+
+    session = await async_storage.aread("session-1")
+    assert session is not None
+    assert session.agent_id == "agent-1"
+    assert await async_storage.aread("session-1", user_id="user-1") is None
+    assert await async_storage.aread("missing") is None
+
+    sessions = await async_storage.aget_all_sessions(user_id="user-1")
+    assert [s.session_id for s in sessions] == ["session-2", "session-0"]
+    sessions = await async_storage.aget_all_sessions(user_id="user-2", entity_id="agent-2")
+    assert [s.session_id for s in sessions] == ["session-3"]
+
+    # Sessions written by the async client are visible to the sync client and vice versa
+    assert async_storage.read("session-3") is not None
+    async_storage.delete_session("session-3")
+    assert await async_storage.aread("session-3") is None
@@ -0,0 +1,167 @@
+import json
+import tempfile
+from pathlib import Path
+from typing import Generator
+from unittest.mock import patch
+
+import pytest
+
+from agno.storage.codec import (
+    MAGIC,
+    SessionCodec,
+    decode_session,
+    intern_strings,
+    is_encoded,
+    migrate_sessions,
+    restore_strings,
+)
+from agno.storage.json import JsonStorage
+from agno.storage.session.agent import AgentSession
+
+LONG_MESSAGE = "Tell me everything you know about the history of the Roman Empire, in detail."
+
+
+def _make_session_dict():
+    message = {"role": "user", "content": LONG_MESSAGE}
+    return {
+        "session_id": "session-1",
+        "agent_id": "agent-1",
+        "user_id": "user-1",
+        "memory": {
+            "runs": [{"message": message, "response": {"messages": [message]}}],
+            "messages": [message],
+        },
+        "session_data": {"session_name": None, "ratio": 0.5, "count": 3},
+        "created_at": 1700000000,
+        "updated_at": 1700000001,
+    }
+
+
+@pytest.fixture
+def temp_dir() -> Generator[Path, None, None]:
+    with tempfile.TemporaryDirectory() as temp_dir:
+        yield Path(temp_dir)
+
+
+@pytest.mark.parametrize("format", ["json", "orjson", "msgpack"])
+@pytest.mark.parametrize("compression", [None, "zlib", "zstd"])
+def test_codec_round_trip(format, compression):
+    if format != "json":
+        pytest.importorskip(format)
+    if compression == "zstd":
+        pytest.importorskip("zstandard")
+
+    codec = SessionCodec(format=format, compression=compression)
+    data = _make_session_dict()
+    encoded = codec.encode(data)
+
+    assert encoded.startswith(MAGIC)
+    assert is_encoded(encoded)
+    assert codec.decode(encoded) == data
+    # Any codec decodes sessions encoded by another codec
+    assert decode_session(encoded) == data
+
+
+def test_codec_is_smaller_than_json():
+    pytest.importorskip("msgpack")
+    data = _make_session_dict()
+    data["memory"]["runs"] = data["memory"]["runs"] * 20
+
+    encoded = SessionCodec(format="msgpack", compression="zlib").encode(data)
+
+    assert len(encoded) < len(json.dumps(data)) / 4
+
+
+def test_intern_strings():
+    data = _make_session_dict()
+
+    interned = intern_strings(data, min_length=32)
+
+    assert interned is not None
+    assert interned["strings"] == [LONG_MESSAGE]
+    assert LONG_MESSAGE not in json.dumps(interned["data"])
+    assert restore_strings(interned) == data
+    # Nothing to intern
+    assert intern_strings({"content": "short"}, min_length=32) is None
+
+
+def test_decode_legacy_json():
+    data = _make_session_dict()
+
+    assert not is_encoded(json.dumps(data))
+    assert decode_session(json.dumps(data)) == data
+    assert decode_session(json.dumps(data).encode("utf-8")) == data
+
+
+def test_decode_newer_version():
+    encoded = bytearray(SessionCodec(format="json").encode(_make_session_dict()))
+    encoded[len(MAGIC)] = 99
+
+    with pytest.raises(ValueError, match="newer codec version"):
+        decode_session(bytes(encoded))
+
+
+def test_unknown_format_and_compression():
+    with pytest.raises(ValueError):
+        SessionCodec(format="xml")  # type: ignore
+    with pytest.raises(ValueError):
+        SessionCodec(format="json", compression="lz4")  # type: ignore
+
+
+def test_json_storage_with_codec(temp_dir: Path):
+    storage = JsonStorage(dir_path=temp_dir, codec=SessionCodec(format="json", compression="zlib"))
+    session = AgentSession(**_make_session_dict())
+
+    storage.upsert(session)
+
+    raw = (temp_dir / "session-1.json").read_bytes()
+    assert is_encoded(raw)
+    read_session = storage.read("session-1")
+    assert read_session is not None
+    assert read_session.memory == session.memory
+    assert storage.get_all_session_ids(user_id="user-1") == ["session-1"]
+    assert [listing.title for listing in storage.list_sessions()] == [LONG_MESSAGE]
+
+
+def test_migrate_sessions(temp_dir: Path):
+    source = JsonStorage(dir_path=temp_dir / "source")
+    for i in range(3):
+        data = _make_session_dict()
+        data["session_id"] = f"session-{i}"
+        source.upsert(AgentSession(**data))
+
+    target = JsonStorage(dir_path=temp_dir / "target", codec=SessionCodec(format="json", compression="zlib"))
+    assert migrate_sessions(source, target) == 3
+
+    for i in range(3):
+        assert is_encoded((temp_dir / "target" / f"session-{i}.json").read_bytes())
+        target_session = target.read(f"session-{i}")
+        assert target_session is not None
+        assert target_session.memory == source.read(f"session-{i}").memory  # type: ignore
+
+    # Sessions are rewritten in place with the codec of the source storage
+    source.codec = SessionCodec(format="json")
+    assert migrate_sessions(source) == 3
+    assert is_encoded((temp_dir / "source" / "session-0.json").read_bytes())
+
+
+def test_redis_storage_with_codec():
+    fakeredis = pytest.importorskip("fakeredis")
+    from agno.storage.redis import RedisStorage
+
+    server = fakeredis.FakeServer()
+    with patch("agno.storage.redis.Redis", side_effect=lambda **kwargs: fakeredis.FakeRedis(server=server, **kwargs)):
+        legacy = RedisStorage(prefix="test_agent", mode="agent", use_index=True)
+        legacy.upsert(AgentSession(**_make_session_dict()))
+
+        storage = RedisStorage(
+            prefix="test_agent", mode="agent", use_index=True, codec=SessionCodec(format="json", compression="zlib")
+        )
+        # Sessions stored as JSON are still readable
+        assert storage.read("session-1").memory == _make_session_dict()["memory"]  # type: ignore
+
+        assert migrate_sessions(storage) == 1
+        assert is_encoded(storage.session_client.get("test_agent:session-1"))
+        assert storage.read("session-1").memory == _make_session_dict()["memory"]  # type: ignore
+        assert [s.session_id for s in storage.get_all_sessions(user_id="user-1")] == ["session-1"]
+        assert [listing.title for listing in storage.list_sessions()] == [LONG_MESSAGE]
@@ -193,3 +193,37 @@ def test_workflow_storage_filtering(workflow_storage: SqliteStorage):
 
     empty_sessions = workflow_storage.get_all_sessions(entity_id="non-existent")
     assert len(empty_sessions) == 0
+
+
+@pytest.mark.parametrize("in_memory", [False, True], ids=["file", "in_memory"])
+async def test_agent_storage_async(temp_db_path: Path, in_memory: bool):
+    if in_memory:
+        # In-memory databases don't get an async engine and are queried from the event loop thread
+        storage = SqliteStorage(table_name="agent_sessions", mode="agent")
+    else:
+        pytest.importorskip("aiosqlite")
+        storage = SqliteStorage(table_name="agent_sessions", db_file=str(temp_db_path), mode="agent")
+    assert (storage._get_async_engine() is None) == in_memory
+
+    for i in range(3):
+        session = AgentSession(
+            session_id=f"session-{i}",
+            agent_id="agent-1" if i < 2 else "agent-2",
+            user_id="user-1",
+            memory={"runs": []},
+        )
+        saved_session = await storage.aupsert(session)
+        assert saved_session is not None
+        assert saved_session.session_id == f"session-{i}"
+
+    read_session = await storage.aread("session-2", user_id="user-1")
+    assert read_session is not None
+    assert read_session.agent_id == "agent-2"
+    assert await storage.aread("session-2", user_id="user-2") is None
+
+    assert sorted(await storage.aget_all_session_ids(entity_id="agent-1")) == ["session-0", "session-1"]
+    assert len(await storage.aget_all_sessions(user_id="user-1")) == 3
+    assert len(await storage.alist_sessions(entity_id="agent-2")) == 1
+
+    # The sync and async methods read and write the same database
+    assert storage.read("session-0") is not None
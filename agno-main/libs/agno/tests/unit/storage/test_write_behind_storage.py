@@ -0,0 +1,192 @@
+import os
+import tempfile
+from pathlib import Path
+from typing import Generator
+from unittest.mock import patch
+
+import pytest
+
+from agno.storage.json import JsonStorage
+from agno.storage.session.agent import AgentSession
+from agno.storage.sqlite import SqliteStorage
+from agno.storage.write_behind import WriteBehindStorage
+
+
+@pytest.fixture
+def temp_db_path() -> Generator[Path, None, None]:
+    with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as f:
+        db_path = Path(f.name)
+    yield db_path
+    if db_path.exists():
+        os.unlink(db_path)
+
+
+@pytest.fixture
+def sqlite_storage(temp_db_path: Path) -> SqliteStorage:
+    storage = SqliteStorage(table_name="agent_sessions", db_file=str(temp_db_path), mode="agent")
+    storage.create()
+    return storage
+
+
+def make_session(num_runs: int, session_id: str = "session-1", **kwargs) -> AgentSession:
+    runs = [{"run_id": f"run-{i}", "content": f"response {i}"} for i in range(num_runs)]
+    return AgentSession(
+        session_id=session_id,
+        agent_id="agent-1",
+        user_id="user-1",
+        memory={"runs": runs, "memories": {"user-1": {"m": num_runs}}},
+        **kwargs,
+    )
+
+
+def test_sqlite_upsert_runs_appends_runs(sqlite_storage: SqliteStorage):
+    sqlite_storage.upsert(make_session(2))
+
+    session = make_session(4, session_data={"session_name": "renamed"})
+    sqlite_storage.upsert_runs(session, new_runs=session.memory["runs"][2:])  # type: ignore
+
+    stored = sqlite_storage.read("session-1")
+    assert stored is not None
+    assert stored.memory == session.memory
+    assert stored.session_data == {"session_name": "renamed"}
+
+
+def test_sqlite_upsert_runs_falls_back_to_upsert(sqlite_storage: SqliteStorage):
+    session = make_session(1)
+    sqlite_storage.upsert_runs(session, new_runs=[])
+
+    stored = sqlite_storage.read("session-1")
+    assert stored is not None
+    assert stored.memory == session.memory
+
+
+def test_batched_upserts_are_coalesced(sqlite_storage: SqliteStorage):
+    storage = WriteBehindStorage(sqlite_storage, flush_interval=None, flush_on_exit=False)
+
+    with patch.object(sqlite_storage, "upsert", wraps=sqlite_storage.upsert) as mock_upsert:
+        for num_runs in range(1, 4):
+            storage.upsert(make_session(num_runs))
+
+        assert storage.pending_session_ids == ["session-1"]
+        assert sqlite_storage.read("session-1") is None
+        # Reads see the pending session
+        assert storage.read("session-1").memory["runs"][-1]["run_id"] == "run-2"  # type: ignore
+
+        storage.flush()
+
+    mock_upsert.assert_called_once()
+    assert storage.pending_session_ids == []
+    assert len(sqlite_storage.read("session-1").memory["runs"]) == 3  # type: ignore
+
+
+def test_only_appended_runs_are_persisted(sqlite_storage: SqliteStorage):
+    storage = WriteBehindStorage(sqlite_storage, durability="write_through", flush_on_exit=False)
+    storage.upsert(make_session(2))
+
+    with patch.object(sqlite_storage, "upsert_runs", wraps=sqlite_storage.upsert_runs) as mock_upsert_runs:
+        storage.upsert(make_session(3))
+
+    assert mock_upsert_runs.call_args.kwargs["new_runs"] == [{"run_id": "run-2", "content": "response 2"}]
+    assert sqlite_storage.read("session-1").memory == make_session(3).memory  # type: ignore
+
+
+def test_changed_runs_are_fully_persisted(sqlite_storage: SqliteStorage):
+    storage = WriteBehindStorage(sqlite_storage, durability="write_through", flush_on_exit=False)
+    storage.upsert(make_session(2))
+
+    session = make_session(3)
+    session.memory["runs"][1]["run_id"] = "other-run"  # type: ignore
+    with patch.object(sqlite_storage, "upsert_runs") as mock_upsert_runs:
+        storage.upsert(session)
+
+    mock_upsert_runs.assert_not_called()
+    assert sqlite_storage.read("session-1").memory == session.memory  # type: ignore
+
+
+def test_max_pending_sessions_triggers_flush(tmp_path: Path):
+    json_storage = JsonStorage(dir_path=tmp_path)
+    storage = WriteBehindStorage(json_storage, flush_interval=None, max_pending_sessions=2, flush_on_exit=False)
+
+    storage.upsert(make_session(1, session_id="session-1"))
+    assert json_storage.read("session-1") is None
+
+    storage.upsert(make_session(1, session_id="session-2"))
+    assert storage.pending_session_ids == []
+    assert sorted(storage.get_all_session_ids()) == ["session-1", "session-2"]
+
+
+def test_close_flushes_pending_sessions(tmp_path: Path):
+    json_storage = JsonStorage(dir_path=tmp_path)
+    storage = WriteBehindStorage(json_storage, flush_interval=60)
+
+    storage.upsert(make_session(2))
+    storage.close()
+
+    assert json_storage.read("session-1") is not None
+
+
+def test_delete_session_drops_pending_session(sqlite_storage: SqliteStorage):
+    storage = WriteBehindStorage(sqlite_storage, flush_interval=None, flush_on_exit=False)
+    storage.upsert(make_session(1))
+    storage.delete_session("session-1")
+    storage.flush()
+
+    assert storage.read("session-1") is None
+
+
+async def test_async_upsert_buffers_until_max_pending_sessions(tmp_path: Path):
+    json_storage = JsonStorage(dir_path=tmp_path)
+    storage = WriteBehindStorage(json_storage, flush_interval=None, max_pending_sessions=2, flush_on_exit=False)
+
+    await storage.aupsert(make_session(1, session_id="session-1"))
+    assert json_storage.read("session-1") is None
+    assert (await storage.aread("session-1")) is not None
+
+    await storage.aupsert(make_session(1, session_id="session-2"))
+    assert storage.pending_session_ids == []
+    assert json_storage.read("session-1") is not None
+    assert (await storage.aread("session-2")) is not None
+
+
+def test_changes_to_persisted_runs_are_fully_persisted(sqlite_storage: SqliteStorage):
+    storage = WriteBehindStorage(sqlite_storage, durability="write_through", flush_on_exit=False)
+    storage.upsert(make_session(2))
+
+    # Same number of runs and last run_id, but a stored run changed
+    session = make_session(2)
+    session.memory["runs"][0]["content"] = "edited response"  # type: ignore
+    with patch.object(sqlite_storage, "upsert_runs") as mock_upsert_runs:
+        storage.upsert(session)
+
+    mock_upsert_runs.assert_not_called()
+    assert sqlite_storage.read("session-1").memory == session.memory  # type: ignore
+
+
+def test_reads_and_upserts_are_not_blocked_by_a_flush(sqlite_storage: SqliteStorage):
+    import threading
+
+    storage = WriteBehindStorage(sqlite_storage, flush_interval=None, flush_on_exit=False)
+    storage.upsert(make_session(1))
+
+    writing = threading.Event()
+    release = threading.Event()
+    upsert = sqlite_storage.upsert
+
+    def slow_upsert(session):
+        writing.set()
+        release.wait(5)
+        return upsert(session)
+
+    with patch.object(sqlite_storage, "upsert", side_effect=slow_upsert):
+        flush = threading.Thread(target=storage.flush)
+        flush.start()
+        assert writing.wait(5)
+        # The session being flushed is still read, and new upserts are buffered
+        assert storage.read("session-1").memory["runs"][-1]["run_id"] == "run-0"  # type: ignore
+        storage.upsert(make_session(2, session_id="session-2"))
+        assert storage.pending_session_ids == ["session-2"]
+        release.set()
+        flush.join(5)
+
+    assert sqlite_storage.read("session-1") is not None
+    assert storage.read("session-2") is not None
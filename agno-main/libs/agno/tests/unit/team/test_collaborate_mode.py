@@ -0,0 +1,164 @@
+import asyncio
+import time
+from dataclasses import dataclass
+from typing import Any, List
+
+import pytest
+
+from agno.agent import Agent
+from agno.memory.team import TeamMemory
+from agno.models.base import Model
+from agno.models.response import ModelResponse
+from agno.run.team import TeamRunResponse
+from agno.team.team import Team
+from agno.utils.concurrency import StreamSerializer, merge_iterators
+
+
+@dataclass
+class SlowModel(Model):
+    """Responds with its id after a delay, streaming it in words."""
+
+    id: str = "slow"
+    delay: float = 0.2
+
+    def invoke(self, messages: Any, **kwargs) -> Any:
+        time.sleep(self.delay)
+        return f"answer from {self.id}"
+
+    async def ainvoke(self, messages: Any, **kwargs) -> Any:
+        await asyncio.sleep(self.delay)
+        return f"answer from {self.id}"
+
+    def invoke_stream(self, messages: Any, **kwargs):
+        for word in ["answer ", "from ", self.id]:
+            time.sleep(self.delay / 3)
+            yield word
+
+    async def ainvoke_stream(self, messages: Any, **kwargs):
+        for word in ["answer ", "from ", self.id]:
+            await asyncio.sleep(self.delay / 3)
+            yield word
+
+    def parse_provider_response(self, response: Any) -> ModelResponse:
+        return ModelResponse(role="assistant", content=response)
+
+    def parse_provider_response_delta(self, response: Any) -> ModelResponse:
+        return ModelResponse(role="assistant", content=response)
+
+
+def _make_team(num_members: int = 5, **kwargs) -> Team:
+    members: List[Any] = [
+        Agent(name=f"member-{i}", model=SlowModel(id=f"m{i}"), telemetry=False) for i in range(num_members)
+    ]
+    team = Team(mode="collaborate", members=members, memory=TeamMemory(), telemetry=False, **kwargs)
+    team.run_response = TeamRunResponse()
+    return team
+
+
+def _run_member_agents(team: Team, stream: bool = False, async_mode: bool = False) -> Any:
+    function = team.get_run_member_agents_function(session_id="session", stream=stream, async_mode=async_mode)
+    return function.entrypoint(task_description="Answer the question")  # type: ignore
+
+
+def test_members_run_concurrently():
+    team = _make_team(run_members_in_parallel=True)
+
+    start = time.perf_counter()
+    results = list(_run_member_agents(team))
+    elapsed = time.perf_counter() - start
+
+    assert results == [f"Agent member-{i}: answer from m{i}" for i in range(5)]
+    assert elapsed < 0.2 * 3
+    assert len(team.run_response.member_responses) == 5  # type: ignore
+    assert [run.member_name for run in team.memory.team_context.member_interactions] == [  # type: ignore
+        f"member-{i}" for i in range(5)
+    ]
+
+
+def test_members_run_sequentially_by_default():
+    team = _make_team(num_members=2)
+
+    start = time.perf_counter()
+    results = list(_run_member_agents(team))
+
+    assert time.perf_counter() - start >= 0.2 * 2
+    assert results == ["Agent member-0: answer from m0", "Agent member-1: answer from m1"]
+
+
+def test_streamed_members_are_contiguous():
+    team = _make_team(num_members=3, run_members_in_parallel=True)
+
+    start = time.perf_counter()
+    output = "".join(_run_member_agents(team, stream=True))
+    elapsed = time.perf_counter() - start
+
+    for i in range(3):
+        assert f"Agent member-{i}: answer from m{i}" in output
+    assert elapsed < 0.2 * 2
+    assert len(team.run_response.member_responses) == 3  # type: ignore
+
+
+def test_async_members_run_concurrently_by_default():
+    team = _make_team(num_members=3)
+
+    async def collect() -> List[str]:
+        return [result async for result in _run_member_agents(team, async_mode=True)]
+
+    start = time.perf_counter()
+    results = asyncio.run(collect())
+
+    assert time.perf_counter() - start < 0.2 * 2
+    assert results == [f"Agent member-{i}: answer from m{i}" for i in range(3)]
+
+
+def test_async_streamed_members_are_interleaved():
+    team = _make_team(num_members=3, run_members_in_parallel=True)
+
+    async def collect() -> str:
+        return "".join([chunk async for chunk in _run_member_agents(team, stream=True, async_mode=True)])
+
+    start = time.perf_counter()
+    output = asyncio.run(collect())
+    elapsed = time.perf_counter() - start
+
+    for i in range(3):
+        assert f"Agent member-{i}: answer from m{i}" in output
+    assert elapsed < 0.2 * 2
+    assert len(team.run_response.member_responses) == 3  # type: ignore
+
+
+def test_stream_serializer_keeps_sources_contiguous():
+    serializer = StreamSerializer()
+    merged = [(0, "a1", False), (1, "b1", False), (0, "a2", False), (1, None, True), (2, "c1", False)]
+    merged += [(0, None, True), (2, "c2", False), (2, None, True)]
+
+    emitted = [pair for index, item, finished in merged for pair in serializer.push(index, item, finished)]
+
+    assert emitted == [(0, "a1"), (0, "a2"), (1, "b1"), (2, "c1"), (2, "c2")]
+
+
+def test_merge_iterators_raises_source_errors():
+    def failing():
+        yield 1
+        raise ValueError("boom")
+
+    with pytest.raises(ValueError, match="boom"):
+        list(merge_iterators([failing, lambda: iter([2])]))
+
+
+def test_merge_iterators_stops_sources_when_the_consumer_stops():
+    closed: List[int] = []
+
+    def endless(index: int):
+        try:
+            while True:
+                time.sleep(0.01)
+                yield index
+        finally:
+            closed.append(index)
+
+    merged = merge_iterators([lambda: endless(0), lambda: endless(1)])
+    next(merged)
+    merged.close()
+
+    assert sorted(closed) == [0, 1]
@@ -0,0 +1,122 @@
+"""Unit tests for compiling Function schemas."""
+
+from copy import deepcopy
+from unittest.mock import patch
+
+import pytest
+
+from agno.tools import function as function_module
+from agno.tools.function import Function, FunctionCall, get_validated_entrypoint
+from agno.tools.toolkit import Toolkit
+
+
+class SearchTools(Toolkit):
+    def __init__(self, prefix: str = "result"):
+        self.prefix = prefix
+        super().__init__(name="search_tools", tools=[self.search])
+
+    def search(self, query: str, limit: int = 5) -> str:
+        """Search for a query.
+
+        Args:
+            query (str): The query to search for.
+            limit (int): The maximum number of results.
+        """
+        return f"{self.prefix}: {query} ({limit})"
+
+
+def add(a: int, b: int) -> int:
+    """Add two numbers."""
+    return a + b
+
+
+def test_schema_is_compiled_once_per_function():
+    first, second = SearchTools(), SearchTools()
+
+    function_module._schema_cache.clear()
+    with patch.object(
+        function_module, "_compile_function_schema", wraps=function_module._compile_function_schema
+    ) as compile_schema:
+        first.functions["search"].process_entrypoint()
+        second.functions["search"].process_entrypoint()
+        # Processing an already processed function again is a no-op
+        first.functions["search"].process_entrypoint()
+
+    assert compile_schema.call_count == 1
+    function = second.functions["search"]
+    assert function.description == "Search for a query."
+    assert function.parameters["required"] == ["query"]
+    assert set(function.parameters["properties"]) == {"query", "limit"}
+    # Each function gets its own copy of the shared parameters
+    assert function.parameters is not first.functions["search"].parameters
+
+
+def test_strict_schema_is_compiled_separately():
+    function = Function.from_callable(add)
+    strict_function = Function.from_callable(add, strict=True)
+
+    assert function.parameters["required"] == ["a", "b"]
+    assert strict_function.parameters["required"] == ["a", "b"]
+    assert strict_function.parameters.get("additionalProperties") is False
+
+
+def test_validated_entrypoint_is_bound_to_the_instance():
+    first, second = SearchTools(prefix="first"), SearchTools(prefix="second")
+
+    first_entrypoint = get_validated_entrypoint(first.search)
+    second_entrypoint = get_validated_entrypoint(second.search)
+
+    assert first_entrypoint.__func__ is second_entrypoint.__func__
+    assert first_entrypoint("cats") == "first: cats (5)"
+    assert second_entrypoint("dogs", limit="3") == "second: dogs (3)"
+    # Validated entrypoints are not wrapped again
+    assert get_validated_entrypoint(first_entrypoint) is first_entrypoint
+
+
+def test_processed_toolkit_function_can_be_copied():
+    toolkit = SearchTools(prefix="original")
+    toolkit.functions["search"].process_entrypoint()
+
+    copied_toolkit = deepcopy(toolkit)
+    copied_toolkit.prefix = "copy"
+    function_call = FunctionCall(function=copied_toolkit.functions["search"], arguments={"query": "cats"})
+
+    assert function_call.execute()
+    assert function_call.result == "copy: cats (5)"
+
+
+def test_get_payload_is_built_once():
+    function = Function.from_callable(add)
+    calls = []
+
+    def build(f: Function):
+        calls.append(f.name)
+        return {"name": f.name}
+
+    assert function.get_payload("test", build) == {"name": "add"}
+    assert function.get_payload("test", build) == {"name": "add"}
+    # Copies of the function share the payload
+    assert Function.from_callable(add).get_payload("test", build) == {"name": "add"}
+    assert calls == ["add"]
+
+    # The payload is rebuilt when the schema changes
+    function.description = "Add two integers."
+    function.get_payload("test", build)
+    function.parameters["properties"]["a"]["description"] = "The first number."
+    function.get_payload("test", build)
+    assert calls == ["add", "add", "add"]
+
+
+@pytest.mark.parametrize("provider", ["anthropic", "bedrock"])
+def test_provider_payloads(provider):
+    if provider == "anthropic":
+        pytest.importorskip("anthropic")
+        from agno.models.anthropic.claude import format_function_for_anthropic as format_function
+    else:
+        pytest.importorskip("boto3")
+        from agno.models.aws.bedrock import format_function_for_bedrock as format_function
+
+    payload = format_function(Function.from_callable(add))
+
+    assert "add" in str(payload)
+    assert "Add two numbers." in str(payload)
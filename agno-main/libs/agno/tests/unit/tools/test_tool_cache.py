@@ -0,0 +1,194 @@
+"""Unit tests for the tool result caches."""
+
+import os
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from agno.tools.cache import DiskToolCache, InMemoryToolCache, TieredToolCache, get_cache_key
+from agno.tools.function import Function, FunctionCall
+
+
+def test_cache_key_is_canonical():
+    assert get_cache_key({"a": 1, "b": {"x": 1, "y": 2}}) == get_cache_key({"b": {"y": 2, "x": 1}, "a": 1})
+    assert get_cache_key({"a": 1}) != get_cache_key({"a": 2})
+    assert get_cache_key(None) == get_cache_key({})
+
+
+def test_in_memory_cache_evicts_least_recently_used():
+    cache = InMemoryToolCache(max_entries=2)
+    cache.set("fn", "a", 1)
+    cache.set("fn", "b", 2)
+    assert cache.get("fn", "a") == 1
+    cache.set("fn", "c", 3)
+
+    assert cache.get("fn", "b") is None
+    assert cache.get("fn", "a") == 1
+    assert cache.get("fn", "c") == 3
+    assert cache.stats.hits == 3
+    assert cache.stats.misses == 1
+    assert cache.stats.hit_rate == 0.75
+
+
+def test_in_memory_cache_ttl():
+    cache = InMemoryToolCache()
+    cache.set("fn", "a", 1, ttl=0.01)
+    time.sleep(0.02)
+
+    assert cache.get("fn", "a") is None
+    assert len(cache) == 0
+
+
+def test_disk_cache(tmp_path: Path):
+    cache = DiskToolCache(cache_dir=tmp_path)
+    cache.set("fn", "a", {"result": [1, 2]})
+
+    assert (tmp_path / "functions" / "fn" / "a.json").exists()
+    assert DiskToolCache(cache_dir=tmp_path).get("fn", "a") == {"result": [1, 2]}
+
+    cache.set("fn", "b", "expired", ttl=-1)
+    assert cache.get("fn", "b") is None
+    assert not (tmp_path / "functions" / "fn" / "b.json").exists()
+
+    cache.clear("fn")
+    assert cache.get("fn", "a") is None
+
+
+def test_disk_cache_evicts_oldest_entries(tmp_path: Path):
+    cache = DiskToolCache(cache_dir=tmp_path, max_size_bytes=10_000)
+    for i in range(5):
+        cache.set("fn", str(i), "x" * 1000)
+        path = tmp_path / "functions" / "fn" / f"{i}.json"
+        os.utime(path, (i, i))
+
+    cache.max_size_bytes = 2_500
+    cache.evict()
+
+    assert sorted(p.stem for p in (tmp_path / "functions" / "fn").glob("*.json")) == ["4"]
+
+
+def test_disk_cache_evicts_in_background(tmp_path: Path):
+    cache = DiskToolCache(cache_dir=tmp_path, max_size_bytes=2_500)
+    for i in range(5):
+        cache.set("fn", str(i), "x" * 1000)
+
+    deadline = time.time() + 5
+    while cache._evicting.is_set() and time.time() < deadline:
+        time.sleep(0.01)
+
+    assert len(list((tmp_path / "functions" / "fn").glob("*.json"))) <= 2
+
+
+def test_tiered_cache_backfills_faster_tiers(tmp_path: Path):
+    memory = InMemoryToolCache()
+    disk = DiskToolCache(cache_dir=tmp_path)
+    disk.set("fn", "a", 1)
+    cache = TieredToolCache([memory, disk])
+
+    assert cache.get("fn", "a") == 1
+    assert memory.get("fn", "a") == 1
+    assert cache.get("fn", "b") is None
+    assert cache.stats.hit_rate == 0.5
+
+
+def test_tiered_cache_backfills_with_remaining_ttl(tmp_path: Path):
+    memory = InMemoryToolCache()
+    disk = DiskToolCache(cache_dir=tmp_path)
+    disk.set("fn", "a", 1, ttl=60)
+    cache = TieredToolCache([memory, disk])
+
+    assert cache.get("fn", "a") == 1
+    value, ttl = memory.get_with_ttl("fn", "a")
+    assert value == 1
+    assert ttl is not None and 0 < ttl <= 60
+
+    disk.set("fn", "b", 2, ttl=0.05)
+    assert cache.get("fn", "b") == 2
+    time.sleep(0.1)
+    assert memory.get("fn", "b") is None
+
+
+def test_disk_cache_concurrent_writes(tmp_path: Path):
+    caches = [DiskToolCache(cache_dir=tmp_path) for _ in range(2)]
+    threads = [
+        threading.Thread(target=lambda c=cache, i=i: [c.set("fn", "a", {"writer": i, "n": n}) for n in range(50)])
+        for i, cache in enumerate(caches * 2)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert caches[0].get("fn", "a")["n"] == 49
+    assert list((tmp_path / "functions" / "fn").glob("*.tmp")) == []
+
+
+async def test_tiered_cache_async(tmp_path: Path):
+    memory = InMemoryToolCache()
+    cache = TieredToolCache([memory, DiskToolCache(cache_dir=tmp_path)])
+
+    await cache.aset("fn", "a", 1)
+
+    memory.clear()
+    assert await cache.aget("fn", "a") == 1
+    assert memory.get("fn", "a") == 1
+
+
+def test_redis_cache():
+    fakeredis = pytest.importorskip("fakeredis")
+    from agno.tools.cache.redis import RedisToolCache
+
+    cache = RedisToolCache(prefix="test", client=fakeredis.FakeRedis(decode_responses=True))
+    cache.set("fn", "a", {"value": 1}, ttl=60)
+    cache.set("other", "a", 2)
+
+    assert cache.get("fn", "a") == {"value": 1}
+    assert 0 < cache.redis_client.pttl("test:fn:a") <= 60_000
+    value, ttl = cache.get_with_ttl("fn", "a")
+    assert value == {"value": 1} and ttl is not None and 0 < ttl <= 60
+    assert cache.get_with_ttl("other", "a") == (2, None)
+    cache.clear("fn")
+    assert cache.get("fn", "a") is None
+    assert cache.get("other", "a") == 2
+    assert cache.stats.hits == 4
+    assert cache.stats.misses == 1
+
+
+def test_function_call_uses_cache():
+    calls = []
+
+    def search(query: str, limit: int = 5) -> str:
+        calls.append(query)
+        return f"results for {query}"
+
+    cache = InMemoryToolCache()
+    function = Function.from_callable(search)
+    function.cache = cache
+
+    for arguments in [{"query": "cats", "limit": 3}, {"limit": 3, "query": "cats"}, {"query": "dogs"}]:
+        function_call = FunctionCall(function=function, arguments=arguments)
+        assert function_call.execute()
+
+    assert calls == ["cats", "dogs"]
+    assert cache.stats.hits == 1
+    assert cache.stats.misses == 2
+
+
+async def test_async_function_call_uses_cache():
+    calls = []
+
+    async def search(query: str) -> str:
+        calls.append(query)
+        return f"results for {query}"
+
+    function = Function.from_callable(search)
+    function.cache = InMemoryToolCache()
+
+    for _ in range(2):
+        function_call = FunctionCall(function=function, arguments={"query": "cats"})
+        assert await function_call.aexecute()
+        assert function_call.result == "results for cats"
+
+    assert calls == ["cats"]
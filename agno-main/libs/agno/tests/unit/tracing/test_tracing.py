@@ -0,0 +1,194 @@
+import asyncio
+import json
+from dataclasses import dataclass, field
+from typing import Any, List
+from unittest.mock import Mock
+
+import pytest
+
+from agno.agent import Agent
+from agno.models.base import Model
+from agno.models.response import ModelResponse
+from agno.storage.json import JsonStorage
+from agno.team.team import Team
+from agno.tracing import InMemorySpanCollector, disable_tracing, enable_tracing, trace_span
+
+
+@dataclass
+class ToolCallingModel(Model):
+    """Calls the `add` tool on its first turn of a run, then answers."""
+
+    id: str = "tool-calling"
+    tool_name: str = "add"
+    tool_arguments: dict = field(default_factory=lambda: {"a": 1, "b": 2})
+
+    def _response(self, messages: List[Any]) -> ModelResponse:
+        if messages[-1].role == "tool" or not self.tool_name:
+            return ModelResponse(role="assistant", content="The answer is 3.")
+        tool_call = {
+            "id": "call_1",
+            "type": "function",
+            "function": {"name": self.tool_name, "arguments": json.dumps(self.tool_arguments)},
+        }
+        return ModelResponse(role="assistant", tool_calls=[tool_call])
+
+    def invoke(self, messages: List[Any], **kwargs) -> Any:
+        return self._response(messages)
+
+    async def ainvoke(self, messages: List[Any], **kwargs) -> Any:
+        return self._response(messages)
+
+    def invoke_stream(self, messages: List[Any], **kwargs):
+        yield self._response(messages)
+
+    async def ainvoke_stream(self, messages: List[Any], **kwargs):
+        yield self._response(messages)
+
+    def parse_provider_response(self, response: Any) -> ModelResponse:
+        return response
+
+    def parse_provider_response_delta(self, response: Any) -> ModelResponse:
+        return response
+
+
+def add(a: int, b: int) -> int:
+    """Add two numbers."""
+    return a + b
+
+
+@pytest.fixture
+def collector():
+    collector = InMemorySpanCollector()
+    enable_tracing(collector)
+    yield collector
+    disable_tracing()
+
+
+def _names(spans) -> List[str]:
+    return [span.name for span in spans]
+
+
+def test_no_spans_when_disabled():
+    with trace_span("test") as span:
+        assert span is None
+
+
+def test_nested_spans(collector):
+    with trace_span("parent", {"key": "value", "empty": None}) as parent:
+        with trace_span("child") as child:
+            pass
+    with pytest.raises(ValueError):
+        with trace_span("failed"):
+            raise ValueError("Boom")
+
+    assert child.parent_span_id == parent.span_id
+    assert child.trace_id == parent.trace_id
+    assert parent.attributes == {"key": "value"}
+    assert collector.get_children(parent) == [child]
+    failed = collector.get_spans(name="failed")[0]
+    assert failed.status == "ERROR"
+    assert failed.events[0].attributes["exception.type"] == "ValueError"
+    assert failed.trace_id != parent.trace_id
+
+
+def test_agent_run_spans(collector, tmp_path):
+    agent = Agent(model=ToolCallingModel(), tools=[add], storage=JsonStorage(dir_path=tmp_path), telemetry=False)
+    agent.run("What is 1 + 2?")
+
+    run = collector.get_spans(name="agent.run")[0]
+    assert run.parent_span_id is None
+    assert _names(collector.get_children(run)) == [
+        "storage.read",
+        "system_message",
+        "model.response",
+        "tool.call",
+        "model.response",
+        "memory.update",
+        "storage.write",
+    ]
+    tool_call = collector.get_spans(name="tool.call")[0]
+    assert tool_call.attributes["agno.tool.name"] == "add"
+    model_response = collector.get_spans(name="model.response")[0]
+    assert model_response.attributes["gen_ai.request.model"] == "tool-calling"
+    assert "gen_ai.usage.input_tokens" in model_response.attributes
+    assert collector.get_durations(run.trace_id)["agent.run"] == run.duration
+
+
+def test_agent_run_stream_spans(collector):
+    agent = Agent(model=ToolCallingModel(), tools=[add], telemetry=False)
+    for _ in agent.run("What is 1 + 2?", stream=True):
+        # The run span is only current while the run produces a response
+        with trace_span("consumer") as consumer:
+            assert consumer.parent_span_id is None
+
+    run = collector.get_spans(name="agent.run")[0]
+    assert run.attributes["agno.run.stream"] is True
+    assert _names(collector.get_children(run)) == [
+        "system_message",
+        "model.response",
+        "tool.call",
+        "model.response",
+        "memory.update",
+    ]
+    model_response = collector.get_spans(name="model.response")[0]
+    assert model_response.attributes["agno.model.time_to_first_token"] <= model_response.duration
+
+
+def test_agent_arun_spans(collector):
+    agent = Agent(model=ToolCallingModel(), tools=[add], telemetry=False)
+    asyncio.run(agent.arun("What is 1 + 2?"))
+
+    run = collector.get_spans(name="agent.run")[0]
+    assert _names(collector.get_children(run)) == [
+        "system_message",
+        "model.response",
+        "tool.call",
+        "model.response",
+        "memory.update",
+    ]
+
+
+def test_team_member_spans_nest_under_delegation(collector):
+    members: List[Any] = [
+        Agent(name=f"member-{i}", model=ToolCallingModel(tool_name=""), telemetry=False) for i in range(2)
+    ]
+    team = Team(
+        mode="collaborate",
+        members=members,
+        model=ToolCallingModel(tool_name="run_member_agents", tool_arguments={"task_description": "Add 1 and 2"}),
+        telemetry=False,
+    )
+    team.run("What is 1 + 2?")
+
+    team_run = collector.get_spans(name="team.run")[0]
+    delegation = collector.get_spans(name="tool.call")[0]
+    assert delegation.attributes["agno.tool.name"] == "run_member_agents"
+    assert delegation.parent_span_id == team_run.span_id
+
+    member_runs = collector.get_spans(name="agent.run")
+    assert len(member_runs) == 2
+    for member_run in member_runs:
+        assert member_run.parent_span_id == delegation.span_id
+        assert member_run.trace_id == team_run.trace_id
+        assert member_run.attributes["agno.team.id"] == team.team_id
+
+
+def test_opentelemetry_span_processor():
+    pytest.importorskip("opentelemetry")
+    from agno.tracing.otel import OpenTelemetrySpanProcessor
+
+    tracer = Mock()
+    processor = OpenTelemetrySpanProcessor(tracer=tracer)
+    enable_tracing(processor)
+    try:
+        with trace_span("parent"):
+            with trace_span("child", {"key": "value"}):
+                pass
+    finally:
+        disable_tracing()
+
+    assert [call.args[0] for call in tracer.start_span.call_args_list] == ["parent", "child"]
+    assert tracer.start_span.call_args_list[0].kwargs["context"] is None
+    assert tracer.start_span.call_args_list[1].kwargs["context"] is not None
+    assert tracer.start_span.call_args_list[1].kwargs["attributes"] == {"key": "value"}
+    assert tracer.start_span.return_value.end.call_count == 2
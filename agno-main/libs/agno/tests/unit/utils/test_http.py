@@ -0,0 +1,158 @@
+import asyncio
+
+import httpx
+import pytest
+
+from agno.utils.http import (
+    aclose_http_clients,
+    close_http_clients,
+    get_async_http_client,
+    get_http_client,
+    is_http2_available,
+)
+
+
+@pytest.fixture(autouse=True)
+def reset_http_clients():
+    yield
+    close_http_clients()
+
+
+def test_http_clients_are_shared_per_settings():
+    client = get_http_client(base_url="https://api.example.com")
+
+    assert get_http_client(base_url="https://api.example.com") is client
+    assert get_http_client(base_url="https://other.example.com") is not client
+    assert get_http_client(base_url="https://api.example.com", verify=False) is not client
+    assert get_http_client(base_url="https://api.example.com", limits=httpx.Limits(max_connections=5)) is not client
+
+
+def test_closed_http_clients_are_replaced():
+    client = get_http_client()
+    close_http_clients()
+
+    assert client.is_closed
+    assert get_http_client() is not client
+
+
+def test_closing_a_shared_client_does_not_break_other_holders():
+    client = get_http_client()
+    client.close()
+    with client:
+        pass
+
+    assert not client.is_closed
+    assert get_http_client() is client
+
+
+def test_close_http_clients_closes_async_clients():
+    async def get_client():
+        return get_async_http_client()
+
+    loop = asyncio.new_event_loop()
+    try:
+        client = loop.run_until_complete(get_client())
+        close_http_clients()
+        assert client.is_closed
+    finally:
+        loop.close()
+
+    client_without_loop = get_async_http_client()
+    close_http_clients()
+    assert client_without_loop.is_closed
+
+
+def test_api_close_closes_async_clients():
+    from agno.api.api import Api
+
+    api = Api()
+    loop = asyncio.new_event_loop()
+    try:
+
+        async def get_client():
+            return api.AsyncClient()
+
+        async_client = loop.run_until_complete(get_client())
+        client = api.Client()
+        api.close()
+        assert client.is_closed
+        assert async_client.is_closed
+    finally:
+        loop.close()
+
+
+def test_http2_requires_h2():
+    if is_http2_available():
+        assert get_http_client(http2=True) is not None
+    else:
+        with pytest.raises(ImportError):
+            get_http_client(http2=True)
+
+
+def test_async_http_clients_are_shared_per_event_loop():
+    async def get_clients():
+        return get_async_http_client(), get_async_http_client()
+
+    async def get_and_close():
+        client = get_async_http_client()
+        await aclose_http_clients()
+        return client
+
+    first, second = asyncio.run(get_clients())
+    assert first is second
+    assert asyncio.run(get_clients())[0] is not first
+    assert asyncio.run(get_and_close()).is_closed
+
+
+def test_openai_clients_share_http_clients():
+    pytest.importorskip("openai")
+    from agno.models.openai import OpenAIChat
+
+    first, second = OpenAIChat(api_key="test"), OpenAIChat(api_key="test")
+
+    assert first.get_client()._client is second.get_client()._client
+
+    async def get_async_clients():
+        return first.get_async_client(), first.get_async_client(), second.get_async_client()
+
+    async_client, same_async_client, other_async_client = asyncio.run(get_async_clients())
+    assert async_client is same_async_client
+    assert async_client._client is other_async_client._client
+
+
+def test_openai_async_client_is_rebuilt_on_another_event_loop():
+    pytest.importorskip("openai")
+    from agno.models.openai import OpenAIChat
+
+    model = OpenAIChat(api_key="test")
+
+    async def get_async_client():
+        async_client = model.get_async_client()
+        assert async_client._client is get_async_http_client(base_url=model.base_url)
+        return async_client
+
+    # e.g. two asyncio.run(agent.arun(...)) calls
+    first = asyncio.run(get_async_client())
+    second = asyncio.run(get_async_client())
+    assert second is not first
+    assert second._client is not first._client
+
+
+def test_api_reads_the_auth_headers_per_request(monkeypatch):
+    from agno.api.api import Api
+    from agno.constants import AGNO_API_KEY_ENV_VAR
+
+    monkeypatch.setattr("agno.api.api.read_auth_token", lambda: None)
+    monkeypatch.delenv(AGNO_API_KEY_ENV_VAR, raising=False)
+    requests = []
+    api = Api()
+    client = api.AuthenticatedClient()
+    client._transport = httpx.MockTransport(lambda request: requests.append(request) or httpx.Response(200))
+
+    client.get("/")
+    monkeypatch.setenv(AGNO_API_KEY_ENV_VAR, "key")
+    client.get("/")
+    assert "Authorization" not in requests[0].headers
+    assert requests[1].headers["Authorization"] == "Bearer key"
+    assert api.AuthenticatedClient() is client
+    api.close()
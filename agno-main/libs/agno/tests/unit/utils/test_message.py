@@ -0,0 +1,30 @@
+from agno.media import Image
+from agno.models.message import Message
+from agno.utils.message import get_history_messages
+from agno.utils.tokens import count_message_tokens, estimate_message_tokens
+
+
+def test_get_history_messages_does_not_modify_or_copy_payloads():
+    image = Image(url="https://example.com/image.png")
+    tool_calls = [{"id": "call_1", "type": "function", "function": {"name": "search", "arguments": "{}"}}]
+    original = Message(role="assistant", content="Hello", images=[image], tool_calls=tool_calls)
+
+    history = get_history_messages([original])
+
+    assert len(history) == 1
+    assert history[0].from_history is True
+    assert original.from_history is False
+    # Payloads are shared with the original message
+    assert history[0].images is original.images
+    assert history[0].tool_calls is original.tool_calls
+
+
+def test_count_message_tokens_is_cached():
+    message = Message(role="user", content="x" * 400)
+
+    assert count_message_tokens(message) == estimate_message_tokens(message) == 104
+    message.content = "changed"
+    # The count is cached, as history messages are not modified
+    assert count_message_tokens(message) == 104
+    # History views share the cached count
+    assert count_message_tokens(get_history_messages([message])[0]) == 104
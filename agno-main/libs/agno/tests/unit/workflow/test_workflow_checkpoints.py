@@ -0,0 +1,165 @@
+from typing import Iterator
+
+import pytest
+
+from agno.run.response import RunResponse
+from agno.storage.sqlite import SqliteStorage
+from agno.workflow import Step, Workflow
+
+
+class Enrichment:
+    """Steps of an enrichment job, the enrich step fails until fixed."""
+
+    def __init__(self, fail: bool = True):
+        self.fail = fail
+        self.calls = []
+
+    def fetch(self, company: str) -> str:
+        self.calls.append("fetch")
+        return f"page of {company}"
+
+    def extract(self, fetch: str) -> dict:
+        self.calls.append("extract")
+        return {"facts": fetch}
+
+    def enrich(self, extract: dict) -> str:
+        self.calls.append("enrich")
+        if self.fail:
+            raise RuntimeError("provider unavailable")
+        return f"enriched {extract['facts']}"
+
+    def steps(self):
+        # cache=False, so only the checkpoints of the run are reused
+        return [
+            Step(name="fetch", function=self.fetch, cache=False),
+            Step(name="extract", function=self.extract, depends_on=["fetch"], cache=False),
+            Step(name="enrich", function=self.enrich, depends_on=["extract"], cache=False),
+        ]
+
+
+def _make_storage(tmp_path) -> SqliteStorage:
+    return SqliteStorage(table_name="workflows", db_file=str(tmp_path / "workflows.db"))
+
+
+def test_resume_only_runs_the_failed_steps(tmp_path):
+    job = Enrichment()
+    workflow = Workflow(session_id="session", steps=job.steps(), storage=_make_storage(tmp_path), telemetry=False)
+    with pytest.raises(RuntimeError):
+        workflow.run(company="agno")
+    failed_run_id = workflow.run_id
+    assert job.calls == ["fetch", "extract", "enrich"]
+
+    # Resume from storage in a new process, with the inputs of the failed run
+    fixed_job = Enrichment(fail=False)
+    resumed = Workflow(session_id="session", steps=fixed_job.steps(), storage=_make_storage(tmp_path), telemetry=False)
+    response = resumed.resume()
+
+    assert fixed_job.calls == ["enrich"]
+    assert response.content == "enriched page of agno"
+    assert resumed.run_id == failed_run_id
+    # The checkpoints of a completed run are removed
+    assert resumed.run_checkpoints == {}
+    with pytest.raises(ValueError, match="no run to resume"):
+        resumed.resume()
+
+
+def test_checkpoints_are_saved_per_step_only_if_enabled(tmp_path):
+    for checkpoint_steps, expected_writes in [(False, 1), (True, 2)]:
+        workflow = Workflow(
+            session_id=f"session-{checkpoint_steps}",
+            steps=Enrichment().steps(),
+            storage=_make_storage(tmp_path),
+            checkpoint_steps=checkpoint_steps,
+            telemetry=False,
+        )
+        writes = []
+        write_to_storage = workflow.write_to_storage
+        workflow.write_to_storage = lambda: writes.append(1) or write_to_storage()  # type: ignore
+        with pytest.raises(RuntimeError):
+            workflow.run(company="agno")
+
+        # Without checkpoint_steps, the checkpoint is saved once when the run fails
+        assert len(writes) == expected_writes
+
+
+def test_checkpoints_of_old_failed_runs_are_dropped():
+    job = Enrichment()
+    workflow = Workflow(steps=job.steps(), max_run_checkpoints=2, telemetry=False)
+    run_ids = []
+    for company in ["a", "b", "c"]:
+        with pytest.raises(RuntimeError):
+            workflow.run(company=company)
+        run_ids.append(workflow.run_id)
+
+    assert workflow.run_checkpoints is not None
+    assert list(workflow.run_checkpoints) == run_ids[1:]
+
+
+def test_resume_reruns_steps_with_changed_inputs():
+    job = Enrichment()
+    workflow = Workflow(steps=job.steps(), telemetry=False)
+    with pytest.raises(RuntimeError):
+        workflow.run(company="agno")
+
+    job.fail = False
+    job.calls = []
+    workflow.resume(company="phidata")
+
+    assert job.calls == ["fetch", "extract", "enrich"]
+
+
+class ResearchWorkflow(Workflow):
+    def __init__(self, fail: bool, **kwargs):
+        super().__init__(**kwargs)
+        self.fail = fail
+        self.calls = []
+
+    def research(self, topic: str) -> RunResponse:
+        self.calls.append("research")
+        return RunResponse(content=f"research on {topic}")
+
+    def write(self, research: str) -> str:
+        self.calls.append("write")
+        if self.fail:
+            raise RuntimeError("model overloaded")
+        return f"article from {research}"
+
+    def run(self, topic: str) -> RunResponse:  # type: ignore
+        research = self.run_step("research", self.research, topic=topic)
+        article = self.run_step("write", self.write, research=research.content)
+        return RunResponse(content=article)
+
+
+def test_run_step_checkpoints_imperative_workflows(tmp_path):
+    workflow = ResearchWorkflow(fail=True, session_id="session", storage=_make_storage(tmp_path), telemetry=False)
+    with pytest.raises(RuntimeError):
+        workflow.run(topic="agents")
+
+    resumed = ResearchWorkflow(fail=False, session_id="session", storage=_make_storage(tmp_path), telemetry=False)
+    response = resumed.resume()
+
+    assert resumed.calls == ["write"]
+    assert response.content == "article from research on agents"
+
+
+class StreamingResearchWorkflow(ResearchWorkflow):
+    def run(self, topic: str) -> Iterator[RunResponse]:  # type: ignore
+        research = self.run_step("research", self.research, topic=topic)
+        yield research
+        yield RunResponse(content=self.run_step("write", self.write, research=research.content))
+
+
+def test_failed_generator_runs_can_be_resumed(tmp_path):
+    workflow = StreamingResearchWorkflow(
+        fail=True, session_id="session", storage=_make_storage(tmp_path), telemetry=False
+    )
+    with pytest.raises(RuntimeError):
+        list(workflow.run(topic="agents"))
+
+    resumed = StreamingResearchWorkflow(
+        fail=False, session_id="session", storage=_make_storage(tmp_path), telemetry=False
+    )
+    responses = list(resumed.resume())
+
+    assert resumed.calls == ["write"]
+    assert responses[-1].content == "article from research on agents"
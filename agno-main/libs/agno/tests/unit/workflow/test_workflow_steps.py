@@ -0,0 +1,235 @@
+import asyncio
+import time
+from contextvars import ContextVar
+
+import pytest
+from pydantic import BaseModel
+
+from agno.storage.sqlite import SqliteStorage
+from agno.workflow import RunResponse, Step, Workflow
+
+
+class Calls:
+    def __init__(self):
+        self.steps = []
+
+    def step(self, name, delay: float = 0.0):
+        def run(**inputs):
+            self.steps.append(name)
+            time.sleep(delay)
+            return f"{name}({','.join(str(inputs[key]) for key in sorted(inputs))})"
+
+        return run
+
+
+def _make_steps(calls: Calls, delay: float = 0.0, cache: bool = False):
+    def fetch(topic: str) -> str:
+        calls.steps.append("fetch")
+        time.sleep(delay)
+        return f"fetch({topic})"
+
+    return [
+        Step(name="fetch", function=fetch, cache=cache),
+        Step(name="summarize", function=calls.step("summarize", delay), depends_on=["fetch"], cache=cache),
+        Step(name="extract", function=calls.step("extract", delay), depends_on=["fetch"], cache=cache),
+        Step(name="classify", function=calls.step("classify", delay), depends_on=["fetch"], cache=cache),
+        Step(
+            name="report", function=calls.step("report"), depends_on=["summarize", "extract", "classify"], cache=cache
+        ),
+    ]
+
+
+def test_independent_steps_run_concurrently():
+    calls = Calls()
+    workflow = Workflow(steps=_make_steps(calls, delay=0.2), telemetry=False)
+
+    start = time.perf_counter()
+    response = workflow.run(topic="agents")
+    elapsed = time.perf_counter() - start
+
+    assert isinstance(response, RunResponse)
+    # Steps accepting **kwargs also receive the run inputs
+    assert response.content == (
+        "report(classify(fetch(agents),agents),extract(fetch(agents),agents),summarize(fetch(agents),agents),agents)"
+    )
+    # fetch, then the three fan-out steps together, then report
+    assert elapsed < 0.2 * 3
+    assert calls.steps[0] == "fetch" and calls.steps[-1] == "report"
+    assert workflow._run_parameters is not None and list(workflow._run_parameters) == ["topic"]
+
+
+def test_step_outputs_are_reused_while_inputs_are_unchanged():
+    calls = Calls()
+    workflow = Workflow(steps=_make_steps(calls, cache=True), telemetry=False)
+
+    workflow.run(topic="agents")
+    assert len(calls.steps) == 5
+
+    workflow.run(topic="agents")
+    assert len(calls.steps) == 5
+
+    workflow.run(topic="models")
+    assert len(calls.steps) == 10
+
+
+def test_step_outputs_are_not_reused_by_default():
+    assert Step(name="step", function=lambda: None).cache is False
+    calls = Calls()
+    workflow = Workflow(steps=_make_steps(calls), telemetry=False)
+
+    workflow.run(topic="agents")
+    workflow.run(topic="agents")
+    assert len(calls.steps) == 10
+
+
+def test_step_outputs_are_resumed_from_storage(tmp_path):
+    db_file = str(tmp_path / "workflows.db")
+    calls = Calls()
+    workflow = Workflow(
+        session_id="session",
+        steps=_make_steps(calls, cache=True),
+        storage=SqliteStorage(table_name="workflows", db_file=db_file),
+        telemetry=False,
+    )
+    first = workflow.run(topic="agents")
+
+    resumed_calls = Calls()
+    resumed = Workflow(
+        session_id="session",
+        steps=_make_steps(resumed_calls, cache=True),
+        storage=SqliteStorage(table_name="workflows", db_file=db_file),
+        telemetry=False,
+    )
+    response = resumed.run(topic="agents")
+
+    assert resumed_calls.steps == []
+    assert response.content == first.content
+
+
+def test_async_steps_run_concurrently():
+    async def fetch(topic: str) -> str:
+        await asyncio.sleep(0.2)
+        return topic
+
+    async def summarize(fetch: str) -> str:
+        await asyncio.sleep(0.2)
+        return f"summary of {fetch}"
+
+    def extract(fetch: str) -> str:
+        time.sleep(0.2)
+        return f"facts of {fetch}"
+
+    workflow = Workflow(
+        steps=[
+            Step(name="fetch", function=fetch),
+            Step(name="summarize", function=summarize, depends_on=["fetch"]),
+            Step(name="extract", function=extract, depends_on=["fetch"]),
+        ],
+        telemetry=False,
+    )
+
+    start = time.perf_counter()
+    response = asyncio.run(workflow.arun(topic="agents"))
+
+    assert time.perf_counter() - start < 0.2 * 3
+    assert response.content == {"summarize": "summary of agents", "extract": "facts of agents"}
+
+
+class Summary(BaseModel):
+    topic: str
+    words: int
+
+
+def test_pydantic_step_outputs_are_restored_from_storage(tmp_path):
+    db_file = str(tmp_path / "workflows.db")
+    calls = Calls()
+
+    def summarize(topic: str) -> Summary:
+        calls.steps.append("summarize")
+        return Summary(topic=topic, words=3)
+
+    def report(summarize: Summary) -> str:
+        return f"{summarize.topic}: {summarize.words} words"
+
+    def make_workflow() -> Workflow:
+        return Workflow(
+            session_id="session",
+            steps=[
+                Step(name="summarize", function=summarize, cache=True),
+                Step(name="report", function=report, depends_on=["summarize"]),
+            ],
+            storage=SqliteStorage(table_name="workflows", db_file=db_file),
+            telemetry=False,
+        )
+
+    make_workflow().run(topic="agents")
+    resumed = make_workflow()
+    response = resumed.run(topic="agents")
+
+    assert response.content == "agents: 3 words"
+    assert calls.steps == ["summarize"]
+    assert isinstance(resumed.step_outputs["summarize"]["output"], Summary)
+
+
+request_id: ContextVar[str] = ContextVar("request_id", default="")
+
+
+def test_steps_run_in_the_callers_context():
+    async def async_step() -> str:
+        return request_id.get()
+
+    def sync_step() -> str:
+        return request_id.get()
+
+    workflow = Workflow(
+        steps=[Step(name="async_step", function=async_step), Step(name="sync_step", function=sync_step)],
+        telemetry=False,
+    )
+    request_id.set("request-1")
+
+    assert workflow.run().content == {"async_step": "request-1", "sync_step": "request-1"}
+
+
+def test_invalid_steps_are_rejected():
+    with pytest.raises(ValueError, match="unknown step"):
+        Workflow(steps=[Step(name="a", function=lambda: 1, depends_on=["b"])], telemetry=False)
+    with pytest.raises(ValueError, match="cycle"):
+        Workflow(
+            steps=[
+                Step(name="a", function=lambda b: b, depends_on=["b"]),
+                Step(name="b", function=lambda a: a, depends_on=["a"]),
+            ],
+            telemetry=False,
+        )
+
+
+def test_running_steps_complete_and_are_saved_when_a_step_fails():
+    from agno.workflow.steps import StepGraph
+
+    def fail(topic: str) -> str:
+        raise RuntimeError("provider unavailable")
+
+    def slow(topic: str) -> str:
+        time.sleep(0.1)
+        return f"slow {topic}"
+
+    def after_fail(fail: str) -> str:
+        return fail
+
+    completed = []
+    graph = StepGraph(
+        [
+            Step(name="fail", function=fail),
+            Step(name="slow", function=slow),
+            Step(name="after_fail", function=after_fail, depends_on=["fail"]),
+        ]
+    )
+    for run in (
+        lambda callback: graph.run({"topic": "agents"}, on_step_complete=callback),
+        lambda callback: asyncio.run(graph.arun({"topic": "agents"}, on_step_complete=callback)),
+    ):
+        completed.clear()
+        with pytest.raises(RuntimeError, match="provider unavailable"):
+            run(lambda step, input_hash, output: completed.append((step.name, output)))
+        # The step running when the other failed completed before the error was raised
+        assert completed == [("slow", "slow agents")]